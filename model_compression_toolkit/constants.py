@@ -90,6 +90,12 @@ UPPER_FACTOR = 1.2
 DEC_RANGE_BOTTOM = 0.97
 DEC_RANGE_UPPER = 1.03
 
+# Maximal number of bytes of the quantized candidates tensors that are computed in a single batched pass of
+# the quantization parameters search (the candidates are split into chunks to bound the peak memory).
+QPARAMS_SEARCH_BATCH_MAX_BYTES = 2 ** 22
+# Seed of the random elements subset that is used to estimate the quantization error in the parameters search.
+QPARAMS_SEARCH_SAMPLING_SEED = 0
+
 # KPI computation parameters
 BITS_TO_BYTES = 8.0
 
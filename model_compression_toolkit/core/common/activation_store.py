@@ -0,0 +1,166 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Any, List, Iterator
+
+import numpy as np
+
+from model_compression_toolkit.logger import Logger
+
+
+class ActivationStore:
+    """
+    A store of samples (e.g., images batches or the output tensors of a model on them), where each sample is a
+    numpy array or a (possibly nested) list or tuple of numpy arrays.
+    The arrays are kept in RAM as long as the total size of the arrays in RAM does not exceed the store's RAM
+    budget. Arrays beyond the budget are written to .npy shards on local disk, and are read back as
+    memory-mapped arrays, so only the pages of the arrays that are in use are resident in memory.
+    """
+
+    def __init__(self,
+                 ram_budget: int = None,
+                 directory: str = None):
+        """
+        Args:
+            ram_budget: Maximal number of bytes of arrays to keep in RAM. If None, all arrays are kept in RAM.
+            directory: Directory to write the shards to. If None, a temporary directory is created when the
+                first shard is written (and is removed when the store is cleared or garbage collected).
+        """
+        if ram_budget is not None and ram_budget < 0:
+            Logger.critical(f'The RAM budget of an activation store should be non-negative, '
+                            f'but is {ram_budget}.')  # pragma: no cover
+        self.ram_budget = ram_budget
+        self.directory = directory
+        self.ram_bytes = 0
+        self.disk_bytes = 0
+
+        # For each sample, its structure and its arrays (or the paths of their shards, for spilled arrays).
+        self._samples = []
+        self._shards_directory = None
+        self._finalizer = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Args:
+            index: Index of a sample in the store.
+
+        Returns:
+            The sample, with the same structure as it was appended (spilled arrays are read-only memory-mapped
+            arrays).
+        """
+        structure, arrays = self._samples[index]
+        arrays = [np.load(a, mmap_mode='r') if isinstance(a, str) else a for a in arrays]
+        return self._unflatten(structure, iter(arrays))
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, sample: Any) -> int:
+        """
+        Adds a sample to the store. Arrays that fit in the remaining RAM budget are kept in RAM (without copying
+        them), and the rest are written to shards on disk.
+
+        Args:
+            sample: A numpy array, or a (possibly nested) list or tuple of numpy arrays.
+
+        Returns:
+            The index of the sample in the store.
+        """
+        arrays = []
+        structure = self._flatten(sample, arrays)
+        index = len(self._samples)
+        stored_arrays = []
+        for array_index, array in enumerate(arrays):
+            if self.ram_budget is None or self.ram_bytes + array.nbytes <= self.ram_budget:
+                self.ram_bytes += array.nbytes
+                stored_arrays.append(array)
+            else:
+                path = os.path.join(self._get_shards_directory(), f'{index}_{array_index}.npy')
+                np.save(path, array)
+                self.disk_bytes += array.nbytes
+                stored_arrays.append(path)
+        self._samples.append((structure, stored_arrays))
+        return index
+
+    def clear(self):
+        """
+        Removes all the samples from the store, and deletes the shards the store has written to disk.
+        """
+        for _, arrays in self._samples:
+            for a in arrays:
+                if isinstance(a, str) and os.path.exists(a):
+                    os.remove(a)
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._samples = []
+        self._shards_directory = None
+        self.ram_bytes = 0
+        self.disk_bytes = 0
+
+    def _get_shards_directory(self) -> str:
+        """
+        Returns: The directory to write shards to (creates a temporary directory if no directory was given).
+        """
+        if self._shards_directory is None:
+            if self.directory is not None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._shards_directory = self.directory
+            else:
+                self._shards_directory = tempfile.mkdtemp(prefix='mct_activation_store_')
+                self._finalizer = weakref.finalize(self, shutil.rmtree, self._shards_directory, True)
+        return self._shards_directory
+
+    @staticmethod
+    def _flatten(sample: Any, arrays: List[np.ndarray]) -> Any:
+        """
+        Flattens a sample to a list of arrays.
+
+        Args:
+            sample: A numpy array, or a (possibly nested) list or tuple of numpy arrays.
+            arrays: List to append the sample's arrays to.
+
+        Returns:
+            The structure of the sample (None for an array, or the type of a list or tuple and the structures of
+            its elements).
+        """
+        if isinstance(sample, (list, tuple)):
+            return type(sample), [ActivationStore._flatten(s, arrays) for s in sample]
+        arrays.append(np.asarray(sample))
+        return None
+
+    @staticmethod
+    def _unflatten(structure: Any, arrays: Iterator[np.ndarray]) -> Any:
+        """
+        Rebuilds a sample from its structure and its flattened arrays.
+
+        Args:
+            structure: Structure of the sample (see _flatten).
+            arrays: Iterator over the sample's arrays.
+
+        Returns:
+            The sample.
+        """
+        if structure is None:
+            return next(arrays)
+        sample_type, elements_structures = structure
+        return sample_type([ActivationStore._unflatten(s, arrays) for s in elements_structures])
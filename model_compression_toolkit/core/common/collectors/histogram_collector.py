@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
+import math
 from typing import Tuple
 import numpy as np
 from model_compression_toolkit.core.common.collectors.base_collector import BaseCollector
@@ -41,23 +42,69 @@ def interpolate_histogram(current_bins: np.ndarray,
     return interpolated_counts
 
 
+def rebin_histogram(bins: np.ndarray,
+                    counts: np.ndarray,
+                    new_min: float,
+                    new_max: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand a uniform histogram so it covers the range [new_min, new_max] while keeping the same number of bins.
+    The new bin width is an integer multiple of the current bin width, and the new bins edges are aligned
+    with the current bins edges, so each current bin falls entirely inside a single new bin and the counts
+    are merged exactly (without interpolation).
+
+    Args:
+        bins: Bins edges of the histogram to expand (uniform bins).
+        counts: Counts of the histogram to expand.
+        new_min: Minimal value the expanded histogram should cover.
+        new_max: Maximal value the expanded histogram should cover.
+
+    Returns:
+        Bins edges and counts of the expanded histogram.
+    """
+    n_bins = len(counts)
+    bin_width = bins[1] - bins[0]
+    hist_min, hist_max = bins[0], bins[-1]
+
+    # Number of current bins to add below the current minimum, and the factor (number of current bins
+    # in each new bin) that is needed to cover the new range with the same number of bins.
+    n_pad_left = int(math.ceil((hist_min - new_min) / bin_width)) if new_min < hist_min else 0
+    merged_min = hist_min - n_pad_left * bin_width
+    factor = max(int(math.ceil((max(new_max, hist_max) - merged_min) / (n_bins * bin_width))), 1)
+
+    padded_counts = np.zeros(n_bins * factor, dtype=counts.dtype)
+    padded_counts[n_pad_left:n_pad_left + n_bins] = counts
+    merged_counts = padded_counts.reshape([n_bins, factor]).sum(axis=1)
+    merged_bins = merged_min + np.arange(n_bins + 1) * bin_width * factor
+    return merged_bins, merged_counts
+
+
 class HistogramCollector(BaseCollector):
     """
     Collector for holding histogram of tensors going through it.
     """
 
-    def __init__(self, n_bins: int = 2048):
+    def __init__(self, n_bins: int = 2048, streaming: bool = False):
         """
         Args:
             n_bins: Number of bins in the histogram.
+            streaming: Whether to fold each tensor into a single running histogram of n_bins bins
+            (bounded memory), instead of keeping a histogram per iteration and merging them lazily.
         """
 
         super().__init__()
         self.__n_bins = n_bins
+        self.__streaming = streaming
         self.__bins = None
         self.__counts = None
         self.__histogram_per_iteration = []
 
+    @property
+    def streaming(self) -> bool:
+        """
+        Returns: Whether the collector folds tensors into a single running histogram.
+        """
+        return self.__streaming
+
     def __merge_histograms(self):
         """
         After collecting histogram per iteration, we merge these histograms to a single histogram
@@ -65,15 +112,16 @@ class HistogramCollector(BaseCollector):
         The merge is done in a lazy manner (is computed only when actually needed).
         """
         if len(self.__histogram_per_iteration) > 0:
-            # Stack all bins that were gathered during inference
-            bins_stack = np.vstack([hist[1] for hist in self.__histogram_per_iteration])
+            # Gather all bins that were gathered during inference (histograms that were merged from other
+            # collectors may have a different number of bins).
+            bins_per_iteration = [hist[1] for hist in self.__histogram_per_iteration]
 
             # The combined histogram will be computed between new min/max (which is the min/max of all histograms).
             # The bin width of the merged histogram is the minimal bin width among all histograms (to lose as less
             # information as possible during the merge).
-            merged_histogram_min = np.min(bins_stack)
-            merged_histogram_max = np.max(bins_stack)
-            merged_bin_width = np.min(bins_stack[:, 1] - bins_stack[:, 0])
+            merged_histogram_min = np.min([np.min(bins) for bins in bins_per_iteration])
+            merged_histogram_max = np.max([np.max(bins) for bins in bins_per_iteration])
+            merged_bin_width = np.min([bins[1] - bins[0] for bins in bins_per_iteration])
             merged_histogram_bins = np.arange(merged_histogram_min, merged_histogram_max+merged_bin_width, merged_bin_width)
 
             merged_histogram_counts = None
@@ -156,5 +204,59 @@ class HistogramCollector(BaseCollector):
         Args:
             x: Tensor going through the collector to update the histogram according to.
         """
-        count, bins = np.histogram(x, bins=self.__n_bins)
-        self.__histogram_per_iteration.append((count, bins))
+        if self.__streaming:
+            self.__update_streaming_histogram(x)
+        else:
+            count, bins = np.histogram(x, bins=self.__n_bins)
+            self.__histogram_per_iteration.append((count, bins))
+
+    def __update_streaming_histogram(self, x: np.ndarray):
+        """
+        Fold a tensor into the running histogram. If the tensor exceeds the range of the running histogram,
+        the running histogram is first expanded (keeping its number of bins) to cover the tensor's range.
+
+        Args:
+            x: Tensor going through the collector to update the histogram according to.
+        """
+        if self.__counts is None:
+            self.__counts, self.__bins = np.histogram(x, bins=self.__n_bins)
+            return
+
+        x_min, x_max = np.min(x), np.max(x)
+        if x_min < self.__bins[0] or x_max > self.__bins[-1]:
+            self.__bins, self.__counts = rebin_histogram(self.__bins, self.__counts, x_min, x_max)
+        count, _ = np.histogram(x, bins=len(self.__counts), range=(self.__bins[0], self.__bins[-1]))
+        self.__counts += count
+
+    def merge(self, other: 'HistogramCollector'):
+        """
+        Merge the statistics of another histogram collector into this collector (for example, when
+        statistics of the same tensor were collected by several partial collectors).
+
+        Args:
+            other: Histogram collector to merge into this collector.
+        """
+        if not other.is_legal:
+            self.update_legal_status(is_illegal=True)
+            return
+
+        other_bins, other_counts = other.get_histogram()
+        if other_counts is None:
+            return
+
+        if not self.__streaming:
+            # The other histogram is kept as an additional iteration, and the merged histogram is recomputed
+            # lazily when it's needed. If this collector's histogram was already merged (and maybe scaled or
+            # shifted since), it replaces the histograms it was merged from.
+            if self.__counts is not None:
+                self.__histogram_per_iteration = [(self.__counts, self.__bins)]
+            self.__histogram_per_iteration.append((other_counts, other_bins))
+            self.__bins, self.__counts = None, None
+            return
+
+        if self.__counts is None:
+            self.__bins = np.linspace(other_bins[0], other_bins[-1], self.__n_bins + 1)
+            self.__counts = np.zeros(self.__n_bins)
+        elif other_bins[0] < self.__bins[0] or other_bins[-1] > self.__bins[-1]:
+            self.__bins, self.__counts = rebin_histogram(self.__bins, self.__counts, other_bins[0], other_bins[-1])
+        self.__counts = self.__counts + interpolate_histogram(self.__bins, other_bins, other_counts)
@@ -58,7 +58,8 @@ class StatsCollector(BaseStatsCollector):
     def __init__(self,
                  out_channel_axis: int,
                  init_min_value: float = None,
-                 init_max_value: float = None):
+                 init_max_value: float = None,
+                 streaming_histogram: bool = False):
         """
         Instantiate three statistics collectors: histogram, mean and min/max per channel.
         Set initial min/max values if are known.
@@ -67,10 +68,11 @@ class StatsCollector(BaseStatsCollector):
             out_channel_axis: Index of output channels.
             init_min_value: Initial min value for min/max stored values.
             init_max_value: Initial max value for min/max stored values.
+            streaming_histogram: Whether the histogram collector keeps a single running histogram.
         """
 
         super().__init__()
-        self.hc = HistogramCollector()
+        self.hc = HistogramCollector(streaming=streaming_histogram)
         self.mc = MeanCollector(axis=out_channel_axis)
         self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
                                               init_max_value=init_max_value,
@@ -19,7 +19,8 @@ from model_compression_toolkit.core.common.collectors.statistics_collector impor
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 
 def create_stats_collector_for_node(node: common.BaseNode,
-                                    fw_info: FrameworkInfo) -> BaseStatsCollector:
+                                    fw_info: FrameworkInfo,
+                                    streaming_histogram: bool = False) -> BaseStatsCollector:
     """
     Gets a node and a groups list and create and return a statistics collector for a node
     according to whether its statistics should be collected and the prior information we
@@ -28,6 +29,7 @@ def create_stats_collector_for_node(node: common.BaseNode,
     Args:
         node: Node to create its statistics collector.
         fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+        streaming_histogram: Whether to collect the node's histogram into a single running histogram.
 
     Returns:
         Statistics collector for statistics collection for the node.
@@ -38,7 +40,8 @@ def create_stats_collector_for_node(node: common.BaseNode,
         max_output = getattr(node.prior_info, 'max_output', None)
         stats_collector = common.StatsCollector(out_channel_axis=fw_info.out_channel_axis_mapping.get(node.type),
                                                 init_min_value=min_output,
-                                                init_max_value=max_output)
+                                                init_max_value=max_output,
+                                                streaming_histogram=streaming_histogram)
     else:
         stats_collector = common.NoStatsCollector()
 
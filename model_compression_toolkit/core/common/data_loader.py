@@ -15,11 +15,16 @@
 
 
 import os
-from typing import List, Callable
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Tuple, Iterator
 
 import numpy as np
 from PIL import Image
 
+from model_compression_toolkit.core.common.prefetch import prefetch
+
 #:
 FILETYPES = ['jpeg', 'jpg', 'bmp', 'png']
 
@@ -35,7 +40,12 @@ class FolderImageLoader(object):
                  folder: str,
                  preprocessing: List[Callable],
                  batch_size: int,
-                 file_types: List[str] = FILETYPES):
+                 file_types: List[str] = FILETYPES,
+                 num_workers: int = 0,
+                 prefetch_batches: int = 0,
+                 cache_bytes: int = 0,
+                 draft_size: Tuple[int, int] = None,
+                 seed: int = None):
 
         """ Initialize a FolderImageLoader object.
 
@@ -45,6 +55,11 @@ class FolderImageLoader(object):
             preprocessing: List of functions to use when processing the images before retrieving them.
             batch_size: Number of images to retrieve each sample.
             file_types: Files types to scan in the folder. Default list is :data:`~model_compression_toolkit.core.common.data_loader.FILETYPES`
+            num_workers: Number of threads to decode and preprocess the images of a batch in parallel. If 0, the images are decoded and preprocessed in the sampling thread.
+            prefetch_batches: Number of batches to prepare in a background thread ahead of sampling them, so the next batch is prepared while the current one is used. If 0, a batch is prepared when it is sampled.
+            cache_bytes: Maximal number of bytes of decoded images to keep in a cache, so images that are sampled again are not decoded again (the least recently used images are removed beyond it). The images are cached before preprocessing. If 0, the images are not cached.
+            draft_size: Size (width, height) the preprocessing resizes the images to. If given, JPEG images are decoded at the smallest scale (a power of two reduction) that is not smaller than this size, which is faster than decoding them at full size.
+            seed: Seed of the random generator of the loader, that samples the images of the batches (also when the batches are prepared in a background thread). If None, the seed is drawn from numpy's global random generator when the loader is created.
 
         Examples:
 
@@ -61,6 +76,10 @@ class FolderImageLoader(object):
 
             >>> image_data_loader = FolderImageLoader('path/to/images/directory', preprocessing=[], batch_size=10, file_types=['png'])
 
+            To decode the images in 4 threads, and prepare the next 2 batches in the background while the current batch is used:
+
+            >>> image_data_loader = FolderImageLoader('path/to/images/directory', preprocessing=[], batch_size=10, num_workers=4, prefetch_batches=2)
+
         """
 
         self.folder = folder
@@ -76,6 +95,89 @@ class FolderImageLoader(object):
         print(f"Finished Disk Scanning: Found {self.n_files} files")
         self.preprocessing = preprocessing
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.prefetch_batches = prefetch_batches
+        self.cache_bytes = cache_bytes
+        self.draft_size = draft_size
+        self.seed = seed
+
+        self.cached_bytes = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 0 else None
+        self._batches = None
+        self._random_state = np.random.RandomState(seed if seed is not None else np.random.randint(2 ** 31))
+
+    def _decode(self, file: str) -> np.ndarray:
+        """
+        Decode an image file (from the cache of decoded images, if the image is cached).
+
+        Args:
+            file: Path of the image file.
+
+        Returns:
+            The decoded RGB image (a copy of the cached image, so preprocessing it in-place does not modify the
+            cache).
+        """
+        with self._cache_lock:
+            if file in self._cache:
+                self._cache.move_to_end(file)
+                return self._cache[file].copy()
+
+        with Image.open(file) as img:
+            if self.draft_size is not None:
+                img.draft('RGB', self.draft_size)  # Has effect on JPEG images only
+            decoded = np.uint8(np.array(img.convert('RGB')))
+
+        # Images that exceed the budget by themselves are not cached.
+        if 0 < decoded.nbytes <= self.cache_bytes:
+            with self._cache_lock:
+                if file not in self._cache:
+                    self._cache[file] = decoded.copy()
+                    self.cached_bytes += decoded.nbytes
+                    while self.cached_bytes > self.cache_bytes:
+                        _, evicted = self._cache.popitem(last=False)
+                        self.cached_bytes -= evicted.nbytes
+        return decoded
+
+    def _load_image(self, file: str) -> np.ndarray:
+        """
+        Decode and preprocess an image file.
+
+        Args:
+            file: Path of the image file.
+
+        Returns:
+            The preprocessed image.
+        """
+        img = self._decode(file)
+        for p in self.preprocessing:  # preprocess images
+            img = p(img)
+        return img
+
+    def _read_batch(self) -> np.ndarray:
+        """
+        Read batch_size random images from the image_list the FolderImageLoader holds, and
+        process them using the preprocessing list that was passed at initialization.
+
+        Returns:
+            The batch of images.
+        """
+
+        index = self._random_state.randint(0, self.n_files, self.batch_size)
+        files = [self.image_list[i] for i in index]
+        if self._executor is not None:
+            image_list = list(self._executor.map(self._load_image, files))
+        else:
+            image_list = [self._load_image(file) for file in files]
+        return np.stack(image_list, axis=0)
+
+    def _generate_batches(self) -> Iterator[np.ndarray]:
+        """
+        Returns: An endless iterator over batches of images.
+        """
+        while True:
+            yield self._read_batch()
 
     def _sample(self):
         """
@@ -84,15 +186,12 @@ class FolderImageLoader(object):
         prepare it for retrieving.
         """
 
-        index = np.random.randint(0, self.n_files, self.batch_size)
-        image_list = []
-        for i in index:
-            file = self.image_list[i]
-            img = np.uint8(np.array(Image.open(file).convert('RGB')))
-            for p in self.preprocessing:  # preprocess images
-                img = p(img)
-            image_list.append(img)
-        self.next_batch_data = np.stack(image_list, axis=0)
+        if self.prefetch_batches > 0:
+            if self._batches is None:
+                self._batches = prefetch(self._generate_batches(), self.prefetch_batches)
+            self.next_batch_data = next(self._batches)
+        else:
+            self.next_batch_data = self._read_batch()
 
     def sample(self):
         """
@@ -104,3 +203,17 @@ class FolderImageLoader(object):
         self._sample()
         data = self.next_batch_data  # get current data
         return data
+
+    def close(self):
+        """
+        Stop preparing batches in the background, and release the decoding threads and the cached images.
+        """
+        if self._batches is not None:
+            self._batches.close()
+            self._batches = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._cache_lock:
+            self._cache.clear()
+            self.cached_bytes = 0
@@ -29,6 +29,7 @@ from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 
 
 class FrameworkImplementation(ABC):
@@ -94,7 +95,8 @@ class FrameworkImplementation(ABC):
                       mode: ModelBuilderMode,
                       append2output: List[Any],
                       fw_info: FrameworkInfo,
-                      return_float_outputs: bool = False) -> Tuple:
+                      return_float_outputs: bool = False,
+                      weights_cache: CandidateWeightsCache = None) -> Tuple:
         """
         Build a framework model from a graph.
         The mode determines how the model should be build. append2output is a list of Nodes
@@ -106,6 +108,8 @@ class FrameworkImplementation(ABC):
             append2output: List of Nodes to set as the model's outputs.
             fw_info: FrameworkInfo object with information about the specific framework's model
             return_float_outputs (bool): whether to return outputs before or after quantization nodes (default)
+            weights_cache: Cache of candidates quantized weights for the configurable weights quantizers of a
+                mixed-precision model (used only in mixed-precision mode).
 
         Returns:
             A tuple with the model and additional relevant supporting objects.
@@ -150,7 +154,10 @@ class FrameworkImplementation(ABC):
                              f'framework\'s apply_shift_negative_correction method.')  # pragma: no cover
 
     @abstractmethod
-    def attach_sc_to_node(self, node: BaseNode, fw_info: FrameworkInfo) -> BaseStatsCollector:
+    def attach_sc_to_node(self,
+                          node: BaseNode,
+                          fw_info: FrameworkInfo,
+                          streaming_histogram: bool = False) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
@@ -158,6 +165,7 @@ class FrameworkImplementation(ABC):
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+            streaming_histogram: Whether the collector should keep a single running histogram (bounded memory).
 
         Returns:
             Statistics collector for the node.
@@ -370,7 +378,8 @@ class FrameworkImplementation(ABC):
                    all_outputs_indices: List[int],
                    alpha: float = 0.3,
                    n_iter: int = 50,
-                   norm_weights: bool = True) -> List[float]:
+                   norm_weights: bool = True,
+                   n_probes: int = 1) -> np.ndarray:
         """
         Calls a framework specific model gradient calculation function, which computes the jacobian-based weights of the model's
         outputs with respect to the feature maps of the set of given interest points.
@@ -387,9 +396,10 @@ class FrameworkImplementation(ABC):
                 compatible weight for the distance metric computation).
             n_iter: The number of random iterations to calculate the approximated jacobian-based weights for each interest point.
             norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+            n_probes: Number of random vectors to draw in each backward pass.
 
-        Returns: A list of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
-        point's output has on the model's output.
+        Returns: An array of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
+        point's output has on the model's output, averaged over the images in the input batch.
         """
 
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
@@ -466,3 +476,59 @@ class FrameworkImplementation(ABC):
         """
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s sensitivity_eval_inference method.')  # pragma: no cover
+
+    def sensitivity_eval_inference_with_cache(self,
+                                              model: Any,
+                                              inputs: Any,
+                                              nodes_names: List[str]) -> Tuple[Any, Any]:
+        """
+        Calls for a model inference during mixed precision sensitivity evaluation, and caches the intermediate
+        tensors that are required to resume the inference from each of the given nodes (so the sensitivity of
+        modifying a single node can be evaluated by re-executing only the nodes from the modified node onwards).
+        Frameworks that do not support resuming an inference return no cache.
+
+        Args:
+            model: A model to run inference for.
+            inputs: Input tensors to run inference on.
+            nodes_names: Names of the nodes to resume the inference from.
+
+        Returns:
+            The output of the model inference on the given input, and the cache to resume the inference by
+            (None if resuming an inference is not supported).
+        """
+        return self.sensitivity_eval_inference(model, inputs), None
+
+    def sensitivity_eval_inference_from_cache(self,
+                                              model: Any,
+                                              cache: Any,
+                                              nodes_names: List[str]) -> Any:
+        """
+        Resumes a model inference that was cached by sensitivity_eval_inference_with_cache from the first of the
+        given modified nodes.
+
+        Args:
+            model: A model to run inference for.
+            cache: Cache of an inference of the model.
+            nodes_names: Names of the modified nodes to resume the inference from.
+
+        Returns:
+            The output of the model inference.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s sensitivity_eval_inference_from_cache method.')  # pragma: no cover
+
+    def get_integer_op(self,
+                       node: BaseNode,
+                       fw_info: FrameworkInfo) -> Callable:
+        """
+        Get the operation that runs a node with integer arithmetic in the integer graph executor.
+
+        Args:
+            node: Node to get its integer operation.
+            fw_info: Framework specific information about the node (such as its kernel attributes).
+
+        Returns:
+            An IntegerOp that runs the node.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s get_integer_op method.')  # pragma: no cover
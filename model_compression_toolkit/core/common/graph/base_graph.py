@@ -15,13 +15,11 @@
 from collections import namedtuple
 
 from copy import copy, deepcopy
-from typing import List, Tuple, Any
+from typing import List, Tuple, Any, Dict, Callable
 
 import networkx as nx
 import numpy as np
 
-from networkx.algorithms.dag import topological_sort
-
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX, EDGE_SOURCE_INDEX
 from model_compression_toolkit.core.common.graph.edge import Edge, convert_to_edge
@@ -35,6 +33,10 @@ from model_compression_toolkit.target_platform_capabilities.target_platform.targ
 
 OutTensor = namedtuple('OutTensor', 'node node_out_index')
 
+# Keys of the graph's cached computations.
+TOPO_SORTED_NODES = 'topo_sorted_nodes'
+TOPO_NODE_INDEX = 'topo_node_index'
+
 
 class Graph(nx.MultiDiGraph, GraphSearches):
     """
@@ -59,6 +61,13 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             **attr: Attributes to add to graph as key=value pairs.
         """
 
+        # Cache of computations that depend on the graph's structure only (topological order, etc.). It is
+        # invalidated by every method that mutates the graph's structure. Computations that depend on the nodes'
+        # quantization configuration candidates (e.g., the configurable nodes) are not cached, since the candidates
+        # are modified in-place in many places.
+        self._cache_version = 0
+        self._cache = dict()
+
         super().__init__(**attr)
         self.name = name
         self.input_nodes = input_nodes
@@ -93,12 +102,207 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         """
         self.tpc = tpc
 
+    @property
+    def cache_version(self) -> int:
+        """
+        Returns: Version of the graph's cache. The version is increased every time the graph is mutated,
+        so it can be used to check whether computations that depend on the graph are still valid.
+        """
+        return self._cache_version
+
+    def invalidate_cache(self):
+        """
+        Invalidate all cached computations of the graph (topological order, etc.).
+        It is called by every method that mutates the graph's structure.
+        """
+        self._cache_version += 1
+        self._cache.clear()
+
+    def get_cached(self, key: Any, compute_fn: Callable) -> Any:
+        """
+        Get a cached computation of the graph, and compute it if it's not cached.
+
+        Args:
+            key: Key of the computation in the cache.
+            compute_fn: Function to compute the value if it's not cached.
+
+        Returns:
+            The (possibly cached) value.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute_fn()
+        return self._cache[key]
+
+    def clone(self, share_weights: bool = True) -> 'Graph':
+        """
+        Create a copy of the graph.
+
+        When share_weights is set, the copy shares the nodes' weights arrays and the statistics collectors with the
+        graph instead of duplicating them, and everything else (nodes, edges, quantization configurations, etc.)
+        is copied as in a deep copy. The shared objects are treated as read-only: setting a node's weight
+        (set_weights_by_keys) replaces the weight in the node's copy only, and a statistics collector is replaced
+        by a new collector when its statistics are scaled or shifted, so modifying the copy does not modify the
+        graph. Weights arrays must not be modified in-place.
+
+        Args:
+            share_weights: Whether to share the weights and statistics collectors with the copy. If False, the
+                graph is deep-copied.
+
+        Returns:
+            A copy of the graph.
+        """
+        if not share_weights:
+            return deepcopy(self)
+
+        # Objects in the memo of deepcopy are used as their own copies.
+        memo = {}
+        for n in self.nodes:
+            for w in n.weights.values():
+                if w is not None:
+                    memo[id(w)] = w
+
+        for sc in list(self.node_to_out_stats_collector.values()) + list(self.node_to_in_stats_collector.values()):
+            for collector in (sc if isinstance(sc, list) else [sc]):
+                if collector is not None:
+                    memo[id(collector)] = collector
+
+        return deepcopy(self, memo)
+
+    def add_node(self, node_for_adding: BaseNode, **attr):
+        """
+        Add a node to the graph and invalidate the graph's cache.
+
+        Args:
+            node_for_adding: Node to add.
+            **attr: Attributes to add to the node.
+        """
+        super().add_node(node_for_adding, **attr)
+        self.invalidate_cache()
+
+    def add_nodes_from(self, nodes_for_adding: List[BaseNode], **attr):
+        """
+        Add nodes to the graph and invalidate the graph's cache.
+
+        Args:
+            nodes_for_adding: Nodes to add.
+            **attr: Attributes to add to the nodes.
+        """
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self.invalidate_cache()
+
+    def add_edge(self, u_for_edge: BaseNode, v_for_edge: BaseNode, key: Any = None, **attr) -> Any:
+        """
+        Add an edge to the graph and invalidate the graph's cache.
+
+        Args:
+            u_for_edge: Source node of the edge.
+            v_for_edge: Sink node of the edge.
+            key: Key to identify the edge between the two nodes.
+            **attr: Attributes of the edge.
+
+        Returns:
+            The key of the added edge.
+        """
+        edge_key = super().add_edge(u_for_edge, v_for_edge, key, **attr)
+        self.invalidate_cache()
+        return edge_key
+
+    def add_edges_from(self, ebunch_to_add: List[Any], **attr) -> List[Any]:
+        """
+        Add edges to the graph and invalidate the graph's cache.
+
+        Args:
+            ebunch_to_add: Edges to add.
+            **attr: Attributes of the edges.
+
+        Returns:
+            The keys of the added edges.
+        """
+        keys = super().add_edges_from(ebunch_to_add, **attr)
+        self.invalidate_cache()
+        return keys
+
+    def remove_edge(self, u: BaseNode, v: BaseNode, key: Any = None):
+        """
+        Remove an edge from the graph and invalidate the graph's cache.
+
+        Args:
+            u: Source node of the edge.
+            v: Sink node of the edge.
+            key: Key to identify the edge between the two nodes.
+        """
+        super().remove_edge(u, v, key)
+        self.invalidate_cache()
+
+    def remove_edges_from(self, ebunch: List[Any]):
+        """
+        Remove edges from the graph and invalidate the graph's cache.
+
+        Args:
+            ebunch: Edges to remove.
+        """
+        super().remove_edges_from(ebunch)
+        self.invalidate_cache()
+
+    def remove_nodes_from(self, nodes: List[BaseNode]):
+        """
+        Remove nodes from the graph and invalidate the graph's cache.
+
+        Args:
+            nodes: Nodes to remove.
+        """
+        super().remove_nodes_from(nodes)
+        self.invalidate_cache()
+
+    def clear(self):
+        """
+        Remove all nodes and edges from the graph and invalidate the graph's cache.
+        """
+        super().clear()
+        self.invalidate_cache()
+
+    def clear_edges(self):
+        """
+        Remove all edges from the graph and invalidate the graph's cache.
+        """
+        super().clear_edges()
+        self.invalidate_cache()
+
     def get_topo_sorted_nodes(self):
         """
         Returns: a list of toposorted nodes.
         """
 
-        return list(nx.algorithms.dag.topological_sort(self))
+        return list(self._get_topo_sorted_nodes())
+
+    def _get_topo_sorted_nodes(self) -> List[BaseNode]:
+        """
+        Returns: The (cached) list of toposorted nodes. The list should not be modified.
+        """
+
+        return self.get_cached(TOPO_SORTED_NODES,
+                                lambda: list(nx.algorithms.dag.topological_sort(self)))
+
+    def get_node_topo_index(self, node: BaseNode) -> int:
+        """
+        Get the index of a node in the topological order of the graph's nodes.
+
+        Args:
+            node: Node to get its index.
+
+        Returns:
+            Index of the node in the topologically sorted nodes list.
+        """
+
+        return self._get_topo_node_index()[node]
+
+    def _get_topo_node_index(self) -> Dict[BaseNode, int]:
+        """
+        Returns: A mapping from each node in the graph to its index in the topological order of the graph's nodes.
+        """
+
+        return self.get_cached(TOPO_NODE_INDEX,
+                                lambda: {n: i for i, n in enumerate(self._get_topo_sorted_nodes())})
 
     def get_op_list(self) -> np.ndarray:
         """
@@ -443,6 +647,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
                                                          f'before deleting the node from the graph.'
         #  Remove node
         super().remove_node(node_to_remove)
+        self.invalidate_cache()
 
     def incoming_edges(self,
                        n: BaseNode,
@@ -524,6 +729,24 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         sorted_names = [n.name for n in self.get_configurable_sorted_nodes(include_reused_nodes=include_reused_nodes)]
         return sorted_names
 
+    def get_configurable_nodes_index(self,
+                                     include_reused_nodes: bool = False) -> Dict[str, int]:
+        """
+        Get a mapping from the names of the configurable nodes to their indices in the list of configurable nodes
+        sorted according to the topological order of the graph (namely, the nodes' indices in a mixed-precision
+        configuration).
+
+        Args:
+            include_reused_nodes: Whether or not to include reused nodes (False by default).
+
+        Returns:
+            A dictionary from a configurable node's name to its index in the configurable sorted nodes list
+            (non-configurable nodes are not in the dictionary).
+
+        """
+        return {n.name: i for i, n in reversed(list(enumerate(
+            self.get_configurable_sorted_nodes(include_reused_nodes))))}
+
     def get_weights_configurable_nodes(self,
                                        include_reused_nodes: bool = False) -> List[BaseNode]:
         """
@@ -536,9 +759,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         Returns:
             A list of nodes that their weights can be configured (namely, has one or more weight qc candidate).
         """
-        return list(filter(lambda n: n.is_weights_quantization_enabled()
-                                     and not n.is_all_weights_candidates_equal()
-                                     and (not n.reuse or include_reused_nodes), list(self)))
+        return self._get_sorted_weights_configurable_nodes(include_reused_nodes)
 
     def get_sorted_weights_configurable_nodes(self,
                                               include_reused_nodes: bool = False) -> List[BaseNode]:
@@ -553,7 +774,23 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             A list of nodes that their weights can be configured (namely, has one or more weight qc candidate)
             sorted topologically.
         """
-        return self._sort_nodes_in_list(self.get_weights_configurable_nodes(include_reused_nodes))
+        return self._get_sorted_weights_configurable_nodes(include_reused_nodes)
+
+    def _get_sorted_weights_configurable_nodes(self,
+                                               include_reused_nodes: bool = False) -> List[BaseNode]:
+        """
+        Get the topologically sorted list of nodes that their weights can be configured.
+
+        Args:
+            include_reused_nodes: Whether to include reused nodes (False by default).
+
+        Returns:
+            A list of nodes that their weights can be configured sorted topologically.
+        """
+        return [n for n in self._get_topo_sorted_nodes()
+                if n.is_weights_quantization_enabled()
+                and not n.is_all_weights_candidates_equal()
+                and (not n.reuse or include_reused_nodes)]
 
     def get_activation_configurable_nodes(self) -> List[BaseNode]:
         """
@@ -563,8 +800,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         Returns:
             A list of nodes that their activation can be configured (namely, has one or more activation qc candidate).
         """
-        return list(filter(lambda n: n.is_activation_quantization_enabled()
-                                     and not n.is_all_activation_candidates_equal(), list(self)))
+        return self._get_sorted_activation_configurable_nodes()
 
     def get_sorted_activation_configurable_nodes(self) -> List[BaseNode]:
         """
@@ -575,7 +811,15 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             A list of nodes that their activation can be configured (namely, has one or more activation qc candidate)
             sorted topologically.
         """
-        return self._sort_nodes_in_list(self.get_activation_configurable_nodes())
+        return self._get_sorted_activation_configurable_nodes()
+
+    def _get_sorted_activation_configurable_nodes(self) -> List[BaseNode]:
+        """
+        Returns: The topologically sorted list of nodes that their activation can be configured.
+        """
+        return [n for n in self._get_topo_sorted_nodes()
+                if n.is_activation_quantization_enabled()
+                and not n.is_all_activation_candidates_equal()]
 
     def get_configurable_sorted_nodes(self,
                                       include_reused_nodes: bool = False) -> List[BaseNode]:
@@ -591,8 +835,22 @@ class Graph(nx.MultiDiGraph, GraphSearches):
              A list of nodes that can be configured (namely, has one or more qc candidate) sorted topology.
 
         """
-        weights_configurable_nodes = self.get_weights_configurable_nodes(include_reused_nodes)
-        activation_configurable_nodes = self.get_activation_configurable_nodes()
+        return self._compute_configurable_sorted_nodes(include_reused_nodes)
+
+    def _compute_configurable_sorted_nodes(self,
+                                           include_reused_nodes: bool = False) -> List[BaseNode]:
+        """
+        Compute the list of nodes that can be configured, sorted according to the topological order of the graph.
+
+        Args:
+            include_reused_nodes: Whether or not to include reused nodes (False by default).
+
+        Returns:
+             A list of nodes that can be configured (namely, has one or more qc candidate) sorted topology.
+
+        """
+        weights_configurable_nodes = self._get_sorted_weights_configurable_nodes(include_reused_nodes)
+        activation_configurable_nodes = self._get_sorted_activation_configurable_nodes()
 
         # combine and remove duplications
         configurable_nodes = list(set(weights_configurable_nodes + activation_configurable_nodes))
@@ -609,12 +867,8 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         Returns: nodes_list sorted topologically.
 
         """
-        sorted_configurable_nodes = []
-        sorted_nodes = list(topological_sort(self))
-        for n in sorted_nodes:
-            if n in nodes_list:
-                sorted_configurable_nodes.append(n)
-        return sorted_configurable_nodes
+        topo_node_index = self._get_topo_node_index()
+        return sorted({n for n in nodes_list if n in topo_node_index}, key=lambda n: topo_node_index[n])
 
     def get_min_candidates_config(self) -> List[int]:
         """
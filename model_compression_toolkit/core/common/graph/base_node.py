@@ -20,6 +20,8 @@ import numpy as np
 
 from model_compression_toolkit.constants import WEIGHTS_NBITS_ATTRIBUTE, CORRECTED_BIAS_ATTRIBUTE, \
     ACTIVATION_NBITS_ATTRIBUTE
+from model_compression_toolkit.core.common.quantization.compact_weights import compact_quantized_weights, \
+    get_weights_array
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationConfigOptions, \
     TargetPlatformCapabilities, LayerFilterParams
@@ -50,7 +52,8 @@ class BaseNode:
             framework_attr: Framework attributes the layer had which the node holds.
             input_shape: Input tensor shape of the node.
             output_shape: Input tensor shape of the node.
-            weights: Dictionary from a variable name to the weights with that name in the layer the node represents.
+            weights: Dictionary from a variable name to the weights with that name in the layer the node represents
+                (quantized weights may be held in a compact form, see compact_quantized_weights_by_keys).
             layer_class: Class path of the layer this node represents.
             reuse: Whether this node was duplicated and represents a reused layer.
             reuse_group: Name of group of nodes from the same reused layer.
@@ -141,7 +144,7 @@ class BaseNode:
 
         res = [k for k in self.weights.keys() if name in k]
         if len(res) == 1:  # Make sure there are no duplicates
-            return self.weights[res[0]]
+            return get_weights_array(self.weights[res[0]])
         else:
             return None
 
@@ -162,13 +165,37 @@ class BaseNode:
             self.weights[name] = tensor
             self.weights_keys = list(self.weights.keys())  # update keys
 
+    def compact_quantized_weights_by_keys(self, name: str):
+        """
+        Store a quantized weight of the node in a compact form of integer codes of its per-channel quantization
+        levels (if it is smaller than the weight). The weight is dequantized when it is read.
+
+        Args:
+            name: Name of the quantized weight the node holds.
+
+        """
+
+        res = [k for k in self.weights.keys() if name in k]
+        if len(res) == 1 and self.weights[res[0]] is not None:
+            weights_qc = self.final_weights_quantization_cfg
+            channels_axis = weights_qc.weights_channels_axis if weights_qc.weights_per_channel_threshold else None
+            self.weights[res[0]] = compact_quantized_weights(get_weights_array(self.weights[res[0]]), channels_axis)
+
     def get_weights_list(self):
         """
 
         Returns: A list of all weights the node holds.
 
         """
-        return [self.weights[k] for k in self.weights.keys() if self.weights[k] is not None]
+        return [get_weights_array(self.weights[k]) for k in self.weights.keys() if self.weights[k] is not None]
+
+    def get_weights_dict(self) -> Dict[str, np.ndarray]:
+        """
+
+        Returns: A dictionary from a variable name to the weight with that name that the node holds.
+
+        """
+        return {k: get_weights_array(w) for k, w in self.weights.items()}
 
     def get_num_parameters(self, fw_info) -> Tuple[int,int]:
         """
@@ -182,7 +209,7 @@ class BaseNode:
             A tuple of (Number of quantized parameters, number of float parameters).
 
         """
-        total_node_params = np.sum([w.flatten().shape[0] for w in self.weights.values() if w is not None])
+        total_node_params = np.sum([w.size for w in self.weights.values() if w is not None])
 
         q_node_num_params = 0
 
@@ -448,12 +475,7 @@ class BaseNode:
         if tpc is None:
             Logger.error(f'Can not retrieve QC options for None TPC')  # pragma: no cover
 
-        for fl, qco in tpc.filterlayer2qco.items():
-            if self.is_match_filter_params(fl):
-                return qco
-        if self.type in tpc.layer2qco:
-            return tpc.layer2qco.get(self.type)
-        return tpc.tp_model.default_qco
+        return tpc.qco_resolver.resolve(self)
 
 
     def is_match_filter_params(self, layer_filter_params: LayerFilterParams) -> bool:
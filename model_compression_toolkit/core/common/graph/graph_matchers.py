@@ -14,7 +14,7 @@
 # ==============================================================================
 
 
-from typing import Any, List
+from typing import Any, List, Optional, Set
 
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
 from model_compression_toolkit.core.common.matchers import node_matcher, walk_matcher, edge_matcher
@@ -50,6 +50,13 @@ class NodeOperationMatcher(node_matcher.BaseNodeMatcher):
         if input_node_object.type == self.operation:
             return True
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        """
+        Returns:
+            The operation the matcher matches.
+        """
+        return {self.operation}
+
 
 class NodeFrameworkAttrMatcher(node_matcher.BaseNodeMatcher):
     """
@@ -27,39 +27,41 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
     The graph needs to have 'nodes' and 'edges' attributes, and a 'get_next_nodes' method.
     """
 
-    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher) -> list:
+    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher, nodes: List[BaseNode] = None) -> list:
         """
         Iterate over nodes and returns the nodes in the graph that matches the matcher object.
 
         Args:
             node_matcher: Matcher object to apply on nodes in the graph.
+            nodes: Nodes to match (all the nodes in the graph if None).
 
         Returns:
             List of nodes that match the node_matcher.
         """
 
-        return [n for n in self.nodes if node_matcher.apply(n)]
+        return [n for n in (self.nodes if nodes is None else nodes) if node_matcher.apply(n)]
 
-    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher) -> list:
+    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher, nodes: List[BaseNode] = None) -> list:
         """
         Iterate over edges and returns the edges in the graph that matches
         the edge_matcher object.
 
         Args:
             edge_matcher: Matcher object to apply on edge.
+            nodes: Source nodes of the edges to match (all the nodes in the graph if None).
 
         Returns:
             List of edges that match.
         """
 
         edge_list = []
-        for e in self.edges:
+        for e in (self.edges if nodes is None else self.edges(nodes, keys=True)):
             if edge_matcher.apply(e) and len(self.edges(e[0])):
                 edge_list.append(e)
 
         return edge_list
 
-    def _walk_filter(self, walk_matcher: WalkMatcherList) -> List[BaseNode]:
+    def _walk_filter(self, walk_matcher: WalkMatcherList, nodes: List[BaseNode] = None) -> List[BaseNode]:
         """
         Search for a list of nodes which match the list in walk_matcher.
         If one the nodes in the list (that was found in the graph) has more than one output,
@@ -67,6 +69,7 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
 
         Args:
             walk_matcher: WalkMatcherList with a list of nodes to match.
+            nodes: First nodes of the lists to match (all the nodes in the graph if None).
 
         Returns:
             A list of nodes which match the list in walk_matcher.
@@ -115,8 +118,9 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
             walk_matcher]
         result = []
 
-        # Walk the entire graph, node by node
-        result_match_list = [walk_match(n, [], 0, matcher_list) for n in self.nodes if len(self.get_next_nodes(n)) == 1]
+        # Walk the entire graph (or the given nodes), node by node
+        result_match_list = [walk_match(n, [], 0, matcher_list) for n in (self.nodes if nodes is None else nodes)
+                             if len(self.get_next_nodes(n)) == 1]
         # Flatten lists
         result.extend([r for r_list in result_match_list if r_list is not None for r in r_list])
         return result
@@ -0,0 +1,127 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List, Dict
+
+import numpy as np
+
+from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.integer_executor.integer_tensor import IntegerTensor, \
+    get_activation_integer_params
+from model_compression_toolkit.logger import Logger
+
+
+class IntegerGraphExecutor:
+    """
+    Reference executor of a quantized graph with integer arithmetic: the nodes are run on integer tensors with
+    vectorized NumPy kernels, and their outputs are requantized with fixed-point multipliers according to the final
+    quantization configurations of the nodes (without running the model in its framework).
+    """
+
+    def __init__(self,
+                 graph: Graph,
+                 fw_impl: FrameworkImplementation,
+                 fw_info: FrameworkInfo,
+                 round_half_to_even: bool = True):
+        """
+        Args:
+            graph: Quantized graph (with final quantization configurations) to execute.
+            fw_impl: FrameworkImplementation of the graph's framework (to map its nodes to integer operations).
+            fw_info: Framework information of the graph's framework.
+            round_half_to_even: Whether the outputs of the nodes are rounded with ties to even, as done by PyTorch's
+            fake-quantization (otherwise ties are rounded up, as done by TensorFlow's fake-quantization).
+        """
+        self.graph = graph
+        self.nodes = graph.get_topo_sorted_nodes()
+        self.input_nodes = graph.get_inputs()
+        self.output_nodes = [o.node for o in graph.get_outputs()]
+
+        self.ops = {}
+        self.output_params = {}
+        self.node_inputs = {}
+        self.num_consumers = {n: 0 for n in self.nodes}
+        for n in self.nodes:
+            self.output_params[n] = get_activation_integer_params(n.final_activation_quantization_cfg,
+                                                                  round_half_to_even) \
+                if n.is_activation_quantization_enabled() else None
+            if n in self.input_nodes:
+                if self.output_params[n] is None:
+                    Logger.critical(f'The integer executor requires the activation of input node {n.name} to be '
+                                    f'quantized.')
+                continue
+            in_edges = graph.incoming_edges(n, sort_by_attr=EDGE_SINK_INDEX)
+            if any([e.source_index != 0 for e in in_edges]):
+                Logger.critical(f'The integer executor does not support nodes with multiple outputs, but node '
+                                f'{n.name} has inputs from them.')
+            self.node_inputs[n] = [e.source_node for e in in_edges]
+            for source_node in self.node_inputs[n]:
+                self.num_consumers[source_node] += 1
+            self.ops[n] = fw_impl.get_integer_op(n, fw_info)
+        for n in self.output_nodes:
+            self.num_consumers[n] += 1
+
+        self.weights_bytes = sum([op.weights_bytes for op in self.ops.values()])
+        self.peak_activation_bytes = 0
+        self.activation_traffic_bytes = 0
+
+    def __call__(self,
+                 inputs: List[np.ndarray],
+                 return_integers: bool = False) -> List[np.ndarray]:
+        """
+        Run the graph on a batch of inputs. After the run, peak_activation_bytes holds the maximal size of the
+        activations that were alive together, and activation_traffic_bytes the size of the activations that the nodes
+        read and wrote (both with the number of bits of the quantized activations, and 32 bits for accumulators).
+
+        Args:
+            inputs: Float inputs of the graph (in the order of its input nodes).
+            return_integers: Whether to return the integer outputs (IntegerTensor) instead of their real values.
+
+        Returns:
+            The outputs of the graph (in the order of its output nodes).
+        """
+        if len(inputs) != len(self.input_nodes):
+            Logger.critical(f'The graph has {len(self.input_nodes)} inputs, but got {len(inputs)} '
+                            f'inputs.')  # pragma: no cover
+
+        tensors: Dict[BaseNode, IntegerTensor] = {}
+        remaining_consumers = dict(self.num_consumers)
+        live_bytes, peak_bytes, traffic_bytes = 0, 0, 0
+        for n, x in zip(self.input_nodes, inputs):
+            tensors[n] = IntegerTensor.from_float(x, self.output_params[n])
+            live_bytes += tensors[n].device_bytes
+        peak_bytes = live_bytes
+
+        for n in self.nodes:
+            if n in self.input_nodes:
+                continue
+            node_inputs = [tensors[source_node] for source_node in self.node_inputs[n]]
+            tensors[n] = self.ops[n](node_inputs, self.output_params[n])
+            output_bytes = tensors[n].device_bytes
+            traffic_bytes += output_bytes + sum([x.device_bytes for x in node_inputs])
+            live_bytes += output_bytes
+            peak_bytes = max(peak_bytes, live_bytes)
+            # Free the inputs that have no other consumers.
+            for source_node in self.node_inputs[n]:
+                remaining_consumers[source_node] -= 1
+                if remaining_consumers[source_node] == 0:
+                    live_bytes -= tensors.pop(source_node).device_bytes
+
+        self.peak_activation_bytes = peak_bytes
+        self.activation_traffic_bytes = traffic_bytes
+        outputs = [tensors[n] for n in self.output_nodes]
+        return outputs if return_integers else [o.dequantize() for o in outputs]
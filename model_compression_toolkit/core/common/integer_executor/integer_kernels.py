@@ -0,0 +1,267 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Tuple, List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from model_compression_toolkit.logger import Logger
+
+# Number of bits of the mantissas of fixed-point multipliers.
+MULTIPLIER_BITS = 31
+
+# Float64 represents every integer up to 2^53 exactly.
+FLOAT64_EXACT_INT_LIMIT = 2 ** 53
+
+
+def quantize_multiplier(multiplier: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Represent positive real multipliers as fixed-point numbers: multiplier ~= mantissa * 2^-shift, where the
+    mantissa is a 31-bit integer (as done by integer inference engines for requantization).
+
+    Args:
+        multiplier: A positive real multiplier, or an array of them.
+
+    Returns:
+        The integer mantissas and the right shifts of the multipliers.
+    """
+    mantissa, exponent = np.frexp(np.asarray(multiplier, dtype=np.float64))
+    mantissa = np.round(mantissa * 2 ** MULTIPLIER_BITS).astype(np.int64)
+    # Rounding the mantissa up to 2^31 is represented by a mantissa of 2^30 with a larger exponent.
+    overflow = mantissa == 2 ** MULTIPLIER_BITS
+    mantissa = np.where(overflow, mantissa // 2, mantissa)
+    exponent = np.where(overflow, exponent + 1, exponent)
+    shift = MULTIPLIER_BITS - exponent.astype(np.int64)
+    if np.any(shift < 1) or np.any(shift > 62):
+        Logger.critical(f'Requantization multipliers must be in the range [2^-31, 2^30], but got multipliers in the '
+                        f'range [{np.min(multiplier)}, {np.max(multiplier)}].')  # pragma: no cover
+    return mantissa, shift
+
+
+def multiply_by_quantized_multiplier(x: np.ndarray,
+                                     mantissa: np.ndarray,
+                                     shift: np.ndarray,
+                                     round_half_to_even: bool = True) -> np.ndarray:
+    """
+    Multiply integers by fixed-point multipliers, rounding the results to the nearest integer. Ties are frequent
+    when the scales are powers of two, so they are rounded as the fake-quantization that is simulated rounds them.
+
+    Args:
+        x: Integers to multiply (their products with the mantissas must fit in 63 bits).
+        mantissa: Mantissas of the multipliers (broadcast against x).
+        shift: Right shifts of the multipliers (broadcast against x).
+        round_half_to_even: Whether to round ties to even (otherwise they are rounded up).
+
+    Returns:
+        The rounded products.
+    """
+    product = x * mantissa
+    half = np.int64(1) << (shift - 1)
+    if not round_half_to_even:
+        return (product + half) >> shift
+    floor = product >> shift
+    remainder = product - (floor << shift)
+    return floor + ((remainder > half) | ((remainder == half) & (floor & 1 == 1)))
+
+
+def requantize(x: np.ndarray,
+               multiplier: Any,
+               round_half_to_even: bool = True) -> np.ndarray:
+    """
+    Multiply integers by real multipliers using fixed-point arithmetic.
+
+    Args:
+        x: Integers to multiply (as an int64 array).
+        multiplier: A positive real multiplier, or an array of them that broadcasts against x.
+        round_half_to_even: Whether to round ties to even (otherwise they are rounded up).
+
+    Returns:
+        The rounded products.
+    """
+    mantissa, shift = quantize_multiplier(multiplier)
+    return multiply_by_quantized_multiplier(x, mantissa, shift, round_half_to_even)
+
+
+def int_matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Multiply integer matrices exactly. When the products cannot exceed 2^53 the product is computed with the float64
+    BLAS GEMM, which represents all the partial sums exactly (the same results as an int32 GEMM, much faster than
+    NumPy's integer matmul that does not use BLAS). Otherwise, it is computed with an int64 matmul.
+
+    Args:
+        a: Integer array of shape [..., M, K].
+        b: Integer array of shape [..., K, N].
+
+    Returns:
+        The integer product of shape [..., M, N] (as an int64 array).
+    """
+    if a.size == 0 or b.size == 0:
+        return np.matmul(a, b).astype(np.int64)
+    bound = float(np.max(np.abs(a))) * float(np.max(np.abs(b))) * a.shape[-1]
+    if bound < FLOAT64_EXACT_INT_LIMIT:
+        return np.matmul(a.astype(np.float64), b.astype(np.float64)).astype(np.int64)
+    return np.matmul(a.astype(np.int64), b.astype(np.int64))  # pragma: no cover
+
+
+def get_same_padding(input_size: int,
+                     kernel_size: int,
+                     stride: int,
+                     dilation: int = 1) -> Tuple[int, int]:
+    """
+    Compute the padding of a "same" padded window operation (more padding after the input when the total padding
+    is odd, as done by TensorFlow).
+
+    Args:
+        input_size: Size of the input along the dimension.
+        kernel_size: Size of the window along the dimension.
+        stride: Stride along the dimension.
+        dilation: Dilation along the dimension.
+
+    Returns:
+        The padding before and after the input.
+    """
+    output_size = -(-input_size // stride)
+    total = max((output_size - 1) * stride + (kernel_size - 1) * dilation + 1 - input_size, 0)
+    return total // 2, total - total // 2
+
+
+def pad_nhwc(x: np.ndarray,
+             padding: List[Tuple[int, int]],
+             value: int = 0) -> np.ndarray:
+    """
+    Args:
+        x: Input of shape [N, H, W, C].
+        padding: Padding before and after the input along the height and the width.
+        value: Value to pad with.
+
+    Returns:
+        The padded input.
+    """
+    if not any(p for pads in padding for p in pads):
+        return x
+    return np.pad(x, [(0, 0), padding[0], padding[1], (0, 0)], constant_values=value)
+
+
+def extract_patches(x: np.ndarray,
+                    kernel_size: Tuple[int, int],
+                    strides: Tuple[int, int],
+                    dilations: Tuple[int, int] = (1, 1)) -> np.ndarray:
+    """
+    Extract the (strided, dilated) windows of an input as a view, without copying it.
+
+    Args:
+        x: Padded input of shape [N, H, W, C].
+        kernel_size: Window size (height, width).
+        strides: Strides (height, width).
+        dilations: Dilations (height, width).
+
+    Returns:
+        A view of the windows, of shape [N, H_out, W_out, C, kernel height, kernel width].
+    """
+    window = ((kernel_size[0] - 1) * dilations[0] + 1, (kernel_size[1] - 1) * dilations[1] + 1)
+    patches = sliding_window_view(x, window, axis=(1, 2))
+    return patches[:, ::strides[0], ::strides[1], :, ::dilations[0], ::dilations[1]]
+
+
+def conv2d_nhwc(x: np.ndarray,
+                kernel: np.ndarray,
+                strides: Tuple[int, int],
+                padding: List[Tuple[int, int]],
+                dilations: Tuple[int, int] = (1, 1),
+                groups: int = 1) -> np.ndarray:
+    """
+    Integer 2D convolution. Grouped convolutions are computed with im2col and a GEMM per group, and depthwise
+    convolutions (a single input channel per group) are computed with a vectorized multiply-accumulate per kernel
+    position.
+
+    Args:
+        x: Integer input of shape [N, H, W, C_in] (relative to its zero point).
+        kernel: Integer kernel of shape [kernel height, kernel width, C_in / groups, C_out].
+        strides: Strides (height, width).
+        padding: Padding before and after the input along the height and the width.
+        dilations: Dilations (height, width).
+        groups: Number of groups.
+
+    Returns:
+        The int64 accumulators of shape [N, H_out, W_out, C_out].
+    """
+    kh, kw, group_in, c_out = kernel.shape
+    group_out = c_out // groups
+    x = pad_nhwc(x, padding)
+    patches = extract_patches(x, (kh, kw), strides, dilations)
+    n, h_out, w_out = patches.shape[:3]
+
+    if group_in == 1 and groups > 1:
+        # Depthwise: each output channel accumulates a single input channel over the kernel positions.
+        acc = np.zeros((n, h_out, w_out, c_out), dtype=np.int64)
+        channel_index = np.arange(c_out) // group_out
+        for i in range(kh):
+            for j in range(kw):
+                acc += patches[..., i, j][..., channel_index] * kernel[i, j, 0]
+        return acc
+
+    outputs = []
+    for g in range(groups):
+        group_patches = patches[:, :, :, g * group_in:(g + 1) * group_in]
+        # im2col: [N * H_out * W_out, kernel height * kernel width * C_in / groups]
+        cols = np.ascontiguousarray(group_patches.transpose(0, 1, 2, 4, 5, 3)).reshape(n * h_out * w_out, -1)
+        group_kernel = kernel[..., g * group_out:(g + 1) * group_out].reshape(-1, group_out)
+        outputs.append(int_matmul(cols, group_kernel).reshape(n, h_out, w_out, group_out))
+    return outputs[0] if groups == 1 else np.concatenate(outputs, axis=-1)
+
+
+def max_pool2d_nhwc(x: np.ndarray,
+                    pool_size: Tuple[int, int],
+                    strides: Tuple[int, int],
+                    padding: List[Tuple[int, int]],
+                    pad_value: int) -> np.ndarray:
+    """
+    Args:
+        x: Integer input of shape [N, H, W, C].
+        pool_size: Window size (height, width).
+        strides: Strides (height, width).
+        padding: Padding before and after the input along the height and the width.
+        pad_value: Value to pad with (smaller than all the input values).
+
+    Returns:
+        The maximum of each window, of shape [N, H_out, W_out, C].
+    """
+    patches = extract_patches(pad_nhwc(x, padding, pad_value), pool_size, strides)
+    return patches.max(axis=(-2, -1))
+
+
+def sum_pool2d_nhwc(x: np.ndarray,
+                    pool_size: Tuple[int, int],
+                    strides: Tuple[int, int],
+                    padding: List[Tuple[int, int]],
+                    count_include_pad: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Args:
+        x: Integer input of shape [N, H, W, C] (relative to its zero point).
+        pool_size: Window size (height, width).
+        strides: Strides (height, width).
+        padding: Padding before and after the input along the height and the width.
+        count_include_pad: Whether padded elements are counted in the average of a window.
+
+    Returns:
+        The sum of each window, of shape [N, H_out, W_out, C], and the number of elements to average each
+        window by, of shape [1, H_out, W_out, 1].
+    """
+    sums = extract_patches(pad_nhwc(x, padding), pool_size, strides).sum(axis=(-2, -1))
+    if count_include_pad:
+        return sums, np.full((1, 1, 1, 1), pool_size[0] * pool_size[1], dtype=np.int64)
+    ones = np.ones((1,) + x.shape[1:3] + (1,), dtype=np.int64)
+    counts = extract_patches(pad_nhwc(ones, padding), pool_size, strides).sum(axis=(-2, -1))
+    return sums, counts
@@ -0,0 +1,532 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, List, Tuple, Union
+
+import numpy as np
+from scipy.special import erf
+
+from model_compression_toolkit.core.common.integer_executor.integer_kernels import requantize, conv2d_nhwc, \
+    int_matmul, get_same_padding, max_pool2d_nhwc, sum_pool2d_nhwc
+from model_compression_toolkit.core.common.integer_executor.integer_tensor import IntegerTensor, \
+    IntegerQuantizationParams
+from model_compression_toolkit.logger import Logger
+
+# Number of fractional bits that are added to the inputs of additions and concatenations before they are rescaled
+# to a common scale.
+RESCALE_FRACTIONAL_BITS = 20
+
+SAME = 'same'
+VALID = 'valid'
+
+
+def finalize_accumulator(acc: np.ndarray,
+                         acc_scale: Any,
+                         output_params: IntegerQuantizationParams,
+                         lower_bound: float = None,
+                         upper_bound: float = None) -> IntegerTensor:
+    """
+    Requantize an accumulator to the quantization params of an output, and clip it to the bounds of an activation
+    that follows the accumulation (such as ReLU). Clipping after requantization gives the same results as applying
+    the activation before a fake-quantization of the output.
+
+    Args:
+        acc: Integer accumulator (int64 array).
+        acc_scale: Scale of the accumulator (a scalar or an array that broadcasts against it).
+        output_params: Quantization params of the output, or None to keep the accumulator.
+        lower_bound: Real lower bound of the output (None for no lower bound).
+        upper_bound: Real upper bound of the output (None for no upper bound).
+
+    Returns:
+        The output tensor.
+    """
+    if output_params is None:
+        if lower_bound is not None:
+            acc = np.maximum(acc, np.round(lower_bound / np.asarray(acc_scale)).astype(np.int64))
+        if upper_bound is not None:
+            acc = np.minimum(acc, np.round(upper_bound / np.asarray(acc_scale)).astype(np.int64))
+        return IntegerTensor(acc, acc_scale)
+
+    q_min, q_max = output_params.q_min, output_params.q_max
+    if lower_bound is not None:
+        q_min = max(q_min, int(np.round(lower_bound / output_params.scale)) + output_params.zero_point)
+    if upper_bound is not None:
+        q_max = min(q_max, int(np.round(upper_bound / output_params.scale)) + output_params.zero_point)
+    values = requantize(acc, np.asarray(acc_scale) / output_params.scale, output_params.round_half_to_even) + \
+        output_params.zero_point
+    return IntegerTensor(np.clip(values, q_min, q_max), output_params.scale, output_params.zero_point, output_params)
+
+
+def rescale(x: IntegerTensor, output_params: IntegerQuantizationParams) -> IntegerTensor:
+    """
+    Args:
+        x: Input tensor.
+        output_params: Quantization params of the output, or None to keep the input's quantization.
+
+    Returns:
+        The input tensor, requantized to the output params (if they differ from its params).
+    """
+    if output_params is None or (x.is_quantized and _same_params(x.quantization_params, output_params)):
+        return x
+    return finalize_accumulator(x.centered_values(), x.scale, output_params)
+
+
+def _same_params(a: IntegerQuantizationParams, b: IntegerQuantizationParams) -> bool:
+    return a.scale == b.scale and a.zero_point == b.zero_point and a.q_min == b.q_min and a.q_max == b.q_max
+
+
+def _check_scalar_scale(x: IntegerTensor, op_name: str):
+    if np.ndim(x.scale) > 0:
+        Logger.critical(f'{op_name} requires an input with a single scale, but got an accumulator with a scale per '
+                        f'channel. Quantize the activation of the node that precedes it.')
+
+
+def _to_pairs(x: Union[int, Tuple, List]) -> Tuple[int, int]:
+    return (x, x) if isinstance(x, int) else tuple(x)
+
+
+class IntegerOp:
+    """
+    Base class of the operations of the integer executor. An operation gets its integer input tensors and the
+    quantization params of its output (None when the output's activation is not quantized, in which case the
+    operation returns an accumulator).
+    """
+
+    # Number of bytes of the operation's weights on a device.
+    weights_bytes = 0
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'__call__ method.')  # pragma: no cover
+
+
+class IntegerConv2D(IntegerOp):
+    """
+    Integer 2D convolution (including grouped and depthwise convolutions), with an optional bias and clipping
+    activation.
+    """
+
+    def __init__(self,
+                 kernel: np.ndarray,
+                 kernel_scale: np.ndarray,
+                 kernel_n_bits: int,
+                 bias: np.ndarray = None,
+                 strides: Union[int, Tuple[int, int]] = 1,
+                 padding: Union[str, Tuple[Tuple[int, int], Tuple[int, int]]] = VALID,
+                 dilations: Union[int, Tuple[int, int]] = 1,
+                 groups: int = 1,
+                 channels_first: bool = False,
+                 lower_bound: float = None,
+                 upper_bound: float = None):
+        """
+        Args:
+            kernel: Integer kernel of shape [kernel height, kernel width, C_in / groups, C_out].
+            kernel_scale: Scale of each output channel of the kernel, of shape [C_out].
+            kernel_n_bits: Number of bits of the kernel.
+            bias: Float bias of shape [C_out] (or None).
+            strides: Strides (height, width).
+            padding: 'same', 'valid' or the padding before and after the input along the height and the width.
+            dilations: Dilations (height, width).
+            groups: Number of groups.
+            channels_first: Whether the inputs and outputs are in the NCHW layout (otherwise NHWC).
+            lower_bound: Real lower bound of the output (None for no lower bound).
+            upper_bound: Real upper bound of the output (None for no upper bound).
+        """
+        self.kernel = kernel
+        self.kernel_scale = np.asarray(kernel_scale, dtype=np.float64)
+        self.bias = bias
+        self.strides = _to_pairs(strides)
+        self.padding = padding
+        self.dilations = _to_pairs(dilations)
+        self.groups = groups
+        self.channels_first = channels_first
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.weights_bytes = int(np.ceil(kernel.size * kernel_n_bits / 8))
+
+    def _get_padding(self, input_shape: Tuple) -> List[Tuple[int, int]]:
+        if self.padding == SAME:
+            return [get_same_padding(input_shape[i + 1], self.kernel.shape[i], self.strides[i], self.dilations[i])
+                    for i in range(2)]
+        if self.padding == VALID:
+            return [(0, 0), (0, 0)]
+        return [_to_pairs(p) for p in self.padding]
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        _check_scalar_scale(x, self.__class__.__name__)
+        values = x.centered_values()
+        if self.channels_first:
+            values = values.transpose(0, 2, 3, 1)
+        acc = conv2d_nhwc(values, self.kernel, self.strides, self._get_padding(values.shape), self.dilations,
+                          self.groups)
+        acc_scale = x.scale * self.kernel_scale
+        if self.bias is not None:
+            acc += np.round(self.bias / acc_scale).astype(np.int64)
+        if self.channels_first:
+            acc = acc.transpose(0, 3, 1, 2)
+            acc_scale = acc_scale.reshape(-1, 1, 1)
+        return finalize_accumulator(acc, acc_scale, output_params, self.lower_bound, self.upper_bound)
+
+
+class IntegerDense(IntegerOp):
+    """
+    Integer fully-connected layer (applied on the last axis of its input), with an optional bias and clipping
+    activation.
+    """
+
+    def __init__(self,
+                 kernel: np.ndarray,
+                 kernel_scale: np.ndarray,
+                 kernel_n_bits: int,
+                 bias: np.ndarray = None,
+                 lower_bound: float = None,
+                 upper_bound: float = None):
+        """
+        Args:
+            kernel: Integer kernel of shape [C_in, C_out].
+            kernel_scale: Scale of each output channel of the kernel, of shape [C_out].
+            kernel_n_bits: Number of bits of the kernel.
+            bias: Float bias of shape [C_out] (or None).
+            lower_bound: Real lower bound of the output (None for no lower bound).
+            upper_bound: Real upper bound of the output (None for no upper bound).
+        """
+        self.kernel = kernel
+        self.kernel_scale = np.asarray(kernel_scale, dtype=np.float64)
+        self.bias = bias
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.weights_bytes = int(np.ceil(kernel.size * kernel_n_bits / 8))
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        _check_scalar_scale(x, self.__class__.__name__)
+        values = x.centered_values()
+        acc = int_matmul(values.reshape(-1, values.shape[-1]), self.kernel)
+        acc = acc.reshape(values.shape[:-1] + (self.kernel.shape[1],))
+        acc_scale = x.scale * self.kernel_scale
+        if self.bias is not None:
+            acc += np.round(self.bias / acc_scale).astype(np.int64)
+        return finalize_accumulator(acc, acc_scale, output_params, self.lower_bound, self.upper_bound)
+
+
+def _rescale_to_common_scale(inputs: List[IntegerTensor]) -> Tuple[List[np.ndarray], float]:
+    """
+    Rescale integer tensors to a common scale with fixed-point arithmetic (as done by integer inference engines):
+    the inputs are shifted left to add fractional bits and multiplied by the ratio of their scales and twice the
+    largest scale. Fewer fractional bits are added to large accumulators, so the shifted values fit in 31 bits.
+
+    Args:
+        inputs: Tensors to rescale.
+
+    Returns:
+        The rescaled values and their common scale.
+    """
+    values = [x.centered_values() for x in inputs]
+    max_abs = max([int(np.max(np.abs(v))) if v.size > 0 else 0 for v in values])
+    fractional_bits = int(np.clip(30 - max_abs.bit_length(), 0, RESCALE_FRACTIONAL_BITS))
+    twice_max_scale = 2 * max([np.max(x.scale) for x in inputs])
+    rescaled = [requantize(v << fractional_bits, np.asarray(x.scale) / twice_max_scale)
+                for v, x in zip(values, inputs)]
+    return rescaled, twice_max_scale / 2 ** fractional_bits
+
+
+class IntegerAdd(IntegerOp):
+    """
+    Integer element-wise addition (or subtraction) of tensors with different scales.
+    """
+
+    def __init__(self, subtract: bool = False):
+        """
+        Args:
+            subtract: Whether to subtract the second input from the first one.
+        """
+        self.subtract = subtract
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        rescaled, scale = _rescale_to_common_scale(inputs)
+        acc = rescaled[0] - rescaled[1] if self.subtract else sum(rescaled)
+        return finalize_accumulator(acc, scale, output_params)
+
+
+class IntegerConcat(IntegerOp):
+    """
+    Integer concatenation of tensors with different scales.
+    """
+
+    def __init__(self, axis: int):
+        """
+        Args:
+            axis: Axis to concatenate the tensors along.
+        """
+        self.axis = axis
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        if output_params is not None:
+            inputs = [rescale(x, output_params) for x in inputs]
+            return IntegerTensor(np.concatenate([x.values for x in inputs], axis=self.axis),
+                                 output_params.scale, output_params.zero_point, output_params)
+        rescaled, scale = _rescale_to_common_scale(inputs)
+        return IntegerTensor(np.concatenate(rescaled, axis=self.axis), scale)
+
+
+class IntegerMaxPool2D(IntegerOp):
+    """
+    Integer 2D max pooling (the maximum of quantized values is the quantized maximum, so it is computed directly on
+    the quantized values).
+    """
+
+    def __init__(self,
+                 pool_size: Union[int, Tuple[int, int]],
+                 strides: Union[int, Tuple[int, int]],
+                 padding: Union[str, Tuple[Tuple[int, int], Tuple[int, int]]] = VALID,
+                 channels_first: bool = False):
+        """
+        Args:
+            pool_size: Window size (height, width).
+            strides: Strides (height, width).
+            padding: 'same', 'valid' or the padding before and after the input along the height and the width.
+            channels_first: Whether the inputs and outputs are in the NCHW layout (otherwise NHWC).
+        """
+        self.pool_size = _to_pairs(pool_size)
+        self.strides = _to_pairs(strides)
+        self.padding = padding
+        self.channels_first = channels_first
+
+    def _get_padding(self, input_shape: Tuple) -> List[Tuple[int, int]]:
+        if self.padding == SAME:
+            return [get_same_padding(input_shape[i + 1], self.pool_size[i], self.strides[i]) for i in range(2)]
+        if self.padding == VALID:
+            return [(0, 0), (0, 0)]
+        return [_to_pairs(p) for p in self.padding]
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        values = x.values.transpose(0, 2, 3, 1) if self.channels_first else x.values
+        values = max_pool2d_nhwc(values, self.pool_size, self.strides, self._get_padding(values.shape),
+                                 np.iinfo(np.int64).min)
+        if self.channels_first:
+            values = values.transpose(0, 3, 1, 2)
+        return rescale(IntegerTensor(values, x.scale, x.zero_point, x.quantization_params), output_params)
+
+
+class IntegerAvgPool2D(IntegerMaxPool2D):
+    """
+    Integer 2D average pooling: the sums of the windows are divided by the number of their elements in the
+    requantization.
+    """
+
+    def __init__(self,
+                 pool_size: Union[int, Tuple[int, int]],
+                 strides: Union[int, Tuple[int, int]],
+                 padding: Union[str, Tuple[Tuple[int, int], Tuple[int, int]]] = VALID,
+                 channels_first: bool = False,
+                 count_include_pad: bool = False):
+        """
+        Args:
+            pool_size: Window size (height, width).
+            strides: Strides (height, width).
+            padding: 'same', 'valid' or the padding before and after the input along the height and the width.
+            channels_first: Whether the inputs and outputs are in the NCHW layout (otherwise NHWC).
+            count_include_pad: Whether padded elements are counted in the average of a window.
+        """
+        super(IntegerAvgPool2D, self).__init__(pool_size, strides, padding, channels_first)
+        self.count_include_pad = count_include_pad
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        _check_scalar_scale(x, self.__class__.__name__)
+        values = x.centered_values()
+        values = values.transpose(0, 2, 3, 1) if self.channels_first else values
+        acc, counts = sum_pool2d_nhwc(values, self.pool_size, self.strides, self._get_padding(values.shape),
+                                      self.count_include_pad)
+        if self.channels_first:
+            acc, counts = acc.transpose(0, 3, 1, 2), counts.transpose(0, 3, 1, 2)
+        return finalize_accumulator(acc, x.scale / counts, output_params)
+
+
+class IntegerGlobalAvgPool(IntegerOp):
+    """
+    Integer average over axes of a tensor (such as global average pooling).
+    """
+
+    def __init__(self, axes: Tuple[int], keepdims: bool = False):
+        """
+        Args:
+            axes: Axes to average over.
+            keepdims: Whether to keep the averaged axes with size 1.
+        """
+        self.axes = tuple(axes)
+        self.keepdims = keepdims
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        _check_scalar_scale(x, self.__class__.__name__)
+        values = x.centered_values()
+        count = int(np.prod([values.shape[a] for a in self.axes]))
+        acc = values.sum(axis=self.axes, keepdims=self.keepdims)
+        return finalize_accumulator(acc, x.scale / count, output_params)
+
+
+class IntegerClipActivation(IntegerOp):
+    """
+    Integer piecewise-linear activation that clips its input (such as ReLU, ReLU6 and HardTanh, or the identity
+    when it has no bounds).
+    """
+
+    def __init__(self, lower_bound: float = None, upper_bound: float = None):
+        """
+        Args:
+            lower_bound: Real lower bound of the output (None for no lower bound).
+            upper_bound: Real upper bound of the output (None for no upper bound).
+        """
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        if output_params is None and self.lower_bound is None and self.upper_bound is None:
+            return x
+        return finalize_accumulator(x.centered_values(), x.scale, output_params, self.lower_bound,
+                                    self.upper_bound)
+
+
+class IntegerLUTActivation(IntegerOp):
+    """
+    Integer non-linear activation, computed with a lookup table from the quantized inputs to the quantized outputs.
+    An activation that is fused to the operation before it gets the operation's accumulator, which has too many
+    values for a table, so it is evaluated on the values of the accumulator (as done by a high-precision activation
+    unit).
+    """
+
+    def __init__(self, activation_fn: Callable):
+        """
+        Args:
+            activation_fn: NumPy function of the activation (of real values).
+        """
+        self.activation_fn = activation_fn
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        if output_params is None:
+            Logger.critical(f'{self.__class__.__name__} requires a quantized output.')
+        if not x.is_quantized:
+            return IntegerTensor.from_float(self.activation_fn(x.centered_values() * x.scale), output_params)
+        input_params = x.quantization_params
+        table = output_params.quantize(
+            self.activation_fn(input_params.scale *
+                               (np.arange(input_params.q_min, input_params.q_max + 1) - input_params.zero_point)))
+        return IntegerTensor(table[x.values - input_params.q_min], output_params.scale, output_params.zero_point,
+                             output_params)
+
+
+class IntegerReshape(IntegerOp):
+    """
+    Integer operation that only moves the values of its input (such as reshape, flatten and transpose), or the
+    identity.
+    """
+
+    def __init__(self, fn: Callable = None):
+        """
+        Args:
+            fn: Function that moves the values of an array (None for the identity).
+        """
+        self.fn = fn
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        if self.fn is not None:
+            _check_scalar_scale(x, self.__class__.__name__)
+            x = IntegerTensor(self.fn(x.values), x.scale, x.zero_point, x.quantization_params)
+        return rescale(x, output_params)
+
+
+class IntegerZeroPadding2D(IntegerOp):
+    """
+    Integer 2D zero padding (padded with the zero point of the quantized input).
+    """
+
+    def __init__(self,
+                 padding: Tuple[Tuple[int, int], Tuple[int, int]],
+                 channels_first: bool = False):
+        """
+        Args:
+            padding: Padding before and after the input along the height and the width.
+            channels_first: Whether the inputs and outputs are in the NCHW layout (otherwise NHWC).
+        """
+        self.padding = [_to_pairs(p) for p in padding]
+        self.channels_first = channels_first
+
+    def __call__(self,
+                 inputs: List[IntegerTensor],
+                 output_params: IntegerQuantizationParams) -> IntegerTensor:
+        x = inputs[0]
+        _check_scalar_scale(x, self.__class__.__name__)
+        pad_width = [(0, 0), (0, 0)] + self.padding if self.channels_first else [(0, 0)] + self.padding + [(0, 0)]
+        values = np.pad(x.values, pad_width, constant_values=x.zero_point)
+        return rescale(IntegerTensor(values, x.scale, x.zero_point, x.quantization_params), output_params)
+
+
+def sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-x))
+
+
+def swish(x: np.ndarray) -> np.ndarray:
+    return x * sigmoid(x)
+
+
+def hard_sigmoid(x: np.ndarray) -> np.ndarray:
+    return np.clip(x + 3, 0, 6) / 6
+
+
+def hard_swish(x: np.ndarray) -> np.ndarray:
+    return x * hard_sigmoid(x)
+
+
+def gelu(x: np.ndarray) -> np.ndarray:
+    return 0.5 * x * (1 + erf(x / np.sqrt(2)))
+
+
+def elu(x: np.ndarray, alpha: float = 1.0) -> np.ndarray:
+    return np.where(x > 0, x, alpha * np.expm1(np.minimum(x, 0)))
+
+
+def leaky_relu(x: np.ndarray, alpha: float) -> np.ndarray:
+    return np.where(x > 0, x, alpha * x)
+
+
+def softplus(x: np.ndarray) -> np.ndarray:
+    return np.logaddexp(0, x)
@@ -0,0 +1,230 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.constants import THRESHOLD, SIGNED, RANGE_MIN, RANGE_MAX
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.quantization.node_quantization_config import \
+    NodeActivationQuantizationConfig, NodeWeightsQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantize_node import get_quantized_kernel_by_weights_qc
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import calculate_delta, \
+    fix_range_to_include_zero
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+
+
+class IntegerQuantizationParams:
+    """
+    Parameters of a quantized tensor: its real values are scale * (q - zero_point), for integers q in
+    [q_min, q_max].
+    """
+
+    def __init__(self,
+                 scale: float,
+                 zero_point: int,
+                 q_min: int,
+                 q_max: int,
+                 n_bits: int,
+                 round_half_to_even: bool = True):
+        """
+        Args:
+            scale: Scale of the quantized values.
+            zero_point: Integer that represents the real value 0.
+            q_min: Minimal integer value.
+            q_max: Maximal integer value.
+            n_bits: Number of bits of the integer values.
+            round_half_to_even: Whether values are rounded with ties to even (as done by PyTorch's
+            fake-quantization), or with ties up (as done by TensorFlow's fake-quantization).
+        """
+        self.scale = scale
+        self.zero_point = zero_point
+        self.q_min = q_min
+        self.q_max = q_max
+        self.n_bits = n_bits
+        self.round_half_to_even = round_half_to_even
+
+    def quantize(self, x: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            x: Real values.
+
+        Returns:
+            The integers that represent the values (rounded to the nearest integer and clipped to the range).
+        """
+        x = np.asarray(x, dtype=np.float64) / self.scale
+        x = np.round(x) if self.round_half_to_even else np.floor(x + 0.5)
+        return np.clip(x + self.zero_point, self.q_min, self.q_max).astype(np.int64)
+
+
+class IntegerTensor:
+    """
+    A tensor of integers that represent real values: real = scale * (values - zero_point).
+
+    A quantized tensor (the output of a node whose activation is quantized) has a scalar scale and its
+    quantization params. An accumulator (such as the output of a convolution whose activation is not quantized) has
+    no quantization params, a zero point of 0 and a scale that may be an array that broadcasts against the values
+    (for example, a scale per output channel).
+    """
+
+    def __init__(self,
+                 values: np.ndarray,
+                 scale: Any,
+                 zero_point: int = 0,
+                 quantization_params: IntegerQuantizationParams = None):
+        """
+        Args:
+            values: Integer values (as an int64 array).
+            scale: Scale of the values: a scalar, or an array that broadcasts against the values.
+            zero_point: Integer that represents the real value 0.
+            quantization_params: Quantization params of a quantized tensor (None for accumulators).
+        """
+        self.values = values
+        self.scale = scale
+        self.zero_point = zero_point
+        self.quantization_params = quantization_params
+
+    @classmethod
+    def from_float(cls, x: np.ndarray, quantization_params: IntegerQuantizationParams):
+        """
+        Args:
+            x: Real values.
+            quantization_params: Quantization params to quantize the values with.
+
+        Returns:
+            A quantized tensor of the values.
+        """
+        return cls(quantization_params.quantize(x),
+                   quantization_params.scale,
+                   quantization_params.zero_point,
+                   quantization_params)
+
+    @property
+    def is_quantized(self) -> bool:
+        return self.quantization_params is not None
+
+    def centered_values(self) -> np.ndarray:
+        """
+        Returns:
+            The values relative to the zero point (so the real values are scale * centered values).
+        """
+        return self.values - self.zero_point if self.zero_point != 0 else self.values
+
+    def dequantize(self) -> np.ndarray:
+        """
+        Returns:
+            The real values of the tensor.
+        """
+        return (self.centered_values() * self.scale).astype(np.float32)
+
+    @property
+    def device_bytes(self) -> int:
+        """
+        Returns:
+            Number of bytes of the tensor on a device: quantized values are stored with their number of bits, and
+            accumulators as 32-bit integers.
+        """
+        n_bits = self.quantization_params.n_bits if self.is_quantized else 32
+        return int(np.ceil(self.values.size * n_bits / 8))
+
+
+def get_activation_integer_params(activation_cfg: NodeActivationQuantizationConfig,
+                                  round_half_to_even: bool = True) -> IntegerQuantizationParams:
+    """
+    Get the integer quantization params of a node's activation quantization configuration (as used by the
+    activations' fake-quantization).
+
+    Args:
+        activation_cfg: Activation quantization configuration of a node.
+        round_half_to_even: Whether values are rounded with ties to even (otherwise ties are rounded up).
+
+    Returns:
+        The quantization params of the node's output.
+    """
+    n_bits = activation_cfg.activation_n_bits
+    params = activation_cfg.activation_quantization_params
+    method = activation_cfg.activation_quantization_method
+    if method in [QuantizationMethod.POWER_OF_TWO, QuantizationMethod.SYMMETRIC]:
+        signed = params.get(SIGNED)
+        scale = calculate_delta(params.get(THRESHOLD), n_bits, signed)
+        if signed:
+            return IntegerQuantizationParams(float(scale), 0, -2 ** (n_bits - 1), 2 ** (n_bits - 1) - 1, n_bits,
+                                             round_half_to_even)
+        return IntegerQuantizationParams(float(scale), 0, 0, 2 ** n_bits - 1, n_bits, round_half_to_even)
+    if method == QuantizationMethod.UNIFORM:
+        range_min, range_max = min(params.get(RANGE_MIN), 0), max(params.get(RANGE_MAX), 0)
+        range_min, range_max = fix_range_to_include_zero(range_min, range_max, n_bits)
+        scale = (range_max - range_min) / (2 ** n_bits - 1)
+        return IntegerQuantizationParams(float(scale), int(-np.round(range_min / scale)), 0, 2 ** n_bits - 1, n_bits,
+                                         round_half_to_even)
+    Logger.critical(f'Activation quantization method {method} is not supported by the integer '
+                    f'executor.')  # pragma: no cover
+
+
+def get_integer_weights(quantized_kernel: np.ndarray,
+                        weights_cfg: NodeWeightsQuantizationConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the integer representation of a quantized kernel: integers (relative to the kernel's zero point) and the
+    scale of each of them.
+
+    Args:
+        quantized_kernel: Kernel after the node's weights quantization.
+        weights_cfg: Weights quantization configuration of the node.
+
+    Returns:
+        The integer kernel, and the scales (broadcast to the kernel's shape), such that the quantized kernel equals
+        scales * integer kernel.
+    """
+    n_bits = weights_cfg.weights_n_bits
+    params = weights_cfg.weights_quantization_params
+    method = weights_cfg.weights_quantization_method
+    if method in [QuantizationMethod.POWER_OF_TWO, QuantizationMethod.SYMMETRIC]:
+        scale = calculate_delta(params.get(THRESHOLD), n_bits, signed=True)
+    elif method == QuantizationMethod.UNIFORM:
+        range_min, range_max = fix_range_to_include_zero(params.get(RANGE_MIN), params.get(RANGE_MAX), n_bits)
+        scale = (range_max - range_min) / (2 ** n_bits - 1)
+    else:
+        Logger.critical(f'Weights quantization method {method} is not supported by the integer '
+                        f'executor.')  # pragma: no cover
+    scale = np.broadcast_to(np.asarray(scale, dtype=np.float64), quantized_kernel.shape)
+    return np.round(quantized_kernel / scale).astype(np.int64), scale
+
+
+def get_node_integer_kernel(node: BaseNode,
+                            fw_info: FrameworkInfo,
+                            fw_impl: FrameworkImplementation) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize the kernel of a node according to its final weights quantization configuration, and get its integer
+    representation.
+
+    Args:
+        node: Node to get its integer kernel.
+        fw_info: Framework information of the node's framework.
+        fw_impl: FrameworkImplementation of the node's framework.
+
+    Returns:
+        The integer kernel (in the node's kernel layout), and the scales (broadcast to the kernel's shape).
+    """
+    if not node.is_weights_quantization_enabled():
+        Logger.critical(f'The integer executor requires the weights of node {node.name} to be quantized, but its '
+                        f'weights quantization is disabled.')
+    quantized_kernel, _ = get_quantized_kernel_by_weights_qc(fw_info,
+                                                             node,
+                                                             node.final_weights_quantization_cfg,
+                                                             fw_impl=fw_impl)
+    return get_integer_weights(quantized_kernel, node.final_weights_quantization_cfg)
@@ -0,0 +1,128 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+
+from model_compression_toolkit.constants import EPS, MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE
+
+
+class JacobianTraceAccumulator:
+    """
+    Accumulates random-probe (Hutchinson) samples of the squared norm of the Jacobian of a model's outputs with
+    respect to the feature maps of its interest points, for each image of a batch and each interest point.
+
+    Samples of several probes are added at once (one backward pass computes the samples of all the interest points
+    for several probes and images), but they are accumulated one probe at a time, so the approximation of each
+    image and interest point stops on the same convergence criterion as when drawing a single probe per pass:
+    after MIN_JACOBIANS_ITER samples, when a new sample changes the mean by less than JACOBIANS_COMP_TOLERANCE
+    (relatively), or after n_iter samples. Samples of an approximation that has already stopped are ignored.
+    """
+
+    def __init__(self,
+                 num_images: int,
+                 num_interest_points: int,
+                 n_iter: int):
+        """
+        Args:
+            num_images: Number of images to approximate their Jacobian traces.
+            num_interest_points: Number of interest points to approximate their Jacobian traces.
+            n_iter: Maximal number of samples for each image and interest point.
+        """
+        self.n_iter = n_iter
+        self.sums = np.zeros((num_images, num_interest_points))
+        self.counts = np.zeros((num_images, num_interest_points), dtype=int)
+        self.converged = self.counts >= n_iter
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns: Whether the approximations of all the images and interest points have stopped.
+        """
+        return bool(np.all(self.converged))
+
+    def update(self, samples: np.ndarray):
+        """
+        Adds samples of several probes.
+
+        Args:
+            samples: Array of samples with shape (num_probes, num_images, num_interest_points).
+        """
+        for probe_samples in samples:
+            active = np.logical_not(self.converged)
+            mean = self.sums / np.maximum(self.counts, 1)
+            new_mean = (self.sums + probe_samples) / (self.counts + 1)
+            delta = np.abs(new_mean - mean) / (np.abs(new_mean) + 1e-6)
+            insignificant_change = np.logical_and(self.counts > MIN_JACOBIANS_ITER, delta < JACOBIANS_COMP_TOLERANCE)
+
+            self.sums = np.where(active, self.sums + probe_samples, self.sums)
+            self.counts = self.counts + active
+            self.converged = np.logical_or(self.converged,
+                                           np.logical_or(insignificant_change, self.counts >= self.n_iter))
+
+    def get_means(self) -> np.ndarray:
+        """
+        Returns: Array of the mean of the samples of each image and interest point, with shape
+        (num_images, num_interest_points).
+        """
+        return self.sums / np.maximum(self.counts, 1)
+
+
+def normalize_jacobian_weights(jacobians_traces: np.ndarray,
+                               all_outputs_indices: List[int],
+                               alpha: float) -> np.ndarray:
+    """
+    Output layers or layers that come after the model's considered output layers,
+    are assigned with a constant normalized value, according to the given alpha variable and the number of such layers.
+    Other layers returned weights are normalized by dividing the jacobian-based weights value by the sum of all other values.
+
+    Args:
+        jacobians_traces: The approximated average jacobian-based weights of each interest point.
+        all_outputs_indices: A list of indices of all nodes that consider outputs.
+        alpha: A multiplication factor.
+
+    Returns: Normalized jacobian-based weights (for each interest point).
+
+    """
+
+    sum_without_outputs = sum([jacobians_traces[i] for i in range(len(jacobians_traces))
+                               if i not in all_outputs_indices])
+
+    return np.asarray([alpha / len(all_outputs_indices) if i in all_outputs_indices
+                       else (1 - alpha) * grad / (sum_without_outputs + EPS)
+                       for i, grad in enumerate(jacobians_traces)])
+
+
+def average_jacobian_weights(jacobians_traces: np.ndarray,
+                             all_outputs_indices: List[int],
+                             alpha: float,
+                             norm_weights: bool) -> np.ndarray:
+    """
+    Averages the jacobian-based weights of several images, where the weights of each image are (possibly)
+    normalized before averaging.
+
+    Args:
+        jacobians_traces: Array of the approximated jacobian traces with shape (num_images, num_interest_points).
+        all_outputs_indices: A list of indices of all nodes that consider outputs.
+        alpha: A multiplication factor.
+        norm_weights: Whether to normalize the weights of each image.
+
+    Returns: The average jacobian-based weights (for each interest point).
+
+    """
+    if norm_weights:
+        jacobians_traces = np.stack([normalize_jacobian_weights(image_traces, all_outputs_indices, alpha)
+                                     for image_traces in jacobians_traces])
+    return np.mean(jacobians_traces, axis=0)
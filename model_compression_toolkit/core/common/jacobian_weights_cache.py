@@ -0,0 +1,274 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import json
+import os
+import re
+import tempfile
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List
+
+import numpy as np
+
+from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.quantization.compact_weights import get_weights_array
+from model_compression_toolkit.logger import Logger
+
+# Prefix of the names of the cache's files.
+CACHE_FILE_PREFIX = 'jacobian_weights_'
+
+
+class JacobianWeightsCache:
+    """
+    On-disk cache of Jacobian-based (or Hessian-based) weights of interest points, so runs on the same float model,
+    interest points and samples (e.g., a sweep over target KPIs or GPTQ hyperparameters) do not recompute them.
+
+    Each entry is a .npy file in the cache's directory, named by a fingerprint of the computation (see get_key).
+    When the total size of the entries exceeds the cache's budget, the least recently used entries are removed.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 max_bytes: int):
+        """
+        Args:
+            directory: Directory of the cache's files (created if it does not exist).
+            max_bytes: Maximal total number of bytes of the cache's files.
+        """
+        if max_bytes < 0:
+            Logger.critical(f'Jacobian weights cache budget must be non-negative, but got {max_bytes}')  # pragma: no cover
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(graph: Graph,
+                interest_points: List[BaseNode],
+                samples: Iterable[Any],
+                settings: Dict[str, Any]) -> str:
+        """
+        Computes a fingerprint of a weights computation.
+
+        Args:
+            graph: Float graph the weights are computed on (its structure, its nodes' attributes and call arguments and
+                its nodes' weights are fingerprinted).
+            interest_points: Interest points to compute weights for.
+            samples: Samples the weights are computed on. Each sample is a numpy array, or a (possibly nested)
+                list or tuple of numpy arrays.
+            settings: Settings of the weights computation (JSON-serializable values, or values with a
+                deterministic string representation).
+
+        Returns:
+            A hex digest that identifies the computation.
+        """
+        h = hashlib.sha256()
+        for n in graph.get_topo_sorted_nodes():
+            h.update(f'{n.name}|{getattr(n.type, "__name__", n.type)}|{n.output_shape}'.encode())
+            for e in graph.incoming_edges(n, sort_by_attr=EDGE_SINK_INDEX):
+                h.update(f'<{e.source_node.name}:{e.source_index}:{e.sink_index}'.encode())
+            for attr_name in ['framework_attr', 'op_call_args', 'op_call_kwargs']:
+                h.update(f'@{attr_name}'.encode())
+                _update_hash_with_value(h, getattr(n, attr_name, None))
+            for weights_key in sorted(n.weights.keys(), key=str):
+                h.update(f'#{weights_key}'.encode())
+                _update_hash_with_array(h, get_weights_array(n.weights[weights_key]))
+
+        h.update(json.dumps([n.name for n in interest_points]).encode())
+
+        for sample in samples:
+            h.update(b'sample')
+            for array in _flatten_sample(sample):
+                _update_hash_with_array(h, array)
+
+        h.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def load(self, key: str) -> np.ndarray:
+        """
+        Args:
+            key: Key of an entry (see get_key).
+
+        Returns:
+            The weights of the entry, or None if the cache has no such entry.
+        """
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            weights = np.load(path)
+        except (OSError, ValueError):
+            Logger.warning(f'Removing unreadable Jacobian weights cache file {path}')
+            self._remove(path)
+            return None
+        # Mark the entry as recently used.
+        os.utime(path)
+        return weights
+
+    def save(self, key: str, weights: np.ndarray):
+        """
+        Adds an entry to the cache, and removes the least recently used entries if the cache exceeds its budget.
+        Weights that exceed the budget by themselves are not cached.
+
+        Args:
+            key: Key of the entry (see get_key).
+            weights: Weights to cache.
+        """
+        # Write to a temporary file first, so a concurrent run never reads a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(suffix='.npy', dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.asarray(weights))
+        if os.path.getsize(tmp_path) > self.max_bytes:
+            self._remove(tmp_path)
+            return
+        os.replace(tmp_path, self._get_path(key))
+        self._evict()
+
+    def get_or_compute(self, key: str, compute_fn: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Gets the weights of an entry from the cache, or computes and caches them if the cache has no such entry.
+
+        Args:
+            key: Key of the entry (see get_key).
+            compute_fn: A function that computes the weights.
+
+        Returns:
+            The weights.
+        """
+        weights = self.load(key)
+        if weights is not None:
+            Logger.info(f'Using cached Jacobian-based weights from {self._get_path(key)}')
+            return weights
+        weights = compute_fn()
+        self.save(key, weights)
+        return weights
+
+    def _get_path(self, key: str) -> str:
+        """
+        Args:
+            key: Key of an entry.
+
+        Returns:
+            Path of the entry's file.
+        """
+        return os.path.join(self.directory, f'{CACHE_FILE_PREFIX}{key}.npy')
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the total size of the entries is within the budget.
+        """
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(CACHE_FILE_PREFIX) and file_name.endswith('.npy'):
+                path = os.path.join(self.directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # pragma: no cover
+                    continue  # Removed by a concurrent run
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum([size for _, size, _ in entries])
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    @staticmethod
+    def _remove(path: str):
+        """
+        Removes a cache file (ignoring a file that was already removed by a concurrent run).
+
+        Args:
+            path: Path of the file.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+
+def _update_hash_with_array(h: Any, array: Any):
+    """
+    Updates a hash with the dtype, shape and contents of an array.
+
+    Args:
+        h: A hashlib hash object.
+        array: An array.
+    """
+    array = np.ascontiguousarray(array)
+    h.update(f'{array.dtype}{array.shape}'.encode())
+    h.update(array.reshape(-1).view(np.uint8))
+
+
+def _update_hash_with_value(h: Any, value: Any):
+    """
+    Updates a hash with a node's attribute value: a (possibly nested) dict, list or tuple of arrays, tensors,
+    classes, functions, scalars and strings. Arrays and tensors are hashed by their contents (their representation
+    may be truncated), and other objects by their type and configuration (or attributes).
+
+    Args:
+        h: A hashlib hash object.
+        value: A value.
+    """
+    if isinstance(value, dict):
+        h.update(b'{')
+        for k in sorted(value.keys(), key=str):
+            h.update(f'{k}:'.encode())
+            _update_hash_with_value(h, value[k])
+        h.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[')
+        for v in value:
+            _update_hash_with_value(h, v)
+        h.update(b']')
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        h.update(repr(value).encode())
+    elif isinstance(value, (np.ndarray, np.generic)):
+        _update_hash_with_array(h, value)
+    elif hasattr(value, 'detach') and hasattr(value, 'cpu'):  # A framework tensor (e.g., torch.Tensor)
+        _update_hash_with_array(h, np.asarray(value.detach().cpu()))
+    elif callable(getattr(value, 'numpy', None)):  # A framework tensor (e.g., tf.Tensor or tf.Variable)
+        _update_hash_with_array(h, np.asarray(value.numpy()))
+    elif hasattr(value, '__array__'):  # An array-like object
+        _update_hash_with_array(h, np.asarray(value))
+    elif hasattr(value, '__module__') and hasattr(value, '__qualname__'):  # A class or a function
+        h.update(f'{value.__module__}.{value.__qualname__}'.encode())
+    else:
+        h.update(f'{type(value).__module__}.{type(value).__qualname__}'.encode())
+        if isinstance(value, Enum):
+            h.update(value.name.encode())
+        elif callable(getattr(value, 'get_config', None)):  # A framework object (e.g., a Keras initializer)
+            _update_hash_with_value(h, value.get_config())
+        elif hasattr(value, '__dict__'):
+            _update_hash_with_value(h, vars(value))
+        else:
+            # Remove memory addresses from the default representation of objects, so it is deterministic.
+            h.update(re.sub(r' at 0x[0-9a-fA-F]+', '', repr(value)).encode())
+    h.update(b';')
+
+
+def _flatten_sample(sample: Any) -> List[np.ndarray]:
+    """
+    Args:
+        sample: A numpy array, or a (possibly nested) list or tuple of numpy arrays.
+
+    Returns:
+        A flat list of the sample's arrays.
+    """
+    if isinstance(sample, (list, tuple)):
+        return [a for s in sample for a in _flatten_sample(s)]
+    return [np.asarray(sample)]
@@ -14,6 +14,7 @@
 # ==============================================================================
 
 from abc import abstractmethod
+from typing import List, Any
 
 from . import base_matcher
 from . import edge_matcher
@@ -27,12 +28,15 @@ class BaseGraphFilter(object):
     Base class to implement graph filtering by nodes, edges and sequences of nodes.
     """
 
-    def filter(self, matcher: base_matcher.BaseMatcher) -> list:
+    def filter(self, matcher: base_matcher.BaseMatcher, nodes: List[Any] = None) -> list:
         """
         Receive a matcher and return a list of matches in the graph.
 
         Args:
             matcher: Object of type BaseMatcher.
+            nodes: Nodes to search the matches from (the nodes to match, the source nodes of the edges to match,
+            or the first nodes of the walks to match), in the order of the graph's nodes. If None, the matches are
+            searched from all the nodes in the graph.
 
         Returns:
             List of matches.
@@ -40,25 +44,26 @@ class BaseGraphFilter(object):
 
         # Return the nodes that matches the matcher object.
         if function.is_node_matcher(matcher):
-            return self._node_filter(matcher)
+            return self._node_filter(matcher, nodes)
 
         # Return the edges that matches the matcher object.
         elif function.is_edge_matcher(matcher):
-            return self._edge_filter(matcher)
+            return self._edge_filter(matcher, nodes)
 
         # Return a list of nodes that match the matcher.
         elif function.is_walk_matcher(matcher):
-            return self._walk_filter(matcher)
+            return self._walk_filter(matcher, nodes)
         else:
             raise NotImplemented  # pragma: no cover
 
     @abstractmethod
-    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher) -> list:
+    def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher, nodes: List[Any] = None) -> list:
         """
         Returns the nodes in the graph that matches the matcher object.
 
         Args:
             node_matcher: Matcher object to apply on nodes in the graph.
+            nodes: Nodes to match (all the nodes in the graph if None).
 
         Returns:
             List of nodes that match the node_matcher.
@@ -66,12 +71,13 @@ class BaseGraphFilter(object):
         pass  # pragma: no cover
 
     @abstractmethod
-    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher) -> list:
+    def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher, nodes: List[Any] = None) -> list:
         """
         Returns the edges in the graph that match the matcher object.
 
         Args:
             edge_matcher: Matcher object to apply on the edges.
+            nodes: Source nodes of the edges to match (all the nodes in the graph if None).
 
         Returns:
             List of edges that match.
@@ -79,7 +85,7 @@ class BaseGraphFilter(object):
         pass  # pragma: no cover
 
     @abstractmethod
-    def _walk_filter(self, walk_matcher: walk_matcher.WalkMatcherList) -> list:
+    def _walk_filter(self, walk_matcher: walk_matcher.WalkMatcherList, nodes: List[Any] = None) -> list:
         """
         Search for a list of nodes which match the list in walk_matcher. and return it.
         If one the nodes in the list (that was found in the graph) has more than one output,
@@ -87,6 +93,7 @@ class BaseGraphFilter(object):
 
         Args:
             walk_matcher: WalkMatcherList with a list of nodes to match.
+            nodes: First nodes of the lists to match (all the nodes in the graph if None).
 
         Returns:
             A list of nodes which match the list in walk_matcher.
@@ -15,7 +15,7 @@
 
 
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Optional, Set
 
 
 class BaseMatcher(object):
@@ -37,6 +37,16 @@ class BaseMatcher(object):
         """
         pass  # pragma: no cover
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        """
+        Get the types of the nodes the matcher can match, so searches can skip nodes of other types (the nodes
+        of edge matchers are the edges' source nodes, and the nodes of walk matchers are the walks' first nodes).
+
+        Returns:
+            A set of node types, or None if the matcher can match nodes of any type.
+        """
+        return None
+
     def __and__(self, other: Any):
         """
         Return a matcher to check the logic AND of two BaseMatchers on an object.
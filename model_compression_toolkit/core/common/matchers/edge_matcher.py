@@ -13,8 +13,10 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Any, Optional, Set
 
-from model_compression_toolkit.core.common.matchers.node_matcher import BaseNodeMatcher
+from model_compression_toolkit.core.common.matchers.node_matcher import BaseNodeMatcher, intersect_candidate_types, \
+    unite_candidate_types
 from . import base_matcher
 
 
@@ -64,6 +66,9 @@ class BaseEdgeMatcher(base_matcher.BaseMatcher):
         else:
             return False
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return self.source_matcher.get_candidate_types()
+
 
 class EdgeAndMatcher(BaseEdgeMatcher):
     """
@@ -77,6 +82,9 @@ class EdgeAndMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) and self.matcher_b.apply(input_object)
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return intersect_candidate_types(self.matcher_a.get_candidate_types(), self.matcher_b.get_candidate_types())
+
 
 class EdgeOrMatcher(BaseEdgeMatcher):
     """
@@ -90,6 +98,9 @@ class EdgeOrMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) or self.matcher_b.apply(input_object)
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return unite_candidate_types(self.matcher_a.get_candidate_types(), self.matcher_b.get_candidate_types())
+
 
 class EdgeAnyMatcher(BaseEdgeMatcher):
     """
@@ -99,6 +110,9 @@ class EdgeAnyMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return True
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return None
+
 
 class EdgeNotMatcher(BaseEdgeMatcher):
     """
@@ -110,3 +124,6 @@ class EdgeNotMatcher(BaseEdgeMatcher):
 
     def apply(self, input_object) -> bool:
         return not self.matcher_a.apply(input_object)
+
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return None
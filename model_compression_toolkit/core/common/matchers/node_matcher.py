@@ -13,10 +13,41 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Any, Optional, Set
 
 from . import base_matcher
 
 
+def intersect_candidate_types(types_a: Optional[Set[Any]], types_b: Optional[Set[Any]]) -> Optional[Set[Any]]:
+    """
+    Args:
+        types_a: Candidate types of a matcher (None for any type).
+        types_b: Candidate types of another matcher (None for any type).
+
+    Returns:
+        The candidate types of the logic AND of the matchers.
+    """
+    if types_a is None:
+        return types_b
+    if types_b is None:
+        return types_a
+    return types_a & types_b
+
+
+def unite_candidate_types(types_a: Optional[Set[Any]], types_b: Optional[Set[Any]]) -> Optional[Set[Any]]:
+    """
+    Args:
+        types_a: Candidate types of a matcher (None for any type).
+        types_b: Candidate types of another matcher (None for any type).
+
+    Returns:
+        The candidate types of the logic OR of the matchers.
+    """
+    if types_a is None or types_b is None:
+        return None
+    return types_a | types_b
+
+
 class BaseNodeMatcher(base_matcher.BaseMatcher):
     """
     Base class for matchers that match a node in the graph.
@@ -54,6 +85,9 @@ class NodeAndMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) and self.matcher_b.apply(input_object)
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return intersect_candidate_types(self.matcher_a.get_candidate_types(), self.matcher_b.get_candidate_types())
+
 
 class NodeOrMatcher(BaseNodeMatcher):
     """
@@ -67,6 +101,9 @@ class NodeOrMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) or self.matcher_b.apply(input_object)
 
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return unite_candidate_types(self.matcher_a.get_candidate_types(), self.matcher_b.get_candidate_types())
+
 
 class NodeAnyMatcher(BaseNodeMatcher):
     """
@@ -14,6 +14,7 @@
 # ==============================================================================
 
 from abc import ABC
+from typing import Any, Optional, Set
 
 from . import base_matcher
 
@@ -33,3 +34,6 @@ class WalkMatcherList(BaseWalkMatcher, ABC):
 
     def __init__(self, matcher_list: list):
         self.matcher_list = matcher_list
+
+    def get_candidate_types(self) -> Optional[Set[Any]]:
+        return self.matcher_list[0].get_candidate_types() if len(self.matcher_list) > 0 else None
@@ -40,13 +40,14 @@ def set_bit_widths(mixed_precision_enable: bool,
             "All configurable nodes in graph should have at least one candidate configuration in mixed precision mode"
 
         Logger.info(f'Set bit widths from configuration: {bit_widths_config}')
-        # Get a list of nodes' names we need to finalize (that they have at least one weight qc candidate).
-        sorted_nodes_names = graph.get_configurable_sorted_nodes_names()
+        # Get the indices of the nodes we need to finalize (that they have at least one weight qc candidate).
+        nodes_index = graph.get_configurable_nodes_index()
         for node in graph.nodes:  # set a specific node qc for each node final weights qc
             # If it's reused, take the configuration that the base node has
             node_name = node.name if not node.reuse else '_'.join(node.name.split('_')[:-2])
-            if node_name in sorted_nodes_names:  # only configurable nodes are in this list
-                node_index_in_graph = sorted_nodes_names.index(node_name)
+            # Non-configurable nodes have no index.
+            node_index_in_graph = nodes_index.get(node_name)
+            if node_index_in_graph is not None:
                 _set_node_final_qc(bit_widths_config,
                                    node,
                                    node_index_in_graph)
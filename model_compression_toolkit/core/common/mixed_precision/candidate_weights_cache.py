@@ -0,0 +1,120 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+from collections import OrderedDict
+from typing import Callable, Union
+
+import numpy as np
+
+from model_compression_toolkit.core.common.quantization.compact_weights import CompactWeights, \
+    compact_quantized_weights, get_weights_array
+from model_compression_toolkit.logger import Logger
+
+
+class CandidateWeightsCache:
+    """
+    LRU cache of quantized candidate weights of mixed-precision configurable weights quantizers, with a budget of
+    bytes.
+
+    A cache is shared by the configurable quantizers of a mixed-precision model, which quantize the candidate weights
+    on demand when their active candidate is changed, instead of keeping the quantized weights of all the candidates.
+    The least recently used candidate weights are evicted when the total size exceeds the budget, and are quantized
+    again when they are needed.
+    """
+
+    def __init__(self,
+                 max_bytes: int,
+                 compact: bool = False):
+        """
+        Args:
+            max_bytes: Maximal number of bytes of the cached candidate weights.
+            compact: Whether to store the cached weights as integer codes of per-channel levels instead of float
+                tensors (see CompactWeights).
+        """
+        if max_bytes < 0:
+            Logger.critical(f'Candidate weights cache budget must be non-negative, but got {max_bytes}')  # pragma: no cover
+
+        self.max_bytes = max_bytes
+        self.compact = compact
+        self.nbytes = 0
+        self.num_quantizations = 0
+        self._entries = OrderedDict()
+        self._owners_ids = itertools.count()
+
+    def new_owner_id(self) -> int:
+        """
+        Returns: A unique id for a quantizer that uses the cache, to identify its candidates weights.
+        """
+        return next(self._owners_ids)
+
+    def get(self,
+            owner_id: int,
+            candidate_index: int,
+            quantize_fn: Callable[[], np.ndarray],
+            channels_axis: int = None) -> np.ndarray:
+        """
+        Gets the quantized weights of a candidate from the cache, or quantizes them if they are not cached.
+
+        Args:
+            owner_id: Id of the quantizer the weights belong to (see new_owner_id).
+            candidate_index: Index of the weights' quantization candidate.
+            quantize_fn: A function that returns the quantized weights of the candidate.
+            channels_axis: Axis of the output channels of the weights (used by the compact form).
+
+        Returns:
+            The quantized weights of the candidate.
+        """
+        key = (owner_id, candidate_index)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return get_weights_array(self._entries[key])
+
+        quantized_weights = quantize_fn()
+        self.num_quantizations += 1
+        entry = self._to_entry(quantized_weights, channels_axis)
+        entry_nbytes = entry.nbytes
+        # Weights that exceed the budget by themselves are not cached.
+        if entry_nbytes <= self.max_bytes:
+            self._entries[key] = entry
+            self.nbytes += entry_nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+        return quantized_weights
+
+    def clear(self):
+        """
+        Removes all the cached weights.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _to_entry(self,
+                  quantized_weights: np.ndarray,
+                  channels_axis: int) -> Union[np.ndarray, CompactWeights]:
+        """
+        Args:
+            quantized_weights: Quantized weights to cache.
+            channels_axis: Axis of the output channels of the weights.
+
+        Returns:
+            The form of the weights to keep in the cache.
+        """
+        if self.compact:
+            return compact_quantized_weights(quantized_weights, channels_axis)
+        return quantized_weights
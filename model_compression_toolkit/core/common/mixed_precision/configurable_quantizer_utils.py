@@ -58,19 +58,47 @@ def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
 
     quantized_weights = []
     for qc in node_q_cfg:
-        qc_weights = qc.weights_quantization_cfg
-        q_weight = qc_weights.weights_quantization_fn(float_weights,
-                                                      qc_weights.weights_n_bits,
-                                                      True,
-                                                      qc_weights.weights_quantization_params,
-                                                      qc_weights.weights_per_channel_threshold,
-                                                      qc_weights.weights_channels_axis)
-
-        quantized_weights.append(fw_tensor_convert_func(q_weight))
+        quantized_weights.append(fw_tensor_convert_func(quantize_candidate_weights(qc, float_weights)))
 
     return quantized_weights
 
 
+def quantize_candidate_weights(qc: CandidateNodeQuantizationConfig,
+                               float_weights: Any) -> Any:
+    """
+    Quantizes weights according to a quantization configuration candidate.
+
+    Args:
+        qc: Quantization configuration candidate to quantize the weights with.
+        float_weights: A tensor of the layer's weights.
+
+    Returns: The quantized weights.
+
+    """
+
+    qc_weights = qc.weights_quantization_cfg
+    return qc_weights.weights_quantization_fn(float_weights,
+                                              qc_weights.weights_n_bits,
+                                              True,
+                                              qc_weights.weights_quantization_params,
+                                              qc_weights.weights_per_channel_threshold,
+                                              qc_weights.weights_channels_axis)
+
+
+def get_candidate_weights_channels_axis(qc: CandidateNodeQuantizationConfig) -> Any:
+    """
+    Args:
+        qc: Quantization configuration candidate.
+
+    Returns: The output channels axis of the candidate's quantized weights if they are quantized per-channel,
+        otherwise None.
+
+    """
+
+    qc_weights = qc.weights_quantization_cfg
+    return qc_weights.weights_channels_axis if qc_weights.weights_per_channel_threshold else None
+
+
 def init_activation_quantizers(node_q_cfg: List[CandidateNodeQuantizationConfig]) -> List:
     """
     Builds a list of quantizers for each of the bitwidth candidates for activation quantization,
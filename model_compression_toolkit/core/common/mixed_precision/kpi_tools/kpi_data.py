@@ -20,6 +20,8 @@ from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.constants import FLOAT_BITWIDTH
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.max_cut_memory import \
+    get_max_cut_activation_memory
 from model_compression_toolkit.target_platform_capabilities.target_platform import TargetPlatformCapabilities
 from model_compression_toolkit.core.runner import read_model_to_graph, get_finalized_graph
 
@@ -29,10 +31,12 @@ def compute_kpi_data(in_model: Any,
                      core_config: CoreConfig,
                      tpc: TargetPlatformCapabilities,
                      fw_info: FrameworkInfo,
-                     fw_impl: FrameworkImplementation) -> KPI:
+                     fw_impl: FrameworkImplementation,
+                     compute_activation_max_cut: bool = False) -> KPI:
     """
     Compute KPI information that can be relevant for defining target KPI for mixed precision search.
-    Calculates maximal activation tensor, sum of weights' parameters and total (sum of both).
+    Calculates maximal activation tensor, sum of weights' parameters, total (sum of both), BOPS and (if requested)
+    the maximal activation cut (peak activation memory) of the model's computation schedule.
 
     Args:
         in_model:  Model to build graph from (the model that intended to be quantized).
@@ -42,6 +46,9 @@ def compute_kpi_data(in_model: Any,
                                               the attached framework operator's information.
         fw_info: Information needed for quantization about the specific framework.
         fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        compute_activation_max_cut: Whether to compute the maximal activation cut, which requires searching the
+            model's computation schedule (only needed for setting an activation max-cut target KPI). If False,
+            the KPI's activation max-cut memory is left unset (infinite).
 
     Returns: A KPI object with the results.
 
@@ -76,10 +83,16 @@ def compute_kpi_data(in_model: Any,
     bops_count = compute_total_bops(graph=transformed_graph, fw_info=fw_info, fw_impl=fw_impl)
     bops_count = np.inf if len(bops_count) == 0 else sum(bops_count)
 
+    # Compute activation max-cut kpi - the number of activation elements in the largest cut of the model's schedule
+    activation_max_cut_size = np.inf
+    if compute_activation_max_cut:
+        activation_max_cut_size = get_max_cut_activation_memory(transformed_graph).compute_max_cut_size()
+
     return KPI(weights_memory=total_weights_params,
                activation_memory=max_activation_tensor_size,
                total_memory=total_size,
-               bops=bops_count)
+               bops=bops_count,
+               activation_max_cut_memory=activation_max_cut_size)
 
 
 def compute_nodes_weights_params(graph: Graph, fw_info: FrameworkInfo) -> np.ndarray:
@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget
+from typing import Dict, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget, KPI
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
 
@@ -23,4 +27,25 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods
 kpi_functions_mapping = {KPITarget.WEIGHTS: (MpKpiMetric.WEIGHTS_SIZE, MpKpiAggregation.SUM),
                          KPITarget.ACTIVATION: (MpKpiMetric.ACTIVATION_OUTPUT_SIZE, MpKpiAggregation.MAX),
                          KPITarget.TOTAL: (MpKpiMetric.TOTAL_WEIGHTS_ACTIVATION_SIZE, MpKpiAggregation.TOTAL),
-                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM)}
+                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM),
+                         KPITarget.ACTIVATION_MAX_CUT: (MpKpiMetric.ACTIVATION_MAX_CUT, MpKpiAggregation.MAX)}
+
+# KPI targets that are computed only if they are set in the target KPI
+# (the activation max-cut KPI requires running a max-cut search over the graph).
+ON_DEMAND_KPI_TARGETS = [KPITarget.ACTIVATION_MAX_CUT]
+
+
+def get_kpi_functions_mapping(target_kpi: KPI = None) -> Dict[KPITarget, Tuple[MpKpiMetric, MpKpiAggregation]]:
+    """
+    Get the mapping of KPI targets to their KPI functions, for the KPI targets that should be computed for
+    a given target KPI.
+
+    Args:
+        target_kpi: Target KPI of a mixed-precision search. If None, on-demand KPI targets are not computed.
+
+    Returns: A dictionary mapping a KPITarget to a pair of kpi metric function and kpi aggregation function.
+
+    """
+    kpi_dict = {} if target_kpi is None else target_kpi.get_kpi_dict()
+    return {target: kpi_fns for target, kpi_fns in kpi_functions_mapping.items()
+            if target not in ON_DEMAND_KPI_TARGETS or kpi_dict.get(target, np.inf) < np.inf}
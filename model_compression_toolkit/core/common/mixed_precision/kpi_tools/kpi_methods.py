@@ -25,6 +25,8 @@ from model_compression_toolkit.core.common.framework_implementation import Frame
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common.graph.virtual_activation_weights_node import VirtualActivationWeightsNode, \
     VirtualSplitWeightsNode, VirtualSplitActivationNode
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.max_cut_memory import \
+    get_max_cut_activation_memory
 from model_compression_toolkit.logger import Logger
 
 
@@ -48,8 +50,7 @@ def weights_size_kpi(mp_cfg: List[int],
 
     """
     weights_memory = []
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
-    weights_mp_nodes = [n.name for n in graph.get_sorted_weights_configurable_nodes()]
+    weights_mp_nodes = {n.name for n in graph.get_sorted_weights_configurable_nodes()}
 
     if len(mp_cfg) == 0:
         # Computing non-configurable nodes KPI
@@ -65,8 +66,9 @@ def weights_size_kpi(mp_cfg: List[int],
                 weights_memory.append(node_weights_memory_in_bytes)
     else:
         # Go over configurable all nodes that should be taken into consideration when computing the weights KPI.
+        mp_nodes_index = graph.get_configurable_nodes_index()
         for n in graph.get_sorted_weights_configurable_nodes():
-            node_idx = mp_nodes.index(n.name)
+            node_idx = mp_nodes_index[n.name]
             node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
             node_nbits = node_qc.weights_quantization_cfg.weights_n_bits
 
@@ -98,8 +100,7 @@ def activation_output_size_kpi(mp_cfg: List[int],
 
     """
     activation_memory = []
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
-    activation_mp_nodes = [n.name for n in graph.get_sorted_activation_configurable_nodes()]
+    activation_mp_nodes = {n.name for n in graph.get_sorted_activation_configurable_nodes()}
 
     if len(mp_cfg) == 0:
         # Computing non-configurable nodes KPI
@@ -114,8 +115,9 @@ def activation_output_size_kpi(mp_cfg: List[int],
                 activation_memory.append(node_activation_memory_in_bytes)
     else:
         # Go over all nodes that should be taken into consideration when computing the weights KPI.
+        mp_nodes_index = graph.get_configurable_nodes_index()
         for n in graph.get_sorted_activation_configurable_nodes():
-            node_idx = mp_nodes.index(n.name)
+            node_idx = mp_nodes_index[n.name]
             node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
             node_nbits = node_qc.activation_quantization_cfg.activation_n_bits
 
@@ -204,6 +206,36 @@ def total_weights_activation_kpi(mp_cfg: List[int],
     return np.array(weights_activation_memory)
 
 
+def activation_max_cut_kpi(mp_cfg: List[int],
+                           graph: Graph,
+                           fw_info: FrameworkInfo,
+                           fw_impl: FrameworkImplementation) -> np.ndarray:
+    """
+    Computes a KPIs vector with the respective memory of the activation tensors in each cut of the graph's
+    computation schedule (found using a max-cut search), according to the given mixed-precision configuration.
+    The max of the vector is the peak activation memory of the model.
+    The schedule's cuts are computed once per graph and re-evaluated incrementally for configurations that
+    differ in a few nodes (as in the KPI matrix computation of the mixed-precision search).
+
+    Since each cut includes the activation tensors of both configurable and non-configurable nodes,
+    an empty configuration yields an empty vector, unless the graph has no configurable nodes.
+
+    Args:
+        mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node)
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize)
+            (not used in this method).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation(not used in this method).
+
+    Returns: A vector of the schedule's cuts memory sizes.
+
+    """
+    if len(mp_cfg) == 0 and len(graph.get_configurable_sorted_nodes_names()) > 0:
+        return np.array([])
+
+    return get_max_cut_activation_memory(graph).compute_cuts_memory(mp_cfg)
+
+
 def bops_kpi(mp_cfg: List[int],
              graph: Graph,
              fw_info: FrameworkInfo,
@@ -411,12 +443,15 @@ class MpKpiMetric(Enum):
 
      BOPS_COUNT - applies the bops_kpi function
 
+     ACTIVATION_MAX_CUT - applies the activation_max_cut_kpi function
+
     """
 
     WEIGHTS_SIZE = partial(weights_size_kpi)
     ACTIVATION_OUTPUT_SIZE = partial(activation_output_size_kpi)
     TOTAL_WEIGHTS_ACTIVATION_SIZE = partial(total_weights_activation_kpi)
     BOPS_COUNT = partial(bops_kpi)
+    ACTIVATION_MAX_CUT = partial(activation_max_cut_kpi)
 
     def __call__(self, *args):
         return self.value(*args)
@@ -0,0 +1,226 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List, Set
+
+import numpy as np
+
+from model_compression_toolkit.constants import BITS_TO_BYTES, FLOAT_BITWIDTH
+from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import compute_graph_max_cut
+from model_compression_toolkit.core.common.graph.memory_graph.memory_element import ActivationMemoryTensor
+from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+from model_compression_toolkit.logger import Logger
+
+# Key of the MaxCutActivationMemory object in the graph's cache.
+MAX_CUT_ACTIVATION_MEMORY = 'max_cut_activation_memory'
+
+# If a configuration differs from the reference configuration in more than this fraction of the configurable
+# nodes, the cuts memory is computed from scratch instead of incrementally.
+INCREMENTAL_UPDATE_MAX_RATIO = 0.5
+
+
+class MaxCutActivationMemory:
+    """
+    Computes the memory of the activation tensors that are alive in each cut of a graph's computation schedule,
+    for a given mixed-precision configuration.
+
+    The schedule and its cuts are computed once (using the max-cut AStar search on the graph's MemoryGraph).
+    Since the memory of each cut is a linear function of the bit-widths of the activation tensors in it,
+    the cuts are stored as a (cuts x nodes) matrix of tensors sizes, and the memory of a configuration
+    that differs from a previously computed configuration in a few nodes is updated incrementally, by
+    changing only the contribution of the modified nodes.
+    The cuts depend on the graph's structure only, while the bit-widths depend on the nodes' candidates, which may
+    be modified in-place, so the bit-widths are updated from the candidates by update_candidates.
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Args:
+            graph: Graph to compute its activation cuts memory.
+        """
+        self.graph = graph
+        self.nodes = graph.get_topo_sorted_nodes()
+        self.cuts_sizes = self._compute_cuts_sizes()
+
+        self.nodes_candidates_bytes = None
+        self.configurable_nodes_indices = None
+        self.base_bytes = None
+        self._reference_cfg = None
+        self._reference_bytes = None
+        self._reference_cuts_memory = None
+        self.update_candidates()
+
+    def update_candidates(self):
+        """
+        Updates the bytes per activation element of the nodes' candidates and the configurable nodes from the
+        nodes' current candidates. If they were modified, the reference configuration of the incremental update
+        is discarded.
+        """
+        # Bytes per activation element of each node, for each of the node's candidates.
+        nodes_candidates_bytes = [np.array([self._get_candidate_nbits(c) / BITS_TO_BYTES
+                                            for c in n.candidates_quantization_cfg]) for n in self.nodes]
+
+        # Topological index of each configurable node (by the configurable nodes order of an MP configuration).
+        configurable_nodes_indices = np.array([self.graph.get_node_topo_index(n)
+                                               for n in self.graph.get_configurable_sorted_nodes()], dtype=int)
+
+        if self.nodes_candidates_bytes is not None and \
+                np.array_equal(configurable_nodes_indices, self.configurable_nodes_indices) and \
+                all([np.array_equal(b, prev_b) for b, prev_b in zip(nodes_candidates_bytes,
+                                                                    self.nodes_candidates_bytes)]):
+            return
+
+        self.nodes_candidates_bytes = nodes_candidates_bytes
+        self.configurable_nodes_indices = configurable_nodes_indices
+        # Nodes which are not configurable use their first candidate.
+        self.base_bytes = np.array([b[0] for b in self.nodes_candidates_bytes])
+        self._reference_cfg = None
+        self._reference_bytes = None
+        self._reference_cuts_memory = None
+
+    @staticmethod
+    def _get_candidate_nbits(candidate) -> int:
+        """
+        Args:
+            candidate: A node's quantization configuration candidate.
+
+        Returns: The bit-width of the node's activation tensors with the given candidate (FLOAT_BITWIDTH
+        if the activation is not quantized).
+
+        """
+        activation_cfg = candidate.activation_quantization_cfg
+        return activation_cfg.activation_n_bits if activation_cfg.enable_activation_quantization else FLOAT_BITWIDTH
+
+    def _compute_cuts_sizes(self) -> np.ndarray:
+        """
+        Runs the max-cut search on the graph and builds the cuts' sizes matrix.
+        If the search fails to find a schedule, the graph's topological order is used as the schedule.
+
+        Returns: A matrix with a row for each (unique) cut and a column for each node (by the graph's topological
+        order), where each entry is the total number of elements in the node's activation tensors in the cut.
+
+        """
+        memory_graph = MemoryGraph(self.graph)
+        tensor_to_node = {t: memory_graph.activation_tensor_parents(t)[0] for t in memory_graph.b_nodes}
+
+        # Note that the max-cut search adds dummy nodes to the memory graph (which are removed from the result cuts).
+        schedule, _, cuts = compute_graph_max_cut(memory_graph)
+        if schedule is None:
+            Logger.warning(f'Max-cut search did not find a schedule for graph {self.graph.name}, using the graph '
+                           f'topological order to compute the activation max-cut KPI.')
+            memory_graph = MemoryGraph(self.graph)
+            tensor_to_node = {t: memory_graph.activation_tensor_parents(t)[0] for t in memory_graph.b_nodes}
+            cuts_elements = self._schedule_cuts(memory_graph, self.nodes)
+        else:
+            cuts_elements = [c.mem_elements.elements for c in cuts]
+
+        cuts_sizes = np.zeros((len(cuts_elements), len(self.nodes)))
+        for i, elements in enumerate(cuts_elements):
+            for t in elements:
+                cuts_sizes[i, self.graph.get_node_topo_index(tensor_to_node[t])] += t.total_size
+
+        return np.unique(cuts_sizes, axis=0)
+
+    @staticmethod
+    def _schedule_cuts(memory_graph: MemoryGraph, schedule: List[BaseNode]) -> List[Set[ActivationMemoryTensor]]:
+        """
+        Computes the cuts of a given schedule. The cut of each step in the schedule contains the output tensors
+        of the executed node and all tensors that were computed before and are still required by a node that is
+        executed in this step or later (the model's output tensors are kept until the end of the schedule).
+
+        Args:
+            memory_graph: MemoryGraph of the scheduled graph.
+            schedule: Execution order of the graph's nodes.
+
+        Returns: A list of cuts (sets of activation tensors).
+
+        """
+        step = {n: i for i, n in enumerate(schedule)}
+        last_use = {t: max([step[c] for c in memory_graph.activation_tensor_children(t)], default=len(schedule))
+                    for t in memory_graph.b_nodes}
+        cuts, alive = [], set()
+        for i, n in enumerate(schedule):
+            alive.update(memory_graph.operation_node_children(n))
+            cuts.append(set(alive))
+            alive = {t for t in alive if last_use[t] > i}
+        return cuts
+
+    def _get_cfg_bytes(self, mp_cfg: List[int]) -> np.ndarray:
+        """
+        Args:
+            mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node).
+
+        Returns: Bytes per activation element of each node according to the given configuration.
+
+        """
+        cfg_bytes = self.base_bytes.copy()
+        for node_idx, candidate_idx in zip(self.configurable_nodes_indices, mp_cfg):
+            cfg_bytes[node_idx] = self.nodes_candidates_bytes[node_idx][candidate_idx]
+        return cfg_bytes
+
+    def compute_cuts_memory(self, mp_cfg: List[int]) -> np.ndarray:
+        """
+        Computes the memory (in bytes) of each cut for the given configuration. If the configuration differs from
+        the last fully computed configuration in a few nodes only, the memory is updated incrementally.
+
+        Args:
+            mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node).
+
+        Returns: A vector with the memory of each cut.
+
+        """
+        mp_cfg = np.asarray(mp_cfg, dtype=int)
+        if len(mp_cfg) != len(self.configurable_nodes_indices):
+            Logger.critical(f'Mixed-precision configuration length {len(mp_cfg)} does not match the number of '
+                            f'configurable nodes {len(self.configurable_nodes_indices)}.')  # pragma: no cover
+
+        if self._reference_cfg is not None:
+            changed = np.flatnonzero(mp_cfg != self._reference_cfg)
+            if len(changed) <= INCREMENTAL_UPDATE_MAX_RATIO * len(mp_cfg):
+                cuts_memory = self._reference_cuts_memory.copy()
+                for conf_idx in changed:
+                    node_idx = self.configurable_nodes_indices[conf_idx]
+                    bytes_diff = self.nodes_candidates_bytes[node_idx][mp_cfg[conf_idx]] - \
+                                 self._reference_bytes[node_idx]
+                    cuts_memory += self.cuts_sizes[:, node_idx] * bytes_diff
+                return cuts_memory
+
+        self._reference_cfg = mp_cfg
+        self._reference_bytes = self._get_cfg_bytes(mp_cfg)
+        self._reference_cuts_memory = self.cuts_sizes @ self._reference_bytes
+        return self._reference_cuts_memory.copy()
+
+    def compute_max_cut_size(self) -> float:
+        """
+        Returns: The number of activation elements in the largest cut of the graph.
+        """
+        return 0 if len(self.cuts_sizes) == 0 else float(np.max(np.sum(self.cuts_sizes, axis=1)))
+
+
+def get_max_cut_activation_memory(graph: Graph) -> MaxCutActivationMemory:
+    """
+    Returns a MaxCutActivationMemory of the graph. The object is cached in the graph, so the max-cut search runs once
+    as long as the graph's structure is not modified, and its candidates bit-widths are updated from the nodes'
+    current candidates.
+
+    Args:
+        graph: Graph to get its MaxCutActivationMemory.
+
+    Returns: A MaxCutActivationMemory object.
+
+    """
+    max_cut_memory = graph.get_cached(MAX_CUT_ACTIVATION_MEMORY, lambda: MaxCutActivationMemory(graph))
+    max_cut_memory.update_candidates()
+    return max_cut_memory
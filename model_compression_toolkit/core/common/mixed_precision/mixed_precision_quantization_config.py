@@ -33,7 +33,17 @@ class MixedPrecisionQuantizationConfigV2:
                  use_grad_based_weights: bool = True,
                  output_grad_factor: float = 0.1,
                  norm_weights: bool = True,
-                 refine_mp_solution: bool = True):
+                 refine_mp_solution: bool = True,
+                 metric_cache_size: int = 1024,
+                 incremental_sensitivity_evaluation: bool = False,
+                 samples_ram_budget: int = None,
+                 candidate_weights_cache_size: int = None,
+                 compact_candidate_weights: bool = False,
+                 jacobians_n_probes: int = 4,
+                 jacobians_n_iter: int = 50,
+                 jacobians_images_per_pass: int = 1,
+                 jacobians_cache_dir: str = None,
+                 jacobians_cache_size: int = 2 ** 24):
         """
         Class with mixed precision parameters to quantize the input model.
         Unlike QuantizationConfig, number of bits for quantization is a list of possible bit widths to
@@ -49,6 +59,16 @@ class MixedPrecisionQuantizationConfigV2:
             output_grad_factor (float): A tuning parameter to be used for gradient-based weights.
             norm_weights (bool): Whether to normalize the returned weights (to get values between 0 and 1).
             refine_mp_solution (bool): Whether to try to improve the final mixed-precision configuration using a greedy algorithm that searches layers to increase their bit-width, or not.
+            metric_cache_size (int): Maximal number of configurations to keep their computed sensitivity metric in a cache (with LRU eviction), so the metric of a configuration that was already evaluated is not recomputed. The cache is kept by the sensitivity evaluator, so it is reused by the searches that share the evaluator (e.g., searches of a graph with different target KPIs). If 0, the metric is always computed.
+            incremental_sensitivity_evaluation (bool): Whether to evaluate the sensitivity of modifying a single node relative to a baseline configuration by re-executing only the part of the MP model from the modified node onwards (using cached intermediate tensors of the baseline configuration inference), instead of running a full inference. Requires memory for the cached tensors, and falls back to a full inference in frameworks that do not support it.
+            samples_ram_budget (int): Maximal number of bytes of the images batches and the baseline model's outputs on them to keep in RAM during the sensitivity evaluation. Samples beyond the budget are spilled to memory-mapped .npy files on local disk. If None, all the samples are kept in RAM.
+            candidate_weights_cache_size (int): Maximal number of bytes of quantized candidate weights to keep in the configurable weights quantizers of the MP model. If set, the candidate weights are quantized on demand when a layer's bit-width is changed and kept in an LRU cache with this budget, instead of keeping the quantized weights of all the candidates of all the layers. If None, the weights are quantized for all the candidates in advance.
+            compact_candidate_weights (bool): Whether to keep the cached candidate weights as integer codes of per-channel quantization levels instead of float tensors (relevant only if candidate_weights_cache_size is set).
+            jacobians_n_probes (int): Number of random vectors to draw in each backward pass when approximating the Jacobian-based weights (the images are replicated for each vector).
+            jacobians_n_iter (int): Number of random iterations to run when approximating the Jacobian-based weights.
+            jacobians_images_per_pass (int): Number of images to process in each backward pass when approximating the Jacobian-based weights.
+            jacobians_cache_dir (str): Directory of an on-disk cache of Jacobian-based weights, keyed by a fingerprint of the float graph, the interest points, the images and the approximation settings, so runs with the same inputs (e.g., with different target KPIs) reuse the weights instead of recomputing them. If None, the weights are not cached.
+            jacobians_cache_size (int): Maximal number of bytes of the on-disk cache of Jacobian-based weights (the least recently used weights are removed beyond it).
 
         """
 
@@ -57,6 +77,16 @@ class MixedPrecisionQuantizationConfigV2:
         self.num_of_images = num_of_images
         self.configuration_overwrite = configuration_overwrite
         self.refine_mp_solution = refine_mp_solution
+        self.metric_cache_size = metric_cache_size
+        self.incremental_sensitivity_evaluation = incremental_sensitivity_evaluation
+        self.samples_ram_budget = samples_ram_budget
+        self.candidate_weights_cache_size = candidate_weights_cache_size
+        self.compact_candidate_weights = compact_candidate_weights
+        self.jacobians_n_probes = jacobians_n_probes
+        self.jacobians_n_iter = jacobians_n_iter
+        self.jacobians_images_per_pass = jacobians_images_per_pass
+        self.jacobians_cache_dir = jacobians_cache_dir
+        self.jacobians_cache_size = jacobians_cache_size
 
         assert 0.0 < num_interest_points_factor <= 1.0, "num_interest_points_factor should represent a percentage of " \
                                                         "the base set of interest points that are required to be " \
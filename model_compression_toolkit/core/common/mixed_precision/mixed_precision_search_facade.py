@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-import copy
 from enum import Enum
 import numpy as np
 from typing import List, Callable, Dict
@@ -21,9 +20,11 @@ from typing import List, Callable, Dict
 from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import kpi_functions_mapping
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import \
+    get_kpi_functions_mapping
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import MixedPrecisionSearchManager
+from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
     mp_integer_programming_search
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
@@ -49,7 +50,8 @@ def search_bit_width(graph_to_search_cfg: Graph,
                      target_kpi: KPI,
                      mp_config: MixedPrecisionQuantizationConfigV2,
                      representative_data_gen: Callable,
-                     search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING) -> List[int]:
+                     search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING,
+                     sensitivity_evaluator: SensitivityEvaluation = None) -> List[int]:
     """
     Search for an MP configuration for a given graph. Given a search_method method (by default, it's linear
     programming), we use the sensitivity_evaluator object that provides a function to compute an
@@ -66,6 +68,9 @@ def search_bit_width(graph_to_search_cfg: Graph,
         mp_config: Mixed-precision quantization configuration.
         representative_data_gen: Dataset to use for retrieving images for the models inputs.
         search_method: BitWidthSearchMethod to define which searching method to use.
+        sensitivity_evaluator: A SensitivityEvaluation of graph_to_search_cfg to use for the search (e.g., an
+            evaluator that is shared by searches of the graph with different target KPIs, so the metrics it
+            computed and cached in earlier searches are reused). If None, a new evaluator is created.
 
     Returns:
         A MP configuration for the graph (list of integers, where the index in the list, is the node's
@@ -79,29 +84,31 @@ def search_bit_width(graph_to_search_cfg: Graph,
         Logger.critical('Target KPI have to be passed for search_methods bit-width configuration')  # pragma: no cover
 
     # Set graph for MP search
-    graph = copy.deepcopy(graph_to_search_cfg)  # Copy graph before searching
+    graph = graph_to_search_cfg.clone()  # Copy graph before searching (weights are shared with the copy)
     if target_kpi.bops < np.inf:
         # Since Bit-operations count target KPI is set, we need to reconstruct the graph for the MP search
         graph = substitute(graph, fw_impl.get_substitutions_virtual_weights_activation_coupling())
 
-    # If we only run weights compression with MP than no need to consider activation quantization when computing the
-    # MP metric (it adds noise to the computation)
-    disable_activation_for_metric = (target_kpi.weights_memory < np.inf and
-                                    (target_kpi.activation_memory == np.inf and
-                                     target_kpi.total_memory == np.inf and
-                                     target_kpi.bops == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
+    disable_activation_for_metric = _is_activation_disabled_for_metric(graph_to_search_cfg, target_kpi)
 
     # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
     # even if a virtual graph was created (and is used only for BOPS KPI computation purposes)
-    se = fw_impl.get_sensitivity_evaluator(
-        graph_to_search_cfg,
-        mp_config,
-        representative_data_gen=representative_data_gen,
-        fw_info=fw_info,
-        disable_activation_for_metric=disable_activation_for_metric)
+    if sensitivity_evaluator is None:
+        se = get_sensitivity_evaluator(graph_to_search_cfg,
+                                       fw_info,
+                                       fw_impl,
+                                       target_kpi,
+                                       mp_config,
+                                       representative_data_gen)
+    else:
+        if sensitivity_evaluator.graph is not graph_to_search_cfg or \
+                sensitivity_evaluator.disable_activation_for_metric != disable_activation_for_metric:
+            Logger.critical('The given sensitivity evaluator was not created for the searched graph and the '
+                            'metric of the target KPI, use get_sensitivity_evaluator to create it.')
+        se = sensitivity_evaluator
 
     # Each pair of (KPI method, KPI aggregation) should match to a specific provided kpi target
-    kpi_functions = kpi_functions_mapping
+    kpi_functions = get_kpi_functions_mapping(target_kpi)
 
     # Instantiate a manager object
     search_manager = MixedPrecisionSearchManager(graph,
@@ -125,3 +132,54 @@ def search_bit_width(graph_to_search_cfg: Graph,
         result_bit_cfg = greedy_solution_refinement_procedure(result_bit_cfg, search_manager, target_kpi)
 
     return result_bit_cfg
+
+
+def get_sensitivity_evaluator(graph_to_search_cfg: Graph,
+                              fw_info: FrameworkInfo,
+                              fw_impl: FrameworkImplementation,
+                              target_kpi: KPI,
+                              mp_config: MixedPrecisionQuantizationConfigV2,
+                              representative_data_gen: Callable) -> SensitivityEvaluation:
+    """
+    Create a sensitivity evaluator for the MP search of a graph with a given target KPI. The evaluator can be
+    passed to search_bit_width to search the graph with several target KPIs (that use the same metric, i.e.,
+    all of them either consider the activation quantization in the metric or not), so the metrics that are
+    cached by the evaluator in a search are reused by the following searches.
+
+    Args:
+        graph_to_search_cfg: Graph to search a MP configuration for.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_kpi: Target KPI of the search (determines whether the activation quantization is considered in the metric).
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+
+    Returns:
+        A SensitivityEvaluation of the graph.
+    """
+    return fw_impl.get_sensitivity_evaluator(
+        graph_to_search_cfg,
+        mp_config,
+        representative_data_gen=representative_data_gen,
+        fw_info=fw_info,
+        disable_activation_for_metric=_is_activation_disabled_for_metric(graph_to_search_cfg, target_kpi))
+
+
+def _is_activation_disabled_for_metric(graph_to_search_cfg: Graph, target_kpi: KPI) -> bool:
+    """
+    Check whether the activation quantization should be disabled when computing the MP metric for a target KPI.
+    If we only run weights compression with MP than no need to consider activation quantization when computing the
+    MP metric (it adds noise to the computation).
+
+    Args:
+        graph_to_search_cfg: Graph to search a MP configuration for.
+        target_kpi: Target KPI of the search.
+
+    Returns:
+        Whether to disable the activation quantization when computing the MP metric.
+    """
+    return (target_kpi.weights_memory < np.inf and
+            (target_kpi.activation_memory == np.inf and
+             target_kpi.total_memory == np.inf and
+             target_kpi.bops == np.inf and
+             target_kpi.activation_max_cut_memory == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
@@ -244,7 +244,7 @@ class MixedPrecisionSearchManager:
         """
 
         non_conf_kpi_dict = {}
-        for target, kpi_value in self.target_kpi.get_kpi_dict().items():
+        for target in self.compute_kpi_functions.keys():
             # Call for the KPI method of the given target - empty quantization configuration list is passed since we
             # compute for non-configurable nodes
             if target == KPITarget.BOPS:
@@ -315,6 +315,9 @@ class ConfigReconstructionHelper:
 
         self.virtual_sorted_nodes_names = self.virtual_graph.get_configurable_sorted_nodes_names()
         self.origin_sorted_conf_nodes_names = self.original_graph.get_configurable_sorted_nodes_names()
+        # Indices of the configurable nodes' names in the sorted configurable nodes lists.
+        self.virtual_conf_nodes_index = self.virtual_graph.get_configurable_nodes_index()
+        self.origin_conf_nodes_index = self.original_graph.get_configurable_nodes_index()
 
         self.origin_node_idx_to_cfg = {}
 
@@ -422,10 +425,10 @@ class ConfigReconstructionHelper:
             self.get_weights_for_split_activation(n, n, virtual_cfg_idx, virtual_mp_cfg)
         else:
             # Node didn't change in virtual graph - candidates list is similar to original
-            if n.name not in self.origin_sorted_conf_nodes_names:
+            origin_idx = self.origin_conf_nodes_index.get(n.name)
+            if origin_idx is None:
                 Logger.error(f"Node {n.name} appears in virtual graph as configurable, "
                              f"but is not configurable in the original graph.")  # pragma: no cover
-            origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
             self.origin_node_idx_to_cfg[origin_idx] = virtual_cfg_idx
 
     def retrieve_weights_only_config(self, weights_node: BaseNode, virtual_node: BaseNode, virtual_cfg_idx: int):
@@ -493,7 +496,7 @@ class ConfigReconstructionHelper:
         """
 
         activation_bitwidth = activation_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(activation_node.name)]].activation_quantization_cfg.activation_n_bits
+            self.virtual_conf_nodes_index[activation_node.name]]].activation_quantization_cfg.activation_n_bits
 
         weights_bitwidth = virtual_node.candidates_quantization_cfg[virtual_cfg_idx].weights_quantization_cfg.weights_n_bits
 
@@ -524,7 +527,7 @@ class ConfigReconstructionHelper:
         """
 
         weights_bitwidth = weights_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(weights_node.name)]].weights_quantization_cfg.weights_n_bits
+            self.virtual_conf_nodes_index[weights_node.name]]].weights_quantization_cfg.weights_n_bits
 
         activation_bitwidth = virtual_node.candidates_quantization_cfg[
             virtual_cfg_idx].activation_quantization_cfg.activation_n_bits
@@ -634,5 +637,5 @@ class ConfigReconstructionHelper:
 
         """
 
-        origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
+        origin_idx = self.origin_conf_nodes_index[n.name]
         self.origin_node_idx_to_cfg[origin_idx] = origin_cfg_idx
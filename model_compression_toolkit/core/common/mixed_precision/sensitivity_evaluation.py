@@ -12,13 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import copy
+from collections import OrderedDict
 
 import numpy as np
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Tuple
 
 from model_compression_toolkit.core import FrameworkInfo, MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.activation_store import ActivationStore
+from model_compression_toolkit.core.common.jacobian_weights_cache import JacobianWeightsCache
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.logger import Logger
 
@@ -90,14 +93,30 @@ class SensitivityEvaluation:
         # in the new built MP model.
         self.baseline_model, self.model_mp, self.conf_node2layers = self._build_models()
 
-        # Build images batches for inference comparison
+        # The configuration the MP model is currently configured to (None if it is unknown, before the model is
+        # configured to a full configuration for the first time).
+        self._model_configuration = None
+
+        # LRU cache of computed metrics, by the configuration the MP model was configured to when computing them.
+        # The cache belongs to this evaluation (of a graph and its interest points and images), so it is reused by
+        # all the searches that use this evaluator (e.g., searches of the graph with different target KPIs).
+        self._metric_cache = OrderedDict()
+        self.metric_cache_hits = 0
+        self.metric_cache_misses = 0
+
+        # Caches of the MP model's inference on each images batch with the configuration in
+        # _inference_caches_configuration, to resume the inference from modified configurable nodes
+        # (used if incremental_sensitivity_evaluation is enabled).
+        self._inference_caches = None
+        self._inference_caches_configuration = None
+        self._incremental_inference_supported = True
+
+        # Build images batches for inference comparison. The batches are kept as numpy arrays in a store (in RAM
+        # up to the samples RAM budget, and on disk beyond it), and are cast to the framework tensor type when used.
         self.images_batches = self._get_images_batches(quant_config.num_of_images)
 
         # Get baseline model inference on all samples
-        self.baseline_tensors_list = []  # setting from outside scope
-
-        # Casting images tensors to the framework tensor type.
-        self.images_batches = list(map(lambda in_arr: self.fw_impl.to_tensor(in_arr), self.images_batches))
+        self.baseline_tensors_list = None  # setting from outside scope
 
         # Initiating baseline_tensors_list since it is not initiated in SensitivityEvaluationManager init.
         self._init_baseline_tensors_list()
@@ -110,7 +129,13 @@ class SensitivityEvaluation:
                 f"{self.outputs_replacement_nodes} and {self.output_nodes_indices} " \
                 f"should've been assigned before computing the gradient-based weights."
 
-            self.interest_points_gradients = self._compute_gradient_based_weights()
+            if self.quant_config.jacobians_cache_dir is not None:
+                jacobians_cache = JacobianWeightsCache(self.quant_config.jacobians_cache_dir,
+                                                       self.quant_config.jacobians_cache_size)
+                self.interest_points_gradients = jacobians_cache.get_or_compute(self._get_jacobians_cache_key(),
+                                                                                self._compute_gradient_based_weights)
+            else:
+                self.interest_points_gradients = self._compute_gradient_based_weights()
             self.quant_config.distance_weighting_method = lambda d: self.interest_points_gradients
 
     def compute_metric(self,
@@ -132,28 +157,158 @@ class SensitivityEvaluation:
             The sensitivity metric of the MP model for a given configuration.
         """
 
+        cache_key = self._get_metric_cache_key(mp_model_configuration, node_idx)
+
+        if cache_key in self._metric_cache:
+            self.metric_cache_hits += 1
+            self._metric_cache.move_to_end(cache_key)
+            # The model is not configured to compute a cached metric. Only the nodes whose configuration differs
+            # from the configuration the model should be left in (usually none, when the model is already
+            # configured to the baseline configuration) are configured.
+            self._configure_modified_nodes(self._get_final_configuration(cache_key,
+                                                                         node_idx,
+                                                                         baseline_mp_configuration))
+            return self._metric_cache[cache_key]
+
+        # Names of the modified nodes to resume the MP model inference from (None for a full inference).
+        modified_nodes_names = self._prepare_incremental_inference(node_idx, baseline_mp_configuration)
+
         # Configure MP model with the given configuration.
         self._configure_bitwidths_model(mp_model_configuration,
                                         node_idx)
 
         # Compute the distance matrix
-        distance_matrix = self._build_distance_matrix()
+        distance_matrix = self._build_distance_matrix(modified_nodes_names)
+        metric = self._compute_mp_distance_measure(distance_matrix, self.quant_config.distance_weighting_method)
+        if cache_key is not None:
+            self.metric_cache_misses += 1
+            self._metric_cache[cache_key] = metric
+            if len(self._metric_cache) > self.quant_config.metric_cache_size:
+                self._metric_cache.popitem(last=False)
 
         # Configure MP model back to the same configuration as the baseline model if baseline provided
         if baseline_mp_configuration is not None:
             self._configure_bitwidths_model(baseline_mp_configuration,
                                             node_idx)
 
-        return self._compute_mp_distance_measure(distance_matrix, self.quant_config.distance_weighting_method)
+        return metric
+
+    def _get_final_configuration(self,
+                                 configuration: Tuple[int],
+                                 node_idx: List[int],
+                                 baseline_mp_configuration: List[int]) -> List[int]:
+        """
+        Computes the configuration the MP model is left in after computing the metric of a configuration.
+
+        Args:
+            configuration: The full configuration the metric is computed for (its metrics cache key).
+            node_idx: A list of nodes' indices to configure (None if the entire configuration is configured).
+            baseline_mp_configuration: A mixed-precision configuration to set the model back to after computing
+                the metric (None if the model is left in the configuration the metric is computed for).
+
+        Returns:
+            The configuration the MP model is left in.
+        """
+        if baseline_mp_configuration is None:
+            return list(configuration)
+        if node_idx is None:
+            return list(baseline_mp_configuration)
+        final_configuration = list(self._model_configuration)
+        for i in node_idx:
+            final_configuration[i] = baseline_mp_configuration[i]
+        return final_configuration
+
+    def _configure_modified_nodes(self, mp_model_configuration: List[int]):
+        """
+        Configures the MP model to a configuration by configuring only the nodes whose configuration differs from
+        the configuration the model is currently configured to (or all the nodes, if it is unknown).
+
+        Args:
+            mp_model_configuration: Configuration of bit-width indices to set to the model.
+        """
+        if self._model_configuration is None:
+            self._configure_bitwidths_model(mp_model_configuration, None)
+        else:
+            self._configure_bitwidths_model(mp_model_configuration,
+                                            [i for i, (current, bitwidth_idx) in
+                                             enumerate(zip(self._model_configuration, mp_model_configuration))
+                                             if current != bitwidth_idx])
+
+    def _prepare_incremental_inference(self,
+                                       node_idx: List[int],
+                                       baseline_mp_configuration: List[int]) -> List[str]:
+        """
+        Checks whether the metric of a configuration can be computed by resuming the MP model inference from
+        the modified nodes, which is possible when specific nodes are modified relative to the baseline
+        configuration and the MP model is currently configured to the baseline configuration. If so, and the
+        inference caches were not created for the baseline configuration, they are created (by running the MP
+        model with the baseline configuration).
+
+        Args:
+            node_idx: A list of nodes' indices to configure.
+            baseline_mp_configuration: A mixed-precision configuration to set the model back to after modifying it.
+
+        Returns:
+            The names of the modified nodes to resume the inference from, or None if a full inference is required.
+        """
+        if not self.quant_config.incremental_sensitivity_evaluation or not self._incremental_inference_supported \
+                or not node_idx or baseline_mp_configuration is None \
+                or self._model_configuration != list(baseline_mp_configuration):
+            return None
+
+        if self._inference_caches_configuration != self._model_configuration:
+            self._inference_caches = [self.fw_impl.sensitivity_eval_inference_with_cache(
+                self.model_mp, self.fw_impl.to_tensor(images), self.sorted_configurable_nodes_names)[1]
+                for images in self.images_batches]
+            if any([c is None for c in self._inference_caches]):
+                Logger.warning('Incremental sensitivity evaluation is not supported for the MP model, '
+                               'using a full inference to compute the sensitivity metric.')
+                self._incremental_inference_supported = False
+                return None
+            self._inference_caches_configuration = list(self._model_configuration)
+
+        return [self.sorted_configurable_nodes_names[i] for i in node_idx]
+
+    def _get_metric_cache_key(self,
+                              mp_model_configuration: List[int],
+                              node_idx: List[int] = None) -> Tuple[int]:
+        """
+        Computes the key of a metric in the metrics cache, which is the full configuration that the MP model is
+        configured to when computing the metric (a configuration of specific nodes modifies the configuration that
+        the model is currently configured to).
+
+        Args:
+            mp_model_configuration: Bitwidth configuration to use to configure the MP model.
+            node_idx: A list of nodes' indices to configure (instead of using the entire mp_model_configuration).
+
+        Returns:
+            The configuration as a tuple, or None if the metric should not be cached (the cache is disabled, or the
+            MP model's current configuration is unknown).
+        """
+        if self.quant_config.metric_cache_size <= 0:
+            return None
+        if node_idx is None:
+            return tuple(mp_model_configuration)
+        if self._model_configuration is None:
+            return None
+        configuration = list(self._model_configuration)
+        for i in node_idx:
+            configuration[i] = mp_model_configuration[i]
+        return tuple(configuration)
 
     def _init_baseline_tensors_list(self):
         """
-        Evaluates the baseline model on all images and saves the obtained lists of tensors in a list for later use.
+        Evaluates the baseline model on all images and saves the obtained lists of tensors in a store for later use
+        (with the RAM budget that is left after storing the images batches).
         Initiates a class variable self.baseline_tensors_list
         """
-        self.baseline_tensors_list = [self.fw_impl.to_numpy(self.fw_impl.sensitivity_eval_inference(self.baseline_model,
-                                                                                                    images))
-                                      for images in self.images_batches]
+        ram_budget = self.quant_config.samples_ram_budget
+        if ram_budget is not None:
+            ram_budget = max(ram_budget - self.images_batches.ram_bytes, 0)
+        self.baseline_tensors_list = ActivationStore(ram_budget=ram_budget)
+        for images in self.images_batches:
+            self.baseline_tensors_list.append(self.fw_impl.to_numpy(
+                self.fw_impl.sensitivity_eval_inference(self.baseline_model, self.fw_impl.to_tensor(images))))
 
     def _build_models(self) -> Any:
         """
@@ -164,17 +319,23 @@ class SensitivityEvaluation:
             Note that the type of the returned models is dependent on the used framework (TF/Pytorch).
         """
 
-        evaluation_graph = copy.deepcopy(self.graph)
+        evaluation_graph = self.graph.clone()
 
         if self.disable_activation_for_metric:
             for n in evaluation_graph.get_topo_sorted_nodes():
                 for c in n.candidates_quantization_cfg:
                     c.activation_quantization_cfg.enable_activation_quantization = False
 
+        weights_cache = None
+        if self.quant_config.candidate_weights_cache_size is not None:
+            weights_cache = CandidateWeightsCache(self.quant_config.candidate_weights_cache_size,
+                                                  compact=self.quant_config.compact_candidate_weights)
+
         model_mp, _, conf_node2layers = self.fw_impl.model_builder(evaluation_graph,
                                                                    mode=ModelBuilderMode.MIXEDPRECISION,
                                                                    append2output=self.interest_points,
-                                                                   fw_info=self.fw_info)
+                                                                   fw_info=self.fw_info,
+                                                                   weights_cache=weights_cache)
 
         # Build a baseline model.
         baseline_model, _ = self.fw_impl.model_builder(evaluation_graph,
@@ -191,23 +352,49 @@ class SensitivityEvaluation:
         to be used for the distance metric weighted average computation.
         """
 
+        images_per_pass = self.quant_config.jacobians_images_per_pass
         grad_per_batch = []
         for images in self.images_batches:
-            batch_ip_gradients = []
-            for i in range(1, images[0].shape[0] + 1):
-                Logger.info(f"Computing Jacobian-based weights approximation for image sample {i} out of {images[0].shape[0]}...")
-                image_ip_gradients = self.fw_impl.model_grad(self.graph,
-                                                             {inode: images[0][i - 1:i] for inode in
-                                                              self.graph.get_inputs()},
-                                                             self.interest_points,
-                                                             self.outputs_replacement_nodes,
-                                                             self.output_nodes_indices,
-                                                             self.quant_config.output_grad_factor,
-                                                             norm_weights=self.quant_config.norm_weights)
-                batch_ip_gradients.append(image_ip_gradients)
-            grad_per_batch.append(np.mean(batch_ip_gradients, axis=0))
+            images = self.fw_impl.to_tensor(images)
+            num_images = images[0].shape[0]
+            batch_ip_gradients, passes_num_images = [], []
+            for i in range(0, num_images, images_per_pass):
+                pass_num_images = min(images_per_pass, num_images - i)
+                Logger.info(f"Computing Jacobian-based weights approximation for image samples {i + 1}-"
+                            f"{i + pass_num_images} out of {num_images}...")
+                pass_ip_gradients = self.fw_impl.model_grad(self.graph,
+                                                            {inode: images[0][i:i + pass_num_images] for inode in
+                                                             self.graph.get_inputs()},
+                                                            self.interest_points,
+                                                            self.outputs_replacement_nodes,
+                                                            self.output_nodes_indices,
+                                                            self.quant_config.output_grad_factor,
+                                                            n_iter=self.quant_config.jacobians_n_iter,
+                                                            norm_weights=self.quant_config.norm_weights,
+                                                            n_probes=self.quant_config.jacobians_n_probes)
+                batch_ip_gradients.append(pass_ip_gradients)
+                passes_num_images.append(pass_num_images)
+            grad_per_batch.append(np.average(batch_ip_gradients, axis=0, weights=passes_num_images))
         return np.mean(grad_per_batch, axis=0)
 
+    def _get_jacobians_cache_key(self) -> str:
+        """
+        Returns: Key of the gradient-based weights in the Jacobian-based weights cache, which identifies the float
+        graph, the interest points, the images and the approximation settings.
+        """
+        return JacobianWeightsCache.get_key(self.graph,
+                                            self.interest_points,
+                                            self.images_batches,
+                                            {'framework': type(self.fw_impl).__name__,
+                                             'outputs_replacement_nodes': [n.name for n in
+                                                                           self.outputs_replacement_nodes],
+                                             'output_nodes_indices': sorted(self.output_nodes_indices),
+                                             'output_grad_factor': self.quant_config.output_grad_factor,
+                                             'norm_weights': self.quant_config.norm_weights,
+                                             'n_probes': self.quant_config.jacobians_n_probes,
+                                             'n_iter': self.quant_config.jacobians_n_iter,
+                                             'images_per_pass': self.quant_config.jacobians_images_per_pass})
+
     def _configure_bitwidths_model(self,
                                    mp_model_configuration: List[int],
                                    node_idx: List[int]):
@@ -234,6 +421,13 @@ class SensitivityEvaluation:
                 self._configure_node_bitwidth(self.sorted_configurable_nodes_names,
                                               mp_model_configuration, node_idx_to_configure)
 
+        # Track the configuration of the model (for the metrics cache keys).
+        if node_idx is None:
+            self._model_configuration = list(mp_model_configuration)
+        elif self._model_configuration is not None:
+            for i in node_idx:
+                self._model_configuration[i] = mp_model_configuration[i]
+
     def _configure_node_bitwidth(self,
                                  sorted_configurable_nodes_names: List[str],
                                  mp_model_configuration: List[int],
@@ -287,9 +481,14 @@ class SensitivityEvaluation:
 
         return distance_matrix
 
-    def _build_distance_matrix(self):
+    def _build_distance_matrix(self, modified_nodes_names: List[str] = None):
         """
         Builds a matrix that contains the distances between the baseline and MP models for each interest point.
+
+        Args:
+            modified_nodes_names: Names of modified nodes to resume the MP model inference from, using the inference
+                caches (if None, a full inference of the MP model is used).
+
         Returns: A distance matrix.
         """
         # List of distance matrices. We create a distance matrix for each sample from the representative_data_gen
@@ -297,9 +496,14 @@ class SensitivityEvaluation:
         distance_matrices = []
 
         # Compute the distance matrix for num_of_images images.
-        for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
-            # when using model.predict(), it does not use the QuantizeWrapper functionality
-            mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, images)
+        for batch_idx, (images, baseline_tensors) in enumerate(zip(self.images_batches, self.baseline_tensors_list)):
+            if modified_nodes_names is None:
+                # when using model.predict(), it does not use the QuantizeWrapper functionality
+                mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, self.fw_impl.to_tensor(images))
+            else:
+                mp_tensors = self.fw_impl.sensitivity_eval_inference_from_cache(self.model_mp,
+                                                                                self._inference_caches[batch_idx],
+                                                                                modified_nodes_names)
             mp_tensors = self.fw_impl.to_numpy(mp_tensors)
 
             # Build distance matrix: similarity between the baseline model to the float model
@@ -329,18 +533,18 @@ class SensitivityEvaluation:
         # Use weights such that every layer's distance is weighted differently (possibly).
         return np.average(mean_distance_per_layer, weights=metrics_weights_fn(distance_matrix))
 
-    def _get_images_batches(self, num_of_images: int) -> List[Any]:
+    def _get_images_batches(self, num_of_images: int) -> ActivationStore:
         """
         Construct batches of image samples for inference.
 
         Args:
             num_of_images: Num of total images for evaluation.
 
-        Returns: A list of images batches (lists of images)
+        Returns: A store of images batches (lists of images)
         """
         # First, select images to use for all measurements.
         samples_count = 0  # Number of images we used so far to compute the distance matrix.
-        images_batches = []
+        images_batches = ActivationStore(ram_budget=self.quant_config.samples_ram_budget)
         for inference_batch_input in self.representative_data_gen():
             if samples_count >= num_of_images:
                 break
@@ -0,0 +1,70 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import queue
+import threading
+from typing import Any, Iterator
+
+# Marks the end of the batches in the prefetching queue.
+_END_OF_BATCHES = object()
+
+
+def prefetch(batches: Iterator[Any], num_batches: int) -> Iterator[Any]:
+    """
+    Prepares batches in a background thread.
+
+    Args:
+        batches: Iterator over batches.
+        num_batches: Maximal number of prepared batches waiting to be consumed.
+
+    Returns:
+        An iterator over the prepared batches. An exception in the preparation of a batch is raised when the batch
+        is consumed.
+    """
+    prepared = queue.Queue(maxsize=num_batches)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        # Wait for room in the queue, unless the consumer stopped consuming the batches.
+        while not stop.is_set():
+            try:
+                prepared.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for batch in batches:
+                if not _put((batch, None)):
+                    return
+        except Exception as e:
+            _put((None, e))
+            return
+        _put((_END_OF_BATCHES, None))
+
+    producer = threading.Thread(target=_produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            batch, error = prepared.get()
+            if error is not None:
+                raise error
+            if batch is _END_OF_BATCHES:
+                return
+            yield batch
+    finally:
+        stop.set()
+        producer.join()
@@ -0,0 +1,166 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Tuple, Union
+
+import numpy as np
+
+# Maximal number of levels in a channel for its codes to be packed in 4 bits (two codes in a byte).
+MAX_PACKED_LEVELS = 16
+
+
+class CompactWeights:
+    """
+    Compact form of a quantized weights tensor: since a quantized tensor has a small number of distinct values
+    in each output channel (its quantization grid or LUT centers), it is stored as integer codes of the values
+    in a per-channel levels table. Codes of tensors with up to 16 levels per channel are packed in 4 bits, and
+    otherwise are stored in 8 or 16 bits (or 32 bits, for tensors that are not quantized).
+
+    The compact form is lossless: the decompressed tensor equals the quantized tensor.
+    """
+
+    def __init__(self,
+                 quantized_weights: np.ndarray,
+                 channels_axis: int = None):
+        """
+        Args:
+            quantized_weights: Quantized weights tensor to store.
+            channels_axis: Axis of the output channels of the tensor. If None, a single levels table is used
+                for the entire tensor.
+        """
+        self.shape = quantized_weights.shape
+        self.dtype = quantized_weights.dtype
+        self.channels_axis = channels_axis
+
+        channels = self._to_channels(quantized_weights)
+        channels_levels = [np.unique(c) for c in channels]
+        num_levels = max([len(l) for l in channels_levels])
+        codes_dtype = np.uint8 if num_levels <= np.iinfo(np.uint8).max + 1 else \
+            np.uint16 if num_levels <= np.iinfo(np.uint16).max + 1 else np.uint32
+
+        # Pad the levels of each channel with its last level, so the levels are stored as a single array.
+        self.levels = np.stack([np.pad(l, (0, num_levels - len(l)), mode='edge') for l in channels_levels])
+        codes = np.stack([np.searchsorted(l, c) for l, c in zip(channels_levels, channels)]).astype(codes_dtype)
+
+        self.packed = num_levels <= MAX_PACKED_LEVELS
+        self.num_codes = codes.shape[1]
+        self.codes = self._pack(codes) if self.packed else codes
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns: Number of bytes of the compact form.
+        """
+        return self.levels.nbytes + self.codes.nbytes
+
+    @property
+    def size(self) -> int:
+        """
+        Returns: Number of elements of the tensor.
+        """
+        return int(np.prod(self.shape))
+
+    def decompress(self) -> np.ndarray:
+        """
+        Returns: The quantized weights tensor.
+        """
+        codes = self._unpack(self.codes, self.num_codes) if self.packed else self.codes
+        channels = np.take_along_axis(self.levels, codes.astype(np.int64), axis=1).astype(self.dtype)
+        if self.channels_axis is None:
+            return channels.reshape(self.shape)
+        return np.moveaxis(channels.reshape(self._moved_shape()), 0, self.channels_axis)
+
+    def _moved_shape(self) -> Tuple[int]:
+        """
+        Returns: Shape of the tensor when its channels axis is the first axis.
+        """
+        return (self.shape[self.channels_axis],) + tuple(np.delete(self.shape, self.channels_axis))
+
+    def _to_channels(self, tensor: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            tensor: Tensor to split.
+
+        Returns:
+            A 2D array with a row of the flattened values of each channel of the tensor.
+        """
+        if self.channels_axis is None:
+            return tensor.reshape(1, -1)
+        return np.moveaxis(tensor, self.channels_axis, 0).reshape(tensor.shape[self.channels_axis], -1)
+
+    @staticmethod
+    def _pack(codes: np.ndarray) -> np.ndarray:
+        """
+        Packs two 4-bit codes in each byte.
+
+        Args:
+            codes: A 2D array of codes that are smaller than 16.
+
+        Returns:
+            A 2D array of bytes with half the number of columns (rounded up).
+        """
+        if codes.shape[1] % 2:
+            codes = np.pad(codes, ((0, 0), (0, 1)))
+        return (codes[:, 0::2] | (codes[:, 1::2] << 4)).astype(np.uint8)
+
+    @staticmethod
+    def _unpack(packed_codes: np.ndarray, num_codes: int) -> np.ndarray:
+        """
+        Unpacks codes that were packed by _pack.
+
+        Args:
+            packed_codes: A 2D array of packed codes.
+            num_codes: Number of codes in each row.
+
+        Returns:
+            A 2D array of the codes.
+        """
+        codes = np.empty((packed_codes.shape[0], 2 * packed_codes.shape[1]), dtype=np.uint8)
+        codes[:, 0::2] = packed_codes & 0xF
+        codes[:, 1::2] = packed_codes >> 4
+        return codes[:, :num_codes]
+
+
+def compact_quantized_weights(quantized_weights: np.ndarray,
+                              channels_axis: int = None) -> Union[np.ndarray, CompactWeights]:
+    """
+    Converts quantized weights to their compact form, if it is smaller than the weights.
+
+    Args:
+        quantized_weights: Quantized weights tensor.
+        channels_axis: Axis of the output channels of the tensor, or None if it was quantized per-tensor.
+
+    Returns:
+        A CompactWeights of the weights, or the weights as is if the compact form is not smaller (e.g., the
+        weights have many distinct values).
+    """
+    if quantized_weights.size == 0:
+        return quantized_weights
+    compact_weights = CompactWeights(quantized_weights, channels_axis)
+    if compact_weights.nbytes < quantized_weights.nbytes:
+        return compact_weights
+    return quantized_weights
+
+
+def get_weights_array(weights: Union[np.ndarray, CompactWeights]) -> np.ndarray:
+    """
+    Args:
+        weights: Weights tensor, or weights in a compact form.
+
+    Returns:
+        The weights tensor.
+    """
+    if isinstance(weights, CompactWeights):
+        return weights.decompress()
+    return weights
@@ -97,6 +97,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         self.z_threshold = qc.z_threshold
         self.shift_negative_ratio = qc.shift_negative_ratio
         self.shift_negative_threshold_recalculation = qc.shift_negative_threshold_recalculation
+        self.histogram_error_engine = qc.histogram_error_engine
 
     def quantize_node_output(self,
                              tensors: Any) -> Any:
@@ -208,7 +209,8 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
                self.shift_negative_activation_correction == other.shift_negative_activation_correction and \
                self.z_threshold == other.z_threshold and \
                self.shift_negative_ratio == other.shift_negative_ratio and \
-               self.shift_negative_threshold_recalculation == other.shift_negative_threshold_recalculation
+               self.shift_negative_threshold_recalculation == other.shift_negative_threshold_recalculation and \
+               self.histogram_error_engine == other.histogram_error_engine
 
     def __hash__(self):
         return hash((self.activation_quantization_fn,
@@ -224,7 +226,8 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
                      self.shift_negative_activation_correction,
                      self.z_threshold,
                      self.shift_negative_ratio,
-                     self.shift_negative_threshold_recalculation))
+                     self.shift_negative_threshold_recalculation,
+                     self.histogram_error_engine))
 
 
 class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
@@ -260,6 +263,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
         self.enable_weights_quantization = op_cfg.enable_weights_quantization
         self.min_threshold = qc.min_threshold
         self.l_p_value = qc.l_p_value
+        self.weights_error_sample_size = qc.weights_error_sample_size
+        self.compact_quantized_weights = qc.compact_quantized_weights
 
 
     @property
@@ -331,7 +336,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
                                                                                     n_bits=self.weights_n_bits,
                                                                                     per_channel=self.weights_per_channel_threshold and self.weights_channels_axis is not None,
                                                                                     channel_axis=self.weights_channels_axis,
-                                                                                    min_threshold=self.min_threshold))
+                                                                                    min_threshold=self.min_threshold,
+                                                                                    error_sample_size=self.weights_error_sample_size))
         else:
             return self.set_weights_quantization_param({})
 
@@ -367,7 +373,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
                self.weights_per_channel_threshold == other.weights_per_channel_threshold and \
                self.enable_weights_quantization == other.enable_weights_quantization and \
                self.min_threshold == other.min_threshold and \
-               self.l_p_value == other.l_p_value
+               self.l_p_value == other.l_p_value and \
+               self.weights_error_sample_size == other.weights_error_sample_size
 
     def __hash__(self):
         return hash((self.weights_quantization_fn,
@@ -381,4 +388,5 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
                      self.weights_per_channel_threshold,
                      self.enable_weights_quantization,
                      self.min_threshold,
-                     self.l_p_value))
+                     self.l_p_value,
+                     self.weights_error_sample_size))
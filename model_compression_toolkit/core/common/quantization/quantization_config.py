@@ -63,7 +63,14 @@ class QuantizationConfig:
                  residual_collapsing: bool = True,
                  shift_negative_ratio: float = 0.05,
                  shift_negative_threshold_recalculation: bool = False,
-                 shift_negative_params_search: bool = False):
+                 shift_negative_params_search: bool = False,
+                 streaming_histogram_collection: bool = False,
+                 weights_error_sample_size: int = None,
+                 qparams_computation_n_workers: int = 1,
+                 compiled_inference: bool = False,
+                 compiled_inference_jit_compile: bool = False,
+                 compact_quantized_weights: bool = False,
+                 histogram_error_engine: bool = True):
         """
         Class to wrap all different parameters the library quantize the input model according to.
 
@@ -85,6 +92,13 @@ class QuantizationConfig:
             shift_negative_ratio (float): Value for the ratio between the minimal negative value of a non-linearity output to its activation threshold, which above it - shifting negative activation should occur if enabled.
             shift_negative_threshold_recalculation (bool): Whether or not to recompute the threshold after shifting negative activation.
             shift_negative_params_search (bool): Whether to search for optimal shift and threshold in shift negative activation (experimental)
+            streaming_histogram_collection (bool): Whether to fold the activations histograms of all representative batches into a single running histogram with a fixed number of bins (bounded memory), instead of keeping a histogram per batch. Thresholds may slightly differ from the non-streaming collection (up to about two histogram bins).
+            weights_error_sample_size (int): Number of randomly sampled elements (per output channel, when quantizing per-channel) to estimate the quantization error of the weights by during the weights parameters' search, to speed up the search for very large tensors. If None (default), all the weights are used.
+            qparams_computation_n_workers (int): Number of workers to compute the quantization parameters of the nodes with (concurrently). The weights parameters of LUT quantization methods are computed in a process pool and the rest in a thread pool. If 1 (default), the parameters are computed serially.
+            compiled_inference (bool): Whether to run the models that are built for statistics collection, mixed-precision sensitivity evaluation and second moment correction as traced graphs with a fixed input signature, instead of running them eagerly (supported for Keras models).
+            compiled_inference_jit_compile (bool): Whether to compile the traced graphs of the compiled inference with XLA.
+            compact_quantized_weights (bool): Whether to store the quantized kernels of the graph's nodes as integer codes of their per-channel quantization levels (packed in 4 bits for up to 16 levels) instead of float arrays, to reduce the memory of quantized graphs and of their copies. The kernels are dequantized when they are read.
+            histogram_error_engine (bool): Whether to evaluate the candidates of the activations parameters' search on a histogram at once, using prefix sums of the histogram (HistogramErrorEngine). If False, the candidates are evaluated one by one with the histogram error functions.
 
         Examples:
             One may create a quantization configuration to quantize a model according to.
@@ -120,6 +134,13 @@ class QuantizationConfig:
         self.shift_negative_ratio = shift_negative_ratio
         self.shift_negative_threshold_recalculation = shift_negative_threshold_recalculation
         self.shift_negative_params_search = shift_negative_params_search
+        self.streaming_histogram_collection = streaming_histogram_collection
+        self.weights_error_sample_size = weights_error_sample_size
+        self.qparams_computation_n_workers = qparams_computation_n_workers
+        self.compiled_inference = compiled_inference
+        self.compiled_inference_jit_compile = compiled_inference_jit_compile
+        self.compact_quantized_weights = compact_quantized_weights
+        self.histogram_error_engine = histogram_error_engine
 
     def __repr__(self):
         return str(self.__dict__)
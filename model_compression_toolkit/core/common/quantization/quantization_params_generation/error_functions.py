@@ -369,6 +369,73 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
     return quant_method_error_function_mapping[quant_error_method]
 
 
+def get_threshold_selection_tensor_batch_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                        p: int,
+                                                        norm: bool = False,
+                                                        norm_eps: float = 1e-8) -> Callable:
+    """
+    Returns a vectorized version of the error function compatible to the provided error method, to be used
+    in a batched threshold optimization search for tensor quantization, where a tensor is compared to a batch
+    of its quantized versions (one for each candidate) in a single pass.
+    The returned function gets a float tensor and a quantized tensor with additional leading dimensions (that the float
+    tensor is broadcast to), and computes the error along the last axis only. For a single candidate,
+    it computes the same values as the error function of get_threshold_selection_tensor_error_function.
+
+    Args:
+        quant_error_method: the requested error function type.
+        p: p-norm to use for the Lp-norm distance.
+        norm: whether to normalize the error function result.
+        norm_eps: epsilon value for error normalization stability.
+
+    Returns: A Callable method that calculates the errors between a tensor and a batch of quantized tensors, or None
+    if the error method has no vectorized version (in which case the candidates are evaluated one by one).
+    """
+
+    def _batch_error(x: np.ndarray, q_x: np.ndarray, error_fn: Callable) -> np.ndarray:
+        error = error_fn(x - q_x).mean(axis=-1)
+        if norm:
+            error /= (error_fn(x).mean(axis=-1) + norm_eps)
+        return error
+
+    quant_method_batch_error_function_mapping = {
+        qc.QuantizationErrorMethod.MSE: lambda x, q_x: _batch_error(x, q_x, lambda d: d ** 2),
+        qc.QuantizationErrorMethod.MAE: lambda x, q_x: _batch_error(x, q_x, np.abs),
+        qc.QuantizationErrorMethod.LP: lambda x, q_x: _batch_error(x, q_x, lambda d: np.abs(d) ** p)
+    }
+
+    return quant_method_batch_error_function_mapping.get(quant_error_method)
+
+
+def get_threshold_selection_histogram_batch_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                           p: int) -> Callable:
+    """
+    Returns a vectorized version of the histogram error function compatible to the provided error method, to be
+    used in a batched threshold optimization search for histogram quantization, where the errors of a batch of
+    candidate quantization ranges are computed in a single pass using a HistogramErrorEngine of the histogram.
+    The returned function gets the engine, the candidates quantization range bounds and number of bits, and the
+    candidates range bounds to compute the KL-divergence in (which are ignored by the other error methods),
+    and returns a vector with the error of each candidate.
+
+    Args:
+        quant_error_method: the requested error function type.
+        p: p-norm to use for the Lp-norm distance.
+
+    Returns: A Callable method that calculates the errors of a histogram for a batch of quantization ranges.
+    """
+    quant_method_batch_error_function_mapping = {
+        qc.QuantizationErrorMethod.MSE: lambda engine, range_min, range_max, n_bits, kl_range_min, kl_range_max:
+        engine.mse(range_min, range_max, n_bits),
+        qc.QuantizationErrorMethod.MAE: lambda engine, range_min, range_max, n_bits, kl_range_min, kl_range_max:
+        engine.mae(range_min, range_max, n_bits),
+        qc.QuantizationErrorMethod.LP: lambda engine, range_min, range_max, n_bits, kl_range_min, kl_range_max:
+        engine.lp(range_min, range_max, n_bits, p),
+        qc.QuantizationErrorMethod.KL: lambda engine, range_min, range_max, n_bits, kl_range_min, kl_range_max:
+        engine.kl(range_min, range_max, n_bits, kl_range_min, kl_range_max)
+    }
+
+    return quant_method_batch_error_function_mapping[quant_error_method]
+
+
 def get_threshold_selection_histogram_error_function(quantization_method: QuantizationMethod,
                                                      quant_error_method: qc.QuantizationErrorMethod,
                                                      p: int) -> Callable:
@@ -0,0 +1,297 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Tuple
+
+import numpy as np
+
+from model_compression_toolkit.constants import QPARAMS_SEARCH_BATCH_MAX_BYTES
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import \
+    fix_range_to_include_zero, uniform_quantize_tensor
+
+
+class HistogramErrorEngine:
+    """
+    Computes the quantization errors of a histogram for a batch of candidate quantization ranges.
+
+    The prefix sums of the bins' counts and moments (sum of counts, sum of x*count and sum of x^2*count, where x is
+    a bin's value) are computed once for the histogram. Since the bins that are quantized to the same
+    quantization level are a contiguous run of bins, the MSE and MAE of a quantization range are computed from
+    the prefix sums at the boundaries of the quantization levels, so the error of each candidate costs
+    O(levels * log(bins)) instead of O(bins), and all the candidates are computed in a single vectorized pass.
+    The KL-divergence spreads the counts of each quantization level over the level's bins and smooths the
+    distributions of each candidate, so it costs O(bins) per candidate. It is computed for all the candidates in
+    vectorized passes over (candidates, bins) arrays, where the sums of each level are taken from the prefix sums at
+    the boundaries of the level's run of bins (instead of iterating over the unique levels).
+
+    The values of the histogram's bins are the bins' lower edges (as in the histogram error functions
+    in error_functions.py), and the errors are normalized by the total count.
+    """
+
+    def __init__(self, bins: np.ndarray, counts: np.ndarray):
+        """
+        Args:
+            bins: Bins edges of the histogram (sorted, with one more element than counts).
+            counts: Bins counts of the histogram.
+        """
+        self.bins = bins
+        self.values = bins[:-1]
+        self.counts = counts.astype(np.float64)
+        self.total_count = np.sum(self.counts)
+
+        # Prefix sums of the counts, moments and number of non-empty bins, with a leading zero, such that
+        # the sum over the bins [i, j) is prefix[j] - prefix[i].
+        self.prefix_counts = self._prefix_sum(self.counts)
+        self.prefix_first_moment = self._prefix_sum(self.counts * self.values)
+        self.prefix_second_moment = self._prefix_sum(self.counts * np.square(self.values))
+        self.prefix_positive_bins = self._prefix_sum((self.counts > 0).astype(np.float64))
+
+    @staticmethod
+    def _prefix_sum(x: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            x: Values to sum.
+
+        Returns: Cumulative sum of the values with a leading zero.
+        """
+        return np.concatenate([[0.0], np.cumsum(x)])
+
+    def _segments_sums(self, prefix: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            prefix: Prefix sums to compute the segments sums by.
+            starts: Indices of the segments first bins.
+            ends: Indices of the segments last bins (exclusive).
+
+        Returns: The sums of the segments.
+        """
+        return prefix[ends] - prefix[starts]
+
+    def _quantization_levels(self,
+                             range_min: np.ndarray,
+                             range_max: np.ndarray,
+                             n_bits: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the quantization levels of each candidate range and the bins segment of each level.
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+
+        Returns:
+            The quantization levels, and the indices of the first and last (exclusive) bins that are quantized to each
+            level, as (candidates, levels) arrays.
+        """
+        a, b = fix_range_to_include_zero(np.asarray(range_min, dtype=np.float64),
+                                         np.asarray(range_max, dtype=np.float64), n_bits)
+        delta = ((b - a) / (2 ** n_bits - 1)).reshape([-1, 1])
+        levels = delta * np.arange(2 ** n_bits) + a.reshape([-1, 1])
+
+        # A bin is quantized to the level that is nearest to its value (values out of the range are clipped to the
+        # first and last levels), so the levels bins segments are separated by the levels midpoints.
+        bounds = np.searchsorted(self.values, levels[:, :-1] + delta / 2)
+        starts = np.concatenate([np.zeros([len(levels), 1], dtype=int), bounds], axis=1)
+        ends = np.concatenate([bounds, np.full([len(levels), 1], len(self.values))], axis=1)
+        return levels, starts, ends
+
+    def mse(self, range_min: np.ndarray, range_max: np.ndarray, n_bits: int) -> np.ndarray:
+        """
+        Computes the mean square error of quantizing the histogram by each candidate range.
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+
+        Returns: A vector with the MSE of each candidate.
+        """
+        levels, starts, ends = self._quantization_levels(range_min, range_max, n_bits)
+        s0 = self._segments_sums(self.prefix_counts, starts, ends)
+        s1 = self._segments_sums(self.prefix_first_moment, starts, ends)
+        s2 = self._segments_sums(self.prefix_second_moment, starts, ends)
+        # sum((x - level)^2 * count) over each level's segment.
+        errors = np.sum(s2 - 2 * levels * s1 + np.square(levels) * s0, axis=1)
+        return np.maximum(errors, 0) / self.total_count
+
+    def mae(self, range_min: np.ndarray, range_max: np.ndarray, n_bits: int) -> np.ndarray:
+        """
+        Computes the mean absolute error of quantizing the histogram by each candidate range.
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+
+        Returns: A vector with the MAE of each candidate.
+        """
+        levels, starts, ends = self._quantization_levels(range_min, range_max, n_bits)
+        # Split each level's segment to the bins below and above the level.
+        splits = np.clip(np.searchsorted(self.values, levels), starts, ends)
+        below_s0 = self._segments_sums(self.prefix_counts, starts, splits)
+        below_s1 = self._segments_sums(self.prefix_first_moment, starts, splits)
+        above_s0 = self._segments_sums(self.prefix_counts, splits, ends)
+        above_s1 = self._segments_sums(self.prefix_first_moment, splits, ends)
+        errors = np.sum(levels * below_s0 - below_s1 + above_s1 - levels * above_s0, axis=1)
+        return np.maximum(errors, 0) / self.total_count
+
+    def lp(self, range_min: np.ndarray, range_max: np.ndarray, n_bits: int, p: int) -> np.ndarray:
+        """
+        Computes the Lp-norm distance between the histogram and its quantized version for each candidate range.
+        For p=1 and p=2 the distance is computed from the prefix sums (as the MAE and MSE). Higher powers are
+        numerically unstable to compute from prefix sums of higher moments, so other values of p are computed by
+        quantizing the bins of the histogram by all the candidates in a single vectorized pass.
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+            p: p-norm to use for the Lp-norm distance.
+
+        Returns: A vector with the Lp distance of each candidate.
+        """
+        if p == 1:
+            return self.mae(range_min, range_max, n_bits)
+        if p == 2:
+            return self.mse(range_min, range_max, n_bits)
+
+        q_values = uniform_quantize_tensor(self.values,
+                                           np.reshape(range_min, [-1, 1]),
+                                           np.reshape(range_max, [-1, 1]),
+                                           n_bits)
+        return np.sum(np.power(np.abs(q_values - self.values), p) * self.counts, axis=1) / self.total_count
+
+    def kl(self,
+           range_min: np.ndarray,
+           range_max: np.ndarray,
+           n_bits: int,
+           kl_range_min: np.ndarray,
+           kl_range_max: np.ndarray) -> np.ndarray:
+        """
+        Computes the KL-divergence between the histogram and its quantized version for each candidate range,
+        with the same semantics as _kl_error_histogram: the histograms are sliced to the bins in the KL range
+        (where the float histogram's counts out of the slice are accumulated to its edges), and the counts of
+        each quantization level are spread evenly over the non-empty bins of the level.
+        The candidates are computed in vectorized passes over (candidates, bins) arrays, in chunks of candidates
+        of at most QPARAMS_SEARCH_BATCH_MAX_BYTES bytes per array.
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+            kl_range_min: Candidates min bounds of the range to compute the KL-divergence in (vector).
+            kl_range_max: Candidates max bounds of the range to compute the KL-divergence in (vector).
+
+        Returns: A vector with the KL-divergence of each candidate.
+        """
+        range_min = np.reshape(range_min, [-1]).astype(np.float64)
+        range_max = np.reshape(range_max, [-1]).astype(np.float64)
+        kl_range_min, kl_range_max = np.reshape(kl_range_min, [-1]), np.reshape(kl_range_max, [-1])
+
+        first_bin_idx = np.maximum(np.searchsorted(self.bins, kl_range_min) - 1, 0)
+        last_bin_idx = np.searchsorted(self.bins, kl_range_max) - 1
+
+        # The KL range should contain some bins, with some non-empty bins (unless it contains no complete bin).
+        invalid = (self.bins[-1] < kl_range_min) | (self.bins[0] >= kl_range_max)
+        empty = ~invalid & (first_bin_idx >= last_bin_idx)
+        no_positive_bins = ~invalid & ~empty & (self.prefix_positive_bins[np.maximum(last_bin_idx, 0)] ==
+                                                self.prefix_positive_bins[first_bin_idx])
+        errors = np.where(invalid | no_positive_bins, np.inf, 0.0)
+
+        computed = np.flatnonzero(~invalid & ~empty & ~no_positive_bins)
+        chunk_size = max(1, QPARAMS_SEARCH_BATCH_MAX_BYTES // (len(self.values) * np.dtype(np.float64).itemsize))
+        for i in range(0, len(computed), chunk_size):
+            chunk = computed[i:i + chunk_size]
+            errors[chunk] = self._kl(range_min[chunk], range_max[chunk], n_bits,
+                                     first_bin_idx[chunk], last_bin_idx[chunk])
+        return errors
+
+    def _kl(self,
+            range_min: np.ndarray,
+            range_max: np.ndarray,
+            n_bits: int,
+            first_bin_idx: np.ndarray,
+            last_bin_idx: np.ndarray) -> np.ndarray:
+        """
+        Computes the KL-divergence between the histogram and its quantized version for candidates with valid KL
+        ranges (see kl).
+
+        Args:
+            range_min: Candidates min bounds of the quantization range (vector).
+            range_max: Candidates max bounds of the quantization range (vector).
+            n_bits: Number of bits to quantize by.
+            first_bin_idx: Indices of the first bins in the candidates KL ranges (vector).
+            last_bin_idx: Indices of the last bins (exclusive) in the candidates KL ranges (vector).
+
+        Returns: A vector with the KL-divergence of each candidate.
+        """
+        # Only the bins in the KL ranges of the candidates are used (bins indices are relative to the histogram).
+        window_start, window_end = np.min(first_bin_idx), np.max(last_bin_idx)
+        bins_idx = np.arange(window_start, window_end)
+        values, counts = self.values[window_start:window_end], self.counts[window_start:window_end]
+        first, last = first_bin_idx.reshape([-1, 1]), last_bin_idx.reshape([-1, 1])
+        in_range = (bins_idx >= first) & (bins_idx < last)
+
+        # The bins that are quantized to the same level are contiguous runs of bins. Each bin in the KL range gets
+        # the first bin of its run, and the first bin of the next run (or the end of the KL range).
+        q_values = uniform_quantize_tensor(values, range_min.reshape([-1, 1]), range_max.reshape([-1, 1]), n_bits)
+        level_changed = np.concatenate([np.ones([len(q_values), 1], dtype=bool),
+                                        q_values[:, 1:] != q_values[:, :-1]], axis=1)
+        runs_starts_flags = in_range & (level_changed | (bins_idx == first))
+        runs_starts = np.maximum.accumulate(np.where(runs_starts_flags, bins_idx, window_start), axis=1)
+        next_starts = np.where(runs_starts_flags | (bins_idx >= last), bins_idx, window_end)
+        next_starts = np.minimum.accumulate(next_starts[:, ::-1], axis=1)[:, ::-1]
+        runs_ends = np.concatenate([next_starts[:, 1:], np.full([len(q_values), 1], window_end)], axis=1)
+        runs_ends = np.minimum(runs_ends, last)
+        runs_counts = self._segments_sums(self.prefix_counts, runs_starts, runs_ends)
+        runs_positive_bins = self._segments_sums(self.prefix_positive_bins, runs_starts, runs_ends)
+
+        # Spread the counts of each level evenly over the level's non-empty bins.
+        qbc = np.where(in_range, runs_counts / (runs_positive_bins + 1e-6) * (counts > 0), 0.0)
+
+        rows = np.arange(len(q_values))
+        counts_acc = np.where(in_range, counts, 0.0)
+        counts_acc[rows, first_bin_idx - window_start] += self.prefix_counts[first_bin_idx]
+        counts_acc[rows, last_bin_idx - 1 - window_start] += self.total_count - self.prefix_counts[last_bin_idx]
+
+        p_fxp = self._smooth_distributions(qbc / np.sum(qbc, axis=1, keepdims=True), in_range)
+        p_float = self._smooth_distributions(counts_acc / np.sum(counts_acc, axis=1, keepdims=True), in_range)
+        # The bins out of the KL ranges (where both distributions are zeros) do not contribute to the divergence.
+        ratio = np.divide(p_float, p_fxp, out=np.ones_like(p_float), where=in_range)
+        return np.sum(p_float * np.log(ratio), axis=1)
+
+    @staticmethod
+    def _smooth_distributions(probability: np.ndarray, in_range: np.ndarray) -> np.ndarray:
+        """
+        Smooths the distributions of the candidates (rows) in their KL ranges, the same as _smooth_distribution.
+
+        Args:
+            probability: Probabilities of the bins of each candidate (candidates, bins).
+            in_range: Whether each bin is in the KL range of each candidate (candidates, bins).
+
+        Returns: The smoothed distributions (float32, as _smooth_distribution), where the bins out of the KL ranges
+        are zeros.
+        """
+        nonzeros = in_range & (probability != 0)
+        zeros = in_range & (probability == 0)
+        n_bins = np.sum(in_range, axis=1, keepdims=True)
+        nonzero_count = np.sum(nonzeros, axis=1, keepdims=True)
+
+        # make sure the subtracted value is smaller than all current probabilities.
+        smoothing_term = np.min(np.where(nonzeros, probability, np.inf), axis=1, keepdims=True) / (2.0 * n_bins)
+        reduce_to_fix = smoothing_term * (n_bins - nonzero_count) / nonzero_count
+
+        # The correction is added to the float32 probabilities in float64 precision (as in _smooth_distribution).
+        correction = smoothing_term * zeros + (-reduce_to_fix) * nonzeros
+        return np.where(in_range, probability.astype(np.float32) + correction, 0.0).astype(np.float32)
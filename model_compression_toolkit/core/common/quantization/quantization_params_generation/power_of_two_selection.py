@@ -20,7 +20,8 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     qparams_selection_tensor_search, qparams_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, get_tensor_max
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batch_error_function, get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 
 
@@ -31,7 +32,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                   channel_axis: int = 1,
                                   n_iter: int = 10,
                                   min_threshold: float = MIN_THRESHOLD,
-                                  quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                                  quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                                  error_sample_size: int = None) -> dict:
     """
     Compute the power of two threshold based on the provided QuantizationErrorMethod to quantize the tensor.
     Different search is applied, depends on the value of the selected QuantizationErrorMethod.
@@ -45,6 +47,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
         n_iter: Number of iterations to search for the optimal threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (not used for this method).
         quant_error_method: an error function to optimize the parameters' selection accordingly.
+        error_sample_size: Number of elements (per-channel) to estimate the quantization error by during the
+            search (if None, all the tensor's elements are used).
 
     Returns:
         Power of two threshold to quantize the tensor in a power of 2 manner.
@@ -65,7 +69,11 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                     channel_axis=channel_axis,
                                                     n_iter=n_iter,
                                                     min_threshold=min_threshold,
-                                                    signed=signed)
+                                                    signed=signed,
+                                                    batch_error_function=
+                                                    get_threshold_selection_tensor_batch_error_function(
+                                                        quant_error_method, p, norm=False),
+                                                    error_sample_size=error_sample_size)
     return {THRESHOLD: threshold}
 
 
@@ -78,7 +86,8 @@ def power_of_two_selection_histogram(bins: np.ndarray,
                                      constrained: bool = True,
                                      n_iter: int = 20,
                                      min_threshold: float = MIN_THRESHOLD,
-                                     quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                                     quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                                     histogram_error_engine: bool = True) -> dict:
     """
     Compute the power of two threshold based on the provided QuantizationErrorMethod to quantize a histogram.
     Different search is applied, depends on the value of the selected QuantizationErrorMethod.
@@ -94,6 +103,7 @@ def power_of_two_selection_histogram(bins: np.ndarray,
         n_iter: Number of iteration ot search for the threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (used only for kl threshold selection).
         quant_error_method: an error function to optimize the parameters' selection accordingly.
+        histogram_error_engine: Whether to evaluate the search candidates at once with a HistogramErrorEngine of the histogram.
 
     Returns:
         Power of two threshold to quantize the histogram a power of 2 manner.
@@ -110,7 +120,11 @@ def power_of_two_selection_histogram(bins: np.ndarray,
                                                        n_bits,
                                                        constrained=constrained,
                                                        n_iter=n_iter,
-                                                       min_threshold=min_threshold)
+                                                       min_threshold=min_threshold,
+                                                       batch_error_function=
+                                                       get_threshold_selection_histogram_batch_error_function(
+                                                           quant_error_method, p)
+                                                       if histogram_error_engine else None)
     return {THRESHOLD: threshold}
 
 
@@ -124,7 +138,8 @@ def power_of_two_no_clipping_selection_min_max(bins: np.ndarray,
                                                n_iter: int = 20,
                                                min_threshold: float = MIN_THRESHOLD,
                                                quant_error_method: qc.QuantizationErrorMethod =
-                                               qc.QuantizationErrorMethod.NOCLIPPING) -> dict:
+                                               qc.QuantizationErrorMethod.NOCLIPPING,
+                                               histogram_error_engine: bool = True) -> dict:
     """
     Gets a threshold between min and max numbers.
     If computed threshold is less than min_threshold, min_threshold is returned.
@@ -141,4 +156,5 @@ def power_of_two_no_clipping_selection_min_max(bins: np.ndarray,
                                             constrained,
                                             n_iter,
                                             min_threshold=min_threshold,
-                                            quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING)
+                                            quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING,
+                                            histogram_error_engine=histogram_error_engine)
@@ -72,7 +72,8 @@ def get_activations_qparams(activation_quant_cfg: NodeActivationQuantizationConf
                                                                                min_value,
                                                                                max_value,
                                                                                min_threshold=activation_quant_cfg.min_threshold,
-                                                                               quant_error_method=activation_quant_cfg.activation_error_method)
+                                                                               quant_error_method=activation_quant_cfg.activation_error_method,
+                                                                               histogram_error_engine=activation_quant_cfg.histogram_error_engine)
     activation_params.update({SIGNED: signed})
 
     return activation_params
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
 from typing import List
 
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
@@ -21,13 +23,20 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     import get_activations_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
     get_weights_qparams, get_channels_axis
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+
+
+# Weights quantization methods which compute their parameters using KMeans clustering. KMeans holds the GIL
+# for parts of its computation, so the parameters of these methods are computed in a process pool.
+LUT_WEIGHTS_QUANTIZATION_METHODS = [QuantizationMethod.LUT_POT_QUANTIZER, QuantizationMethod.LUT_SYM_QUANTIZER]
 
 
 def calculate_quantization_params(graph: Graph,
                                   fw_info: FrameworkInfo,
                                   nodes: List[BaseNode] = [],
                                   specific_nodes: bool = False,
-                                  fw_impl: FrameworkImplementation = None):
+                                  fw_impl: FrameworkImplementation = None,
+                                  n_workers: int = 1):
     """
     For a graph, go over its nodes, compute quantization params (for both weights and activations according
     to the given framework info), and create and attach a NodeQuantizationConfig to each node (containing the
@@ -35,6 +44,8 @@ def calculate_quantization_params(graph: Graph,
     By default, the function goes over all nodes in the graph. However, the specific_nodes flag enables
     to compute quantization paramss for specific nodes if the default behavior is unnecessary. For that,
     a list of nodes nodes should be passed as well.
+    If n_workers is larger than 1, the parameters of all the nodes' candidates are computed concurrently
+    (see _calculate_quantization_params_parallel).
 
     Args:
         fw_info: Information needed for quantization about the specific framework (e.g., kernel channels indices,
@@ -43,12 +54,17 @@ def calculate_quantization_params(graph: Graph,
         nodes: List of nodes to compute their thresholds instead of computing it for all nodes in the graph.
         specific_nodes: Flag to compute thresholds for only specific nodes.
         fw_impl: FrameworkImplementation with specific framework implementations.
+        n_workers: Number of workers to compute the quantization params with.
 
     """
 
     # Create a list of nodes to compute their thresholds
     nodes_list: List[BaseNode] = nodes if specific_nodes else graph.nodes()
 
+    if n_workers > 1:
+        _calculate_quantization_params_parallel(graph, fw_info, nodes_list, fw_impl, n_workers)
+        return
+
     for n in nodes_list:  # iterate only nodes that we should compute their thresholds
         for candidate_qc in n.candidates_quantization_cfg:
             if n.is_weights_quantization_enabled():
@@ -67,3 +83,74 @@ def calculate_quantization_params(graph: Graph,
                     out_stats_container=graph.get_out_stats_collector(n))
                 # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
                 candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
+
+
+def _calculate_quantization_params_parallel(graph: Graph,
+                                            fw_info: FrameworkInfo,
+                                            nodes_list: List[BaseNode],
+                                            fw_impl: FrameworkImplementation,
+                                            n_workers: int):
+    """
+    Computes the quantization params of the nodes' candidates concurrently. The computation of each candidate's
+    weights and activation params is independent, so they are submitted to a thread pool (the NumPy computations
+    release the GIL), except for the weights params of LUT quantization methods, which are submitted to a process
+    pool. The computed params are set to the candidates in the nodes and candidates order after all of them are
+    computed, so the result does not depend on the order the computations complete in.
+
+    Args:
+        graph: Graph to compute its nodes' thresholds.
+        fw_info: Information needed for quantization about the specific framework.
+        nodes_list: List of nodes to compute their thresholds.
+        fw_impl: FrameworkImplementation with specific framework implementations.
+        n_workers: Number of workers in each pool.
+
+    """
+    use_process_pool = any([n.is_weights_quantization_enabled() and
+                            c.weights_quantization_cfg.weights_quantization_method in LUT_WEIGHTS_QUANTIZATION_METHODS
+                            for n in nodes_list for c in n.candidates_quantization_cfg])
+
+    with ThreadPoolExecutor(max_workers=n_workers) as thread_pool, _get_process_pool(use_process_pool,
+                                                                                      n_workers) as process_pool:
+        weights_futures, activation_futures = [], []
+        for n in nodes_list:
+            for candidate_qc in n.candidates_quantization_cfg:
+                if n.is_weights_quantization_enabled():
+                    weights_cfg = candidate_qc.weights_quantization_cfg
+                    output_channels_axis, _ = get_channels_axis(weights_cfg, fw_info, n.type)
+                    pool = process_pool if weights_cfg.weights_quantization_method in \
+                                           LUT_WEIGHTS_QUANTIZATION_METHODS else thread_pool
+                    weights_futures.append((weights_cfg, output_channels_axis,
+                                            pool.submit(get_weights_qparams,
+                                                        n.get_weights_by_keys(fw_impl.constants.KERNEL),
+                                                        weights_cfg,
+                                                        output_channels_axis)))
+                if n.is_activation_quantization_enabled():
+                    activation_futures.append((candidate_qc.activation_quantization_cfg,
+                                               thread_pool.submit(get_activations_qparams,
+                                                                  activation_quant_cfg=
+                                                                  candidate_qc.activation_quantization_cfg,
+                                                                  nodes_prior_info=n.prior_info,
+                                                                  out_stats_container=
+                                                                  graph.get_out_stats_collector(n))))
+
+        for weights_cfg, output_channels_axis, future in weights_futures:
+            weights_cfg.set_weights_quantization_param(future.result())
+            weights_cfg.weights_channels_axis = output_channels_axis
+        for activation_cfg, future in activation_futures:
+            activation_cfg.set_activation_quantization_param(future.result())
+
+
+def _get_process_pool(use_process_pool: bool, n_workers: int) -> Executor:
+    """
+    Args:
+        use_process_pool: Whether a process pool is required.
+        n_workers: Number of workers in the pool.
+
+    Returns: A process pool (using the spawn start method, since forking a process that already initialized
+    the frameworks' threads is unsafe), or a placeholder single-worker thread pool if a process pool is not required
+    (no tasks are submitted to it, so it starts no threads).
+
+    """
+    if use_process_pool:
+        return ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('spawn'))
+    return ThreadPoolExecutor(max_workers=1)
@@ -23,9 +23,12 @@ from model_compression_toolkit.constants import MIN_THRESHOLD, DEFAULT_TOL, DEFA
     SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ, SYMMETRIC_TENSOR_N_INTERVALS, SYMMETRIC_TENSOR_N_ITER, \
     UNIFORM_TENSOR_PER_CHANNEL_N_ITER, UNIFORM_TENSOR_N_ITER, SYMMETRIC_HISTOGRAM_DEC_FREQ, SYMMETRIC_HISTOGRAM_N_ITER, \
     SYMMETRIC_HISTOGRAM_N_INTERVALS, UNIFORM_HISTOGRAM_N_ITER, BOTTOM_FACTOR, UPPER_FACTOR, UNIFORM_TENSOR_N_SAMPLES, \
-    UNIFORM_HISTOGRAM_N_SAMPLES, DEC_RANGE_UPPER, DEC_RANGE_BOTTOM
+    UNIFORM_HISTOGRAM_N_SAMPLES, DEC_RANGE_UPPER, DEC_RANGE_BOTTOM, QPARAMS_SEARCH_BATCH_MAX_BYTES, \
+    QPARAMS_SEARCH_SAMPLING_SEED
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.histogram_error_engine import \
+    HistogramErrorEngine
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
-    reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape
+    reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape, calculate_delta
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, \
     get_tensor_max
 
@@ -37,7 +40,9 @@ def qparams_selection_tensor_search(error_function: Callable,
                                     channel_axis: int = 1,
                                     n_iter: int = 10,
                                     min_threshold=MIN_THRESHOLD,
-                                    signed: bool = True) -> Any:
+                                    signed: bool = True,
+                                    batch_error_function: Callable = None,
+                                    error_sample_size: int = None) -> Any:
     """
     Search for an optimal threshold to quantize a tensor.
     The search_methods starts with the constrained no-clipping threshold the tensor has, and continues with
@@ -54,6 +59,10 @@ def qparams_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batch_error_function: Vectorized version of error_function to evaluate all candidate thresholds in batched
+            passes (if None, the candidates are evaluated one by one).
+        error_sample_size: Number of elements (per-channel, if the search is per-channel) to estimate the error by.
+            If None, all the tensor's elements are used.
 
     Returns:
         Optimal constrained threshold to quantize the tensor.
@@ -69,7 +78,18 @@ def qparams_selection_tensor_search(error_function: Callable,
     # If the threshold is computed per-channel, we rearrange the tensor such that each sub-tensor
     # is flattened, and we iterate over each one of them when searching for the threshold.
     if per_channel:
-        tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, channel_axis)
+        tensor_data_r = _sample_tensor_for_search(reshape_tensor_for_per_channel_search(tensor_data, channel_axis),
+                                                  per_channel, error_sample_size)
+    else:
+        tensor_data = _sample_tensor_for_search(tensor_data, per_channel, error_sample_size)
+
+    if batch_error_function is not None:
+        # Evaluate all the candidate thresholds (per-channel) in batched passes.
+        thresholds = threshold.flatten()[np.newaxis, :] / np.power(2, np.arange(n_iter))[:, np.newaxis]
+        errors = _get_thresholds_batch_loss_fn(tensor_data_r if per_channel else tensor_data, n_bits, signed,
+                                               batch_error_function, per_channel)(thresholds)
+        i = np.argmin(errors, axis=0)
+        return np.maximum(np.reshape(threshold.flatten() / np.power(2, i), output_shape), min_threshold)
 
     error_list = []  # init an empty error list
     # On each iteration a new constrained threshold which equal to half of the previous tested threshold
@@ -99,7 +119,8 @@ def qparams_selection_histogram_search(error_function: Callable,
                                        n_bits: int,
                                        constrained: bool = True,
                                        n_iter: int = 10,
-                                       min_threshold: float = MIN_THRESHOLD):
+                                       min_threshold: float = MIN_THRESHOLD,
+                                       batch_error_function: Callable = None):
     """
     Search for an optimal threshold to quantize a histogram of collected float values.
     The search_methods starts with the constrained no-clipping threshold by the bins' maximal value, and continues with
@@ -115,6 +136,9 @@ def qparams_selection_histogram_search(error_function: Callable,
         constrained: Whether the threshold should be constrained or not.
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
+        batch_error_function: Function to compute the errors of the histogram for a batch of quantization ranges
+            (see get_threshold_selection_histogram_batch_error_function), to evaluate all candidate thresholds
+            in a single pass (if None, the candidates are evaluated one by one using error_function).
 
     Returns:
         Optimal constrained threshold to quantize the tensor.
@@ -132,6 +156,13 @@ def qparams_selection_histogram_search(error_function: Callable,
     error_list = []
     threshold_list = threshold / np.power(2, np.linspace(0, n_iter - 1, n_iter))
 
+    if batch_error_function is not None:
+        batch_loss_fn = _get_histogram_batch_loss_fn(bins, counts, n_bits, batch_error_function,
+                                                     lambda t: (*_get_threshold_quantization_range(t, n_bits, signed),
+                                                                -t, t))
+        errors = batch_loss_fn(np.reshape(threshold_list, [-1, 1]))
+        return np.maximum(threshold_list[np.argmin(errors)], min_threshold)
+
     # On each iteration a new constrained threshold which equal to half of the previous tested threshold
     # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
     # eventually used to select the threshold with the minimal error.
@@ -157,7 +188,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
                                              dec_factor: Tuple = DEFAULT_DEC_FACTOR,
                                              dec_freq: int = SYMMETRIC_TENSOR_DEC_FREQ,
                                              tolerance: float = DEFAULT_TOL,
-                                             per_channel=False) -> Dict[str, np.ndarray]:
+                                             per_channel=False,
+                                             batch_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal threshold to for symmetric tensor quantization.
     The search starts with the no-clipping threshold the tensor has, and continues with
@@ -181,6 +213,9 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         dec_freq: Frequency for decreasing the multiplication factors.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batch_loss_fn: Function that gets a batch of candidate thresholds with shape (candidates, channels), where
+            channels is 1 for a per-tensor search, and returns their losses in the same shape, to evaluate the
+            candidates in batched passes (if None, the candidates are evaluated one by one using loss_fn).
 
     Returns:
         Dictionary with optimized threshold for symmetric tensor quantization (best obtained during the search),
@@ -190,7 +225,14 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
     range_scale = np.array([alpha, beta])
     curr_threshold = x0
 
-    if per_channel:
+    if batch_loss_fn is not None:
+        loss = batch_loss_fn(np.reshape(curr_threshold, [1, -1]))
+        if per_channel:
+            curr_threshold = curr_threshold.reshape([-1, 1])
+            loss = loss.reshape([-1, 1])
+        else:
+            loss = loss[0, 0]
+    elif per_channel:
         # wrapping loss function with per-channel wrapper for vectorized per-channel computation
         # Note: x should be already reshaped tensor for per-channel search
         curr_threshold = curr_threshold.reshape([-1, 1])
@@ -204,7 +246,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         prev_best_loss = best['loss']
         new_range_bounds = curr_threshold * range_scale
 
-        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel)
+        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel,
+                                                batch_loss_fn=batch_loss_fn)
         curr_threshold = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -233,7 +276,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                            n_bits: int,
                                            n_iter: int = UNIFORM_TENSOR_N_ITER,
                                            tolerance: float = DEFAULT_TOL,
-                                           per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                           per_channel: bool = False,
+                                           batch_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal quantization range for uniform tensor quantization.
     The search starts with the no-clipping range the tensor has, and continues with
@@ -249,6 +293,9 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
         n_iter: Number of searching iterations.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batch_loss_fn: Function that gets a batch of candidate ranges with shape (candidates, channels, 2), where
+            channels is 1 for a per-tensor search, and returns their losses with shape (candidates, channels), to
+            evaluate the candidates in batched passes (if None, the candidates are evaluated one by one using loss_fn).
 
     Returns:
         Dictionary with optimized quantization range for uniform tensor quantization (best obtained during the search),
@@ -257,7 +304,10 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     """
     curr_range_bounds = x0
 
-    if per_channel:
+    if batch_loss_fn is not None:
+        loss = batch_loss_fn(np.reshape(curr_range_bounds, [1, -1, 2]))
+        loss = loss.reshape([-1, 1]) if per_channel else loss[0, 0]
+    elif per_channel:
         # wrapping loss function with per-channel wrapper for vectorized per-channel computation
         # Note: x should be already reshaped tensor for per-channel search and x0 is a tensor or ranges
         # of shape (num_channels, 2)
@@ -275,7 +325,7 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     for n in range(n_iter):
         prev_best_loss = best['loss']
         curr_res = search_dynamic_range(base_range=curr_range_bounds, scalers=scalers, x=x, loss_fn=loss_fn,
-                                        n_bits=n_bits, per_channel=per_channel)
+                                        n_bits=n_bits, per_channel=per_channel, batch_loss_fn=batch_loss_fn)
         curr_range_bounds = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -297,7 +347,8 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
                                  n_bits: int,
                                  signed: bool = True,
                                  n_intervals: int = 100,
-                                 per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                 per_channel: bool = False,
+                                 batch_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of n_intervals thresholds, taken from evenly-space intervales from the constructed range.
 
@@ -309,11 +360,26 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
         signed: Whether quantization range is signed or not.
         n_intervals: Number of locations to examine each iteration from the given range.
         per_channel: Whether the search is done per-channel or per-tensor.
+        batch_loss_fn: Function that gets a batch of candidate thresholds with shape (candidates, channels) and returns
+            their losses in the same shape, to evaluate all candidates in batched passes (if None, the candidates
+            are evaluated one by one using loss_fn).
 
     Returns: Dictionary with best obtained threshold and the threshold's matching loss.
 
     """
-    if per_channel:
+    if batch_loss_fn is not None:
+        # Evaluate all the candidate thresholds (per-channel) in batched passes. Taking the first minimum
+        # yields the same selection as the sequential search below.
+        intervals = np.linspace(start=range_bounds[..., 0], stop=range_bounds[..., 1], num=n_intervals, dtype=float)
+        intervals = intervals.reshape([n_intervals, -1])
+        errors = batch_loss_fn(intervals)
+        best_idx, channels = np.argmin(errors, axis=0), np.arange(errors.shape[1])
+        if per_channel:
+            best = {"param": intervals[best_idx, channels].reshape([-1, 1]),
+                    "loss": errors[best_idx, channels].reshape([-1, 1])}
+        else:
+            best = {"param": intervals[best_idx[0], 0], "loss": errors[best_idx[0], 0]}
+    elif per_channel:
         # search per-channel
         intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
         # just the first interval values
@@ -341,7 +407,7 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
 
 
 def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndarray, loss_fn: Callable, n_bits: int,
-                         per_channel: bool = False) -> Dict[str, np.ndarray]:
+                         per_channel: bool = False, batch_loss_fn: Callable = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of constructed quantization ranges.
 
@@ -352,11 +418,28 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         loss_fn: Function to compute the error between the original and quantized tensors.
         n_bits: Number of bits to quantize the
         per_channel: Whether the search is done per-channel or per-tensor.
+        batch_loss_fn: Function that gets a batch of candidate ranges with shape (candidates, channels, 2) and returns
+            their losses with shape (candidates, channels), to evaluate all candidates in batched passes (if None,
+            the candidates are evaluated one by one using loss_fn).
 
     Returns: Dictionary with best obtained quantization range and the threshold's matching loss.
 
     """
-    if per_channel:
+    if batch_loss_fn is not None:
+        # Evaluate all the candidate ranges (per-channel) in batched passes. Taking the first minimum
+        # yields the same selection as the sequential search below.
+        if per_channel:
+            ranges = np.stack([np.multiply.outer(scalers[:, 0], base_range[:, 0]),
+                               np.multiply.outer(scalers[:, 1], base_range[:, 1])], axis=2)
+        else:
+            ranges = (base_range * scalers)[:, np.newaxis, :]
+        errors = batch_loss_fn(ranges)
+        best_idx, channels = np.argmin(errors, axis=0), np.arange(errors.shape[1])
+        if per_channel:
+            best = {"param": ranges[best_idx, channels], "loss": errors[best_idx, channels].reshape([-1, 1])}
+        else:
+            best = {"param": ranges[best_idx[0], 0], "loss": errors[best_idx[0], 0]}
+    elif per_channel:
         # search per-channel
         ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
                            np.multiply.outer(base_range[:, 1], scalers[:, 1])], axis=2)
@@ -396,7 +479,9 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                               channel_axis: int = 1,
                                               n_iter: int = SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                               min_threshold=MIN_THRESHOLD,
-                                              signed: bool = True) -> Any:
+                                              signed: bool = True,
+                                              batch_error_function: Callable = None,
+                                              error_sample_size: int = None) -> Any:
     """
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a tensor,
     using the iterative optimizer method.
@@ -411,6 +496,10 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batch_error_function: Vectorized version of error_function to evaluate the candidate thresholds in batched
+            passes (if None, the candidates are evaluated one by one).
+        error_sample_size: Number of elements (per-channel, if the search is per-channel) to estimate the error by.
+            If None, all the tensor's elements are used.
 
     Returns:
         Ndarray with an optimized threshold (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -422,7 +511,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
     # If the threshold is computed per-channel, we rearrange the tensor such that each sub-tensor
     # is flattened, and we iterate over each one of them when searching for the threshold.
     if per_channel:
-        tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, channel_axis)
+        tensor_data_r = _sample_tensor_for_search(reshape_tensor_for_per_channel_search(tensor_data, channel_axis),
+                                                  per_channel, error_sample_size)
         max_tensor = np.maximum(min_threshold, tensor_max)
         res = qparams_symmetric_iterative_minimization(x0=max_tensor,
                                                        x=tensor_data_r,
@@ -432,10 +522,14 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                        n_intervals=SYMMETRIC_TENSOR_PER_CHANNEL_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ,
-                                                       per_channel=True)
+                                                       per_channel=True,
+                                                       batch_loss_fn=_get_thresholds_batch_loss_fn(
+                                                           tensor_data_r, n_bits, signed, batch_error_function,
+                                                           per_channel))
         return np.reshape(np.maximum(min_threshold, res['param']), output_shape)
     else:
         # quantize per-tensor
+        tensor_data = _sample_tensor_for_search(tensor_data, per_channel, error_sample_size)
         res = qparams_symmetric_iterative_minimization(x0=get_init_threshold(min_threshold, tensor_max),
                                                        x=tensor_data,
                                                        loss_fn=error_function,
@@ -444,7 +538,10 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                        n_intervals=SYMMETRIC_TENSOR_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_DEC_FREQ,
-                                                       per_channel=False)
+                                                       per_channel=False,
+                                                       batch_loss_fn=_get_thresholds_batch_loss_fn(
+                                                           tensor_data, n_bits, signed, batch_error_function,
+                                                           per_channel))
 
         return max(min_threshold, res['param'])
 
@@ -456,7 +553,9 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                             n_bits: int,
                                             per_channel: bool = False,
                                             channel_axis: int = 1,
-                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER) -> Any:
+                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
+                                            batch_error_function: Callable = None,
+                                            error_sample_size: int = None) -> Any:
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a tensor,
     using the iterative optimizer method and built-in scale factors
@@ -471,6 +570,10 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
         per_channel: Whether the tensor should be quantized per-channel or per-tensor.
         channel_axis: Index of output channels dimension.
         n_iter: Number of searching iterations.
+        batch_error_function: Vectorized version of error_function to evaluate the candidate ranges in batched
+            passes (if None, the candidates are evaluated one by one).
+        error_sample_size: Number of elements (per-channel, if the search is per-channel) to estimate the error by.
+            If None, all the tensor's elements are used.
 
     Returns:
         Ndarray with an optimized range (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -487,7 +590,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
     # is flattened, and we iterate over each one of them when searching for the threshold.
     if per_channel:
         if per_channel:
-            tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, channel_axis)
+            tensor_data_r = _sample_tensor_for_search(reshape_tensor_for_per_channel_search(tensor_data, channel_axis),
+                                                      per_channel, error_sample_size)
             tensor_min_max = np.column_stack([tensor_min.flatten(), tensor_max.flatten()])
             res = iterative_uniform_dynamic_range_search(x0=tensor_min_max,
                                                          x=tensor_data_r,
@@ -495,18 +599,24 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                          loss_fn=error_function,
                                                          n_bits=n_bits,
                                                          n_iter=UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
-                                                         per_channel=True)
+                                                         per_channel=True,
+                                                         batch_loss_fn=_get_ranges_batch_loss_fn(
+                                                             tensor_data_r, n_bits, batch_error_function,
+                                                             per_channel))
             return np.reshape(res['param'][:, 0], output_shape), np.reshape(res['param'][:, 1], output_shape)
     else:
         # quantize per-tensor
         pass
+        tensor_data = _sample_tensor_for_search(tensor_data, per_channel, error_sample_size)
         res = iterative_uniform_dynamic_range_search(x0=np.array([tensor_min, tensor_max]),
                                                      x=tensor_data,
                                                      scalers=scalers,
                                                      loss_fn=error_function,
                                                      n_bits=n_bits,
                                                      n_iter=UNIFORM_TENSOR_N_ITER,
-                                                     per_channel=False)
+                                                     per_channel=False,
+                                                     batch_loss_fn=_get_ranges_batch_loss_fn(
+                                                         tensor_data, n_bits, batch_error_function, per_channel))
         return res['param']
 
 
@@ -516,7 +626,8 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                  counts: np.ndarray,
                                                  n_bits: int,
                                                  n_iter: int = SYMMETRIC_HISTOGRAM_N_ITER,
-                                                 min_threshold: float = MIN_THRESHOLD):
+                                                 min_threshold: float = MIN_THRESHOLD,
+                                                 batch_error_function: Callable = None):
     """
     search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
     using the iterative optimizer method.
@@ -529,6 +640,9 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
         n_bits: Number of bits to quantize the tensor.
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
+        batch_error_function: Function to compute the errors of the histogram for a batch of quantization ranges
+            (see get_threshold_selection_histogram_batch_error_function), to evaluate the candidate thresholds
+            in batched passes (if None, the candidates are evaluated one by one using error_function).
 
     Returns:
         Optimized threshold for quantifying the histogram.
@@ -548,7 +662,11 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
+                                                   per_channel=False,
+                                                   batch_loss_fn=_get_histogram_batch_loss_fn(
+                                                       bins, counts, n_bits, batch_error_function,
+                                                       lambda t: (*_get_threshold_quantization_range(t, n_bits, signed),
+                                                                  -t * int(signed), t)))
     return max(min_threshold, res['param'])
 
 
@@ -558,7 +676,8 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                     counts: np.ndarray,
                                                     n_bits: int,
                                                     n_iter: int = SYMMETRIC_HISTOGRAM_N_ITER,
-                                                    min_threshold: float = MIN_THRESHOLD):
+                                                    min_threshold: float = MIN_THRESHOLD,
+                                                    batch_error_function: Callable = None):
     """
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
     with KL-Divergence loss function (needs a separate search function
@@ -573,6 +692,9 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
         n_bits: Number of bits to quantize the tensor.
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
+        batch_error_function: Function to compute the errors of the histogram for a batch of quantization ranges
+            (see get_threshold_selection_histogram_batch_error_function), to evaluate the candidate thresholds
+            in batched passes (if None, the candidates are evaluated one by one using error_function).
 
     Returns:
         Optimized threshold for quantifying the histogram.
@@ -595,7 +717,11 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
+                                                   per_channel=False,
+                                                   batch_loss_fn=_get_histogram_batch_loss_fn(
+                                                       bins, counts, n_bits, batch_error_function,
+                                                       lambda t: (*_get_threshold_quantization_range(t, n_bits, signed),
+                                                                  -t * int(signed), t)))
     return max(min_threshold, res['param'])
 
 
@@ -604,7 +730,8 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
                                                bins: np.ndarray,
                                                counts: np.ndarray,
                                                n_bits: int,
-                                               n_iter: int = UNIFORM_HISTOGRAM_N_ITER):
+                                               n_iter: int = UNIFORM_HISTOGRAM_N_ITER,
+                                               batch_error_function: Callable = None):
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a histogram,
     using the iterative optimizer method and built-in scale factors
@@ -617,6 +744,9 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
         counts: Number of elements in the bins to search_methods for a threshold.
         n_bits: Number of bits to quantize the tensor.
         n_iter: Number of searching iterations.
+        batch_error_function: Function to compute the errors of the histogram for a batch of quantization ranges
+            (see get_threshold_selection_histogram_batch_error_function), to evaluate the candidate ranges
+            in batched passes (if None, the candidates are evaluated one by one using error_function).
 
     Returns:
         Optimized range for quantifying the histogram.
@@ -636,7 +766,10 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
                                                                                                    min_max_range=mm),
                                                  n_bits=n_bits,
                                                  n_iter=UNIFORM_HISTOGRAM_N_ITER,
-                                                 per_channel=False)
+                                                 per_channel=False,
+                                                 batch_loss_fn=_get_histogram_batch_loss_fn(
+                                                     bins, counts, n_bits, batch_error_function,
+                                                     lambda r: (r[:, 0], r[:, 1], r[:, 0], r[:, 1])))
     return res['param']
 
 
@@ -732,3 +865,160 @@ def _error_function_wrapper(error_function: Callable,
     for j in range(float_tensor.shape[0]):  # iterate all channels of the tensor.
         _error_per_list.append(error_function(float_tensor[j, :], q_tensor[j, :], in_params[j]))
     return np.asarray(_error_per_list)
+
+
+def _sample_tensor_for_search(tensor_data: np.ndarray,
+                              per_channel: bool,
+                              sample_size: int = None) -> np.ndarray:
+    """
+    Takes a random subset of a tensor's elements, to estimate the quantization error of each candidate during the
+    quantization parameters' search by the subset only (the same subset is used for all candidates, and it is
+    taken with a fixed seed, so the search is deterministic).
+
+    Args:
+        tensor_data: Numpy array with tensor's content (reshaped to (channels, elements) if per_channel).
+        per_channel: Whether the search is done per-channel (then, the same elements are sampled in all channels).
+        sample_size: Number of elements to sample (per-channel, if per_channel). If None, the tensor is returned as is.
+
+    Returns:
+        The sampled tensor (flattened if per-tensor), or the tensor itself if it's not larger than the sample size.
+    """
+    n_elements = tensor_data.shape[-1] if per_channel else tensor_data.size
+    if sample_size is None or n_elements <= sample_size:
+        return tensor_data
+
+    indices = np.sort(np.random.default_rng(QPARAMS_SEARCH_SAMPLING_SEED).choice(n_elements, sample_size,
+                                                                                 replace=False))
+    return tensor_data[:, indices] if per_channel else tensor_data.flatten()[indices]
+
+
+def _batch_quantization_errors(x: np.ndarray,
+                               quantize_fn: Callable,
+                               candidates: np.ndarray,
+                               batch_error_function: Callable,
+                               per_channel: bool) -> np.ndarray:
+    """
+    Computes the quantization errors of a tensor for a set of candidate quantization parameters. The tensor
+    is quantized by all the candidates in broadcasted passes, where the candidates are split into chunks, such that
+    the quantized tensors of a chunk take at most QPARAMS_SEARCH_BATCH_MAX_BYTES bytes (a chunk has at least one
+    candidate, so a tensor that is larger than the budget is quantized by one candidate at a time).
+
+    Args:
+        x: Numpy array with tensor's content (reshaped to (channels, elements) if per_channel).
+        quantize_fn: Function that gets the tensor (as a (channels, elements) array) and a chunk of candidates,
+            and returns the tensor quantized by each candidate, stacked along a new first axis.
+        candidates: Candidate quantization parameters, with shape (candidates, channels, ...) where the number
+            of channels is 1 for a per-tensor search.
+        batch_error_function: Function to compute the errors between a tensor and a batch of its quantized versions.
+        per_channel: Whether the search is done per-channel or per-tensor.
+
+    Returns:
+        Array of errors with shape (candidates, channels).
+    """
+    # A contiguous tensor keeps the elements of each channel contiguous in the quantized tensors, so the errors are
+    # reduced in the same order as in a search that evaluates the candidates one by one.
+    x = np.ascontiguousarray(x if per_channel else x.reshape([1, -1]))
+    chunk_size = max(1, QPARAMS_SEARCH_BATCH_MAX_BYTES // max(x.nbytes, 1))
+    return np.concatenate([batch_error_function(x, quantize_fn(x, candidates[i:i + chunk_size]))
+                           for i in range(0, len(candidates), chunk_size)], axis=0)
+
+
+def _get_thresholds_batch_loss_fn(x: np.ndarray,
+                                  n_bits: int,
+                                  signed: bool,
+                                  batch_error_function: Callable,
+                                  per_channel: bool) -> Callable:
+    """
+    Creates a function that computes the errors of quantizing a tensor by a batch of candidate thresholds
+    (see _batch_quantization_errors).
+
+    Args:
+        x: Numpy array with tensor's content (reshaped to (channels, elements) if per_channel).
+        n_bits: Number of bits to quantize the tensor.
+        signed: Whether quantization range is signed or not.
+        batch_error_function: Function to compute the errors between a tensor and a batch of its quantized versions.
+        per_channel: Whether the search is done per-channel or per-tensor.
+
+    Returns:
+        A function that gets candidate thresholds with shape (candidates, channels) and returns their errors in the
+        same shape, or None if batch_error_function is None.
+    """
+    if batch_error_function is None:
+        return None
+    return lambda thresholds: _batch_quantization_errors(
+        x, lambda _x, t: quantize_tensor(_x, t[..., np.newaxis], n_bits, signed), thresholds, batch_error_function,
+        per_channel)
+
+
+def _get_ranges_batch_loss_fn(x: np.ndarray,
+                              n_bits: int,
+                              batch_error_function: Callable,
+                              per_channel: bool) -> Callable:
+    """
+    Creates a function that computes the errors of quantizing a tensor by a batch of candidate ranges
+    (see _batch_quantization_errors).
+
+    Args:
+        x: Numpy array with tensor's content (reshaped to (channels, elements) if per_channel).
+        n_bits: Number of bits to quantize the tensor.
+        batch_error_function: Function to compute the errors between a tensor and a batch of its quantized versions.
+        per_channel: Whether the search is done per-channel or per-tensor.
+
+    Returns:
+        A function that gets candidate ranges with shape (candidates, channels, 2) and returns their errors with
+        shape (candidates, channels), or None if batch_error_function is None.
+    """
+    if batch_error_function is None:
+        return None
+    return lambda ranges: _batch_quantization_errors(
+        x, lambda _x, r: uniform_quantize_tensor(_x, r[..., 0:1], r[..., 1:2], n_bits), ranges, batch_error_function,
+        per_channel)
+
+
+def _get_threshold_quantization_range(thresholds: np.ndarray, n_bits: int, signed: bool) -> Tuple[np.ndarray,
+                                                                                                  np.ndarray]:
+    """
+    Computes the quantization range that quantize_tensor uses for the given thresholds.
+
+    Args:
+        thresholds: Thresholds for quantization ranges.
+        n_bits: Number of bits to quantize the tensor.
+        signed: Whether quantization range is signed or not.
+
+    Returns:
+        The min and max bounds of the quantization range of each threshold.
+    """
+    return -thresholds * int(signed), thresholds - calculate_delta(thresholds, n_bits, signed)
+
+
+def _get_histogram_batch_loss_fn(bins: np.ndarray,
+                                 counts: np.ndarray,
+                                 n_bits: int,
+                                 batch_error_function: Callable,
+                                 get_ranges: Callable) -> Callable:
+    """
+    Creates a function that computes the errors of quantizing a histogram by a batch of (per-tensor) candidates,
+    using a HistogramErrorEngine of the histogram.
+
+    Args:
+        bins: Bins of the histogram.
+        counts: Number of elements in the bins.
+        n_bits: Number of bits to quantize the histogram.
+        batch_error_function: Function to compute the errors of the histogram for a batch of quantization ranges.
+        get_ranges: Function that gets the candidates with shape (candidates, candidate's values) and returns the
+            min and max bounds of their quantization ranges and the min and max bounds of their KL-divergence ranges.
+
+    Returns:
+        A function that gets candidates with shape (candidates, 1) for thresholds or (candidates, 1, 2) for ranges
+        and returns their errors with shape (candidates, 1), or None if batch_error_function is None.
+    """
+    if batch_error_function is None:
+        return None
+    engine = HistogramErrorEngine(bins, counts)
+
+    def _batch_loss_fn(candidates: np.ndarray) -> np.ndarray:
+        range_min, range_max, kl_range_min, kl_range_max = get_ranges(np.reshape(candidates, [len(candidates), -1]))
+        errors = batch_error_function(engine, range_min, range_max, n_bits, kl_range_min, kl_range_max)
+        return np.reshape(errors, [-1, 1])
+
+    return _batch_loss_fn
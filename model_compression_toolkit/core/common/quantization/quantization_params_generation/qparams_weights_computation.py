@@ -49,7 +49,8 @@ def get_weights_qparams(kernel: np.ndarray,
                                                                              per_channel=weights_quant_config.weights_per_channel_threshold and output_channels_axis is not None,
                                                                              channel_axis=output_channels_axis,
                                                                              min_threshold=weights_quant_config.min_threshold,
-                                                                             quant_error_method=weights_quant_config.weights_error_method)
+                                                                             quant_error_method=weights_quant_config.weights_error_method,
+                                                                             error_sample_size=weights_quant_config.weights_error_sample_size)
     else:
         weights_params = {}
 
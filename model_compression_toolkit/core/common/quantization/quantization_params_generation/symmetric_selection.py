@@ -17,7 +17,8 @@ import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram, \
+    get_threshold_selection_tensor_batch_error_function, get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_symmetric_selection_tensor_search, \
     qparams_symmetric_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search
@@ -33,7 +34,8 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                channel_axis: int = 1,
                                n_iter: int = 10,
                                min_threshold: float = MIN_THRESHOLD,
-                               quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                               quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                               error_sample_size: int = None) -> dict:
     """
     Compute the optimal threshold based on the provided QuantizationErrorMethod to quantize the tensor.
     Different search is applied, depends on the value of the selected QuantizationErrorMethod.
@@ -47,6 +49,8 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
         n_iter: Number of iterations to search for the optimal threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (not used for this method).
         quant_error_method: an error function to optimize the parameters' selection accordingly.
+        error_sample_size: Number of elements (per-channel) to estimate the quantization error by during the
+            search (if None, all the tensor's elements are used).
 
     Returns:
         Optimal threshold to quantize the tensor in a symmetric manner.
@@ -66,7 +70,11 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                                               per_channel,
                                                               channel_axis,
                                                               min_threshold=min_threshold,
-                                                              signed=signed)
+                                                              signed=signed,
+                                                              batch_error_function=
+                                                              get_threshold_selection_tensor_batch_error_function(
+                                                                  quant_error_method, p, norm=False),
+                                                              error_sample_size=error_sample_size)
     return {THRESHOLD: threshold}
 
 
@@ -79,7 +87,8 @@ def symmetric_selection_histogram(bins: np.ndarray,
                                   constrained: bool = True,
                                   n_iter: int = 20,
                                   min_threshold: float = MIN_THRESHOLD,
-                                  quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                                  quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                                  histogram_error_engine: bool = True) -> dict:
     """
     Compute the optimal threshold based on the provided QuantizationErrorMethod to quantize a histogram.
     Different search is applied, depends on the value of the selected QuantizationErrorMethod.
@@ -95,6 +104,7 @@ def symmetric_selection_histogram(bins: np.ndarray,
         n_iter: Number of iteration ot search for the threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (used only for kl threshold selection).
         quant_error_method: an error function to optimize the parameters' selection accordingly.
+        histogram_error_engine: Whether to evaluate the search candidates at once with a HistogramErrorEngine of the histogram.
 
     Returns:
         Optimal threshold to quantize the histogram a symmetric manner.
@@ -109,7 +119,11 @@ def symmetric_selection_histogram(bins: np.ndarray,
                                                                     bins,
                                                                     counts,
                                                                     n_bits,
-                                                                    min_threshold=min_threshold)
+                                                                    min_threshold=min_threshold,
+                                                                    batch_error_function=
+                                                                    get_threshold_selection_histogram_batch_error_function(
+                                                                        quant_error_method, p)
+                                                                    if histogram_error_engine else None)
     else:
         error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.SYMMETRIC, quant_error_method, p)
         threshold = qparams_symmetric_selection_histogram_search(error_function,
@@ -117,7 +131,11 @@ def symmetric_selection_histogram(bins: np.ndarray,
                                                                  bins,
                                                                  counts,
                                                                  n_bits,
-                                                                 min_threshold=min_threshold)
+                                                                 min_threshold=min_threshold,
+                                                                 batch_error_function=
+                                                                 get_threshold_selection_histogram_batch_error_function(
+                                                                     quant_error_method, p)
+                                                                 if histogram_error_engine else None)
     return {THRESHOLD: threshold}
 
 
@@ -131,7 +149,8 @@ def symmetric_no_clipping_selection_min_max(bins: np.ndarray,
                                             n_iter: int = 20,
                                             min_threshold: float = MIN_THRESHOLD,
                                             quant_error_method: qc.QuantizationErrorMethod =
-                                            qc.QuantizationErrorMethod.NOCLIPPING) -> dict:
+                                            qc.QuantizationErrorMethod.NOCLIPPING,
+                                            histogram_error_engine: bool = True) -> dict:
     """
     Gets a threshold between min and max numbers.
     If computed threshold is less than min_threshold, min_threshold is returned.
@@ -148,7 +167,8 @@ def symmetric_no_clipping_selection_min_max(bins: np.ndarray,
                                          constrained,
                                          n_iter,
                                          min_threshold=min_threshold,
-                                         quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING)
+                                         quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING,
+                                         histogram_error_engine=histogram_error_engine)
 
 
 def get_init_threshold(min_threshold: float, tensor_max: np.ndarray, per_channel: bool = False) -> np.ndarray:
@@ -19,7 +19,8 @@ from model_compression_toolkit.constants import MIN_THRESHOLD, RANGE_MIN, RANGE_
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_uniform_selection_tensor_search, qparams_uniform_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batch_error_function, get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
     get_tensor_min
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
@@ -31,7 +32,8 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
                              channel_axis: int = 1,
                              n_iter: int = 10,
                              min_threshold: float = MIN_THRESHOLD,
-                             quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                             quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                             error_sample_size: int = None) -> dict:
     """
     Compute the optimal quantization range based on the provided QuantizationErrorMethod
     to uniformly quantize the tensor.
@@ -46,6 +48,8 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
         n_iter: Number of iterations to search for the optimal threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (not used for this method).
         quant_error_method: an error function to optimize the range parameters' selection accordingly.
+        error_sample_size: Number of elements (per-channel) to estimate the quantization error by during the
+            search (if None, all the tensor's elements are used).
 
     Returns:
         Optimal quantization range to quantize the tensor uniformly.
@@ -63,7 +67,11 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
                                                      tensor_max,
                                                      n_bits,
                                                      per_channel,
-                                                     channel_axis)
+                                                     channel_axis,
+                                                     batch_error_function=
+                                                     get_threshold_selection_tensor_batch_error_function(
+                                                         quant_error_method, p, norm=False),
+                                                     error_sample_size=error_sample_size)
     return {RANGE_MIN: mm[0],
             RANGE_MAX: mm[1]}
 
@@ -77,7 +85,8 @@ def uniform_selection_histogram(bins: np.ndarray,
                                 constrained: bool = True,
                                 n_iter: int = 20,
                                 min_threshold: float = MIN_THRESHOLD,
-                                quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE) -> dict:
+                                quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
+                                histogram_error_engine: bool = True) -> dict:
     """
     Compute the optimal quantization range based on the provided QuantizationErrorMethod
     to uniformly quantize the histogram.
@@ -94,6 +103,7 @@ def uniform_selection_histogram(bins: np.ndarray,
         n_iter: Number of iteration ot search for the threshold (not used for this method).
         min_threshold: Minimal threshold to use if threshold is too small (not used for this method).
         quant_error_method: an error function to optimize the range parameters selection accordingly.
+        histogram_error_engine: Whether to evaluate the search candidates at once with a HistogramErrorEngine of the histogram.
 
     Returns:
         Optimal quantization range to quantize the histogram uniformly.
@@ -110,7 +120,11 @@ def uniform_selection_histogram(bins: np.ndarray,
                                                         tensor_min_max,
                                                         bins,
                                                         counts,
-                                                        n_bits)
+                                                        n_bits,
+                                                        batch_error_function=
+                                                        get_threshold_selection_histogram_batch_error_function(
+                                                            quant_error_method, p)
+                                                        if histogram_error_engine else None)
 
     return {RANGE_MIN: mm[0],
             RANGE_MAX: mm[1]}
@@ -126,7 +140,8 @@ def uniform_no_clipping_selection_min_max(bins: np.ndarray,
                                           n_iter: int = 20,
                                           min_threshold: float = MIN_THRESHOLD,
                                           quant_error_method: qc.QuantizationErrorMethod =
-                                          qc.QuantizationErrorMethod.NOCLIPPING) -> dict:
+                                          qc.QuantizationErrorMethod.NOCLIPPING,
+                                          histogram_error_engine: bool = True) -> dict:
     """
     Gets a quantization rage between min and max numbers.
 
@@ -142,5 +157,6 @@ def uniform_no_clipping_selection_min_max(bins: np.ndarray,
                                        constrained,
                                        n_iter,
                                        min_threshold=min_threshold,
-                                       quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING)
+                                       quant_error_method=qc.QuantizationErrorMethod.NOCLIPPING,
+                                       histogram_error_engine=histogram_error_engine)
 
@@ -54,5 +54,7 @@ def quantize_graph_weights(graph: Graph,
 
             # Set the kernel node to be the quantized kernel.
             n.set_weights_by_keys(fw_impl.constants.KERNEL, quantized_kernel)
+            if n.final_weights_quantization_cfg.compact_quantized_weights:
+                n.compact_quantized_weights_by_keys(fw_impl.constants.KERNEL)
 
     return graph
@@ -13,25 +13,131 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import List
+import time
+from typing import List, Any, Callable, Dict, Optional, Set
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.logger import Logger
+
+
+class NodeTypesIndex:
+    """
+    Index of the nodes of a graph by their types, so a substitution is matched against the nodes of the types it
+    can match only, instead of against all the nodes in the graph.
+    The index is updated incrementally when the graph is mutated: nodes that are added to or removed from the graph
+    (tracked by the graph's cache version), and nodes whose types were changed in place (e.g., by a substitution
+    that sets a node's layer_class) are moved to the buckets of their new types. The nodes are kept in the order of
+    the graph's nodes, so searching the candidates of a matcher gives the same matches, in the same order, as
+    searching the entire graph.
+    """
+
+    def __init__(self, graph: common.Graph):
+        """
+        Args:
+            graph: Graph to index its nodes.
+        """
+        self.graph = graph
+        self._nodes_by_type = dict()
+        # Types the nodes are indexed by (to find nodes whose types were changed since they were indexed).
+        self._types = dict()
+        # Positions of the nodes, increasing in the order of the graph's nodes.
+        self._positions = dict()
+        self._next_position = 0
+        self._cache_version = None
+        self.update()
+
+    def update(self):
+        """
+        Update the index with the nodes that were added to or removed from the graph since the last update, and with
+        the nodes whose types were changed since the last update.
+        A node that was removed and added again is moved to the end of the graph's nodes, so it gets a new position.
+        """
+        if self._cache_version != self.graph.cache_version:
+            self._update_nodes()
+        self._update_types()
+
+    def _update_nodes(self):
+        """
+        Index the nodes that were added to the graph, and remove the nodes that were removed from it.
+        """
+        self._cache_version = self.graph.cache_version
+
+        nodes = list(self.graph.nodes)
+        last_position = -1
+        for n in nodes:
+            position = self._positions.get(n)
+            if position is None or position <= last_position:
+                if position is None:
+                    self._types[n] = n.type
+                    self._nodes_by_type.setdefault(n.type, set()).add(n)
+                position = self._next_position
+                self._next_position += 1
+                self._positions[n] = position
+            last_position = position
+
+        for n in self._positions.keys() - set(nodes):
+            del self._positions[n]
+            self._nodes_by_type[self._types.pop(n)].discard(n)
+
+    def _update_types(self):
+        """
+        Move the nodes whose types were changed in place to the buckets of their new types.
+        """
+        for n, indexed_type in self._types.items():
+            if n.type is not indexed_type:
+                self._nodes_by_type[indexed_type].discard(n)
+                self._nodes_by_type.setdefault(n.type, set()).add(n)
+                self._types[n] = n.type
+
+    def get_candidates(self, types: Optional[Set[Any]]) -> Optional[List[BaseNode]]:
+        """
+        Args:
+            types: Types of nodes to get (None for all types).
+
+        Returns:
+            The nodes of the types in the order of the graph's nodes, or None if types is None.
+        """
+        if types is None:
+            return None
+        candidates = [n for t in types for n in self._nodes_by_type.get(t, ())]
+        candidates.sort(key=self._positions.__getitem__)
+        return candidates
 
 
 def substitute(graph: common.Graph,
-               substitutions_list: List[common.BaseSubstitution]) -> common.Graph:
+               substitutions_list: List[common.BaseSubstitution],
+               profiler: Callable = None) -> common.Graph:
     """
     Apply a list of substitutions on a graph.
+    Each substitution is matched against the graph once, and then applied to its matches one by one. Only nodes of
+    the types a substitution's matcher can match are searched (using an index of the graph's nodes by their types,
+    which is updated as the substitutions mutate the graph), and the wall-clock duration of each substitution is
+    logged (in debug level).
+
     Args:
         graph: Graph to transform.
         substitutions_list: List of substitutions to apply on the graph.
+        profiler: Function to call after each substitution is applied, with the substitution, its number of
+        matches and its wall-clock duration in seconds. Defaults to None (no profiling).
 
     Returns:
         Transformed graph after applying all substitutions in substitutions_list.
     """
 
+    index = NodeTypesIndex(graph)
     for substitution in substitutions_list:
-        matched_nodes = graph.filter(substitution.matcher_instance)
+        start = time.perf_counter()
+        if index.graph is not graph:
+            index = NodeTypesIndex(graph)
+        index.update()
+        candidates = index.get_candidates(substitution.matcher_instance.get_candidate_types())
+        matched_nodes = graph.filter(substitution.matcher_instance, candidates)
         for idn in matched_nodes:
             graph = substitution.substitute(graph, idn)
+        duration = time.perf_counter() - start
+        Logger.debug(f'Substitution {type(substitution).__name__}: {len(matched_nodes)} matches in '
+                     f'{duration:.4f} seconds')
+        if profiler is not None:
+            profiler(substitution, len(matched_nodes), duration)
     return graph
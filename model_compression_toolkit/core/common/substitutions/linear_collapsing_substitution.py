@@ -14,6 +14,7 @@
 # ==============================================================================
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import NodeTypesIndex
 
 
 def linear_collapsing_substitute(graph: common.Graph,
@@ -30,7 +31,10 @@ def linear_collapsing_substitute(graph: common.Graph,
     Returns:
         Transformed graph after applying all linear collapsing substitutions.
     """
-    matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
+    matcher = linear_collapsing_substitution.matcher_instance
+    candidate_types = matcher.get_candidate_types()
+    index = NodeTypesIndex(graph)
+    matched_nodes = graph.filter(matcher, index.get_candidates(candidate_types))
     matched_nodes_list = []
     match_indicator = True
     while len(matched_nodes) > 0 and match_indicator:
@@ -42,6 +46,9 @@ def linear_collapsing_substitute(graph: common.Graph,
                 matched_nodes_list.append(matched_node)
                 match_indicator = True
                 break
-        # Find new matches on the transformed graph
-        matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
+        # Find new matches on the transformed graph (searching only the nodes of the matched types)
+        if index.graph is not graph:
+            index = NodeTypesIndex(graph)
+        index.update()
+        matched_nodes = graph.filter(matcher, index.get_candidates(candidate_types))
     return graph
\ No newline at end of file
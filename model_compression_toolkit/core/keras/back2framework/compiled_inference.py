@@ -0,0 +1,119 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import weakref
+from typing import Any, Dict, List
+
+import tensorflow as tf
+from tensorflow.keras.models import Model
+
+from model_compression_toolkit.logger import Logger
+
+
+class KerasCompiledInference:
+    """
+    Runs Keras models as traced functions (tf.function) instead of calling them eagerly, to avoid the eager
+    dispatch overhead of every layer in every inference.
+
+    Each model is traced with a fixed input signature (the model's inputs shapes, with an unknown batch size), so
+    batches of different sizes do not retrace the function. The configurable quantizers of mixed-precision models
+    select their active candidate by a variable, so configuring the model to a different bit-width configuration
+    does not retrace the function either. The number of traces is counted per model (see trace_counts), to verify
+    that the functions are not retraced in every call.
+    """
+
+    def __init__(self, jit_compile: bool = False):
+        """
+        Args:
+            jit_compile: Whether to compile the traced functions with XLA.
+        """
+        self.jit_compile = jit_compile
+        # Traced functions of each model, by the model and the training flag they were traced with.
+        self._functions = weakref.WeakKeyDictionary()
+        self._trace_counts = weakref.WeakKeyDictionary()
+
+    def __call__(self,
+                 model: Model,
+                 inputs: Any,
+                 training: bool = False) -> Any:
+        """
+        Runs a model inference using the model's traced function (traces the function in the first call).
+
+        Args:
+            model: Keras model to run.
+            inputs: Input tensor or list of input tensors for the model.
+            training: Whether to run the model in training mode.
+
+        Returns:
+            The model's output.
+        """
+        model_functions = self._functions.setdefault(model, {})
+        if training not in model_functions:
+            model_functions[training] = self._trace_model_function(model, training)
+
+        input_specs = self._get_input_specs(model)
+        inputs_list = inputs if isinstance(inputs, (list, tuple)) else [inputs]
+        if len(inputs_list) != len(input_specs):
+            Logger.critical(f'Model {model.name} has {len(input_specs)} inputs but got '
+                            f'{len(inputs_list)}.')  # pragma: no cover
+        inputs_list = [tf.cast(x, spec.dtype) for x, spec in zip(inputs_list, input_specs)]
+        return model_functions[training](inputs_list)
+
+    def get_trace_count(self, model: Model) -> int:
+        """
+        Args:
+            model: Keras model.
+
+        Returns:
+            Number of times the functions of the model were traced.
+        """
+        return self._trace_counts.get(model, 0)
+
+    @staticmethod
+    def _get_input_specs(model: Model) -> List[tf.TensorSpec]:
+        """
+        Args:
+            model: Keras model.
+
+        Returns:
+            Specs of the model's inputs, with an unknown batch size.
+        """
+        return [tf.TensorSpec(shape=[None] + list(x.shape[1:]), dtype=x.dtype) for x in model.inputs]
+
+    def _trace_model_function(self,
+                              model: Model,
+                              training: bool) -> tf.types.experimental.GenericFunction:
+        """
+        Creates a traced function of a model's inference.
+
+        Args:
+            model: Keras model.
+            training: Whether to run the model in training mode.
+
+        Returns:
+            A function that gets a list of input tensors and returns the model's output.
+        """
+        model_ref = weakref.ref(model)
+
+        def _model_inference(inputs_list):
+            # Python code runs only when the function is traced.
+            traced_model = model_ref()
+            self._trace_counts[traced_model] = self._trace_counts.get(traced_model, 0) + 1
+            Logger.debug(f'Tracing the inference of model {traced_model.name} '
+                         f'(trace {self._trace_counts[traced_model]})')
+            return traced_model(inputs_list, training=training)
+
+        return tf.function(_model_inference,
+                           input_signature=[self._get_input_specs(model)],
+                           jit_compile=self.jit_compile)
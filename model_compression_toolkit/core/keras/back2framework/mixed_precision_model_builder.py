@@ -22,6 +22,7 @@ from mct_quantizers.keras.quantizers import BaseKerasInferableQuantizer
 
 from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 from model_compression_toolkit.core.keras.back2framework.keras_model_builder import KerasModelBuilder
 from model_compression_toolkit.core.keras.mixed_precision.configurable_activation_quantizer import \
     ConfigurableActivationQuantizer
@@ -46,7 +47,8 @@ class MixedPrecisionKerasModelBuilder(KerasModelBuilder):
                  graph: common.Graph,
                  append2output=None,
                  fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 weights_cache: CandidateWeightsCache = None):
         """
 
         Args:
@@ -54,9 +56,12 @@ class MixedPrecisionKerasModelBuilder(KerasModelBuilder):
             append2output: Nodes to append to model's output.
             fw_info: Information about the specific framework of the model that is built.
             return_float_outputs: Whether the model returns float tensors or not.
+            weights_cache: Cache of candidates quantized weights for the configurable weights quantizers to quantize
+                their weights on demand with. If None, the quantizers keep the quantized weights of all candidates.
         """
 
         self.graph = graph
+        self.weights_cache = weights_cache
 
         super().__init__(graph,
                          append2output,
@@ -138,7 +143,8 @@ class MixedPrecisionKerasModelBuilder(KerasModelBuilder):
 
         return {'node_q_cfg': node_q_cfg_candidates,
                 'float_weights': float_weights,
-                'max_candidate_idx': max_candidate_idx
+                'max_candidate_idx': max_candidate_idx,
+                'weights_cache': self.weights_cache
                 }
 
     def mixed_precision_activation_holder(self, n: BaseNode) -> KerasActivationQuantizationHolder:
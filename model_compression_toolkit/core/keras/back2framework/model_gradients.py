@@ -17,8 +17,6 @@ import tensorflow as tf
 from packaging import version
 
 # As from Tensorflow 2.6, keras is a separate package and some classes should be imported differently.
-from tqdm import tqdm
-
 if version.parse(tf.__version__) < version.parse("2.6"):
     from tensorflow.python.keras.layers import Layer  # pragma: no cover
 else:
@@ -26,11 +24,11 @@ else:
 
 from typing import Any, Dict, List, Tuple
 from tensorflow.python.util.object_identity import Reference as TFReference
-from model_compression_toolkit.constants import EPS, MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.jacobian_weights import JacobianTraceAccumulator, average_jacobian_weights
 from model_compression_toolkit.core.keras.back2framework.instance_builder import OperationHandler
 from model_compression_toolkit.logger import Logger
 
@@ -104,12 +102,18 @@ def keras_iterative_approx_jacobian_trace(graph_float: common.Graph,
                                           all_outputs_indices: List[int],
                                           alpha: float = 0.3,
                                           n_iter: int = 50,
-                                          norm_weights: bool = True) -> List[float]:
+                                          norm_weights: bool = True,
+                                          n_probes: int = 1) -> np.ndarray:
     """
     Computes an approximation of the power of the Jacobian trace of a Keras model's outputs with respect to the feature maps of
     the set of given interest points. It then uses the power of the Jacobian trace for each interest point and normalized the
     values, to be used as weights for weighted average in distance metric computation.
 
+    The approximation of all the interest points, of all the images in the input batch and of n_probes random
+    vectors is computed in a single backward pass (each image is replicated for each random vector). If the model
+    mixes the samples of a batch (so the rows of the batch are not independent), each image is processed
+    separately with a single random vector per pass.
+
     Args:
         graph_float: Graph to build its corresponding Keras model.
         model_input_tensors: A mapping between model input nodes to an input batch.
@@ -122,17 +126,60 @@ def keras_iterative_approx_jacobian_trace(graph_float: common.Graph,
             compatible weight for the distance metric computation).
         n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
         norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+        n_probes: Number of random vectors to draw in each backward pass.
+
+    Returns: An array of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
+    point's output has on the model's output, averaged over the images in the input batch.
+    """
+
+    jacobians_traces = _approx_jacobians_traces(graph_float, model_input_tensors, interest_points, output_list,
+                                                n_iter, n_probes)
+    if jacobians_traces is None:
+        num_images = list(model_input_tensors.values())[0].shape[0]
+        jacobians_traces = np.concatenate([_approx_jacobians_traces(graph_float,
+                                                                    {n: t[i:i + 1] for n, t in
+                                                                     model_input_tensors.items()},
+                                                                    interest_points,
+                                                                    output_list,
+                                                                    n_iter,
+                                                                    n_probes=1)
+                                           for i in range(num_images)])
+
+    return average_jacobian_weights(jacobians_traces, all_outputs_indices, alpha, norm_weights)
+
+
+def _approx_jacobians_traces(graph_float: common.Graph,
+                             model_input_tensors: Dict[BaseNode, np.ndarray],
+                             interest_points: List[BaseNode],
+                             output_list: List[BaseNode],
+                             n_iter: int,
+                             n_probes: int) -> np.ndarray:
+    """
+    Approximates the power of the Jacobian trace of the model's outputs with respect to each interest point for each
+    image in the input batch.
+
+    Args:
+        graph_float: Graph to build its corresponding Keras model.
+        model_input_tensors: A mapping between model input nodes to an input batch.
+        interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+        output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace.
+        n_probes: Number of random vectors to draw in each backward pass.
 
-    Returns: A list of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
-    point's output has on the model's output.
+    Returns: An array of the approximations with shape (num_images, num_interest_points), or None if the model
+    mixes the samples of a batch and more than a single sample was used in a pass.
     """
 
-    if not all([images.shape[0] == 1 for node, images in model_input_tensors.items()]):
-        Logger.critical("Iterative jacobian trace computation is only supported on a single image sample")  # pragma: no cover
+    num_images = list(model_input_tensors.values())[0].shape[0]
+    num_rows = num_images * n_probes
+
+    # Replicate the images for each random vector
+    replicated_input_tensors = {n: tf.concat([tf.convert_to_tensor(input_tensor)] * n_probes, axis=0)
+                                for n, input_tensor in model_input_tensors.items()}
 
     with tf.GradientTape(persistent=True, watch_accessed_variables=False) as g:
         outputs, interest_points_tensors = _model_outputs_computation(graph_float,
-                                                                      model_input_tensors,
+                                                                      replicated_input_tensors,
                                                                       interest_points,
                                                                       output_list,
                                                                       gradient_tape=g)
@@ -146,6 +193,9 @@ def keras_iterative_approx_jacobian_trace(graph_float: common.Graph,
             else:
                 unfold_outputs.append(output)
 
+        if num_rows > 1 and any([output.shape[0] != num_rows for output in unfold_outputs]):
+            return None
+
         r_outputs = [tf.reshape(output, shape=[output.shape[0], -1]) for output in unfold_outputs]
 
         concat_axis_dim = [o.shape[0] for o in r_outputs]
@@ -155,37 +205,28 @@ def keras_iterative_approx_jacobian_trace(graph_float: common.Graph,
 
         output = tf.concat(r_outputs, axis=1)
 
-        ipts_jac_trace_approx = []
-        for ipt in tqdm(interest_points_tensors):  # Per Interest point activation tensor
-            trace_jv = []
-            for j in range(n_iter):  # Approximation iterations
-                # Getting a random vector with normal distribution
-                v = tf.random.normal(shape=output.shape)
-                f_v = tf.reduce_sum(v * output)
-
-                with g.stop_recording():
-                    # Computing the jacobian approximation by getting the gradient of (output * v)
-                    jac_v = g.gradient(f_v, ipt, unconnected_gradients=tf.UnconnectedGradients.ZERO)
-                    jac_v = tf.reshape(jac_v, [jac_v.shape[0], -1])
-                    jac_trace_approx = tf.reduce_mean(tf.reduce_sum(tf.pow(jac_v, 2.0)))
-
-                    # If the change to the mean Jacobian approximation is insignificant we stop the calculation
-                    if j > MIN_JACOBIANS_ITER:
-                        new_mean = np.mean([jac_trace_approx, *trace_jv])
-                        delta = new_mean - np.mean(trace_jv)
-                        if np.abs(delta) / (np.abs(new_mean) + 1e-6) < JACOBIANS_COMP_TOLERANCE:
-                            trace_jv.append(jac_trace_approx)
-                            break
-
-                    trace_jv.append(jac_trace_approx)
-            ipts_jac_trace_approx.append(2 * tf.reduce_mean(trace_jv) / output.shape[-1])  # Get averaged squared jacobian trace approximation
-
-        ipts_jac_trace_approx = tf.reduce_mean([ipts_jac_trace_approx], axis=0)  # Just to get one tensor instead of list of tensors with single element
-
-        if norm_weights:
-            return _normalize_weights(ipts_jac_trace_approx, all_outputs_indices, alpha)
-        else:
-            return ipts_jac_trace_approx
+        jac_trace_accumulator = JacobianTraceAccumulator(num_images, len(interest_points_tensors), n_iter)
+        while not jac_trace_accumulator.done:
+            # Getting a random vector with normal distribution for each row
+            v = tf.random.normal(shape=output.shape)
+            f_v = tf.reduce_sum(v * output)
+
+            with g.stop_recording():
+                # Computing the jacobian approximation of all interest points by getting the gradient of (output * v)
+                jacs_v = g.gradient(f_v, interest_points_tensors, unconnected_gradients=tf.UnconnectedGradients.ZERO)
+
+                jac_trace_approx = np.zeros((num_rows, len(interest_points_tensors)))
+                for i, jac_v in enumerate(jacs_v):
+                    # Interest points with several output tensors have a gradient for each tensor
+                    for t in (jac_v if isinstance(jac_v, list) else [jac_v]):
+                        if num_rows > 1 and t.shape[0] != num_rows:
+                            return None
+                        t = tf.reshape(t, [num_rows, -1])
+                        jac_trace_approx[:, i] += tf.reduce_sum(tf.pow(t, 2.0), axis=1).numpy()
+
+            jac_trace_accumulator.update(jac_trace_approx.reshape((n_probes, num_images, -1)))
+
+    return 2 * jac_trace_accumulator.get_means() / output.shape[-1]  # Get averaged squared jacobian trace approximation
 
 
 def _model_outputs_computation(graph_float: common.Graph,
@@ -249,53 +290,3 @@ def _model_outputs_computation(graph_float: common.Graph,
             node_to_output_tensors_dict.update({n: [out_tensors_of_n]})
 
     return output_tensors, interest_points_tensors
-
-
-def _normalize_weights(jacobians_traces: List,
-                       all_outputs_indices: List[int],
-                       alpha: float) -> List[float]:
-    """
-    Output layers or layers that come after the model's considered output layers,
-    are assigned with a constant normalized value, according to the given alpha variable and the number of such layers.
-    Other layers returned weights are normalized by dividing the jacobian-based weights value by the sum of all other values.
-
-    Args:
-        jacobians_traces: The approximated average jacobian-based weights of each interest point.
-        all_outputs_indices: A list of indices of all nodes that consider outputs.
-        alpha: A multiplication factor.
-
-    Returns: Normalized list of jacobian-based weights (for each interest point).
-
-    """
-
-    sum_without_outputs = sum([jacobians_traces[i] for i in range(len(jacobians_traces)) if i not in all_outputs_indices])
-    normalized_grads_weights = [_get_normalized_weight(grad, i, sum_without_outputs, all_outputs_indices, alpha)
-                                for i, grad in enumerate(jacobians_traces)]
-
-    return normalized_grads_weights
-
-
-def _get_normalized_weight(grad: float,
-                           i: int,
-                           sum_without_outputs: float,
-                           all_outputs_indices: List[int],
-                           alpha: float) -> float:
-    """
-    Normalizes the node's gradient value. If it is an output or output replacement node than the normalized value is
-    a constant, otherwise, it is normalized by dividing with the sum of all gradient values.
-
-    Args:
-        grad: The gradient value.
-        i: The index of the node in the sorted interest points list.
-        sum_without_outputs: The sum of all gradients of nodes that are not considered outputs.
-        all_outputs_indices: A list of indices of all nodes that consider outputs.
-        alpha: A multiplication factor.
-
-    Returns: A normalized jacobian-based weights.
-
-    """
-
-    if i in all_outputs_indices:
-        return alpha / len(all_outputs_indices)
-    else:
-        return ((1 - alpha) * grad / (sum_without_outputs + EPS)).numpy()
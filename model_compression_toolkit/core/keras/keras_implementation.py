@@ -24,6 +24,7 @@ from tensorflow.python.layers.base import Layer
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
 from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
 from model_compression_toolkit.core.common.similarity_analyzer import compute_kl_divergence, compute_cs, compute_mse
+from model_compression_toolkit.core.keras.back2framework.compiled_inference import KerasCompiledInference
 from model_compression_toolkit.core.keras.back2framework.model_gradients import \
     keras_iterative_approx_jacobian_trace
 from model_compression_toolkit.core.keras.constants import ACTIVATION, SOFTMAX, SIGMOID, ARGMAX, LAYER_NAME
@@ -85,9 +86,11 @@ from model_compression_toolkit.core.keras.graph_substitutions.substitutions.sepa
 from model_compression_toolkit.core.keras.graph_substitutions.substitutions.shift_negative_activation import \
     keras_apply_shift_negative_correction
 from model_compression_toolkit.core.keras.keras_node_prior_info import create_node_prior_info
+from model_compression_toolkit.core.keras.keras_integer_op_mapping import get_keras_integer_op
 from model_compression_toolkit.core.keras.reader.reader import model_reader
 from model_compression_toolkit.core.common.collectors.statistics_collector_generator import \
     create_stats_collector_for_node
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 import model_compression_toolkit.core.keras.constants as keras_constants
 from model_compression_toolkit.core.keras.tf_tensor_numpy import tf_tensor_to_numpy, to_tf_tensor
 from model_compression_toolkit.core.keras.back2framework import get_keras_model_builder
@@ -98,8 +101,18 @@ class KerasImplementation(FrameworkImplementation):
     A class with implemented methods to support optimizing Keras models.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 compiled_inference: bool = False,
+                 jit_compile: bool = False):
+        """
+        Args:
+            compiled_inference: Whether to run the models inferences of statistics collection, mixed-precision
+                sensitivity evaluation and second moment correction as traced functions (see KerasCompiledInference)
+                instead of running them eagerly.
+            jit_compile: Whether to compile the traced functions with XLA (if compiled_inference is enabled).
+        """
         super().__init__()
+        self.compiled_inference = KerasCompiledInference(jit_compile=jit_compile) if compiled_inference else None
 
     @property
     def constants(self):
@@ -151,7 +164,8 @@ class KerasImplementation(FrameworkImplementation):
                       mode: ModelBuilderMode,
                       append2output: List[Any] = None,
                       fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
-                      return_float_outputs: bool = False) -> Tuple:
+                      return_float_outputs: bool = False,
+                      weights_cache: CandidateWeightsCache = None) -> Tuple:
         """
         Build a Keras model from a graph.
         The mode determines how the model should be build. append2output is a list of Nodes
@@ -163,15 +177,20 @@ class KerasImplementation(FrameworkImplementation):
             append2output: List of Nodes to set as the model's outputs.
             fw_info: FrameworkInfo object with information about the specific framework's model
             return_float_outputs (bool): whether to return outputs before or after quantization nodes (default)
+            weights_cache: Cache of candidates quantized weights for the configurable weights quantizers of a
+                mixed-precision model (used only in mixed-precision mode).
         Returns:
             A tuple with the model and additional relevant supporting objects.
         """
 
+        # Only the mixed-precision model builder uses a candidate weights cache.
+        builder_kwargs = {'weights_cache': weights_cache} if mode == ModelBuilderMode.MIXEDPRECISION else {}
         keras_model_builder = get_keras_model_builder(mode)
         return keras_model_builder(graph=graph,
                                    append2output=append2output,
                                    fw_info=fw_info,
-                                   return_float_outputs=return_float_outputs).build_model()
+                                   return_float_outputs=return_float_outputs,
+                                   **builder_kwargs).build_model()
 
     def run_model_inference(self,
                             model: Any,
@@ -186,6 +205,8 @@ class KerasImplementation(FrameworkImplementation):
         Returns:
             The Keras model's output.
         """
+        if self.compiled_inference is not None:
+            return self.compiled_inference(model, input_list)
         return model(input_list)
 
     def shift_negative_correction(self,
@@ -209,7 +230,8 @@ class KerasImplementation(FrameworkImplementation):
 
     def attach_sc_to_node(self,
                           node: BaseNode,
-                          fw_info: FrameworkInfo) -> BaseStatsCollector:
+                          fw_info: FrameworkInfo,
+                          streaming_histogram: bool = False) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
@@ -217,11 +239,12 @@ class KerasImplementation(FrameworkImplementation):
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel)
+            streaming_histogram: Whether the collector should keep a single running histogram (bounded memory).
 
         Returns:
             Statistics collector for the node.
         """
-        return create_stats_collector_for_node(node, fw_info)
+        return create_stats_collector_for_node(node, fw_info, streaming_histogram)
 
     def get_substitutions_channel_equalization(self,
                                                quant_config: QuantizationConfig,
@@ -464,7 +487,8 @@ class KerasImplementation(FrameworkImplementation):
                    all_outputs_indices: List[int],
                    alpha: float = 0.3,
                    n_iter: int = 50,
-                   norm_weights: bool = True) -> List[float]:
+                   norm_weights: bool = True,
+                   n_probes: int = 1) -> np.ndarray:
         """
         Calls a Keras model gradient calculation function, which computes the jacobian-based weights of the model's
         outputs with respect to the feature maps of the set of given interest points.
@@ -481,14 +505,16 @@ class KerasImplementation(FrameworkImplementation):
                 compatible weight for the distance metric computation).
             n_iter: The number of random iterations to calculate the approximated  jacobian-based weights for each interest point.
             norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+            n_probes: Number of random vectors to draw in each backward pass.
 
-        Returns: A list of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
-        point's output has on the model's output.
+        Returns: An array of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
+        point's output has on the model's output, averaged over the images in the input batch.
 
         """
 
         return keras_iterative_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
-                                                     all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
+                                                     all_outputs_indices, alpha, n_iter, norm_weights=norm_weights,
+                                                     n_probes=n_probes)
 
     def is_node_compatible_for_metric_outputs(self,
                                               node: BaseNode) -> Any:
@@ -564,7 +590,8 @@ class KerasImplementation(FrameworkImplementation):
             A Graph after second moment correction.
         """
         graph_after_second_moment_correction = keras_apply_second_moment_correction(quantized_model, core_config,
-                                                                                    representative_data_gen, graph)
+                                                                                    representative_data_gen, graph,
+                                                                                    self.compiled_inference)
         return graph_after_second_moment_correction
 
     def sensitivity_eval_inference(self,
@@ -580,5 +607,22 @@ class KerasImplementation(FrameworkImplementation):
         Returns:
             The output of the model inference on the given input.
         """
-
+        if self.compiled_inference is not None:
+            return self.compiled_inference(model, inputs)
         return model(inputs)
+
+    def get_integer_op(self,
+                       node: BaseNode,
+                       fw_info: FrameworkInfo) -> Callable:
+        """
+        Get the operation that runs a node that represents a Keras layer with integer arithmetic in the integer graph
+        executor.
+
+        Args:
+            node: Node to get its integer operation.
+            fw_info: Framework specific information about the node (such as its kernel attributes).
+
+        Returns:
+            An IntegerOp that runs the node.
+        """
+        return get_keras_integer_op(node, fw_info, self)
@@ -0,0 +1,208 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import tensorflow as tf
+from packaging import version
+
+if version.parse(tf.__version__) < version.parse("2.6"):
+    from tensorflow.keras.layers import Conv2D, DepthwiseConv2D, Dense, ReLU, Activation, Add, Subtract, \
+        Concatenate, MaxPooling2D, AveragePooling2D, GlobalAveragePooling2D, Flatten, Reshape, Dropout, Permute, \
+        ZeroPadding2D
+else:
+    from keras.layers import Conv2D, DepthwiseConv2D, Dense, ReLU, Activation, Add, Subtract, Concatenate, \
+        MaxPooling2D, AveragePooling2D, GlobalAveragePooling2D, Flatten, Reshape, Dropout, Permute, ZeroPadding2D
+
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.integer_executor.integer_ops import IntegerOp, IntegerConv2D, \
+    IntegerDense, IntegerAdd, IntegerConcat, IntegerMaxPool2D, IntegerAvgPool2D, IntegerGlobalAvgPool, \
+    IntegerClipActivation, IntegerLUTActivation, IntegerReshape, IntegerZeroPadding2D, sigmoid, swish, gelu, elu, \
+    softplus
+from model_compression_toolkit.core.common.integer_executor.integer_tensor import get_node_integer_kernel
+from model_compression_toolkit.core.keras.constants import BIAS, STRIDES, PADDING, DILATIONS, GROUPS, ACTIVATION, \
+    RELU_MAX_VALUE, THRESHOLD, NEGATIVE_SLOPE, CHANNELS_FORMAT, CHANNELS_FORMAT_FIRST, AXIS, DIMS, LINEAR, \
+    IDENTITY, RELU, SIGMOID, TANH, SWISH, GELU
+from model_compression_toolkit.logger import Logger
+
+
+def _hard_sigmoid(x: np.ndarray) -> np.ndarray:
+    # Keras' piecewise-linear approximation of the sigmoid.
+    return np.clip(0.2 * x + 0.5, 0, 1)
+
+
+# Activations (by their Keras names) that clip their input, and their bounds.
+CLIP_ACTIVATIONS = {LINEAR: (None, None),
+                    IDENTITY: (None, None),
+                    RELU: (0, None)}
+
+# Non-linear activations (by their Keras names) that are computed with a lookup table.
+LUT_ACTIVATIONS = {SIGMOID: sigmoid,
+                   TANH: np.tanh,
+                   SWISH: swish,
+                   'silu': swish,
+                   'hard_sigmoid': _hard_sigmoid,
+                   GELU: gelu,
+                   'elu': elu,
+                   'softplus': softplus}
+
+# TF functions of functional nodes that clip their input, and their bounds.
+TF_CLIP_ACTIVATIONS = {tf.nn.relu: (0, None),
+                       tf.nn.relu6: (0, 6),
+                       tf.identity: (None, None)}
+
+# TF functions of functional nodes that are computed with a lookup table.
+TF_LUT_ACTIVATIONS = {tf.nn.sigmoid: sigmoid,
+                      tf.sigmoid: sigmoid,
+                      tf.nn.tanh: np.tanh,
+                      tf.tanh: np.tanh,
+                      tf.nn.silu: swish,
+                      tf.nn.gelu: gelu,
+                      tf.nn.elu: elu,
+                      tf.nn.softplus: softplus}
+
+
+def _get_activation_bounds(node: BaseNode):
+    """
+    Get the bounds of the activation of a layer with a clipping activation (such as Conv2D with a ReLU activation).
+    """
+    activation = node.framework_attr.get(ACTIVATION, LINEAR)
+    if activation not in CLIP_ACTIVATIONS:
+        Logger.critical(f'The integer executor does not support activation {activation} of node {node.name}.')
+    return CLIP_ACTIVATIONS[activation]
+
+
+def _check_channels_last(node: BaseNode):
+    if node.framework_attr.get(CHANNELS_FORMAT) == CHANNELS_FORMAT_FIRST:
+        Logger.critical(f'The integer executor supports only the channels last data format, but node {node.name} '
+                        f'is channels first.')
+
+
+def _get_conv_op(node: BaseNode,
+                 fw_info: FrameworkInfo,
+                 fw_impl: FrameworkImplementation) -> IntegerOp:
+    _check_channels_last(node)
+    kernel, scale = get_node_integer_kernel(node, fw_info, fw_impl)
+    groups = node.framework_attr.get(GROUPS, 1)
+    if node.type == DepthwiseConv2D:
+        # [kernel height, kernel width, C_in, depth multiplier] -> [kernel height, kernel width, 1, C_out]
+        groups = kernel.shape[2]
+        kernel, scale = kernel.reshape(kernel.shape[:2] + (1, -1)), scale.reshape(scale.shape[:2] + (1, -1))
+    lower_bound, upper_bound = _get_activation_bounds(node)
+    return IntegerConv2D(kernel,
+                         scale[0, 0, 0, :],
+                         node.final_weights_quantization_cfg.weights_n_bits,
+                         bias=node.get_weights_by_keys(BIAS),
+                         strides=node.framework_attr.get(STRIDES, 1),
+                         padding=node.framework_attr.get(PADDING),
+                         dilations=node.framework_attr.get(DILATIONS, 1),
+                         groups=groups,
+                         lower_bound=lower_bound,
+                         upper_bound=upper_bound)
+
+
+def _get_dense_op(node: BaseNode,
+                  fw_info: FrameworkInfo,
+                  fw_impl: FrameworkImplementation) -> IntegerOp:
+    kernel, scale = get_node_integer_kernel(node, fw_info, fw_impl)
+    lower_bound, upper_bound = _get_activation_bounds(node)
+    return IntegerDense(kernel,
+                        scale[0, :],
+                        node.final_weights_quantization_cfg.weights_n_bits,
+                        bias=node.get_weights_by_keys(BIAS),
+                        lower_bound=lower_bound,
+                        upper_bound=upper_bound)
+
+
+def _get_pool_op(node: BaseNode, op_class: type) -> IntegerOp:
+    _check_channels_last(node)
+    pool_size = node.framework_attr.get('pool_size')
+    strides = node.framework_attr.get(STRIDES)
+    return op_class(pool_size,
+                    pool_size if strides is None else strides,
+                    padding=node.framework_attr.get(PADDING))
+
+
+def _get_relu_op(node: BaseNode) -> IntegerOp:
+    if node.framework_attr.get(THRESHOLD, 0) != 0:
+        Logger.critical(f'The integer executor does not support ReLU node {node.name} with a threshold.')
+    negative_slope = node.framework_attr.get(NEGATIVE_SLOPE, 0)
+    if negative_slope != 0:
+        max_value = node.framework_attr.get(RELU_MAX_VALUE)
+        return IntegerLUTActivation(lambda x: np.clip(np.where(x > 0, x, negative_slope * x), None, max_value))
+    max_value = node.framework_attr.get(RELU_MAX_VALUE)
+    return IntegerClipActivation(0, None if max_value is None else float(max_value))
+
+
+def get_keras_integer_op(node: BaseNode,
+                         fw_info: FrameworkInfo,
+                         fw_impl: FrameworkImplementation) -> IntegerOp:
+    """
+    Get the integer operation that runs a node of a Keras model in the integer graph executor.
+
+    Args:
+        node: Node to get its integer operation.
+        fw_info: Framework information of Keras.
+        fw_impl: Keras implementation.
+
+    Returns:
+        An IntegerOp that runs the node.
+    """
+    node_type = node.type
+    if node_type in [Conv2D, DepthwiseConv2D]:
+        return _get_conv_op(node, fw_info, fw_impl)
+    if node_type == Dense:
+        return _get_dense_op(node, fw_info, fw_impl)
+    if node_type == ReLU:
+        return _get_relu_op(node)
+    if node_type == Activation:
+        activation = node.framework_attr.get(ACTIVATION)
+        if activation in CLIP_ACTIVATIONS:
+            return IntegerClipActivation(*CLIP_ACTIVATIONS[activation])
+        if activation in LUT_ACTIVATIONS:
+            return IntegerLUTActivation(LUT_ACTIVATIONS[activation])
+    if node_type in TF_CLIP_ACTIVATIONS:
+        return IntegerClipActivation(*TF_CLIP_ACTIVATIONS[node_type])
+    if node_type in TF_LUT_ACTIVATIONS:
+        return IntegerLUTActivation(TF_LUT_ACTIVATIONS[node_type])
+    if node_type == tf.nn.leaky_relu:
+        alpha = node.op_call_kwargs.get('alpha', node.op_call_args[0] if node.op_call_args else 0.2)
+        return IntegerLUTActivation(lambda x: np.where(x > 0, x, alpha * x))
+    if node_type in [Add, Subtract, tf.add] and len(node.input_shape) == 2:
+        return IntegerAdd(subtract=node_type == Subtract)
+    if node_type == Concatenate:
+        return IntegerConcat(node.framework_attr.get(AXIS, -1))
+    if node_type == tf.concat:
+        return IntegerConcat(node.op_call_kwargs.get(AXIS, node.op_call_args[0] if node.op_call_args else -1))
+    if node_type == MaxPooling2D:
+        return _get_pool_op(node, IntegerMaxPool2D)
+    if node_type == AveragePooling2D:
+        return _get_pool_op(node, IntegerAvgPool2D)
+    if node_type == GlobalAveragePooling2D:
+        _check_channels_last(node)
+        return IntegerGlobalAvgPool((1, 2), keepdims=node.framework_attr.get('keepdims', False))
+    if node_type == ZeroPadding2D:
+        _check_channels_last(node)
+        return IntegerZeroPadding2D(node.framework_attr.get(PADDING))
+    if node_type in [Flatten, Reshape, tf.reshape]:
+        output_shape = tuple(node.output_shape[1:])
+        return IntegerReshape(lambda x: x.reshape((x.shape[0],) + output_shape))
+    if node_type == Permute:
+        dims = (0,) + tuple(node.framework_attr.get(DIMS))
+        return IntegerReshape(lambda x: x.transpose(dims))
+    if node_type == Dropout:
+        return IntegerReshape()
+
+    Logger.critical(f'The integer executor does not support node {node.name} of type {node_type}.')
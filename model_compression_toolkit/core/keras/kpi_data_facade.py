@@ -102,7 +102,8 @@ if FOUND_TF:
                                     representative_data_gen: Callable,
                                     core_config: CoreConfig,
                                     fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
-                                    target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC) -> KPI:
+                                    target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC,
+                                    compute_activation_max_cut: bool = False) -> KPI:
         """
         Computes KPI data that can be used to calculate the desired target KPI for mixed-precision quantization.
         Builds the computation graph from the given model and hw modeling, and uses it to compute the KPI data.
@@ -113,6 +114,7 @@ if FOUND_TF:
             core_config (CoreConfig): CoreConfig containing parameters for quantization and mixed precision of how the model should be quantized.
             fw_info (FrameworkInfo): Information needed for quantization about the specific framework (e.g., kernel channels indices, groups of layers by how they should be quantized, etc.). `Default Keras info <https://github.com/sony/model_optimization/blob/main/model_compression_toolkit/core/keras/default_framework_info.py>`_
             target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the Keras model according to.
+            compute_activation_max_cut (bool): Whether to compute the maximal activation cut (peak activation memory) of the model's computation schedule, which requires searching the schedule and is only needed for setting an activation max-cut target KPI. If False, it is left unset (infinite).
 
         Returns:
 
@@ -148,7 +150,8 @@ if FOUND_TF:
                                 core_config,
                                 target_platform_capabilities,
                                 fw_info,
-                                fw_impl)
+                                fw_impl,
+                                compute_activation_max_cut=compute_activation_max_cut)
 
 else:
     # If tensorflow is not installed,
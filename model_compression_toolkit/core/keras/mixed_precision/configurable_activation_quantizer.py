@@ -68,6 +68,9 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
 
         self.activation_quantizers = init_activation_quantizers(self.node_q_cfg)
         self.active_quantization_config_index = max_candidate_idx  # initialize with first config as default
+        # The active index as a variable, so a traced inference (tf.function) of a model that uses the quantizer
+        # reads the active index when it runs, instead of using the index the function was traced with.
+        self.active_quantization_config_index_var = tf.Variable(max_candidate_idx, dtype=tf.int32, trainable=False)
 
     def set_active_activation_quantizer(self, index: int):
         """
@@ -81,6 +84,7 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
         assert index < len(self.node_q_cfg), f'Quantizer has {len(self.node_q_cfg)} ' \
                                              f'possible nbits. Can not set index {index}'
         self.active_quantization_config_index = index
+        self.active_quantization_config_index_var.assign(index)
 
     def __call__(self,
                  inputs: tf.Tensor) -> np.ndarray:
@@ -95,7 +99,10 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
         Returns:
             Quantized activation tensor.
         """
-        return self.activation_quantizers[self.active_quantization_config_index](inputs)
+        if tf.executing_eagerly():
+            return self.activation_quantizers[self.active_quantization_config_index](inputs)
+        return tf.switch_case(self.active_quantization_config_index_var.read_value(),
+                              [lambda q=q: q(inputs) for q in self.activation_quantizers])
 
     def get_config(self) -> Dict[str, Any]:  # pragma: no cover
         """
@@ -26,7 +26,8 @@ from model_compression_toolkit.core import common
 def keras_apply_second_moment_correction(quantized_model: Any,
                                          core_config: CoreConfig,
                                          representative_data_gen: Callable,
-                                         graph: common.Graph):
+                                         graph: common.Graph,
+                                         compiled_inference: Callable = None):
     """
     Apply second moment statistics correction to graph.
 
@@ -35,6 +36,7 @@ def keras_apply_second_moment_correction(quantized_model: Any,
         core_config: QuantizationConfig of how the model should be quantized.
         representative_data_gen: Dataset to use for retrieving images for the models inputs.
         graph: Graph to update the parameters after the second moment correction.
+        compiled_inference: A KerasCompiledInference to run the model with (if None, the model is run eagerly).
 
     Returns:
         A function that applies second moment correction.
@@ -49,7 +51,10 @@ def keras_apply_second_moment_correction(quantized_model: Any,
                 layer.trainable = True
 
     for data in tqdm(representative_data_gen()):
-        quantized_model(data, training=True)
+        if compiled_inference is not None:
+            compiled_inference(quantized_model, data, training=True)
+        else:
+            quantized_model(data, training=True)
 
     # Move every BN to eval mode and update the corresponding BN node params in the graph
     for layer in quantized_model.layers:
@@ -33,7 +33,7 @@ def node_builder(n: BaseNode) -> Module:
 
     framework_attr = copy.copy(n.framework_attr)
     node_instance = n.type(**framework_attr)
-    node_instance.load_state_dict({k: torch.Tensor(v) for k, v in n.weights.items()}, strict=False)
+    node_instance.load_state_dict({k: torch.Tensor(v) for k, v in n.get_weights_dict().items()}, strict=False)
     set_model(node_instance)
     return node_instance
 
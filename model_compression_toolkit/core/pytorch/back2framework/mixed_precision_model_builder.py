@@ -26,6 +26,7 @@ from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PyTorchModelBuilder
 
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
@@ -47,7 +48,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
                  graph: common.Graph,
                  append2output=None,
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 weights_cache: CandidateWeightsCache = None):
         """
 
         Args:
@@ -55,9 +57,12 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
             append2output: Nodes to append to model's output.
             fw_info: Information about the specific framework of the model that is built.
             return_float_outputs: Whether the model returns float tensors or not.
+            weights_cache: Cache of candidates quantized weights for the configurable weights quantizers to quantize
+                their weights on demand with. If None, the quantizers keep the quantized weights of all candidates.
         """
 
         self.graph = graph
+        self.weights_cache = weights_cache
 
         super().__init__(graph,
                          append2output,
@@ -138,7 +143,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
 
         return {'node_q_cfg': node_q_cfg_candidates,
                 'float_weights': float_weights,
-                'max_candidate_idx': max_candidate_idx
+                'max_candidate_idx': max_candidate_idx,
+                'weights_cache': self.weights_cache
                 }
 
     def mixed_precision_activation_holder(self, n: BaseNode) -> PytorchActivationQuantizationHolder:
@@ -17,14 +17,13 @@ from typing import Any, Dict, List
 import torch
 import torch.autograd as autograd
 from networkx import topological_sort
-from tqdm import tqdm
 import numpy as np
 
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
-from model_compression_toolkit.constants import EPS, MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
+from model_compression_toolkit.core.common.jacobian_weights import JacobianTraceAccumulator, average_jacobian_weights
 from model_compression_toolkit.core.pytorch.back2framework.instance_builder import node_builder
 from model_compression_toolkit.core.pytorch.constants import BUFFER
 from model_compression_toolkit.core.pytorch.reader.node_holders import DummyPlaceHolder, BufferHolder
@@ -216,12 +215,18 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
                                             all_outputs_indices: List[int],
                                             alpha: float = 0.3,
                                             n_iter: int = 50,
-                                            norm_weights: bool = True) -> List[float]:
+                                            norm_weights: bool = True,
+                                            n_probes: int = 1) -> np.ndarray:
     """
     Computes an approximation of the power of the Jacobian trace of a Pytorch model's outputs with respect to the feature maps of
     the set of given interest points. It then uses the power of the Jacobian trace for each interest point and normalized the
     values, to be used as weights for weighted average in distance metric computation.
 
+    The approximation of all the interest points, of all the images in the input batch and of n_probes random
+    vectors is computed in a single backward pass (each image is replicated for each random vector). If the model
+    mixes the samples of a batch (so the rows of the batch are not independent), each image is processed
+    separately with a single random vector per pass.
+
     Args:
         graph_float: Graph to build its corresponding Pytorch model.
         model_input_tensors: A mapping between model input nodes to an input batch torch Tensor.
@@ -234,24 +239,61 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
             compatible weight for the distance metric computation).
         n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
         norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+        n_probes: Number of random vectors to draw in each backward pass.
 
-    Returns: A list of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
-    point's output has on the model's output.
+    Returns: An array of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
+    point's output has on the model's output, averaged over the images in the input batch.
     """
 
-    # Set inputs to require_grad
-    for n, input_tensor in model_input_tensors.items():
-        input_tensor.requires_grad_()
-
     model_grads_net = PytorchModelGradients(graph_float=graph_float,
                                             interest_points=interest_points,
                                             output_list=output_list)
+    # Use inference behavior of layers (e.g., BatchNorm), so the images of a batch are independent.
+    model_grads_net.eval()
+
+    jacobians_traces = _approx_jacobians_traces(model_grads_net, model_input_tensors, n_iter, n_probes)
+    if jacobians_traces is None:
+        num_images = list(model_input_tensors.values())[0].shape[0]
+        jacobians_traces = np.concatenate([_approx_jacobians_traces(model_grads_net,
+                                                                    {n: t[i:i + 1] for n, t in
+                                                                     model_input_tensors.items()},
+                                                                    n_iter,
+                                                                    n_probes=1)
+                                           for i in range(num_images)])
+
+    return average_jacobian_weights(jacobians_traces, all_outputs_indices, alpha, norm_weights)
+
+
+def _approx_jacobians_traces(model_grads_net: PytorchModelGradients,
+                             model_input_tensors: Dict[BaseNode, torch.Tensor],
+                             n_iter: int,
+                             n_probes: int) -> np.ndarray:
+    """
+    Approximates the power of the Jacobian trace of the model's outputs with respect to each interest point for each
+    image in the input batch.
+
+    Args:
+        model_grads_net: Model to compute the outputs and the interest points' feature maps.
+        model_input_tensors: A mapping between model input nodes to an input batch torch Tensor.
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace.
+        n_probes: Number of random vectors to draw in each backward pass.
+
+    Returns: An array of the approximations with shape (num_images, num_interest_points), or None if the model
+    mixes the samples of a batch and more than a single sample was used in a pass.
+    """
+
+    num_images = list(model_input_tensors.values())[0].shape[0]
+    num_rows = num_images * n_probes
+
+    # Replicate the images for each random vector, and set the inputs to require_grad
+    replicated_input_tensors = {n: torch.cat([input_tensor] * n_probes).detach().requires_grad_()
+                                for n, input_tensor in model_input_tensors.items()}
 
     # Run model inference
-    output_tensors = model_grads_net(model_input_tensors)
+    model_grads_net.interest_points_tensors = []
+    output_tensors = model_grads_net(replicated_input_tensors)
     device = output_tensors[0].device
 
-
     # Concat outputs
     # First, we need to unfold all outputs that are given as list, to extract the actual output tensors
     unfold_outputs = []
@@ -261,6 +303,9 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
         else:
             unfold_outputs.append(output)
 
+    if num_rows > 1 and any([output.shape[0] != num_rows for output in unfold_outputs]):
+        return None
+
     r_outputs = [torch.reshape(output, shape=[output.shape[0], -1]) for output in unfold_outputs]
 
     concat_axis_dim = [o.shape[0] for o in r_outputs]
@@ -270,97 +315,30 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
 
     output = torch.concat(r_outputs, dim=1)
 
-    ipts_jac_trace_approx = []
-    for ipt in tqdm(model_grads_net.interest_points_tensors):  # Per Interest point activation tensor
-        trace_jv = []
-        for j in range(n_iter):  # Approximation iterations
-            # Getting a random vector with normal distribution
-            v = torch.randn(output.shape, device=device)
-            f_v = torch.sum(v * output)
-
-            # Computing the jacobian approximation by getting the gradient of (output * v)
-            jac_v = autograd.grad(outputs=f_v,
-                                  inputs=ipt,
-                                  retain_graph=True,
-                                  allow_unused=True)[0]
+    interest_points_tensors = model_grads_net.interest_points_tensors
+    jac_trace_accumulator = JacobianTraceAccumulator(num_images, len(interest_points_tensors), n_iter)
+    while not jac_trace_accumulator.done:
+        # Getting a random vector with normal distribution for each row
+        v = torch.randn(output.shape, device=device)
+        f_v = torch.sum(v * output)
+
+        # Computing the jacobian approximation of all interest points by getting the gradient of (output * v)
+        jacs_v = autograd.grad(outputs=f_v,
+                               inputs=interest_points_tensors,
+                               retain_graph=True,
+                               allow_unused=True)
+
+        jac_trace_approx = np.zeros((num_rows, len(interest_points_tensors)))
+        for i, jac_v in enumerate(jacs_v):
             if jac_v is None:
                 # In case we have an output node, which is an interest point, but it is not differentiable,
-                # we still want to set some weight for it. For this, we need to add this dummy tensor to the ipt
-                # jacobian traces list.
-                trace_jv.append(torch.tensor([0.0],
-                                             requires_grad=True,
-                                             device=device))
-                break
-            jac_v = torch.reshape(jac_v, [jac_v.shape[0], -1])
-            jac_trace_approx = torch.mean(torch.sum(torch.pow(jac_v, 2.0)))
-
-            # If the change to the mean Jacobian approximation is insignificant we stop the calculation
-            if j > MIN_JACOBIANS_ITER:
-                new_mean = torch.mean(torch.stack([jac_trace_approx, *trace_jv]))
-                delta = new_mean - torch.mean(torch.stack(trace_jv))
-                if torch.abs(delta) / (torch.abs(new_mean) + 1e-6) < JACOBIANS_COMP_TOLERANCE:
-                    trace_jv.append(jac_trace_approx)
-                    break
-
-            trace_jv.append(jac_trace_approx)
-        ipts_jac_trace_approx.append(2*torch.mean(torch.stack(trace_jv))/output.shape[-1])  # Get averaged jacobian trace approximation
-
-    ipts_jac_trace_approx = torch_tensor_to_numpy(torch.Tensor(ipts_jac_trace_approx))  # Just to get one tensor instead of list of tensors with single element
-
-    if norm_weights:
-        return _normalize_weights(ipts_jac_trace_approx, all_outputs_indices, alpha)
-    else:
-        return ipts_jac_trace_approx
-
-
-def _normalize_weights(jacobians_traces: np.ndarray,
-                       all_outputs_indices: List[int],
-                       alpha: float) -> List[float]:
-    """
-    Output layers or layers that come after the model's considered output layers,
-    are assigned with a constant normalized value, according to the given alpha variable and the number of such layers.
-    Other layers returned weights are normalized by dividing the jacobian-based weights value by the sum of all other values.
-
-    Args:
-        jacobians_traces: The approximated average jacobian-based weights of each interest point.
-        all_outputs_indices: A list of indices of all nodes that consider outputs.
-        alpha: A multiplication factor.
-
-    Returns: Normalized list of jacobian-based weights (for each interest point).
-
-    """
-
-    jacobians_without_outputs = [jacobians_traces[i] for i in range(len(jacobians_traces))
-                                 if i not in all_outputs_indices]
-    sum_without_outputs = sum(jacobians_without_outputs)
-
-    normalized_grads_weights = [_get_normalized_weight(grad, i, sum_without_outputs, all_outputs_indices, alpha)
-                                for i, grad in enumerate(jacobians_traces)]
-
-    return normalized_grads_weights
+                # we still want to set some weight for it, so its jacobian trace approximation is zero.
+                continue
+            if num_rows > 1 and jac_v.shape[0] != num_rows:
+                return None
+            jac_v = torch.reshape(jac_v, [num_rows, -1])
+            jac_trace_approx[:, i] = torch_tensor_to_numpy(torch.sum(torch.pow(jac_v, 2.0), dim=1))
 
+        jac_trace_accumulator.update(jac_trace_approx.reshape((n_probes, num_images, -1)))
 
-def _get_normalized_weight(grad: torch.Tensor,
-                           i: int,
-                           sum_without_outputs: float,
-                           all_outputs_indices: List[int],
-                           alpha: float) -> float:
-    """
-    Normalizes the node's gradient value. If it is an output or output replacement node than the normalized value is
-    a constant, otherwise, it is normalized by dividing with the sum of all gradient values.
-
-    Args:
-        grad: The gradient value tensor.
-        i: The index of the node in the sorted interest points list.
-        sum_without_outputs: The sum of all gradients of nodes that are not considered outputs.
-        all_outputs_indices: A list of indices of all nodes that consider outputs.
-        alpha: A multiplication factor.
-
-    Returns: A normalized jacobian-based weights.
-
-    """
-
-    if i in all_outputs_indices:
-        return alpha / len(all_outputs_indices)
-    else:
-        return ((1 - alpha) * grad / (sum_without_outputs + EPS)).item()
+    return 2 * jac_trace_accumulator.get_means() / output.shape[-1]  # Get averaged jacobian trace approximation
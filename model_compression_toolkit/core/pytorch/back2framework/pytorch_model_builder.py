@@ -14,10 +14,9 @@
 # ==============================================================================
 from abc import abstractmethod
 from functools import partial
-from typing import Tuple, Any, Dict, List, Union, Callable
+from typing import Tuple, Any, Dict, List, Union, Callable, NamedTuple
 
 import torch
-from networkx import topological_sort
 
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core import common
@@ -31,39 +30,10 @@ from model_compression_toolkit.core.pytorch.default_framework_info import DEFAUL
 from model_compression_toolkit.core.pytorch.reader.node_holders import DummyPlaceHolder, BufferHolder
 from model_compression_toolkit.core.pytorch.utils import get_working_device
 from model_compression_toolkit.core.pytorch.constants import BUFFER
+from model_compression_toolkit.logger import Logger
 from mct_quantizers.common.constants import ACTIVATION_HOLDER_QUANTIZER
 
 
-def _build_input_tensors_list(node: BaseNode,
-                              graph: Graph,
-                              inputs: Tuple[Any],
-                              node_to_output_tensors_dict: Dict[BaseNode, List]) -> List[List]:
-    """
-    Given a node, build a list of input tensors the node gets. The list is built
-    based on the node's incoming edges and previous nodes' output tensors.
-
-    Args:
-        node: Node to build its input tensors list.
-        graph: Graph the node is in.
-        inputs: list of input tensors to model
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
-
-    Returns:
-        A list of the node's input tensors.
-    """
-    if node.type == DummyPlaceHolder:
-        input_tensors = [inputs[graph.get_inputs().index(node)]]
-    else:
-        input_tensors = []
-        # Go over a sorted list of the node's incoming edges, and for each source node get its output tensors.
-        # Append them in a result list.
-        for ie in graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX):
-            _input_tensors = node_to_output_tensors_dict[ie.source_node]
-            input_tensors.append(_input_tensors)
-        input_tensors = [tensor for tensor_list in input_tensors for tensor in tensor_list]  # flat list of lists
-    return input_tensors
-
-
 def _run_operation(n: BaseNode,
                    input_tensors: List,
                    op_func: Any,
@@ -102,39 +72,94 @@ def _run_operation(n: BaseNode,
     return out_tensors_of_n, out_tensors_of_n_float
 
 
-def _find_by_node_name(node_to_output_tensors_dict: dict, node_name: str):
+class _ExecutionStep(NamedTuple):
     """
-    Args:
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
-        node_name: Node name
-    Returns:
-        Out tensors if found node with name equal to node_name, None if no exist
+    A single step of a compiled PytorchModel execution plan (running a single node of the graph).
+    Tensors are passed between steps using integer slots (the topological index of the node that
+    produced them).
+    """
+    node: BaseNode
+    op_func: Any
+    model_input_index: Union[int, None]  # Index of the model's input for input nodes (None otherwise).
+    input_slots: Tuple[int, ...]  # Slots of the node's inputs, ordered by the edges' sink index.
+    activation_quantization_fn: Union[Callable, None]
+    use_activation_quantization: bool
+    slots_to_release: Tuple[int, ...]  # Slots that are not used by any later step.
+
+
+class _ExecutionPlan(NamedTuple):
+    """
+    A compiled execution plan of a PytorchModel.
     """
-    for node in node_to_output_tensors_dict.keys():
-        if node.name == node_name:
-            return node_to_output_tensors_dict.get(node)
-    return None
+    steps: List[_ExecutionStep]
+    output_slots: List[int]
+    graph_version: int
 
 
-def _generate_outputs(
-        out_nodes: List[BaseNode],
-        node_to_output_tensors_dict: dict):
+class _ExecutionCache(NamedTuple):
     """
+    The tensors of a PytorchModel forward pass that are required to resume the forward pass from the steps
+    of specific nodes (see PytorchModel.forward_with_cache).
+    """
+    plan: _ExecutionPlan
+    nodes_steps: Dict[str, int]  # Step of each node the forward pass can be resumed from, by the node's name.
+    slots: List[Any]
+    float_slots: List[Any]
+
+
+def _compile_execution_plan(model: 'PytorchModel') -> _ExecutionPlan:
+    """
+    Compile the model's graph into a flat list of execution steps. The steps hold the
+    pre-resolved operations and activation quantization functions, the integer slots of their
+    inputs, and the slots that can be released after running the step (intermediate tensors that
+    are not used anymore), so the forward pass does not need to look-up the graph.
+
     Args:
-        out_nodes: List of output nodes.
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
+        model: PytorchModel to compile its execution plan.
 
     Returns:
-        List of output tensor/s for the model
+        The model's execution plan.
     """
-    output = []
-    for n in out_nodes:
-        out_tensors_of_n = _find_by_node_name(node_to_output_tensors_dict, n.name)
-        if len(out_tensors_of_n) > 1:
-            output.append(out_tensors_of_n)
-        else:
-            output += out_tensors_of_n
-    return output
+    graph = model.graph
+    graph_version = graph.cache_version
+    node_to_slot = {node: slot for slot, node in enumerate(model.node_sort)}
+
+    # Output nodes are looked up by their names (the first node in the topological order with a matching name).
+    name_to_slot = {}
+    for slot, node in enumerate(model.node_sort):
+        name_to_slot.setdefault(node.name, slot)
+    out_nodes = model.append2output if model.append2output else [ot.node for ot in graph.get_outputs()]
+    output_slots = [name_to_slot[n.name] for n in out_nodes]
+
+    configurable_nodes = graph.get_configurable_sorted_nodes_names()
+    graph_inputs = graph.get_inputs()
+    nodes_inputs_slots = []
+    last_use = {}
+    for slot, node in enumerate(model.node_sort):
+        input_slots = tuple(node_to_slot[ie.source_node] for ie in graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX))
+        nodes_inputs_slots.append(input_slots)
+        last_use[slot] = slot
+        for input_slot in input_slots:
+            last_use[input_slot] = slot
+
+    slots_to_release = [[] for _ in model.node_sort]
+    kept_slots = set(output_slots)
+    for slot, last_use_slot in last_use.items():
+        if slot not in kept_slots:
+            slots_to_release[last_use_slot].append(slot)
+
+    steps = []
+    for slot, node in enumerate(model.node_sort):
+        use_activation_quantization, activation_quantization_fn = model._get_activation_quantization_fn(node)
+        steps.append(_ExecutionStep(node=node,
+                                    op_func=model._get_op_func(node, configurable_nodes),
+                                    model_input_index=graph_inputs.index(node) if node.type == DummyPlaceHolder else None,
+                                    input_slots=nodes_inputs_slots[slot],
+                                    activation_quantization_fn=activation_quantization_fn,
+                                    use_activation_quantization=use_activation_quantization,
+                                    slots_to_release=tuple(slots_to_release[slot])))
+
+    return _ExecutionPlan(steps=steps, output_slots=output_slots, graph_version=graph_version)
 
 
 class PytorchModel(torch.nn.Module):
@@ -161,7 +186,7 @@ class PytorchModel(torch.nn.Module):
         """
         super(PytorchModel, self).__init__()
         self.graph = graph
-        self.node_sort = list(topological_sort(graph))
+        self.node_sort = graph.get_topo_sorted_nodes()
         self.node_to_activation_quantization_holder = {}
         self.append2output = append2output
         self.return_float_outputs = return_float_outputs
@@ -169,6 +194,36 @@ class PytorchModel(torch.nn.Module):
         self.get_activation_quantizer_holder = get_activation_quantizer_holder_fn
         self._add_modules()
 
+        # The execution plan is compiled lazily in the first forward pass, and recompiled if the graph
+        # or one of the model's operations (or activation quantization holders) is replaced.
+        self._execution_plan = None
+        self._execution_plan_attributes = {n.name for n in self.node_sort}.union(
+            self.node_to_activation_quantization_holder.values())
+
+    def __setattr__(self, name: str, value: Any):
+        """
+        Set an attribute of the model. If the attribute is an operation of a node (or an activation
+        quantization holder), the execution plan of the model is invalidated.
+
+        Args:
+            name: Attribute name.
+            value: Attribute value.
+
+        """
+        super().__setattr__(name, value)
+        plan_attributes = self.__dict__.get('_execution_plan_attributes')
+        if plan_attributes is not None and name in plan_attributes:
+            self.__dict__['_execution_plan'] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns: The model's state without the compiled execution plan (which holds references to the
+        model's operations, and is recompiled when needed).
+        """
+        state = super().__getstate__().copy()
+        state['_execution_plan'] = None
+        return state
+
     # todo: Move to parent class BaseModelBuilder
     @property
     def use_activation_holder_during_model_building(self) -> bool:
@@ -251,17 +306,99 @@ class PytorchModel(torch.nn.Module):
         Returns:
             torch Tensor/s which is/are the output of the model logic.
         """
-        node_to_output_tensors_dict = dict()
-        node_to_output_tensors_dict_float = dict()
-        configurable_nodes = self.graph.get_configurable_sorted_nodes_names()
-        for node in self.node_sort:
-            input_tensors = _build_input_tensors_list(node,
-                                                      self.graph,
-                                                      args,
-                                                      node_to_output_tensors_dict)
+        plan = self._get_execution_plan()
+        slots = [None] * len(plan.steps)
+        float_slots = [None] * len(plan.steps)
+        self._run_steps(plan, args, slots, float_slots)
+        return self._get_outputs(plan, slots, float_slots)
+
+    def forward_with_cache(self,
+                           nodes_names: List[str],
+                           *args: Any) -> Tuple[Any, _ExecutionCache]:
+        """
+        Runs a forward pass and keeps the tensors that are required to resume the forward pass from the
+        steps of the given nodes (the tensors that are computed before a node's step and are used by the node's
+        step or by later steps), so a forward pass where only these nodes or the nodes after them are modified can
+        re-execute the modified part of the model only (see forward_from_cache).
+
+        Args:
+            nodes_names: Names of the nodes to resume the forward pass from.
+            args: argument input tensors to model.
+
+        Returns:
+            The output of the model, and the cache of the tensors to resume the forward pass by.
+        """
+        plan = self._get_execution_plan()
+        nodes_names = set(nodes_names)
+        nodes_steps = {}
+        for step, execution_step in enumerate(plan.steps):
+            if execution_step.node.name in nodes_names:
+                nodes_steps.setdefault(execution_step.node.name, step)
+
+        release_steps = {slot: step for step, execution_step in enumerate(plan.steps)
+                         for slot in execution_step.slots_to_release}
+        kept_slots = frozenset([slot for slot, release_step in release_steps.items()
+                                if any([slot < node_step <= release_step for node_step in nodes_steps.values()])])
+
+        slots = [None] * len(plan.steps)
+        float_slots = [None] * len(plan.steps)
+        self._run_steps(plan, args, slots, float_slots, kept_slots=kept_slots)
+        return self._get_outputs(plan, slots, float_slots), _ExecutionCache(plan=plan,
+                                                                             nodes_steps=nodes_steps,
+                                                                             slots=slots,
+                                                                             float_slots=float_slots)
+
+    def forward_from_cache(self,
+                           cache: _ExecutionCache,
+                           nodes_names: List[str]) -> Any:
+        """
+        Resumes a forward pass that was cached by forward_with_cache from the first step of the given nodes.
+        The result is the same as a full forward pass, as long as only the given nodes (or the nodes after
+        them) are modified since the cache was created.
+
+        Args:
+            cache: Cache of a forward pass of the model.
+            nodes_names: Names of the modified nodes to resume the forward pass from.
+
+        Returns:
+            The output of the model.
+        """
+        if cache.plan is not self._get_execution_plan():
+            Logger.critical(f'The execution plan of the model was modified since the forward pass '
+                            f'was cached.')  # pragma: no cover
+        slots = list(cache.slots)
+        float_slots = list(cache.float_slots)
+        start_step = min([cache.nodes_steps[node_name] for node_name in nodes_names])
+        self._run_steps(cache.plan, None, slots, float_slots, start_step=start_step)
+        return self._get_outputs(cache.plan, slots, float_slots)
+
+    def _run_steps(self,
+                   plan: _ExecutionPlan,
+                   args: Any,
+                   slots: List[Any],
+                   float_slots: List[Any],
+                   start_step: int = 0,
+                   kept_slots: frozenset = frozenset()):
+        """
+        Runs the steps of an execution plan, and stores their outputs in the given slots lists.
+
+        Args:
+            plan: Execution plan to run.
+            args: argument input tensors to model.
+            slots: Outputs of the steps (filled with the outputs of the steps before start_step).
+            float_slots: Float outputs of the steps (filled with the outputs of the steps before start_step).
+            start_step: Index of the first step to run.
+            kept_slots: Slots that are not released even if they are not used by any later step.
 
-            op_func = self._get_op_func(node, configurable_nodes)
-            use_activation_quantization, activation_quantization_fn = self._get_activation_quantization_fn(node)
+        """
+        steps = plan.steps
+        for slot in range(start_step, len(steps)):
+            (node, op_func, model_input_index, input_slots, activation_quantization_fn,
+             use_activation_quantization, slots_to_release) = steps[slot]
+            if model_input_index is None:
+                input_tensors = [tensor for input_slot in input_slots for tensor in slots[input_slot]]
+            else:
+                input_tensors = [args[model_input_index]]
 
             # Run node operation and fetch outputs
             out_tensors_of_n, out_tensors_of_n_float = _run_operation(node,
@@ -271,22 +408,53 @@ class PytorchModel(torch.nn.Module):
                                                                       use_activation_quantization=use_activation_quantization)
 
             if isinstance(out_tensors_of_n, list):
-                node_to_output_tensors_dict.update({node: out_tensors_of_n})
-                node_to_output_tensors_dict_float.update({node: out_tensors_of_n_float})
+                slots[slot] = out_tensors_of_n
+                float_slots[slot] = out_tensors_of_n_float
             else:
-                node_to_output_tensors_dict.update({node: [out_tensors_of_n]})
-                node_to_output_tensors_dict_float.update({node: [out_tensors_of_n_float]})
+                slots[slot] = [out_tensors_of_n]
+                float_slots[slot] = [out_tensors_of_n_float]
+
+            for released_slot in slots_to_release:
+                if released_slot not in kept_slots:
+                    slots[released_slot] = None
+                    float_slots[released_slot] = None
+
+    def _get_outputs(self,
+                     plan: _ExecutionPlan,
+                     slots: List[Any],
+                     float_slots: List[Any]) -> Any:
+        """
+        Args:
+            plan: Execution plan that computed the slots.
+            slots: Outputs of the plan's steps.
+            float_slots: Float outputs of the plan's steps.
 
-        if self.append2output:
-            outputs = _generate_outputs(self.append2output,
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-        else:
-            outputs = _generate_outputs([ot.node for ot in self.graph.get_outputs()],
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-            if len(outputs) == 1:
-                outputs = outputs[0]
+        Returns:
+            The output of the model.
+        """
+        outputs_slots = float_slots if self.return_float_outputs else slots
+        outputs = []
+        for slot in plan.output_slots:
+            out_tensors_of_n = outputs_slots[slot]
+            if len(out_tensors_of_n) > 1:
+                outputs.append(out_tensors_of_n)
+            else:
+                outputs += out_tensors_of_n
+        if not self.append2output and len(outputs) == 1:
+            outputs = outputs[0]
         return outputs
 
+    def _get_execution_plan(self) -> _ExecutionPlan:
+        """
+        Returns: The model's compiled execution plan. The plan is (re)compiled if it was not compiled
+        yet, or if the graph was modified since it was compiled.
+        """
+        plan = self._execution_plan
+        if plan is None or plan.graph_version != self.graph.cache_version:
+            plan = _compile_execution_plan(self)
+            self.__dict__['_execution_plan'] = plan
+        return plan
+
     def _get_op_func(self,
                      node: BaseNode,
                      configurable_nodes_names: List[str]) -> Any:
@@ -91,7 +91,7 @@ class QuantizedLayerWrapper(torch.nn.Module):
         else:
             framework_attr = copy.copy(n.framework_attr)
             self.layer = n.type(**framework_attr)
-            self.layer.load_state_dict({k: torch.Tensor(v) for k, v in n.weights.items()}, strict=False)
+            self.layer.load_state_dict({k: torch.Tensor(v) for k, v in n.get_weights_dict().items()}, strict=False)
 
     def _quantize_weights(self, n:BaseNode):
         """
@@ -16,7 +16,9 @@ from typing import Dict, Any, List
 
 from model_compression_toolkit.core.common.mixed_precision.configurable_quant_id import ConfigurableQuantizerIdentifier
 from model_compression_toolkit.core.common.mixed_precision.configurable_quantizer_utils import \
-    verify_candidates_descending_order, init_quantized_weights
+    verify_candidates_descending_order, init_quantized_weights, quantize_candidate_weights, \
+    get_candidate_weights_channels_axis
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
 from model_compression_toolkit.logger import Logger
@@ -47,12 +49,17 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
     quantized version of the float weight, it returns only one quantized weight according to an "active"
     index - the index of a candidate weight quantization configuration from a list of candidates that was passed
     to the quantizer when it was initialized.
+
+    If a candidate weights cache is given, the quantizer does not keep the quantized weights of all the candidates.
+    Instead, the weights of a candidate are quantized on demand when it becomes the active candidate, and kept in
+    the cache (which is shared by the configurable quantizers of the model) within the cache's budget.
     """
 
     def __init__(self,
                  node_q_cfg: List[CandidateNodeQuantizationConfig],
                  float_weights: torch.Tensor,
-                 max_candidate_idx: int = 0):
+                 max_candidate_idx: int = 0,
+                 weights_cache: CandidateWeightsCache = None):
         """
         Initializes a configurable quantizer.
 
@@ -61,6 +68,8 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
                 use this quantizer.
             float_weights: Float weights of the layer.
             max_candidate_idx: Index of the node's candidate that has the maximal bitwidth (must exist absolute max).
+            weights_cache: Cache of candidates quantized weights to quantize the weights on demand with. If None,
+                the weights are quantized for all the candidates when the quantizer is initialized.
         """
 
         super(ConfigurableWeightsQuantizer, self).__init__()
@@ -68,6 +77,7 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
         self.node_q_cfg = node_q_cfg
         self.float_weights = float_weights
         self.max_candidate_idx = max_candidate_idx
+        self.weights_cache = weights_cache
 
         verify_candidates_descending_order(self.node_q_cfg)
 
@@ -76,10 +86,15 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
                    self.node_q_cfg[0].weights_quantization_cfg.enable_weights_quantization:
                 Logger.error("Candidates with different weights enabled properties is currently not supported.")  # pragma: no cover
 
-        # Initialize quantized weights for each weight that should be quantized.
-        self.quantized_weights = init_quantized_weights(node_q_cfg=self.node_q_cfg,
-                                                        float_weights=self.float_weights,
-                                                        fw_tensor_convert_func=to_torch_tensor)
+        if self.weights_cache is None:
+            # Initialize quantized weights for each weight that should be quantized.
+            self.quantized_weights = init_quantized_weights(node_q_cfg=self.node_q_cfg,
+                                                            float_weights=self.float_weights,
+                                                            fw_tensor_convert_func=to_torch_tensor)
+        else:
+            self.quantized_weights = None
+            self.weights_cache_owner_id = self.weights_cache.new_owner_id()
+            self.active_quantized_weights = self._get_candidate_quantized_weights(self.max_candidate_idx)
 
         self.active_quantization_config_index = self.max_candidate_idx
 
@@ -97,7 +112,29 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
         assert index < len(self.node_q_cfg), \
             f'Quantizer has {len(self.node_q_cfg)} ' \
             f'possible nbits. Can not set index {index}'
+        if index == self.active_quantization_config_index:
+            # The candidate is already active (so its weights are not looked up in the weights cache again).
+            return
         self.active_quantization_config_index = index
+        if self.weights_cache is not None:
+            self.active_quantized_weights = self._get_candidate_quantized_weights(index)
+
+    def _get_candidate_quantized_weights(self, index: int) -> torch.Tensor:
+        """
+        Gets the quantized weights of a candidate from the weights cache (quantizes them if they are not cached).
+
+        Args:
+            index: Quantization configuration candidate index.
+
+        Returns:
+            The quantized weights of the candidate.
+        """
+
+        qc = self.node_q_cfg[index]
+        return to_torch_tensor(self.weights_cache.get(self.weights_cache_owner_id,
+                                                      index,
+                                                      lambda: quantize_candidate_weights(qc, self.float_weights),
+                                                      channels_axis=get_candidate_weights_channels_axis(qc)))
 
     def __call__(self,
                  inputs: nn.Parameter) -> torch.Tensor:
@@ -116,4 +153,6 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
                 index that is in active_quantization_config_index the quantizer holds).
         """
 
+        if self.weights_cache is not None:
+            return self.active_quantized_weights
         return self.quantized_weights[self.active_quantization_config_index]
@@ -38,7 +38,9 @@ from model_compression_toolkit.core.common.model_builder_mode import ModelBuilde
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_kl_divergence, compute_cs
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
 from model_compression_toolkit.core.pytorch.back2framework import get_pytorch_model_builder
+from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PytorchModel
 from model_compression_toolkit.core.pytorch.back2framework.model_gradients import \
     pytorch_iterative_approx_jacobian_trace
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
@@ -78,6 +80,7 @@ from model_compression_toolkit.core.pytorch.mixed_precision.configurable_activat
 from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
     ConfigurableWeightsQuantizer
 from model_compression_toolkit.core.pytorch.pytorch_node_prior_info import create_node_prior_info
+from model_compression_toolkit.core.pytorch.pytorch_integer_op_mapping import get_pytorch_integer_op
 from model_compression_toolkit.core.pytorch.reader.reader import model_reader
 from model_compression_toolkit.core.pytorch.statistics_correction.apply_second_moment_correction import \
     pytorch_apply_second_moment_correction
@@ -140,7 +143,8 @@ class PytorchImplementation(FrameworkImplementation):
                       mode: ModelBuilderMode,
                       append2output: List[Any] = None,
                       fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                      return_float_outputs: bool = False) -> Tuple:
+                      return_float_outputs: bool = False,
+                      weights_cache: CandidateWeightsCache = None) -> Tuple:
         """
         Build a Pytorch module from a graph.
         The mode determines how the module should be build. append2output is a list of Nodes
@@ -152,15 +156,20 @@ class PytorchImplementation(FrameworkImplementation):
             append2output: List of Nodes to set as the module's outputs.
             fw_info: FrameworkInfo object with information about the specific framework's module
             return_float_outputs (bool): whether to return outputs before or after quantization nodes (default)
+            weights_cache: Cache of candidates quantized weights for the configurable weights quantizers of a
+                mixed-precision module (used only in mixed-precision mode).
 
         Returns:
             A tuple with the model and additional relevant supporting objects.
         """
+        # Only the mixed-precision model builder uses a candidate weights cache.
+        builder_kwargs = {'weights_cache': weights_cache} if mode == ModelBuilderMode.MIXEDPRECISION else {}
         pytorch_model_builder = get_pytorch_model_builder(mode)
         return pytorch_model_builder(graph=graph,
                                      append2output=append2output,
                                      fw_info=fw_info,
-                                     return_float_outputs=return_float_outputs).build_model()
+                                     return_float_outputs=return_float_outputs,
+                                     **builder_kwargs).build_model()
 
     def run_model_inference(self,
                             model: Any,
@@ -198,17 +207,19 @@ class PytorchImplementation(FrameworkImplementation):
 
     def attach_sc_to_node(self,
                           node: BaseNode,
-                          fw_info: FrameworkInfo) -> BaseStatsCollector:
+                          fw_info: FrameworkInfo,
+                          streaming_histogram: bool = False) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel)
+            streaming_histogram: Whether the collector should keep a single running histogram (bounded memory).
         Returns:
             Statistics collector for the node.
         """
-        return create_stats_collector_for_node(node, fw_info)
+        return create_stats_collector_for_node(node, fw_info, streaming_histogram)
 
     def get_substitutions_channel_equalization(self,
                                                quant_config: QuantizationConfig,
@@ -428,7 +439,8 @@ class PytorchImplementation(FrameworkImplementation):
                    all_outputs_indices: List[int],
                    alpha: float = 0.3,
                    n_iter: int = 50,
-                   norm_weights: bool = True) -> List[float]:
+                   norm_weights: bool = True,
+                   n_probes: int = 1) -> np.ndarray:
         """
         Calls a PyTorch specific model gradient calculation function, which computes the  jacobian-based weights of the model's
         outputs with respect to the feature maps of the set of given interest points.
@@ -445,13 +457,15 @@ class PytorchImplementation(FrameworkImplementation):
                 compatible weight for the distance metric computation).
             n_iter: The number of random iterations to calculate the approximated  jacobian-based weights for each interest point.
             norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+            n_probes: Number of random vectors to draw in each backward pass.
 
-        Returns: A list of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
-        point's output has on the model's output.
+        Returns: An array of (possibly normalized) jacobian-based weights to be considered as the relevancy that each interest
+        point's output has on the model's output, averaged over the images in the input batch.
         """
 
         return pytorch_iterative_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
-                                                       all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
+                                                       all_outputs_indices, alpha, n_iter, norm_weights=norm_weights,
+                                                       n_probes=n_probes)
 
     def is_node_compatible_for_metric_outputs(self,
                                               node: BaseNode) -> bool:
@@ -532,4 +546,62 @@ class PytorchImplementation(FrameworkImplementation):
             The output of the model inference on the given input.
         """
 
-        return model(*inputs)
\ No newline at end of file
+        return model(*inputs)
+
+    def sensitivity_eval_inference_with_cache(self,
+                                              model: Module,
+                                              inputs: Any,
+                                              nodes_names: List[str]) -> Tuple[Any, Any]:
+        """
+        Calls for a Pytorch model inference during mixed precision sensitivity evaluation, and caches the
+        intermediate tensors that are required to resume the inference from each of the given nodes
+        (see PytorchModel.forward_with_cache). Models that are not built by MCT's model builder return no cache.
+
+        Args:
+            model: A Pytorch model to run inference for.
+            inputs: Input tensors to run inference on.
+            nodes_names: Names of the nodes to resume the inference from.
+
+        Returns:
+            The output of the model inference on the given input, and the cache to resume the inference by.
+        """
+        if not isinstance(model, PytorchModel):
+            return self.sensitivity_eval_inference(model, inputs), None  # pragma: no cover
+        # The cached tensors are kept without their autograd graph.
+        with torch.no_grad():
+            return model.forward_with_cache(nodes_names, *inputs)
+
+    def sensitivity_eval_inference_from_cache(self,
+                                              model: Module,
+                                              cache: Any,
+                                              nodes_names: List[str]) -> Any:
+        """
+        Resumes a Pytorch model inference that was cached by sensitivity_eval_inference_with_cache from the first
+        of the given modified nodes.
+
+        Args:
+            model: A Pytorch model to run inference for.
+            cache: Cache of an inference of the model.
+            nodes_names: Names of the modified nodes to resume the inference from.
+
+        Returns:
+            The output of the model inference.
+        """
+        with torch.no_grad():
+            return model.forward_from_cache(cache, nodes_names)
+
+    def get_integer_op(self,
+                       node: BaseNode,
+                       fw_info: FrameworkInfo) -> Callable:
+        """
+        Get the operation that runs a node that represents a Pytorch layer with integer arithmetic in the integer graph
+        executor.
+
+        Args:
+            node: Node to get its integer operation.
+            fw_info: Framework specific information about the node (such as its kernel attributes).
+
+        Returns:
+            An IntegerOp that runs the node.
+        """
+        return get_pytorch_integer_op(node, fw_info, self)
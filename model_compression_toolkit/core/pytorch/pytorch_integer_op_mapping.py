@@ -0,0 +1,192 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import operator
+from functools import partial
+
+import numpy as np
+import torch
+from torch import nn
+import torch.nn.functional as F
+
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.integer_executor.integer_ops import IntegerOp, IntegerConv2D, \
+    IntegerDense, IntegerAdd, IntegerConcat, IntegerMaxPool2D, IntegerAvgPool2D, IntegerGlobalAvgPool, \
+    IntegerClipActivation, IntegerLUTActivation, IntegerReshape, IntegerZeroPadding2D, sigmoid, swish, hard_sigmoid, \
+    hard_swish, gelu, elu, leaky_relu, softplus
+from model_compression_toolkit.core.common.integer_executor.integer_tensor import get_node_integer_kernel
+from model_compression_toolkit.core.pytorch.constants import BIAS, STRIDES, PADDING, DILATIONS, GROUPS, \
+    KERNEL_SIZE, HARDTANH_MIN_VAL, HARDTANH_MAX_VAL, DIM
+from model_compression_toolkit.logger import Logger
+
+# Activations that clip their input, and their bounds.
+CLIP_ACTIVATIONS = {nn.ReLU: (0, None),
+                    torch.relu: (0, None),
+                    F.relu: (0, None),
+                    nn.ReLU6: (0, 6),
+                    F.relu6: (0, 6),
+                    nn.Identity: (None, None),
+                    nn.Dropout: (None, None),
+                    F.dropout: (None, None)}
+
+# Non-linear activations that are computed with a lookup table.
+LUT_ACTIVATIONS = {nn.Sigmoid: sigmoid,
+                   torch.sigmoid: sigmoid,
+                   F.sigmoid: sigmoid,
+                   nn.Tanh: np.tanh,
+                   torch.tanh: np.tanh,
+                   F.tanh: np.tanh,
+                   nn.SiLU: swish,
+                   F.silu: swish,
+                   nn.Hardswish: hard_swish,
+                   F.hardswish: hard_swish,
+                   nn.Hardsigmoid: hard_sigmoid,
+                   F.hardsigmoid: hard_sigmoid,
+                   nn.GELU: gelu,
+                   F.gelu: gelu,
+                   nn.Softplus: softplus,
+                   F.softplus: softplus}
+
+FLATTEN_OPS = [nn.Flatten, torch.flatten, torch.reshape, torch.Tensor.view, torch.Tensor.reshape,
+               torch.Tensor.flatten]
+
+
+def _get_call_arg(node: BaseNode, index: int, name: str, default=None):
+    """
+    Get an argument of a functional node's call (by its position after the input tensors, or by its name).
+    """
+    if len(node.op_call_args) > index:
+        return node.op_call_args[index]
+    return node.op_call_kwargs.get(name, default)
+
+
+def _to_explicit_padding(padding):
+    if isinstance(padding, str):
+        return padding
+    ph, pw = (padding, padding) if isinstance(padding, int) else padding
+    return (ph, ph), (pw, pw)
+
+
+def _get_conv_op(node: BaseNode,
+                 fw_info: FrameworkInfo,
+                 fw_impl: FrameworkImplementation) -> IntegerOp:
+    if node.framework_attr.get('padding_mode', 'zeros') != 'zeros':
+        Logger.critical(f'The integer executor supports only zero padding, but node {node.name} has padding mode '
+                        f'{node.framework_attr.get("padding_mode")}.')
+    kernel, scale = get_node_integer_kernel(node, fw_info, fw_impl)
+    # [C_out, C_in / groups, kernel height, kernel width] -> [kernel height, kernel width, C_in / groups, C_out]
+    kernel, scale = kernel.transpose(2, 3, 1, 0), scale.transpose(2, 3, 1, 0)
+    return IntegerConv2D(kernel,
+                         scale[0, 0, 0, :],
+                         node.final_weights_quantization_cfg.weights_n_bits,
+                         bias=node.get_weights_by_keys(BIAS),
+                         strides=node.framework_attr.get(STRIDES, 1),
+                         padding=_to_explicit_padding(node.framework_attr.get(PADDING, 0)),
+                         dilations=node.framework_attr.get(DILATIONS, 1),
+                         groups=node.framework_attr.get(GROUPS, 1),
+                         channels_first=True)
+
+
+def _get_linear_op(node: BaseNode,
+                   fw_info: FrameworkInfo,
+                   fw_impl: FrameworkImplementation) -> IntegerOp:
+    kernel, scale = get_node_integer_kernel(node, fw_info, fw_impl)
+    # [C_out, C_in] -> [C_in, C_out]
+    return IntegerDense(kernel.T,
+                        scale.T[0, :],
+                        node.final_weights_quantization_cfg.weights_n_bits,
+                        bias=node.get_weights_by_keys(BIAS))
+
+
+def _get_pool_op(node: BaseNode, op_class: type) -> IntegerOp:
+    attr = node.framework_attr
+    if attr.get('ceil_mode', False) or attr.get('dilation', 1) not in [1, (1, 1)] or \
+            attr.get('divisor_override') is not None:
+        Logger.critical(f'The integer executor does not support ceil mode, dilation or a divisor override in pooling '
+                        f'node {node.name}.')
+    kernel_size = attr.get(KERNEL_SIZE)
+    stride = attr.get(STRIDES)
+    kwargs = {'count_include_pad': attr.get('count_include_pad', True)} if op_class == IntegerAvgPool2D else {}
+    return op_class(kernel_size,
+                    kernel_size if stride is None else stride,
+                    padding=_to_explicit_padding(attr.get(PADDING, 0)),
+                    channels_first=True,
+                    **kwargs)
+
+
+def get_pytorch_integer_op(node: BaseNode,
+                           fw_info: FrameworkInfo,
+                           fw_impl: FrameworkImplementation) -> IntegerOp:
+    """
+    Get the integer operation that runs a node of a Pytorch model in the integer graph executor.
+
+    Args:
+        node: Node to get its integer operation.
+        fw_info: Framework information of Pytorch.
+        fw_impl: Pytorch implementation.
+
+    Returns:
+        An IntegerOp that runs the node.
+    """
+    node_type = node.type
+    if node_type == nn.Conv2d:
+        return _get_conv_op(node, fw_info, fw_impl)
+    if node_type == nn.Linear:
+        return _get_linear_op(node, fw_info, fw_impl)
+    if node_type in CLIP_ACTIVATIONS:
+        return IntegerClipActivation(*CLIP_ACTIVATIONS[node_type])
+    if node_type == nn.Hardtanh:
+        return IntegerClipActivation(node.framework_attr.get(HARDTANH_MIN_VAL, -1.0),
+                                     node.framework_attr.get(HARDTANH_MAX_VAL, 1.0))
+    if node_type == F.hardtanh:
+        return IntegerClipActivation(_get_call_arg(node, 0, HARDTANH_MIN_VAL, -1.0),
+                                     _get_call_arg(node, 1, HARDTANH_MAX_VAL, 1.0))
+    if node_type in LUT_ACTIVATIONS:
+        return IntegerLUTActivation(LUT_ACTIVATIONS[node_type])
+    if node_type in [nn.LeakyReLU, F.leaky_relu]:
+        alpha = node.framework_attr.get('negative_slope', 0.01) if node_type == nn.LeakyReLU else \
+            _get_call_arg(node, 0, 'negative_slope', 0.01)
+        return IntegerLUTActivation(partial(leaky_relu, alpha=alpha))
+    if node_type in [nn.ELU, F.elu]:
+        alpha = node.framework_attr.get('alpha', 1.0) if node_type == nn.ELU else _get_call_arg(node, 0, 'alpha', 1.0)
+        return IntegerLUTActivation(partial(elu, alpha=alpha))
+    if node_type in [operator.add, torch.add, operator.sub, torch.sub] and len(node.input_shape) == 2 and \
+            not node.op_call_args and not node.op_call_kwargs:
+        return IntegerAdd(subtract=node_type in [operator.sub, torch.sub])
+    if node_type in [torch.cat, torch.concat]:
+        return IntegerConcat(_get_call_arg(node, 0, DIM, 0))
+    if node_type == nn.MaxPool2d:
+        return _get_pool_op(node, IntegerMaxPool2D)
+    if node_type == nn.AvgPool2d:
+        return _get_pool_op(node, IntegerAvgPool2D)
+    if (node_type == nn.AdaptiveAvgPool2d and node.framework_attr.get('output_size') in [1, (1, 1), [1, 1]]) or \
+            (node_type == F.adaptive_avg_pool2d and _get_call_arg(node, 0, 'output_size') in [1, (1, 1), [1, 1]]):
+        return IntegerGlobalAvgPool((2, 3), keepdims=True)
+    if node_type in [torch.mean, torch.Tensor.mean] and \
+            sorted([d % 4 for d in np.atleast_1d(_get_call_arg(node, 0, DIM, []))]) == [2, 3]:
+        return IntegerGlobalAvgPool((2, 3), keepdims=_get_call_arg(node, 1, 'keepdim', False))
+    if node_type == nn.ZeroPad2d:
+        left, right, top, bottom = node.framework_attr.get(PADDING)
+        return IntegerZeroPadding2D(((top, bottom), (left, right)), channels_first=True)
+    if node_type in FLATTEN_OPS:
+        output_shape = tuple(node.output_shape[0][1:])
+        return IntegerReshape(lambda x: x.reshape((x.shape[0],) + output_shape))
+    if node_type in [torch.permute, torch.Tensor.permute]:
+        # The dims are passed either as a sequence or as separate arguments.
+        dims = node.op_call_args if len(node.op_call_args) > 1 else _get_call_arg(node, 0, 'dims')
+        return IntegerReshape(lambda x: x.transpose(dims))
+
+    Logger.critical(f'The integer executor does not support node {node.name} of type {node_type}.')
@@ -29,7 +29,8 @@ from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
-from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import kpi_functions_mapping
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functions_mapping import \
+    get_kpi_functions_mapping
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
 from model_compression_toolkit.core.common.model_collector import ModelCollector
@@ -134,7 +135,7 @@ def core_runner(in_model: Any,
 
     _set_final_kpi(graph=tg,
                    final_bit_widths_config=bit_widths_config,
-                   kpi_functions_dict=kpi_functions_mapping,
+                   kpi_functions_dict=get_kpi_functions_mapping(target_kpi),
                    fw_info=fw_info,
                    fw_impl=fw_impl)
 
@@ -365,7 +366,8 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     calculate_quantization_params(transformed_graph,
                                   fw_info,
-                                  fw_impl=fw_impl)
+                                  fw_impl=fw_impl,
+                                  n_workers=core_config.quantization_config.qparams_computation_n_workers)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'thresholds_selection')
@@ -13,37 +13,81 @@
 # limitations under the License.
 # ==============================================================================
 import copy
-from typing import Callable
+from typing import Callable, Dict
 
 import torch.nn
 
 from mct_quantizers import PytorchQuantizationWrapper
 from mct_quantizers.common.constants import LAYER, WEIGHTS_QUANTIZERS
+from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.exporter.model_exporter.fw_agonstic.exporter import Exporter
 
 
-def _set_quantized_weights_in_wrapper(layer:PytorchQuantizationWrapper):
+def _set_quantized_weights_in_wrapper(layer: PytorchQuantizationWrapper,
+                                      source_layer: PytorchQuantizationWrapper = None):
     """
        Sets the quantized weights in the provided PytorchQuantizationWrapper layer.
-       Replaces the original weights in the layer with the quantized weights.
+       Replaces the original weights in the layer with the quantized weights, and releases the float weights the
+       wrapper holds, so the memory of a layer's float weights is freed once its quantized weights are set.
 
        Args:
            layer (PytorchQuantizationWrapper): The layer containing quantized weights.
+           source_layer (PytorchQuantizationWrapper): The layer to quantize the weights of (by default, the layer
+           itself). Used when the layer is a copy that does not hold the float weights.
 
        Raises:
            AssertionError: If the provided layer is not an instance of PytorchQuantizationWrapper.
     """
     assert isinstance(layer, PytorchQuantizationWrapper), f' Expected module {layer} to be PytorchQuantizationWrapper but is of type {type(layer)}'
+    source_layer = layer if source_layer is None else source_layer
+
+    # Quantize all the weights of the layer once
+    with torch.no_grad():
+        quantized_weights = source_layer.get_quantized_weights()
 
     # Replace the weights in the layer with quantized weights
+    linear_layer = getattr(layer, LAYER)
     for name in layer.weights_quantizers.keys():
-        quantized_weight = torch.nn.Parameter(layer.get_quantized_weights()[name]).detach()
-        linear_layer = getattr(layer, LAYER)
         delattr(linear_layer, name)
-        setattr(linear_layer, name, torch.nn.Parameter(quantized_weight))
+        setattr(linear_layer, name, torch.nn.Parameter(quantized_weights[name].detach()))
+        # Release the float weights of the wrapper
+        if name in layer._parameters:
+            delattr(layer, name)
 
     # Clear the weights quantizers dictionary
     layer.weights_quantizers = {}
+    layer._weights_vars = []
+
+
+def _get_weights_placeholders(model: torch.nn.Module) -> Dict[int, torch.Tensor]:
+    """
+    Map the tensors of a model to the tensors a copy of the model (that is created by deepcopy with this mapping as
+    its memo) uses: the weights of wrapped layers, which are replaced by quantized weights during the export, are
+    mapped to meta-device placeholders (that take no memory), and all other parameters and buffers, as well as the
+    graphs the model was built from (and their nodes, which hold the float weights), are shared with the model
+    (the export does not modify them).
+
+    Args:
+        model: Model to copy.
+
+    Returns:
+        A deepcopy memo that maps ids of the model's tensors to the tensors of the copy.
+    """
+    memo = {id(t): t for t in list(model.parameters()) + list(model.buffers())}
+    for module in model.modules():
+        for value in vars(module).values():
+            if isinstance(value, Graph):
+                memo[id(value)] = value
+                memo.update({id(n): n for n in value.nodes})
+        if isinstance(module, PytorchQuantizationWrapper):
+            for name in module.weights_quantizers.keys():
+                for weight in [getattr(module, name, None), getattr(getattr(module, LAYER), name, None)]:
+                    if isinstance(weight, torch.Tensor):
+                        placeholder = torch.empty_like(weight, device='meta')
+                        if isinstance(weight, torch.nn.Parameter):
+                            placeholder = torch.nn.Parameter(placeholder, requires_grad=weight.requires_grad)
+                        memo[id(weight)] = placeholder
+    return memo
 
 
 class BasePyTorchExporter(Exporter):
@@ -55,33 +99,43 @@ class BasePyTorchExporter(Exporter):
                  model: torch.nn.Module,
                  is_layer_exportable_fn: Callable,
                  save_model_path: str,
-                 repr_dataset: Callable):
+                 repr_dataset: Callable,
+                 inplace: bool = False):
         """
         Args:
             model: Model to export.
             is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
             save_model_path: Path to save the exported model.
             repr_dataset: Representative dataset (needed for creating torch script).
+            inplace: Whether to export the model in place. If True, the weights of the model are replaced by
+            their quantized weights layer by layer and its wrapped layers are unwrapped, so the export does not
+            allocate a copy of the model, but the model can not be used after the export. Otherwise, the model is
+            exported from a copy of its structure that shares its unquantized parameters, so only its quantized
+            weights are allocated.
 
         """
         super().__init__(model,
                          is_layer_exportable_fn,
                          save_model_path)
 
-        self.model = copy.deepcopy(self.model)
+        self.inplace = inplace
+        self.exportable_model = model
+        if not inplace:
+            self.model = copy.deepcopy(self.model, memo=_get_weights_placeholders(self.model))
         self.repr_dataset = repr_dataset
 
     def _substitute_fully_quantized_model(self):
         """
         Substitution for pytorch "fully-quantized" models. It first uses the weight quantizers
-        in PytorchQuantizationWrapper layers to quantize the weights and set them in the layer.
+        in PytorchQuantizationWrapper layers to quantize the weights and set them in the layer (one layer at a time).
         Then, it replace all wrapped layers with the layers the wrap.
         """
 
-        # Replace float weight with wrapped quantized weights
-        for layer in self.model.modules():
+        # Replace float weight with wrapped quantized weights. The modules of the copy are in the same order
+        # as the modules of the exportable model, which holds the float weights.
+        for layer, source_layer in zip(list(self.model.modules()), list(self.exportable_model.modules())):
             if isinstance(layer, PytorchQuantizationWrapper):
-                _set_quantized_weights_in_wrapper(layer)
+                _set_quantized_weights_in_wrapper(layer, source_layer)
 
         # Replace PytorchQuantizationWrapper layers with their internal layers
         self._replace_wrapped_with_unwrapped()
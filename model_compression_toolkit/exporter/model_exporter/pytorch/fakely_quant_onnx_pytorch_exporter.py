@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable
+from typing import Any, Callable
 
 import torch.nn
 
@@ -40,7 +40,8 @@ class FakelyQuantONNXPyTorchExporter(BasePyTorchExporter):
                  model: torch.nn.Module,
                  is_layer_exportable_fn: Callable,
                  save_model_path: str,
-                 repr_dataset: Callable):
+                 repr_dataset: Callable,
+                 inplace: bool = False):
         """
 
         Args:
@@ -48,12 +49,15 @@ class FakelyQuantONNXPyTorchExporter(BasePyTorchExporter):
             is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
             save_model_path: Path to save the exported model.
             repr_dataset: Representative dataset (needed for creating torch script).
+            inplace: Whether to export the model in place (without copying it, so the model can not be used after
+            the export).
         """
 
         super().__init__(model,
                          is_layer_exportable_fn,
                          save_model_path,
-                         repr_dataset)
+                         repr_dataset,
+                         inplace=inplace)
 
 
     def export(self) -> None:
@@ -71,11 +75,20 @@ class FakelyQuantONNXPyTorchExporter(BasePyTorchExporter):
 
         Logger.info(f"Exporting PyTorch fake quant onnx model: {self.save_model_path}")
 
+        self._export_onnx_model(self.save_model_path)
+
+    def _export_onnx_model(self, f: Any):
+        """
+        Export the model (after its wrapped layers were substituted) to ONNX.
+
+        Args:
+            f: Path or file-like object to save the ONNX model to.
+        """
         model_input = to_torch_tensor(next(self.repr_dataset())[0])
 
         torch.onnx.export(self.model,
                           model_input,
-                          self.save_model_path,
+                          f,
                           opset_version=OPSET_VERSION,
                           verbose=False,
                           input_names=['input'],
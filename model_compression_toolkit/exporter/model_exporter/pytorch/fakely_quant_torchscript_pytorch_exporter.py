@@ -34,7 +34,8 @@ class FakelyQuantTorchScriptPyTorchExporter(BasePyTorchExporter):
                  model: torch.nn.Module,
                  is_layer_exportable_fn: Callable,
                  save_model_path: str,
-                 repr_dataset: Callable):
+                 repr_dataset: Callable,
+                 inplace: bool = False):
         """
 
         Args:
@@ -42,12 +43,15 @@ class FakelyQuantTorchScriptPyTorchExporter(BasePyTorchExporter):
             is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
             save_model_path: Path to save the exported model.
             repr_dataset: Representative dataset (needed for creating torch script).
+            inplace: Whether to export the model in place (without copying it, so the model can not be used after
+            the export).
         """
 
         super().__init__(model,
                          is_layer_exportable_fn,
                          save_model_path,
-                         repr_dataset)
+                         repr_dataset,
+                         inplace=inplace)
 
     def export(self) -> None:
         """
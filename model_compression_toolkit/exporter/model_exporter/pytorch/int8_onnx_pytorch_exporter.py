@@ -0,0 +1,335 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import io
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import onnx
+import torch.nn
+from onnx import helper, numpy_helper, version_converter, TensorProto
+
+from mct_quantizers import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, WeightsUniformInferableQuantizer
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_onnx_pytorch_exporter import \
+    FakelyQuantONNXPyTorchExporter
+
+# ONNX opset version from which DequantizeLinear supports 4-bit integers.
+INT4_OPSET_VERSION = 21
+# Weights quantized with up to this number of bits are packed as 4-bit integers (two values in a byte).
+MAX_PACKED_N_BITS = 4
+MAX_INT_N_BITS = 8
+
+
+class IntegerWeights:
+    """
+    Integer representation of quantized weights of a layer.
+    """
+
+    def __init__(self,
+                 layer_name: str,
+                 attr: str,
+                 values: np.ndarray,
+                 scales: np.ndarray,
+                 zero_points: np.ndarray,
+                 channel_axis: int,
+                 num_bits: int,
+                 signed: bool,
+                 quantized_weights: np.ndarray):
+        """
+        Args:
+            layer_name: Name of the layer in the model.
+            attr: Name of the weights attribute of the layer.
+            values: Integer values of the weights.
+            scales: Scales of the weights (one per channel if quantized per-channel, otherwise one).
+            zero_points: Zero points of the weights (one per channel if quantized per-channel, otherwise one).
+            channel_axis: Axis of the channels the weights are quantized per (None if quantized per-tensor).
+            num_bits: Number of bits the weights are quantized with.
+            signed: Whether the integer values are signed.
+            quantized_weights: Float (fakely-quantized) values of the weights.
+        """
+        self.layer_name = layer_name
+        self.attr = attr
+        self.values = values
+        self.scales = scales
+        self.zero_points = zero_points
+        self.channel_axis = channel_axis
+        self.num_bits = num_bits
+        self.signed = signed
+        self.quantized_weights = quantized_weights
+
+
+class INT8ONNXPyTorchExporter(FakelyQuantONNXPyTorchExporter):
+    """
+    Exporter for INT8 ONNX models.
+    The exporter expects to receive an exportable model (where each layer's full quantization parameters
+    can be retrieved), and convert it into an ONNX model in QDQ format: the quantized weights are stored as
+    integer initializers with their scales and zero points (per-channel if the weights are quantized per-channel),
+    and are dequantized by DequantizeLinear nodes, and the activations are quantized by QuantizeLinear and
+    DequantizeLinear nodes. Weights that are quantized with up to 4 bits are packed as 4-bit integers.
+    ONNX Runtime fuses the QDQ nodes around the layers with 8-bit weights to integer kernels (such as QLinearConv and
+    QLinearMatMul), while 4-bit weights are dequantized at inference (so packing them reduces the model size but not
+    its latency).
+    """
+
+    def __init__(self,
+                 model: torch.nn.Module,
+                 is_layer_exportable_fn: Callable,
+                 save_model_path: str,
+                 repr_dataset: Callable,
+                 pack_low_bit_weights: bool = True,
+                 inplace: bool = False):
+        """
+
+        Args:
+            model: Model to export.
+            is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
+            save_model_path: Path to save the exported model.
+            repr_dataset: Representative dataset (needed for creating torch script).
+            pack_low_bit_weights: Whether to pack weights that are quantized with up to 4 bits as 4-bit integers
+            (which requires ONNX opset 21). Otherwise, they are stored as 8-bit integers.
+            inplace: Whether to export the model in place (without copying it, so the model can not be used after
+            the export).
+        """
+
+        super().__init__(model,
+                         is_layer_exportable_fn,
+                         save_model_path,
+                         repr_dataset,
+                         inplace=inplace)
+
+        self.pack_low_bit_weights = pack_low_bit_weights
+        self.exported_model = None
+
+    def export(self) -> None:
+        """
+        Convert an exportable (fully-quantized) PyTorch model to an ONNX model with integer weights.
+        """
+        for layer in self.model.children():
+            self.is_layer_exportable_fn(layer)
+
+        # The integer weights are computed before the substitution removes the weights quantizers.
+        integer_weights = self._get_integer_weights()
+
+        self._substitute_fully_quantized_model()
+
+        Logger.info(f"Exporting PyTorch INT8 onnx model: {self.save_model_path}")
+
+        f = io.BytesIO()
+        self._export_onnx_model(f)
+        self.exported_model = onnx.load_from_string(f.getvalue())
+
+        pack_low_bit_weights = self.pack_low_bit_weights and \
+                               any([w.num_bits <= MAX_PACKED_N_BITS for w in integer_weights])
+        if pack_low_bit_weights:
+            pack_low_bit_weights = self._convert_to_int4_opset()
+
+        self._set_integer_weights(integer_weights, pack_low_bit_weights)
+
+        onnx.save(self.exported_model, self.save_model_path)
+
+    def _get_integer_weights(self) -> List[IntegerWeights]:
+        """
+        Returns:
+            Integer representations of the quantized weights of the wrapped layers in the model that can be
+            represented by ONNX integer weights.
+        """
+        integer_weights = []
+        # The weights are read from the exportable model (the model to substitute may not hold the float weights).
+        for name, module in self.exportable_model.named_children():
+            if not isinstance(module, PytorchQuantizationWrapper):
+                continue
+            quantized_weights = module.get_quantized_weights()
+            for attr, quantizer in module.weights_quantizers.items():
+                if not isinstance(quantizer, (WeightsSymmetricInferableQuantizer, WeightsUniformInferableQuantizer)) \
+                        or quantizer.num_bits > MAX_INT_N_BITS:
+                    Logger.warning(f'Weights {attr} of layer {name} are quantized with {type(quantizer).__name__} '
+                                   f'with {quantizer.num_bits} bits, which can not be represented by ONNX integer '
+                                   f'weights, thus they are exported as float fakely-quantized weights.')
+                    continue
+                integer_weights.append(_get_layer_integer_weights(name, attr, getattr(module.layer, attr), quantizer,
+                                                                  quantized_weights[attr]))
+        return integer_weights
+
+    def _convert_to_int4_opset(self) -> bool:
+        """
+        Convert the exported model to the opset version from which 4-bit integers are supported.
+
+        Returns:
+            Whether the model was converted.
+        """
+        try:
+            self.exported_model = version_converter.convert_version(self.exported_model, INT4_OPSET_VERSION)
+        except Exception as e:
+            Logger.warning(f'Could not convert the ONNX model to opset {INT4_OPSET_VERSION} to pack weights that are '
+                           f'quantized with up to {MAX_PACKED_N_BITS} bits, thus they are stored as 8-bit integers: '
+                           f'{e}')
+            return False
+        return True
+
+    def _set_integer_weights(self,
+                             integer_weights: List[IntegerWeights],
+                             pack_low_bit_weights: bool):
+        """
+        Replace the float initializers of the quantized weights in the exported model with integer initializers and
+        DequantizeLinear nodes (that output the float weights under the names of the replaced initializers).
+
+        Args:
+            integer_weights: Integer representations of the quantized weights.
+            pack_low_bit_weights: Whether to pack weights that are quantized with up to 4 bits as 4-bit integers.
+        """
+        graph = self.exported_model.graph
+        initializers = {initializer.name: initializer for initializer in graph.initializer}
+        dequantize_nodes = []
+        for w in integer_weights:
+            initializer, transposed = _find_weights_initializer(graph, initializers, w)
+            if initializer is None:
+                Logger.warning(f'Could not find the weights {w.attr} of layer {w.layer_name} in the exported ONNX '
+                               f'model, thus they are exported as float fakely-quantized weights.')
+                continue
+
+            values, channel_axis = w.values, w.channel_axis
+            if transposed:
+                values = values.T
+                channel_axis = None if channel_axis is None else 1 - channel_axis
+
+            if pack_low_bit_weights and w.num_bits <= MAX_PACKED_N_BITS:
+                data_type = TensorProto.INT4 if w.signed else TensorProto.UINT4
+            else:
+                data_type = TensorProto.INT8 if w.signed else TensorProto.UINT8
+
+            scales, zero_points = w.scales, w.zero_points
+            if channel_axis is None:
+                scales, zero_points = scales.reshape(()), zero_points.reshape(())
+
+            name = initializer.name
+            graph.initializer.remove(initializer)
+            del initializers[name]
+            graph.initializer.extend([_make_integer_tensor(f'{name}_quantized', values, data_type),
+                                      numpy_helper.from_array(scales, f'{name}_scale'),
+                                      _make_integer_tensor(f'{name}_zero_point', zero_points, data_type)])
+            axis_attr = {} if channel_axis is None else {'axis': channel_axis}
+            dequantize_nodes.append(helper.make_node('DequantizeLinear',
+                                                     [f'{name}_quantized', f'{name}_scale', f'{name}_zero_point'],
+                                                     [name],
+                                                     name=f'{name}_DequantizeLinear',
+                                                     **axis_attr))
+
+        nodes = dequantize_nodes + list(graph.node)
+        del graph.node[:]
+        graph.node.extend(nodes)
+
+
+def _get_layer_integer_weights(layer_name: str,
+                               attr: str,
+                               weights: torch.Tensor,
+                               quantizer: WeightsSymmetricInferableQuantizer,
+                               quantized_weights: torch.Tensor) -> IntegerWeights:
+    """
+    Compute the integer representation of weights (such that dequantizing them gives the same values as the weights
+    quantizer's fake-quantization).
+
+    Args:
+        layer_name: Name of the layer in the model.
+        attr: Name of the weights attribute of the layer.
+        weights: Float weights.
+        quantizer: Weights quantizer of the layer (symmetric, power-of-two or uniform).
+        quantized_weights: Weights after the quantizer's fake-quantization.
+
+    Returns:
+        Integer representation of the weights.
+    """
+    weights = weights.detach().cpu()
+    scales = quantizer.scales.detach().cpu().flatten().float()
+    zero_points = quantizer.zero_points.detach().cpu().flatten().int()
+    channel_axis = None
+    if quantizer.per_channel:
+        channel_axis = quantizer.channel_axis % weights.ndim
+        shape = [1] * weights.ndim
+        shape[channel_axis] = -1
+        broadcast_scales, broadcast_zero_points = scales.reshape(shape), zero_points.reshape(shape)
+    else:
+        broadcast_scales, broadcast_zero_points = scales, zero_points
+
+    # As computed by the fake-quantization: zero_point + round(x / scale), clipped to the quantized domain.
+    values = torch.clamp(torch.round(weights * (1.0 / broadcast_scales)) + broadcast_zero_points,
+                         quantizer.min_quantized_domain, quantizer.max_quantized_domain)
+
+    return IntegerWeights(layer_name=layer_name,
+                          attr=attr,
+                          values=values.numpy().astype(np.int32),
+                          scales=scales.numpy(),
+                          zero_points=zero_points.numpy(),
+                          channel_axis=channel_axis,
+                          num_bits=quantizer.num_bits,
+                          signed=quantizer.min_quantized_domain < 0,
+                          quantized_weights=quantized_weights.detach().cpu().numpy())
+
+
+def _find_weights_initializer(graph: onnx.GraphProto,
+                              initializers: Dict[str, onnx.TensorProto],
+                              integer_weights: IntegerWeights) -> Tuple[onnx.TensorProto, bool]:
+    """
+    Find the initializer of quantized weights in an exported ONNX graph. The initializer is named after the
+    weights' parameter in the model, unless the export transposed the weights (as it does for the weights of a
+    linear layer that is exported as MatMul), in which case it is looked up among the initializers the layer's nodes
+    use.
+
+    Args:
+        graph: Exported ONNX graph.
+        initializers: Mapping from names to initializers of the graph.
+        integer_weights: Integer representation of the weights.
+
+    Returns:
+        The initializer (or None if it is not found), and whether it is transposed.
+    """
+    initializer = initializers.get(f'{integer_weights.layer_name}.{integer_weights.attr}')
+    if initializer is not None:
+        return initializer, False
+
+    if integer_weights.quantized_weights.ndim == 2:
+        transposed_weights = integer_weights.quantized_weights.T
+        layer_scope = f'/{integer_weights.layer_name}/'
+        for node in graph.node:
+            if not node.name.startswith(layer_scope):
+                continue
+            for input_name in node.input:
+                initializer = initializers.get(input_name)
+                if initializer is not None and tuple(initializer.dims) == transposed_weights.shape and \
+                        np.array_equal(numpy_helper.to_array(initializer), transposed_weights):
+                    return initializer, True
+    return None, False
+
+
+def _make_integer_tensor(name: str,
+                         values: np.ndarray,
+                         data_type: int) -> onnx.TensorProto:
+    """
+    Args:
+        name: Name of the tensor.
+        values: Integer values of the tensor.
+        data_type: ONNX data type of the tensor (INT8, UINT8, INT4 or UINT4).
+
+    Returns:
+        ONNX tensor of the values. 4-bit values are packed two in a byte (the first in the low nibble).
+    """
+    if data_type in (TensorProto.INT4, TensorProto.UINT4):
+        nibbles = (values.flatten() & 0x0F).astype(np.uint8)
+        if nibbles.size % 2:
+            nibbles = np.append(nibbles, np.uint8(0))
+        packed = nibbles[0::2] | (nibbles[1::2] << 4)
+        return helper.make_tensor(name, data_type, values.shape, packed.tobytes(), raw=True)
+    dtype = np.int8 if data_type == TensorProto.INT8 else np.uint8
+    return numpy_helper.from_array(values.astype(dtype), name)
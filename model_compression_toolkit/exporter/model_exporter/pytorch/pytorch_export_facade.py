@@ -14,7 +14,7 @@
 # ==============================================================================
 from typing import Callable
 
-from model_compression_toolkit.constants import FOUND_TORCH
+from model_compression_toolkit.constants import FOUND_TORCH, FOUND_ONNX
 from model_compression_toolkit.exporter.model_exporter.pytorch.export_serialization_format import \
     PytorchExportSerializationFormat
 from model_compression_toolkit.logger import Logger
@@ -30,9 +30,13 @@ if FOUND_TORCH:
         FakelyQuantTorchScriptPyTorchExporter
     from model_compression_toolkit.exporter.model_wrapper.pytorch.validate_layer import is_pytorch_layer_exportable
 
+    if FOUND_ONNX:
+        from model_compression_toolkit.exporter.model_exporter.pytorch.int8_onnx_pytorch_exporter import \
+            INT8ONNXPyTorchExporter
+
     supported_serialization_quantization_export_dict = {
         PytorchExportSerializationFormat.TORCHSCRIPT: [QuantizationFormat.FAKELY_QUANT],
-        PytorchExportSerializationFormat.ONNX: [QuantizationFormat.FAKELY_QUANT]
+        PytorchExportSerializationFormat.ONNX: [QuantizationFormat.FAKELY_QUANT, QuantizationFormat.INT8]
     }
 
     def pytorch_export_model(model: torch.nn.Module,
@@ -41,14 +45,17 @@ if FOUND_TORCH:
                              target_platform_capabilities: TargetPlatformCapabilities,
                              is_layer_exportable_fn: Callable = is_pytorch_layer_exportable,
                              serialization_format: PytorchExportSerializationFormat =
-                             PytorchExportSerializationFormat.TORCHSCRIPT) -> None:
+                             PytorchExportSerializationFormat.TORCHSCRIPT,
+                             inplace: bool = False) -> None:
         """
         Export a PyTorch quantized model to a torchscript or onnx model.
         The model will be saved to the path in save_model_path.
-        Currently, pytorch_export_model supports only QuantizationFormat.FAKELY_QUANT (where weights
+        pytorch_export_model supports the combination of QuantizationFormat.FAKELY_QUANT (where weights
         and activations are float fakely-quantized values) and PytorchExportSerializationFormat.TORCHSCRIPT
         (where the model will be saved to TorchScript model) or PytorchExportSerializationFormat.ONNX
-        (where the model will be saved to ONNX model).
+        (where the model will be saved to ONNX model), or the combination of PytorchExportSerializationFormat.ONNX
+        with QuantizationFormat.INT8 (where weights are saved as integers with their scales and zero points, and
+        weights that are quantized with up to 4 bits are packed as 4-bit integers).
 
         Args:
             model: Model to export.
@@ -59,6 +66,9 @@ if FOUND_TORCH:
             is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
             serialization_format: Format to export the model according to (by default
             PytorchExportSerializationFormat.TORCHSCRIPT).
+            inplace: Whether to export the model in place. The weights of the model are replaced by their
+            quantized weights layer by layer, without copying the model, which reduces the peak memory of the export
+            but leaves the model unusable after it.
 
         """
 
@@ -68,7 +78,8 @@ if FOUND_TORCH:
                 exporter = FakelyQuantTorchScriptPyTorchExporter(model,
                                                                  is_layer_exportable_fn,
                                                                  save_model_path,
-                                                                 repr_dataset)
+                                                                 repr_dataset,
+                                                                 inplace=inplace)
             else:
                 Logger.critical(
                     f'Unsupported quantization {target_platform_capabilities.tp_model.quantization_format} for '
@@ -76,12 +87,21 @@ if FOUND_TORCH:
                     f'supported formats.')  # pragma: no cover
 
         elif serialization_format == PytorchExportSerializationFormat.ONNX:
-            if target_platform_capabilities.tp_model.quantization_format in \
-                    supported_serialization_quantization_export_dict[serialization_format]:
+            if target_platform_capabilities.tp_model.quantization_format == QuantizationFormat.FAKELY_QUANT:
                 exporter = FakelyQuantONNXPyTorchExporter(model,
                                                           is_layer_exportable_fn,
                                                           save_model_path,
-                                                          repr_dataset)
+                                                          repr_dataset,
+                                                          inplace=inplace)
+            elif target_platform_capabilities.tp_model.quantization_format == QuantizationFormat.INT8:
+                if not FOUND_ONNX:
+                    Logger.critical('Installing onnx is mandatory when exporting a Pytorch model to ONNX with '
+                                    'QuantizationFormat.INT8. Could not find onnx package.')  # pragma: no cover
+                exporter = INT8ONNXPyTorchExporter(model,
+                                                   is_layer_exportable_fn,
+                                                   save_model_path,
+                                                   repr_dataset,
+                                                   inplace=inplace)
             else:
                 Logger.critical(
                     f'Unsupported quantization {target_platform_capabilities.tp_model.quantization_format} for '
@@ -0,0 +1,121 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+from typing import Any, Callable, List
+
+import numpy as np
+
+from model_compression_toolkit.core.common.activation_store import ActivationStore
+from model_compression_toolkit.logger import Logger
+
+
+class FloatOutputsCache:
+    """
+    Cache of the float (teacher) model's outputs on the batches of the representative dataset during GPTQ training.
+
+    The outputs are computed on the batches of the first epoch and stored (in RAM up to a budget, and in memory-mapped
+    shards on disk beyond it), and are replayed in the following epochs instead of running the float model again.
+    Since the replay is valid only if the dataset yields the same batches in every epoch, a fingerprint of each
+    batch's inputs is kept, and if a batch differs from the batch of the first epoch (or the number of batches
+    changes), the cache is disabled and the outputs are computed live from then on.
+    """
+
+    def __init__(self,
+                 to_numpy: Callable[[Any], Any],
+                 to_tensor: Callable[[Any], Any],
+                 ram_budget: int = None):
+        """
+        Args:
+            to_numpy: Function to convert the framework's tensors (or lists of them) to numpy arrays.
+            to_tensor: Function to convert numpy arrays (or lists of them) to the framework's tensors.
+            ram_budget: Maximal number of bytes of outputs to keep in RAM (the rest are spilled to disk). If None,
+                all the outputs are kept in RAM.
+        """
+        self.to_numpy = to_numpy
+        self.to_tensor = to_tensor
+        self.enabled = True
+        self.num_replays = 0
+
+        self._store = ActivationStore(ram_budget=ram_budget)
+        self._inputs_fingerprints = []
+        self._first_epoch = True
+        self._batch_index = 0
+
+    def get_outputs(self,
+                    input_data: List[Any],
+                    compute_fn: Callable[[], Any]) -> Any:
+        """
+        Gets the float model's outputs on the next batch of the epoch, from the cache if possible.
+
+        Args:
+            input_data: Inputs of the batch.
+            compute_fn: Function that runs the float model on the batch and returns its outputs.
+
+        Returns:
+            The float model's outputs on the batch.
+        """
+        batch_index = self._batch_index
+        self._batch_index += 1
+        if not self.enabled:
+            return compute_fn()
+
+        fingerprint = self._get_fingerprint(input_data)
+        if self._first_epoch:
+            outputs = compute_fn()
+            self._store.append(self.to_numpy(outputs))
+            self._inputs_fingerprints.append(fingerprint)
+            return outputs
+
+        if batch_index < len(self._inputs_fingerprints) and self._inputs_fingerprints[batch_index] == fingerprint:
+            self.num_replays += 1
+            return self.to_tensor(self._store[batch_index])
+
+        self._disable()
+        return compute_fn()
+
+    def end_epoch(self):
+        """
+        Marks the end of an epoch of the representative dataset.
+        """
+        if self.enabled and not self._first_epoch and self._batch_index != len(self._inputs_fingerprints):
+            self._disable()
+        self._first_epoch = False
+        self._batch_index = 0
+
+    def _disable(self):
+        """
+        Disables the cache (after the dataset yielded different batches than in the first epoch) and releases
+        the stored outputs.
+        """
+        Logger.warning('The representative dataset is not deterministic (its batches differ between epochs), '
+                       'so the float model outputs are computed in every epoch instead of being cached.')
+        self.enabled = False
+        self._store.clear()
+        self._inputs_fingerprints = []
+
+    def _get_fingerprint(self, input_data: List[Any]) -> str:
+        """
+        Args:
+            input_data: Inputs of a batch.
+
+        Returns:
+            A fingerprint of the inputs' shapes, dtypes and values.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for array in self.to_numpy(list(input_data)):
+            array = np.ascontiguousarray(array)
+            h.update(f'{array.dtype}{array.shape}'.encode())
+            h.update(array.reshape(-1).view(np.uint8))
+        return h.hexdigest()
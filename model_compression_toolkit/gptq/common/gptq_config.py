@@ -39,7 +39,12 @@ class GPTQHessianWeightsConfig:
                  norm_weights: bool = True,
                  log_norm: bool = True,
                  scale_log_norm: bool = False,
-                 hessians_n_iter: int = 50):
+                 hessians_n_iter: int = 50,
+                 samples_ram_budget: int = None,
+                 hessians_n_probes: int = 4,
+                 hessians_images_per_pass: int = 1,
+                 hessians_cache_dir: str = None,
+                 hessians_cache_size: int = 2 ** 24):
 
         """
         Initialize a GPTQHessianWeightsConfig.
@@ -50,6 +55,11 @@ class GPTQHessianWeightsConfig:
             log_norm (bool): Whether to use log normalization to the GPTQ Hessian-based weights.
             scale_log_norm (bool): Whether to scale the final vector of the Hessian weights.
             hessians_n_iter (int): Number of random iterations to run Hessian approximation for GPTQ weights.
+            samples_ram_budget (int): Maximal number of bytes of the samples for computing the Hessian-based weights to keep in RAM. Samples beyond the budget are spilled to memory-mapped .npy files on local disk. If None, all the samples are kept in RAM.
+            hessians_n_probes (int): Number of random vectors to draw in each backward pass of the Hessian approximation (the images are replicated for each vector).
+            hessians_images_per_pass (int): Number of images to process in each backward pass of the Hessian approximation.
+            hessians_cache_dir (str): Directory of an on-disk cache of Hessian-based weights, keyed by a fingerprint of the float graph, the compare points, the samples and the approximation settings, so runs with the same inputs (e.g., with different GPTQ hyperparameters) reuse the weights instead of recomputing them. If None, the weights are not cached.
+            hessians_cache_size (int): Maximal number of bytes of the on-disk cache of Hessian-based weights (the least recently used weights are removed beyond it).
         """
 
         self.hessians_num_samples = hessians_num_samples
@@ -57,6 +67,43 @@ class GPTQHessianWeightsConfig:
         self.log_norm = log_norm
         self.scale_log_norm = scale_log_norm
         self.hessians_n_iter = hessians_n_iter
+        self.samples_ram_budget = samples_ram_budget
+        self.hessians_n_probes = hessians_n_probes
+        self.hessians_images_per_pass = hessians_images_per_pass
+        self.hessians_cache_dir = hessians_cache_dir
+        self.hessians_cache_size = hessians_cache_size
+
+
+class GPTQDataConfig:
+    """
+    Configuration of the data pipeline that feeds the representative dataset to the GPTQ training.
+    """
+
+    def __init__(self,
+                 batch_size: int = None,
+                 shuffle: bool = False,
+                 seed: int = 0,
+                 prefetch_batches: int = 2,
+                 ram_budget: int = None,
+                 preprocess_fn: Callable = None):
+        """
+        Initialize a GPTQDataConfig.
+
+        Args:
+            batch_size (int): Number of samples in each training batch. The samples of the representative dataset are re-batched to this size. If None, the batch size of the representative dataset's first batch is used.
+            shuffle (bool): Whether to shuffle the samples in each epoch.
+            seed (int): Seed of the random shuffling of the samples.
+            prefetch_batches (int): Number of batches to prepare in a background thread ahead of the training. If 0, the batches are prepared in the training thread.
+            ram_budget (int): Maximal number of bytes of the representative dataset's samples to keep in RAM. Samples beyond the budget are spilled to memory-mapped .npy files on local disk. If None, all the samples are kept in RAM.
+            preprocess_fn (Callable): Function to apply to each training batch (a list of the inputs' arrays), returning the preprocessed list of the inputs' arrays. It allows the representative dataset to yield compact samples (e.g., uint8 images) that are preprocessed on the fly. If None, the samples are used as they are.
+        """
+
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.prefetch_batches = prefetch_batches
+        self.ram_budget = ram_budget
+        self.preprocess_fn = preprocess_fn
 
 
 class GradientPTQConfig:
@@ -76,7 +123,12 @@ class GradientPTQConfig:
                  optimizer_bias: Any = None,
                  regularization_factor: float = REG_DEFAULT,
                  hessian_weights_config: GPTQHessianWeightsConfig = GPTQHessianWeightsConfig(),
-                 gptq_quantizer_params_override: Dict[str, Any] = None):
+                 gptq_quantizer_params_override: Dict[str, Any] = None,
+                 cache_float_outputs: bool = False,
+                 float_outputs_ram_budget: int = None,
+                 log_interval: int = 1,
+                 step_profiler: Callable = None,
+                 data_config: GPTQDataConfig = None):
         """
         Initialize a GradientPTQConfig.
 
@@ -96,6 +148,11 @@ class GradientPTQConfig:
             regularization_factor (float): A floating point number that defines the regularization factor.
             hessian_weights_config (GPTQHessianWeightsConfig): A configuration that include all necessary arguments to run a computation of Hessian weights for the GPTQ loss.
             gptq_quantizer_params_override (dict): A dictionary of parameters to override in GPTQ quantizer instantiation. Defaults to None (no parameters).
+            cache_float_outputs (bool): Whether to compute the float model's outputs on the representative dataset once (in the first epoch) and replay them in the following epochs, instead of running the float model in every epoch. If the representative dataset yields different batches in different epochs, the outputs are computed in every epoch.
+            float_outputs_ram_budget (int): Maximal number of bytes of cached float model's outputs to keep in RAM. Outputs beyond the budget are spilled to memory-mapped .npy files on local disk. If None, all the outputs are kept in RAM.
+            log_interval (int): Number of training steps between calls of log_function. The loss, gradients and parameters for log_function are copied from the device only in these steps.
+            step_profiler (Callable): Function to call after each training step with the step's index and its wall-clock duration in seconds, for profiling the GPTQ training. Defaults to None (no profiling).
+            data_config (GPTQDataConfig): A configuration of a data pipeline that reads the representative dataset once, and re-batches, shuffles and prefetches its samples in each training epoch. If None, the representative dataset is iterated in each epoch.
 
         """
         self.n_iter = n_iter
@@ -114,6 +171,11 @@ class GradientPTQConfig:
 
         self.gptq_quantizer_params_override = {} if gptq_quantizer_params_override is None \
             else gptq_quantizer_params_override
+        self.cache_float_outputs = cache_float_outputs
+        self.float_outputs_ram_budget = float_outputs_ram_budget
+        self.log_interval = log_interval
+        self.step_profiler = step_profiler
+        self.data_config = data_config
 
 
 class GradientPTQConfigV2(GradientPTQConfig):
@@ -132,7 +194,12 @@ class GradientPTQConfigV2(GradientPTQConfig):
                  optimizer_bias: Any = None,
                  regularization_factor: float = REG_DEFAULT,
                  hessian_weights_config: GPTQHessianWeightsConfig = GPTQHessianWeightsConfig(),
-                 gptq_quantizer_params_override: Dict[str, Any] = None):
+                 gptq_quantizer_params_override: Dict[str, Any] = None,
+                 cache_float_outputs: bool = False,
+                 float_outputs_ram_budget: int = None,
+                 log_interval: int = 1,
+                 step_profiler: Callable = None,
+                 data_config: GPTQDataConfig = None):
         """
         Initialize a GradientPTQConfigV2.
 
@@ -152,6 +219,11 @@ class GradientPTQConfigV2(GradientPTQConfig):
             regularization_factor (float): A floating point number that defines the regularization factor.
             hessian_weights_config (GPTQHessianWeightsConfig): A configuration that include all necessary arguments to run a computation of Hessian weights for the GPTQ loss.
             gptq_quantizer_params_override (dict): A dictionary of parameters to override in GPTQ quantizer instantiation. Defaults to None (no parameters).
+            cache_float_outputs (bool): Whether to compute the float model's outputs on the representative dataset once (in the first epoch) and replay them in the following epochs, instead of running the float model in every epoch. If the representative dataset yields different batches in different epochs, the outputs are computed in every epoch.
+            float_outputs_ram_budget (int): Maximal number of bytes of cached float model's outputs to keep in RAM. Outputs beyond the budget are spilled to memory-mapped .npy files on local disk. If None, all the outputs are kept in RAM.
+            log_interval (int): Number of training steps between calls of log_function. The loss, gradients and parameters for log_function are copied from the device only in these steps.
+            step_profiler (Callable): Function to call after each training step with the step's index and its wall-clock duration in seconds, for profiling the GPTQ training. Defaults to None (no profiling).
+            data_config (GPTQDataConfig): A configuration of a data pipeline that reads the representative dataset once, and re-batches, shuffles and prefetches its samples in each training epoch. If None, the representative dataset is iterated in each epoch.
 
         """
 
@@ -167,7 +239,12 @@ class GradientPTQConfigV2(GradientPTQConfig):
                          optimizer_bias=optimizer_bias,
                          regularization_factor=regularization_factor,
                          hessian_weights_config=hessian_weights_config,
-                         gptq_quantizer_params_override=gptq_quantizer_params_override)
+                         gptq_quantizer_params_override=gptq_quantizer_params_override,
+                         cache_float_outputs=cache_float_outputs,
+                         float_outputs_ram_budget=float_outputs_ram_budget,
+                         log_interval=log_interval,
+                         step_profiler=step_profiler,
+                         data_config=data_config)
         self.n_epochs = n_epochs
 
     @classmethod
@@ -0,0 +1,112 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, Iterator, List
+
+import numpy as np
+
+from model_compression_toolkit.core.common.activation_store import ActivationStore
+from model_compression_toolkit.core.common.prefetch import prefetch
+from model_compression_toolkit.gptq.common.gptq_config import GPTQDataConfig
+from model_compression_toolkit.logger import Logger
+
+
+class GPTQDataPipeline:
+    """
+    Data pipeline that feeds the representative dataset to the GPTQ training.
+
+    The representative dataset is read once (on the first call), and its batches are kept in an ActivationStore
+    (in RAM up to a budget, and in memory-mapped shards on disk beyond it). Each call to the pipeline is an epoch:
+    it yields the samples re-batched to the configured batch size, in a random order if shuffling is enabled,
+    preprocessed by the configured preprocessing function, and prepared in a background thread if prefetching is
+    enabled.
+    """
+
+    def __init__(self,
+                 representative_data_gen: Callable,
+                 data_config: GPTQDataConfig):
+        """
+        Args:
+            representative_data_gen: Dataset generator that yields batches (lists of the inputs' arrays).
+            data_config: Configuration of the data pipeline.
+        """
+        if data_config.batch_size is not None and data_config.batch_size < 1:
+            Logger.critical(f'GPTQ data pipeline batch size must be positive, '
+                            f'but got {data_config.batch_size}')  # pragma: no cover
+
+        self.representative_data_gen = representative_data_gen
+        self.data_config = data_config
+        self.batch_size = data_config.batch_size
+        self.num_samples = 0
+
+        self._store = None
+        # Index of the first sample of each batch of the store (and the total number of samples at the end).
+        self._offsets = None
+        self._rng = np.random.RandomState(data_config.seed)
+
+    def __call__(self) -> Iterator[List[np.ndarray]]:
+        """
+        Returns: An iterator over the batches of an epoch.
+        """
+        if self._store is None:
+            self._materialize()
+
+        order = self._rng.permutation(self.num_samples) if self.data_config.shuffle else np.arange(self.num_samples)
+        batches = (self._get_batch(order[i:i + self.batch_size]) for i in range(0, self.num_samples, self.batch_size))
+        if self.data_config.prefetch_batches > 0:
+            return prefetch(batches, self.data_config.prefetch_batches)
+        return batches
+
+    def _materialize(self):
+        """
+        Reads the representative dataset into the store.
+        """
+        self._store = ActivationStore(ram_budget=self.data_config.ram_budget)
+        offsets = [0]
+        for batch in self.representative_data_gen():
+            batch = [np.asarray(x) for x in batch]
+            self._store.append(batch)
+            offsets.append(offsets[-1] + batch[0].shape[0])
+        self._offsets = np.asarray(offsets)
+        self.num_samples = int(self._offsets[-1])
+        if self.num_samples == 0:
+            Logger.critical('The representative dataset for the GPTQ training has no samples.')  # pragma: no cover
+        if self.batch_size is None:
+            self.batch_size = int(self._offsets[1])
+        Logger.info(f'GPTQ data pipeline read {self.num_samples} samples in {len(self._store)} batches '
+                    f'({self._store.ram_bytes} bytes in RAM, {self._store.disk_bytes} bytes on disk)')
+
+    def _get_batch(self, sample_indices: np.ndarray) -> List[Any]:
+        """
+        Args:
+            sample_indices: Indices of the samples of a batch.
+
+        Returns:
+            The (preprocessed) batch, as a list of the inputs' arrays. Samples of the same batch of the store are
+            grouped together in the batch.
+        """
+        store_indices = np.searchsorted(self._offsets, sample_indices, side='right') - 1
+        inputs_parts = []
+        for store_index in np.unique(store_indices):
+            rows = sample_indices[store_indices == store_index] - self._offsets[store_index]
+            stored_batch = self._store[store_index]
+            if len(rows) == stored_batch[0].shape[0] and np.all(rows[1:] > rows[:-1]):
+                # The whole stored batch, in its order.
+                inputs_parts.append([np.array(x) for x in stored_batch])
+            else:
+                inputs_parts.append([x[rows] for x in stored_batch])
+        batch = [np.concatenate(parts) if len(parts) > 1 else parts[0] for parts in zip(*inputs_parts)]
+        if self.data_config.preprocess_fn is not None:
+            batch = self.data_config.preprocess_fn(batch)
+        return batch
@@ -12,17 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import copy
 from abc import ABC, abstractmethod
 import numpy as np
 from typing import Callable, List, Any
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.activation_store import ActivationStore
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.jacobian_weights_cache import JacobianWeightsCache
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR
 from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
 from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCache
+from model_compression_toolkit.gptq.common.gptq_data_pipeline import GPTQDataPipeline
 from model_compression_toolkit.logger import Logger
 
 
@@ -50,8 +53,8 @@ class GPTQTrainer(ABC):
             fw_impl: Framework implementation
             fw_info: Framework information
         """
-        self.graph_float = copy.deepcopy(graph_float)
-        self.graph_quant = copy.deepcopy(graph_quant)
+        self.graph_float = graph_float.clone()
+        self.graph_quant = graph_quant.clone()
         self.gptq_config = gptq_config
         self.fw_impl = fw_impl
         self.fw_info = fw_info
@@ -129,58 +132,103 @@ class GPTQTrainer(ABC):
         to be used for the loss metric weighted average computation when running GPTQ training.
         """
         if self.gptq_config.use_hessian_based_weights:
-            images = self._generate_images_batch(representative_data_gen,
-                                                 self.gptq_config.hessian_weights_config.hessians_num_samples)
-
+            hessian_weights_config = self.gptq_config.hessian_weights_config
+            images_batches = self._generate_images_batch(representative_data_gen,
+                                                         hessian_weights_config.hessians_num_samples,
+                                                         hessian_weights_config.samples_ram_budget)
             model_output_replacement = self._get_model_output_replacement()
 
-            points_apprx_jacobians_weights = []
-            for i in range(1, images.shape[0] + 1):
-                Logger.info(f"Computing Jacobian-based weights approximation for image sample {i} out of {images.shape[0]}...")
-                # Note that in GPTQ loss weights computation we assume that there aren't replacement output nodes,
-                # therefore, output_list is just the graph outputs, and we don't need the tuning factor for
-                # defining the output weights (since the output layer is not a compare point).
-                image_ip_gradients = self.fw_impl.model_grad(self.graph_float,
-                                                             {inode: self.fw_impl.to_tensor(images[i - 1:i]) for inode
-                                                              in
-                                                              self.graph_float.get_inputs()},
-                                                             self.compare_points,
-                                                             output_list=model_output_replacement,
-                                                             all_outputs_indices=[],
-                                                             alpha=0,
-                                                             norm_weights=self.gptq_config.hessian_weights_config.norm_weights,
-                                                             n_iter=self.gptq_config.hessian_weights_config.hessians_n_iter)
-                points_apprx_jacobians_weights.append(image_ip_gradients)
-            if self.gptq_config.hessian_weights_config.log_norm:
-                mean_jacobian_weights = np.mean(points_apprx_jacobians_weights, axis=0)
+            if hessian_weights_config.hessians_cache_dir is not None:
+                jacobians_cache = JacobianWeightsCache(hessian_weights_config.hessians_cache_dir,
+                                                       hessian_weights_config.hessians_cache_size)
+                cache_key = JacobianWeightsCache.get_key(
+                    self.graph_float,
+                    self.compare_points,
+                    images_batches,
+                    {'framework': type(self.fw_impl).__name__,
+                     'output_list': [n.name for n in model_output_replacement],
+                     'norm_weights': hessian_weights_config.norm_weights,
+                     'n_iter': hessian_weights_config.hessians_n_iter,
+                     'n_probes': hessian_weights_config.hessians_n_probes,
+                     'images_per_pass': hessian_weights_config.hessians_images_per_pass})
+                mean_jacobian_weights = jacobians_cache.get_or_compute(
+                    cache_key, lambda: self._compute_mean_jacobians_weights(images_batches, model_output_replacement))
+            else:
+                mean_jacobian_weights = self._compute_mean_jacobians_weights(images_batches, model_output_replacement)
+
+            if hessian_weights_config.log_norm:
                 mean_jacobian_weights = np.where(mean_jacobian_weights != 0, mean_jacobian_weights,
                                                  np.partition(mean_jacobian_weights, 1)[1])
                 log_weights = np.log10(mean_jacobian_weights)
 
-                if self.gptq_config.hessian_weights_config.scale_log_norm:
+                if hessian_weights_config.scale_log_norm:
                     return (log_weights - np.min(log_weights)) / (np.max(log_weights) - np.min(log_weights))
 
                 return log_weights - np.min(log_weights)
             else:
-                return np.mean(points_apprx_jacobians_weights, axis=0)
+                return mean_jacobian_weights
         else:
             num_nodes = len(self.compare_points)
             return np.asarray([1 / num_nodes for _ in range(num_nodes)])
 
+    def _compute_mean_jacobians_weights(self,
+                                        images_batches: ActivationStore,
+                                        model_output_replacement: List[BaseNode]) -> np.ndarray:
+        """
+        Computes the Jacobian-based weights of the compare points, averaged over the images.
+
+        Args:
+            images_batches: Batches of images to compute the weights on.
+            model_output_replacement: Nodes to use as the model's outputs for the gradients computation.
+
+        Returns: A vector of the average weights, one for each compare point.
+        """
+        num_images = sum([images.shape[0] for images in images_batches])
+
+        hessian_weights_config = self.gptq_config.hessian_weights_config
+        images_per_pass = hessian_weights_config.hessians_images_per_pass
+        points_apprx_jacobians_weights, passes_num_images = [], []
+        for images in images_batches:
+            for j in range(0, images.shape[0], images_per_pass):
+                pass_num_images = min(images_per_pass, images.shape[0] - j)
+                Logger.info(f"Computing Jacobian-based weights approximation for image samples "
+                            f"{sum(passes_num_images) + 1}-{sum(passes_num_images) + pass_num_images} "
+                            f"out of {num_images}...")
+                # Note that in GPTQ loss weights computation we assume that there aren't replacement output
+                # nodes, therefore, output_list is just the graph outputs, and we don't need the tuning factor
+                # for defining the output weights (since the output layer is not a compare point).
+                pass_ip_gradients = self.fw_impl.model_grad(self.graph_float,
+                                                            {inode: self.fw_impl.to_tensor(images[j:j + pass_num_images])
+                                                             for inode in self.graph_float.get_inputs()},
+                                                            self.compare_points,
+                                                            output_list=model_output_replacement,
+                                                            all_outputs_indices=[],
+                                                            alpha=0,
+                                                            norm_weights=hessian_weights_config.norm_weights,
+                                                            n_iter=hessian_weights_config.hessians_n_iter,
+                                                            n_probes=hessian_weights_config.hessians_n_probes)
+                points_apprx_jacobians_weights.append(pass_ip_gradients)
+                passes_num_images.append(pass_num_images)
+        return np.average(points_apprx_jacobians_weights, axis=0, weights=passes_num_images)
+
     @staticmethod
-    def _generate_images_batch(representative_data_gen: Callable, num_samples_for_loss: int) -> np.ndarray:
+    def _generate_images_batch(representative_data_gen: Callable,
+                               num_samples_for_loss: int,
+                               ram_budget: int = None) -> ActivationStore:
         """
         Construct batches of image samples for inference.
 
         Args:
             representative_data_gen: A callable method to retrieve images from Dataset.
             num_samples_for_loss: Num of total images for evaluation.
+            ram_budget: Maximal number of bytes of images to keep in RAM (the rest are spilled to disk).
+                If None, all the images are kept in RAM.
 
-        Returns: A tensor of images batches
+        Returns: A store of images batches
         """
         # First, select images to use for all measurements.
         samples_count = 0  # Number of images we used so far to compute the distance matrix.
-        images = []
+        images = ActivationStore(ram_budget=ram_budget)
         for inference_batch_input in representative_data_gen():
             if samples_count >= num_samples_for_loss:
                 break
@@ -200,8 +248,46 @@ class GPTQTrainer(ABC):
                 Logger.warning(f'Not enough images in representative dataset to generate {num_samples_for_loss} data points, '
                                f'only {samples_count} were generated')
 
-        return np.concatenate(images, axis=0)
+        return images
+
+    def get_training_data_function(self, representative_data_gen: Callable) -> Callable:
+        """
+        Args:
+            representative_data_gen: Dataset generator to get images.
+
+        Returns: A callable that returns an iterator over the training batches of an epoch: a data pipeline over
+        the representative dataset (if a data pipeline is configured in the GPTQ config), or the representative
+        dataset generator itself.
+        """
+        if self.gptq_config.data_config is None:
+            return representative_data_gen
+        return GPTQDataPipeline(representative_data_gen, self.gptq_config.data_config)
+
+    def is_log_step(self, step: int) -> bool:
+        """
+        Args:
+            step: Index of a training step.
 
+        Returns: Whether to call the GPTQ config's log function in the training step.
+        """
+        return self.gptq_config.log_function is not None and step % self.gptq_config.log_interval == 0
+
+    def get_float_outputs_cache(self) -> FloatOutputsCache:
+        """
+        Creates a cache of the float model's outputs on the representative dataset batches, to replay them in
+        the training epochs after the first one (if caching is enabled in the GPTQ config).
+
+        Returns: A cache of the float model's outputs, or None if caching is disabled.
+        """
+        if not self.gptq_config.cache_float_outputs:
+            return None
+        if self.gptq_config.data_config is not None and self.gptq_config.data_config.shuffle:
+            Logger.warning('Caching the float model outputs is not supported with shuffled training batches, '
+                           'so the float model outputs are computed in every epoch.')
+            return None
+        return FloatOutputsCache(to_numpy=self.fw_impl.to_numpy,
+                                 to_tensor=self.fw_impl.to_tensor,
+                                 ram_budget=self.gptq_config.float_outputs_ram_budget)
 
     @abstractmethod
     def build_gptq_model(self):
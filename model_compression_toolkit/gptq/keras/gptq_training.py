@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import time
 from typing import Callable, List, Tuple, Union
 
 import tensorflow as tf
@@ -246,7 +247,7 @@ class KerasGPTQTrainer(GPTQTrainer):
         # Training loop
         # ----------------------------------------------
         if self.has_params_to_train:
-            self.micro_training_loop(representative_data_gen,
+            self.micro_training_loop(self.get_training_data_function(representative_data_gen),
                                      compute_gradients,
                                      self.optimizer_with_param,
                                      self.gptq_config.n_epochs,
@@ -274,6 +275,38 @@ class KerasGPTQTrainer(GPTQTrainer):
                                                       training=is_training)
         return loss_value_step, grads
 
+    @tf.function
+    def float_model_step(self, input_data):
+        """
+        Runs the float model, wrapped by a tf.function for acceleration.
+        Args:
+            input_data: input data for the step.
+
+        Returns:
+            The float model's outputs.
+
+        """
+        return self.float_model(input_data)
+
+    @tf.function
+    def nano_training_step_with_float_outputs(self, y_float, input_data, in_compute_gradients,
+                                              in_optimizer_with_param, is_training):
+        """
+        This function run part of the training step given the float model's outputs (e.g., replayed from a cache),
+        wrapped by a tf.function for acceleration.
+        Args:
+            y_float: the float model's outputs on the input data.
+            input_data: input data for the step.
+            in_compute_gradients: A callable function that compute the gradients.
+            in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
+            is_training: A boolean flag stating if the network is running in training mode.
+
+        Returns:
+            loss value and gradients
+
+        """
+        return in_compute_gradients(y_float, input_data, in_optimizer_with_param, training=is_training)
+
     def micro_training_loop(self,
                             data_function: Callable,
                             in_compute_gradients: Callable,
@@ -292,21 +325,43 @@ class KerasGPTQTrainer(GPTQTrainer):
         Returns: None
 
         """
+        float_outputs_cache = self.get_float_outputs_cache()
+        step_profiler = self.gptq_config.step_profiler
+        step = 0
         for _ in tqdm(range(n_epochs)):
+            # The losses are kept as tensors during the epoch, and are copied to numpy once per epoch.
+            epoch_losses = []
             for data in tqdm(data_function()):
+                step_start = time.perf_counter() if step_profiler is not None else None
                 input_data = [d * self.input_scale for d in data]
 
-                loss_value_step, grads = self.nano_training_step(input_data, in_compute_gradients,
-                                                                 in_optimizer_with_param, is_training)
+                if float_outputs_cache is None:
+                    loss_value_step, grads = self.nano_training_step(input_data, in_compute_gradients,
+                                                                     in_optimizer_with_param, is_training)
+                else:
+                    y_float = float_outputs_cache.get_outputs(input_data,
+                                                              lambda: self.float_model_step(input_data))
+                    loss_value_step, grads = self.nano_training_step_with_float_outputs(y_float,
+                                                                                        input_data,
+                                                                                        in_compute_gradients,
+                                                                                        in_optimizer_with_param,
+                                                                                        is_training)
                 # Run one step of gradient descent by updating
                 # the value of the variables to minimize the loss.
                 for i, (o, p) in enumerate(in_optimizer_with_param):
                     o.apply_gradients(zip(grads[i], p))
-                if self.gptq_config.log_function is not None:
+                if self.is_log_step(step):
                     self.gptq_config.log_function(loss_value_step, grads[0], in_optimizer_with_param[0][-1],
                                                   self.compare_points)
-                self.loss_list.append(loss_value_step.numpy())
+                epoch_losses.append(loss_value_step)
+                if step_profiler is not None:
+                    step_profiler(step, time.perf_counter() - step_start)
+                step += 1
+            if len(epoch_losses) > 0:
+                self.loss_list.extend(list(tf.stack(epoch_losses).numpy()))
                 Logger.debug(f'last loss value: {self.loss_list[-1]}')
+            if float_outputs_cache is not None:
+                float_outputs_cache.end_epoch()
 
     def update_graph(self):
         """
@@ -331,6 +386,8 @@ class KerasGPTQTrainer(GPTQTrainer):
                     layer.weights_quantizers[kernel_attribute].update_layer_quantization_params(layer)
                 for weight_attr, weight in weights.items():
                     node.set_weights_by_keys(weight_attr, weight.numpy())
+                if node.final_weights_quantization_cfg.compact_quantized_weights:
+                    node.compact_quantized_weights_by_keys(kernel_attribute)
                 for config_attr, config_value in weight_quant_config.items():
                     node.final_weights_quantization_cfg.set_quant_config_attr(config_attr, config_value)
                 for config_attr, config_value in activation_quant_config.items():
@@ -202,7 +202,9 @@ if FOUND_TF:
 
         tb_w = _init_tensorboard_writer(fw_info)
 
-        fw_impl = GPTQKerasImplemantation()
+        fw_impl = GPTQKerasImplemantation(
+            compiled_inference=core_config.quantization_config.compiled_inference,
+            jit_compile=core_config.quantization_config.compiled_inference_jit_compile)
 
         tg, bit_widths_config = core_runner(in_model=in_model,
                                             representative_data_gen=representative_data_gen,
@@ -18,6 +18,7 @@ import numpy as np
 from torch.nn import Module
 from tqdm import tqdm
 import copy
+import time
 import torch
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PyTorchModelBuilder
@@ -179,19 +180,23 @@ class PytorchGPTQTrainer(GPTQTrainer):
         # ----------------------------------------------
         # Training loop
         # ----------------------------------------------
-        self.micro_training_loop(representative_data_gen, self.gptq_config.n_epochs)
+        self.micro_training_loop(self.get_training_data_function(representative_data_gen),
+                                 self.gptq_config.n_epochs)
 
     def compute_gradients(self,
                           y_float: List[torch.Tensor],
-                          input_tensors: List[torch.Tensor]) -> Tuple[torch.Tensor, List[np.ndarray]]:
+                          input_tensors: List[torch.Tensor],
+                          return_grads: bool = True) -> Tuple[torch.Tensor, List[np.ndarray]]:
         """
         Get outputs from both teacher and student networks. Compute the observed error,
         and use it to compute the gradients and applying them to the student weights.
         Args:
             y_float: A list of reference tensor from the floating point network.
             input_tensors: A list of Input tensors to pass through the networks.
+            return_grads: Whether to copy the gradients to numpy arrays and return them (copying the gradients
+                from the device stalls the training, so it is done only when they are logged).
         Returns:
-            Loss and gradients.
+            Loss and gradients (None if return_grads is False).
         """
 
         # Forward-pass
@@ -213,6 +218,9 @@ class PytorchGPTQTrainer(GPTQTrainer):
         # Back-pass
         loss_value.backward()
 
+        if not return_grads:
+            return loss_value, None
+
         # Get gradients
         grads = []
         for param in self.fxp_model.parameters():
@@ -230,22 +238,40 @@ class PytorchGPTQTrainer(GPTQTrainer):
             data_function: A callable function that give a batch of samples.
             n_epochs: Number of update iterations of representative dataset.
         """
+        float_outputs_cache = self.get_float_outputs_cache()
+        step_profiler = self.gptq_config.step_profiler
+        step = 0
         for _ in tqdm(range(n_epochs)):
+            # The losses are kept on the device during the epoch, and are copied to the host once per epoch.
+            epoch_losses = []
             for data in tqdm(data_function()):
+                step_start = time.perf_counter() if step_profiler is not None else None
                 input_data = [d * self.input_scale for d in data]
                 input_tensor = to_torch_tensor(input_data)
-                y_float = self.float_model(input_tensor)  # running float model
-                loss_value, grads = self.compute_gradients(y_float, input_tensor)
+                # running float model (or replaying its outputs on the batch)
+                y_float = self.float_model(input_tensor) if float_outputs_cache is None else \
+                    float_outputs_cache.get_outputs(input_data, lambda: self.float_model(input_tensor))
+                is_log_step = self.is_log_step(step)
+                loss_value, grads = self.compute_gradients(y_float, input_tensor, return_grads=is_log_step)
                 # Run one step of gradient descent by updating the value of the variables to minimize the loss.
                 for (optimizer, _) in self.optimizer_with_param:
                     optimizer.step()
                     optimizer.zero_grad()
-                if self.gptq_config.log_function is not None:
+                if is_log_step:
                     self.gptq_config.log_function(loss_value.item(),
-                                                  torch_tensor_to_numpy(grads),
+                                                  grads,
                                                   torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
-                self.loss_list.append(loss_value.item())
+                epoch_losses.append(loss_value.detach())
+                if step_profiler is not None:
+                    if torch.cuda.is_available():
+                        torch.cuda.synchronize()  # pragma: no cover
+                    step_profiler(step, time.perf_counter() - step_start)
+                step += 1
+            if len(epoch_losses) > 0:
+                self.loss_list.extend(torch_tensor_to_numpy(torch.stack(epoch_losses)).tolist())
                 Logger.debug(f'last loss value: {self.loss_list[-1]}')
+            if float_outputs_cache is not None:
+                float_outputs_cache.end_epoch()
 
     def update_graph(self) -> Graph:
         """
@@ -269,6 +295,8 @@ class PytorchGPTQTrainer(GPTQTrainer):
                     layer.weights_quantizers[kernel_attribute].update_layer_quantization_params(layer)
                 for weight_attr, weight in weights.items():
                     node.set_weights_by_keys(weight_attr, self.fw_impl.to_numpy(weight))
+                if node.final_weights_quantization_cfg.compact_quantized_weights:
+                    node.compact_quantized_weights_by_keys(kernel_attribute)
                 for config_attr, config_value in weight_quant_config.items():
                     node.final_weights_quantization_cfg.set_quant_config_attr(config_attr, config_value)
                 for config_attr, config_value in activation_quant_config.items():
@@ -0,0 +1,191 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Dict, Set, Tuple
+
+from model_compression_toolkit.target_platform_capabilities.target_platform.op_quantization_config import \
+    QuantizationConfigOptions
+from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.attribute_filter import \
+    Filter, AttributeFilter, OrAttributeFilter, AndAttributeFilter
+from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.layer_filter_params import \
+    LayerFilterParams
+
+# Marks an attribute that is missing from a layer's configuration in a configuration signature.
+_MISSING_ATTR = object()
+
+
+class QuantizationConfigOptionsResolver:
+    """
+    Resolves the QuantizationConfigOptions of nodes according to the mappings of a TargetPlatformCapabilities from
+    layers and LayerFilterParams to QuantizationConfigOptions.
+
+    The LayerFilterParams are bucketed by their layer type, so a node is checked only against the filters of its
+    type (a node with no filters of its type is resolved by its type alone). The result of a node with filters of its
+    type is memoized by the node's type and the values of the attributes the filters of its type check, so nodes
+    with the same type and the same values of these attributes are resolved once.
+    """
+
+    def __init__(self,
+                 layer2qco: Dict[Any, QuantizationConfigOptions],
+                 filterlayer2qco: Dict[LayerFilterParams, QuantizationConfigOptions],
+                 default_qco: QuantizationConfigOptions):
+        """
+        Args:
+            layer2qco: Mapping from layers to their QuantizationConfigOptions.
+            filterlayer2qco: Mapping from LayerFilterParams to their QuantizationConfigOptions (in the order the
+                filters should be checked).
+            default_qco: QuantizationConfigOptions of nodes that match no layer and no LayerFilterParams.
+        """
+        self.layer2qco = layer2qco
+        self.default_qco = default_qco
+
+        # For each layer type: its filters (in the order they are checked), and the attributes they check (or None
+        # if a condition of the filters checks attributes that can not be determined, so results can not be memoized).
+        self._type2filters = {}
+        self._type2attrs = {}
+        for fl, qco in filterlayer2qco.items():
+            self._type2filters.setdefault(fl.layer, []).append((fl, qco))
+        for layer_type, filters in self._type2filters.items():
+            attrs = set()
+            for fl, _ in filters:
+                fl_attrs = _get_filter_params_attrs(fl)
+                attrs = None if attrs is None or fl_attrs is None else attrs.union(fl_attrs)
+            self._type2attrs[layer_type] = None if attrs is None else sorted(attrs)
+
+        self._memo = {}
+
+    def resolve(self, node: Any) -> QuantizationConfigOptions:
+        """
+        Get the QuantizationConfigOptions of a node: the options of the first LayerFilterParams the node matches,
+        or else the options of the node's layer type, or else the default options.
+
+        Args:
+            node: Node to get its QuantizationConfigOptions.
+
+        Returns:
+            QuantizationConfigOptions of the node.
+        """
+        filters = self._type2filters.get(node.type)
+        if filters is None:
+            return self.layer2qco.get(node.type, self.default_qco)
+
+        key = self._get_memo_key(node)
+        if key is not None and key in self._memo:
+            return self._memo[key]
+
+        qco = None
+        for fl, fl_qco in filters:
+            if node.is_match_filter_params(fl):
+                qco = fl_qco
+                break
+        if qco is None:
+            qco = self.layer2qco.get(node.type, self.default_qco)
+
+        if key is not None:
+            self._memo[key] = qco
+        return qco
+
+    def _get_memo_key(self, node: Any) -> Tuple:
+        """
+        Args:
+            node: Node with filters of its type.
+
+        Returns:
+            A key of the node's type and the values of the attributes the filters of its type check, or None if the
+            node's result can not be memoized (the attributes are unknown, or have unhashable values).
+        """
+        attrs = self._type2attrs[node.type]
+        if attrs is None:
+            return None
+
+        # The layer's configuration the filters check (as in BaseNode.is_match_filter_params).
+        layer_config = node.framework_attr
+        if hasattr(node, "op_call_kwargs"):
+            layer_config.update(node.op_call_kwargs)
+
+        signature = []
+        for attr in attrs:
+            value = layer_config.get(attr, _MISSING_ATTR)
+            frozen_value = _freeze(value)
+            if frozen_value is None:
+                return None
+            signature.append(frozen_value)
+        return node.type, tuple(signature)
+
+
+def _get_filter_params_attrs(layer_filter_params: LayerFilterParams) -> Set[str]:
+    """
+    Args:
+        layer_filter_params: LayerFilterParams.
+
+    Returns:
+        The attributes of a layer's configuration that the LayerFilterParams checks, or None if they can not be
+        determined.
+    """
+    attrs = set(layer_filter_params.kwargs.keys())
+    for c in layer_filter_params.conditions:
+        c_attrs = _get_condition_attrs(c)
+        if c_attrs is None:
+            return None
+        attrs.update(c_attrs)
+    return attrs
+
+
+def _get_condition_attrs(condition: Filter) -> Set[str]:
+    """
+    Args:
+        condition: A filter of a layer's configuration.
+
+    Returns:
+        The attributes of a layer's configuration that the filter checks, or None if they can not be determined.
+    """
+    if isinstance(condition, AttributeFilter):
+        return {condition.attr}
+    if isinstance(condition, (OrAttributeFilter, AndAttributeFilter)):
+        attrs = set()
+        for f in condition.filters:
+            f_attrs = _get_condition_attrs(f)
+            if f_attrs is None:
+                return None
+            attrs.update(f_attrs)
+        return attrs
+    return None
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Args:
+        value: Value of an attribute of a layer's configuration.
+
+    Returns:
+        A hashable representation of the value and its type (so values that are equal but have different types,
+        such as 1 and True, are distinguished), or None if the value has no such representation.
+    """
+    if value is _MISSING_ATTR:
+        return (_MISSING_ATTR,)
+    if isinstance(value, (list, tuple)):
+        frozen_items = [_freeze(v) for v in value]
+        if any([v is None for v in frozen_items]):
+            return None
+        return type(value), tuple(frozen_items)
+    if isinstance(value, dict):
+        frozen_items = [(k, _freeze(v)) for k, v in value.items()]
+        if any([v is None for _, v in frozen_items]):
+            return None
+        return type(value), frozenset(frozen_items)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return type(value), value
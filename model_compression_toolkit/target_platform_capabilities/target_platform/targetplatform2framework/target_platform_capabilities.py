@@ -23,6 +23,8 @@ from model_compression_toolkit.target_platform_capabilities.target_platform.targ
     OperationsToLayers, OperationsSetToLayers
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.target_platform_capabilities_component import TargetPlatformCapabilitiesComponent
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.layer_filter_params import LayerFilterParams
+from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.qco_resolver import \
+    QuantizationConfigOptionsResolver
 from model_compression_toolkit.target_platform_capabilities.immutable import ImmutableClass
 from model_compression_toolkit.target_platform_capabilities.target_platform.op_quantization_config import QuantizationConfigOptions, \
     OpQuantizationConfig
@@ -53,6 +55,7 @@ class TargetPlatformCapabilities(ImmutableClass):
         self.tp_model = tp_model
         self.op_sets_to_layers = OperationsToLayers() # Init an empty OperationsToLayers
         self.layer2qco, self.filterlayer2qco = {}, {} # Init empty mappings from layers/LayerFilterParams to QC options
+        self.qco_resolver = QuantizationConfigOptionsResolver(self.layer2qco, self.filterlayer2qco, tp_model.default_qco)
         # Track the unused opsets for warning purposes.
         self.__tp_model_opsets_not_used = [s.name for s in tp_model.operator_set]
         self.remove_fusing_names_from_not_used_list()
@@ -149,6 +152,9 @@ class TargetPlatformCapabilities(ImmutableClass):
             raise exc_value
         self.raise_warnings()
         self.layer2qco, self.filterlayer2qco = self._get_config_options_mapping()
+        self.qco_resolver = QuantizationConfigOptionsResolver(self.layer2qco,
+                                                              self.filterlayer2qco,
+                                                              self.tp_model.default_qco)
         _current_tpc.reset()
         self.initialized_done()
         return self
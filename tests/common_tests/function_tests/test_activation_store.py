@@ -0,0 +1,117 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import gc
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.activation_store import ActivationStore
+from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
+
+
+def get_samples():
+    np.random.seed(0)
+    return [[np.random.randn(2, 8).astype(np.float32), np.random.randn(2, 4).astype(np.float32)]
+            for _ in range(4)]
+
+
+class TestActivationStore(unittest.TestCase):
+
+    def _assert_samples_equal(self, store, samples):
+        self.assertEqual(len(store), len(samples))
+        for stored, sample in zip(store, samples):
+            self.assertIsInstance(stored, list)
+            self.assertEqual(len(stored), len(sample))
+            for s, a in zip(stored, sample):
+                self.assertTrue(np.array_equal(s, a))
+
+    def test_ram_store(self):
+        samples = get_samples()
+        store = ActivationStore()
+        for sample in samples:
+            store.append(sample)
+        self._assert_samples_equal(store, samples)
+        self.assertEqual(store.ram_bytes, sum([a.nbytes for sample in samples for a in sample]))
+        self.assertEqual(store.disk_bytes, 0)
+        self.assertIs(store[0][0], samples[0][0])
+
+    def test_spilled_store(self):
+        samples = get_samples()
+        # The budget fits the first sample only.
+        store = ActivationStore(ram_budget=sum([a.nbytes for a in samples[0]]))
+        for sample in samples:
+            store.append(sample)
+        self._assert_samples_equal(store, samples)
+        self.assertEqual(store.ram_bytes, sum([a.nbytes for a in samples[0]]))
+        self.assertEqual(store.disk_bytes, sum([a.nbytes for sample in samples[1:] for a in sample]))
+        self.assertNotIsInstance(store[0][0], np.memmap)
+        self.assertIsInstance(store[1][0], np.memmap)
+
+        shards_directory = store._shards_directory
+        self.assertEqual(len(os.listdir(shards_directory)), 6)
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertFalse(os.path.exists(shards_directory))
+
+    def test_nested_samples(self):
+        store = ActivationStore(ram_budget=0)
+        sample = (np.arange(3), [np.ones((2, 2)), (np.zeros(1),)])
+        store.append(sample)
+        stored = store[0]
+        self.assertIsInstance(stored, tuple)
+        self.assertIsInstance(stored[1], list)
+        self.assertIsInstance(stored[1][1], tuple)
+        self.assertTrue(np.array_equal(stored[0], np.arange(3)))
+        self.assertTrue(np.array_equal(stored[1][0], np.ones((2, 2))))
+        self.assertTrue(np.array_equal(stored[1][1][0], np.zeros(1)))
+        self.assertEqual(store.append(np.ones(2)), 1)
+        self.assertTrue(np.array_equal(store[1], np.ones(2)))
+
+    def test_shards_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ActivationStore(ram_budget=0, directory=directory)
+            store.append([np.ones(4)])
+            self.assertEqual(os.listdir(directory), ['0_0.npy'])
+            store.clear()
+            # The given directory is kept, and only the store's shards are deleted.
+            self.assertTrue(os.path.exists(directory))
+            self.assertEqual(os.listdir(directory), [])
+
+        store = ActivationStore(ram_budget=0)
+        store.append([np.ones(4)])
+        shards_directory = store._shards_directory
+        del store
+        gc.collect()
+        # A temporary shards directory is deleted with the store.
+        self.assertFalse(os.path.exists(shards_directory))
+
+    def test_gptq_images_store(self):
+        samples = get_samples()
+
+        def representative_data_gen():
+            for sample in samples:
+                yield sample
+
+        images = GPTQTrainer._generate_images_batch(representative_data_gen, num_samples_for_loss=5, ram_budget=0)
+        self.assertEqual(len(images), 3)
+        self.assertEqual(images.ram_bytes, 0)
+        self.assertTrue(np.array_equal(np.concatenate(list(images), axis=0),
+                                       np.concatenate([s[0] for s in samples], axis=0)[:5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
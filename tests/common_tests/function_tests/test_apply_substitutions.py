@@ -0,0 +1,222 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+from model_compression_toolkit.core.common import BaseNode, BaseSubstitution
+from model_compression_toolkit.core.common.graph.base_graph import Graph, OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.graph.graph_matchers import NodeOperationMatcher, EdgeMatcher, \
+    WalkMatcher, NodeFrameworkAttrMatcher
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute, NodeTypesIndex
+
+
+class Conv:
+    pass
+
+
+class BatchNorm:
+    pass
+
+
+class ReLU:
+    pass
+
+
+class Identity:
+    pass
+
+
+def build_node(name, layer_class):
+    return BaseNode(name=name, framework_attr={}, input_shape=(), output_shape=(), weights={},
+                    layer_class=layer_class)
+
+
+def build_graph(n_blocks):
+    # Blocks of conv -> batch norm -> relu -> identity, between an input and an output node.
+    nodes = [build_node('input', Identity)]
+    for i in range(n_blocks):
+        nodes += [build_node(f'conv{i}', Conv), build_node(f'bn{i}', BatchNorm), build_node(f'relu{i}', ReLU),
+                  build_node(f'identity{i}', Identity)]
+    nodes.append(build_node('output', ReLU))
+    edges = [Edge(nodes[i], nodes[i + 1], 0, 0) for i in range(len(nodes) - 1)]
+    return Graph('blocks', nodes, [nodes[0]], [OutTensor(nodes[-1], 0)], edges)
+
+
+def replace_node(graph, node, new_node):
+    graph.add_node(new_node)
+    graph.reconnect_in_edges(node, new_node)
+    graph.reconnect_out_edges(node, new_node)
+    graph.remove_node(node)
+
+
+def remove_node(graph, node):
+    source = graph.get_prev_nodes(node)[0]
+    for e in graph.out_edges(node):
+        graph.add_edge(source, e.sink_node, **e.get_attributes())
+        graph.remove_edge(node, e.sink_node)
+    graph.remove_edge(source, node)
+    graph.remove_node(node)
+
+
+class FoldBatchNorm(BaseSubstitution):
+    def __init__(self):
+        super().__init__(WalkMatcher([NodeOperationMatcher(Conv), NodeOperationMatcher(BatchNorm)]))
+
+    def substitute(self, graph, nodes):
+        remove_node(graph, nodes[1])
+        return graph
+
+
+class ReplaceConv(BaseSubstitution):
+    def __init__(self):
+        super().__init__(NodeOperationMatcher(Conv))
+
+    def substitute(self, graph, node):
+        # The new node is added at the end of the graph's nodes.
+        replace_node(graph, node, build_node(node.name + '_replaced', Conv))
+        return graph
+
+
+class RemoveIdentityAfterReLU(BaseSubstitution):
+    def __init__(self):
+        super().__init__(EdgeMatcher(NodeOperationMatcher(ReLU) | NodeOperationMatcher(BatchNorm),
+                                     NodeOperationMatcher(Identity)))
+
+    def substitute(self, graph, edge):
+        remove_node(graph, edge[1])
+        return graph
+
+
+class ReaddNodes(BaseSubstitution):
+    def __init__(self):
+        super().__init__(NodeOperationMatcher(ReLU) & NodeFrameworkAttrMatcher('readd', True).logic_not())
+
+    def substitute(self, graph, node):
+        # Remove the node and add it again, which moves it to the end of the graph's nodes.
+        if node in graph.get_inputs() or node in [o.node for o in graph.get_outputs()]:
+            return graph
+        node.framework_attr['readd'] = True
+        in_edges, out_edges = graph.incoming_edges(node), graph.out_edges(node)
+        graph.remove_edges_from([(e.source_node, e.sink_node) for e in in_edges + out_edges])
+        graph.remove_node(node)
+        graph.add_node(node)
+        graph.add_edges_from([(e.source_node, e.sink_node, e.get_attributes()) for e in in_edges + out_edges])
+        return graph
+
+
+class ReLUToIdentity(BaseSubstitution):
+    def __init__(self):
+        super().__init__(NodeOperationMatcher(ReLU))
+
+    def substitute(self, graph, node):
+        # Change the node's type in place.
+        node.layer_class = Identity
+        return graph
+
+
+class RecordMatches(BaseSubstitution):
+    def __init__(self, matcher, matches):
+        super().__init__(matcher)
+        self.matches = matches
+
+    def substitute(self, graph, match):
+        self.matches.append([n.name for n in match if isinstance(n, BaseNode)] if isinstance(match, (list, tuple))
+                            else match.name)
+        return graph
+
+
+def substitute_by_searching_all_nodes(graph, substitutions_list):
+    for substitution in substitutions_list:
+        for match in graph.filter(substitution.matcher_instance):
+            graph = substitution.substitute(graph, match)
+    return graph
+
+
+class TestApplySubstitutions(unittest.TestCase):
+
+    def test_candidate_types(self):
+        conv, bn = NodeOperationMatcher(Conv), NodeOperationMatcher(BatchNorm)
+        self.assertEqual(conv.get_candidate_types(), {Conv})
+        self.assertEqual((conv | bn).get_candidate_types(), {Conv, BatchNorm})
+        self.assertEqual((conv & NodeFrameworkAttrMatcher('a', 1)).get_candidate_types(), {Conv})
+        self.assertIsNone((conv | NodeFrameworkAttrMatcher('a', 1)).get_candidate_types())
+        self.assertIsNone(conv.logic_not().get_candidate_types())
+        self.assertEqual(EdgeMatcher(conv, bn).get_candidate_types(), {Conv})
+        self.assertEqual(WalkMatcher([bn, conv]).get_candidate_types(), {BatchNorm})
+
+    def test_substitutions_match_full_search(self):
+        # Recording the matches of each type after the substitutions checks the order of the indexed nodes.
+        matchers = [NodeOperationMatcher(Conv), NodeOperationMatcher(ReLU) | NodeOperationMatcher(Identity),
+                    EdgeMatcher(NodeOperationMatcher(Conv), NodeOperationMatcher(ReLU)),
+                    WalkMatcher([NodeOperationMatcher(ReLU), NodeOperationMatcher(Conv)])]
+        matches, expected_matches = [], []
+        substitutions = [FoldBatchNorm(), ReplaceConv(), RemoveIdentityAfterReLU(), ReaddNodes(), ReplaceConv()]
+
+        graph = build_graph(8)
+        expected_graph = substitute_by_searching_all_nodes(copy.deepcopy(graph),
+                                                           copy.deepcopy(substitutions) +
+                                                           [RecordMatches(m, expected_matches) for m in matchers])
+        graph = substitute(graph, substitutions + [RecordMatches(m, matches) for m in matchers])
+
+        self.assertEqual([n.name for n in graph.nodes], [n.name for n in expected_graph.nodes])
+        self.assertEqual([(u.name, v.name) for u, v in graph.edges()],
+                         [(u.name, v.name) for u, v in expected_graph.edges()])
+        self.assertEqual(matches, expected_matches)
+        self.assertEqual(len([n for n in graph.nodes if n.type == BatchNorm]), 0)
+
+    def test_index_update(self):
+        graph = build_graph(2)
+        index = NodeTypesIndex(graph)
+        self.assertEqual([n.name for n in index.get_candidates({Conv, BatchNorm})], ['conv0', 'bn0', 'conv1', 'bn1'])
+        self.assertIsNone(index.get_candidates(None))
+
+        ReplaceConv().substitute(graph, graph.find_node_by_name('conv0')[0])
+        index.update()
+        self.assertEqual([n.name for n in index.get_candidates({Conv, BatchNorm})],
+                         ['bn0', 'conv1', 'bn1', 'conv0_replaced'])
+
+    def test_node_type_changed_in_place(self):
+        graph = build_graph(2)
+        index = NodeTypesIndex(graph)
+        graph.find_node_by_name('relu0')[0].layer_class = Identity
+        index.update()
+        self.assertEqual([n.name for n in index.get_candidates({ReLU})], ['relu1', 'output'])
+        self.assertEqual([n.name for n in index.get_candidates({Identity})],
+                         ['input', 'relu0', 'identity0', 'identity1'])
+
+        # Substitutions that follow a substitution which changes nodes' types match the nodes by their new types.
+        matches, expected_matches = [], []
+        substitutions = [ReLUToIdentity(), ReplaceConv()]
+        matchers = [NodeOperationMatcher(ReLU), NodeOperationMatcher(Identity),
+                    EdgeMatcher(NodeOperationMatcher(Identity), NodeOperationMatcher(Identity))]
+        graph = build_graph(3)
+        expected_graph = substitute_by_searching_all_nodes(copy.deepcopy(graph),
+                                                           copy.deepcopy(substitutions) +
+                                                           [RecordMatches(m, expected_matches) for m in matchers])
+        substitute(graph, substitutions + [RecordMatches(m, matches) for m in matchers])
+        self.assertEqual([n.name for n in graph.nodes], [n.name for n in expected_graph.nodes])
+        self.assertEqual(matches, expected_matches)
+        self.assertTrue(len(matches) > 0)
+
+    def test_profiler(self):
+        profile = []
+        substitute(build_graph(3), [FoldBatchNorm(), ReplaceConv()],
+                   profiler=lambda substitution, n_matches, duration: profile.append((type(substitution), n_matches)))
+        self.assertEqual(profile, [(FoldBatchNorm, 3), (ReplaceConv, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
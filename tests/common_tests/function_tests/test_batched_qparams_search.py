@@ -0,0 +1,142 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import qparams_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    get_threshold_selection_tensor_error_function, get_threshold_selection_tensor_batch_error_function
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    qparams_selection_tensor_search, qparams_symmetric_selection_tensor_search, \
+    qparams_uniform_selection_tensor_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
+    get_tensor_min
+from model_compression_toolkit.constants import THRESHOLD
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+
+ERROR_METHODS = [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.MAE, qc.QuantizationErrorMethod.LP]
+N_BITS = 4
+CHANNEL_AXIS = 3
+
+
+def search_thresholds(x, error_method, per_channel, batched, error_sample_size=None):
+    """
+    Runs the power-of-two, symmetric and uniform tensor searches, and returns their results.
+    """
+    error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.SYMMETRIC, error_method, p=3)
+    kwargs = {'batch_error_function': get_threshold_selection_tensor_batch_error_function(error_method, p=3)
+              if batched else None,
+              'error_sample_size': error_sample_size}
+    pot_threshold = qparams_selection_tensor_search(error_function, x, N_BITS, per_channel, CHANNEL_AXIS, **kwargs)
+    symmetric_threshold = qparams_symmetric_selection_tensor_search(error_function, x,
+                                                                    get_tensor_max(x, per_channel, CHANNEL_AXIS,
+                                                                                   N_BITS),
+                                                                    N_BITS, per_channel, CHANNEL_AXIS, **kwargs)
+    range_min, range_max = qparams_uniform_selection_tensor_search(error_function, x,
+                                                                   get_tensor_min(x, per_channel, CHANNEL_AXIS),
+                                                                   get_tensor_max(x, per_channel, CHANNEL_AXIS,
+                                                                                  N_BITS,
+                                                                                  is_uniform_quantization=True),
+                                                                   N_BITS, per_channel, CHANNEL_AXIS, **kwargs)
+    return [pot_threshold, symmetric_threshold, range_min, range_max]
+
+
+class TestBatchedQparamsSearch(unittest.TestCase):
+
+    def test_batched_search_equals_sequential_search(self):
+        np.random.seed(0)
+        # A heavy-tailed tensor, so the selected parameters are clipping the tensor.
+        x = np.random.randn(3, 3, 4, 6) ** 3
+        for error_method in ERROR_METHODS:
+            for per_channel in [False, True]:
+                sequential_res = search_thresholds(x, error_method, per_channel, batched=False)
+                batched_res = search_thresholds(x, error_method, per_channel, batched=True)
+                for s, b in zip(sequential_res, batched_res):
+                    self.assertTrue(np.array_equal(s, b), f'Batched search result differs for {error_method} '
+                                                          f'with per_channel={per_channel}')
+
+    def test_batched_search_chunks(self):
+        np.random.seed(1)
+        x = np.random.randn(3, 3, 4, 6) ** 3
+        batched_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, True, batched=True)
+        # Chunks of a single candidate (or less) give the same results as a single chunk.
+        with patch.object(qparams_search, 'QPARAMS_SEARCH_BATCH_MAX_BYTES', 16):
+            chunked_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, True, batched=True)
+        for b, c in zip(batched_res, chunked_res):
+            self.assertTrue(np.array_equal(b, c))
+
+    def test_large_kernel_batches(self):
+        np.random.seed(4)
+        # A kernel with more elements than a per-element budget of 2 ** 16 elements would allow in a chunk.
+        x = np.random.randn(3, 3, 128, 64) ** 3
+        chunk_sizes = []
+        quantize_tensor = qparams_search.quantize_tensor
+
+        def recording_quantize_tensor(tensor, thresholds, *args, **kwargs):
+            if tensor.ndim == 2:  # A batched pass (the tensor is reshaped to (channels, elements))
+                chunk_sizes.append(len(thresholds))
+            return quantize_tensor(tensor, thresholds, *args, **kwargs)
+
+        for per_channel in [False, True]:
+            chunk_sizes.clear()
+            with patch.object(qparams_search, 'quantize_tensor', recording_quantize_tensor):
+                batched_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel, batched=True)
+            self.assertTrue(max(chunk_sizes) > 1, f'Candidates were not batched (per_channel={per_channel})')
+            self.assertTrue(max(chunk_sizes) * x.nbytes <= qparams_search.QPARAMS_SEARCH_BATCH_MAX_BYTES)
+
+            sequential_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel, batched=False)
+            for s, b in zip(sequential_res, batched_res):
+                self.assertTrue(np.array_equal(s, b))
+
+    def test_no_batch_error_function_for_kl(self):
+        self.assertIsNone(get_threshold_selection_tensor_batch_error_function(qc.QuantizationErrorMethod.KL, p=2))
+
+    def test_sampled_error_estimation(self):
+        np.random.seed(2)
+        x = np.random.randn(3, 3, 64, 8)
+        for per_channel in [False, True]:
+            full_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel, batched=True)
+            # A sample size which is not smaller than the tensor does not change the search.
+            res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel, batched=True,
+                                    error_sample_size=x.size)
+            for f, r in zip(full_res, res):
+                self.assertTrue(np.array_equal(f, r))
+
+            # The sampled estimation is deterministic and close to the full search.
+            sampled_res = search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel, batched=True,
+                                            error_sample_size=256)
+            self.assertTrue(all([np.array_equal(s1, s2) for s1, s2 in
+                                 zip(sampled_res, search_thresholds(x, qc.QuantizationErrorMethod.MSE, per_channel,
+                                                                    batched=True, error_sample_size=256))]))
+            for f, s in zip(full_res, sampled_res):
+                self.assertTrue(np.allclose(f, s, rtol=0.5), f'Sampled search result is far from the full '
+                                                             f'search result (per_channel={per_channel})')
+
+    def test_selection_with_error_sample_size(self):
+        np.random.seed(3)
+        x = np.random.randn(3, 3, 16, 4)
+        threshold = symmetric_selection_tensor(x, p=2, n_bits=8, per_channel=True, channel_axis=CHANNEL_AXIS,
+                                               error_sample_size=32)[THRESHOLD]
+        self.assertEqual(threshold.shape, (1, 1, 1, 4))
+        self.assertTrue(np.all(threshold <= get_tensor_max(x, True, CHANNEL_AXIS, 8) * 1.2))
+
+
+if __name__ == '__main__':
+    unittest.main()
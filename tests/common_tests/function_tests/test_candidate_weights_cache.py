@@ -0,0 +1,101 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.candidate_weights_cache import CandidateWeightsCache
+from model_compression_toolkit.core.common.quantization.compact_weights import CompactWeights
+
+
+def get_quantized_weights(n_bits, channels_axis=3, shape=(3, 3, 4, 8)):
+    np.random.seed(n_bits)
+    w = np.random.randn(*shape).astype(np.float32)
+    reduce_axes = tuple([i for i in range(len(shape)) if i != channels_axis])
+    scale = np.max(np.abs(w), axis=reduce_axes, keepdims=True) / (2 ** (n_bits - 1))
+    return (np.clip(np.round(w / scale), -2 ** (n_bits - 1), 2 ** (n_bits - 1) - 1) * scale).astype(np.float32)
+
+
+class TestCandidateWeightsCache(unittest.TestCase):
+
+    def test_compact_weights(self):
+        for channels_axis, shape in [(None, (3, 3, 4, 8)), (0, (3, 3, 4, 8)), (3, (3, 3, 4, 8)), (3, (3, 3, 3, 8))]:
+            q_w = get_quantized_weights(4, channels_axis=channels_axis, shape=shape)
+            compact_weights = CompactWeights(q_w, channels_axis)
+            # Up to 16 levels per channel are packed in 4 bits.
+            self.assertTrue(compact_weights.packed)
+            self.assertEqual(compact_weights.codes.nbytes, compact_weights.levels.shape[0] *
+                             int(np.ceil(q_w.size / compact_weights.levels.shape[0] / 2)))
+            self.assertTrue(compact_weights.nbytes < q_w.nbytes)
+            decompressed = compact_weights.decompress()
+            self.assertEqual(decompressed.dtype, q_w.dtype)
+            self.assertTrue(np.array_equal(decompressed, q_w))
+
+        q_w = get_quantized_weights(8, shape=(3, 3, 16, 8))
+        compact_weights = CompactWeights(q_w, channels_axis=3)
+        self.assertFalse(compact_weights.packed)
+        self.assertEqual(compact_weights.codes.dtype, np.uint8)
+        self.assertTrue(np.array_equal(compact_weights.decompress(), q_w))
+
+        # More than 256 levels are coded in 16 bits.
+        q_w = get_quantized_weights(10, channels_axis=0, shape=(2, 4096))
+        compact_weights = CompactWeights(q_w, channels_axis=0)
+        self.assertEqual(compact_weights.codes.dtype, np.uint16)
+        self.assertTrue(np.array_equal(compact_weights.decompress(), q_w))
+
+    def test_lru_eviction(self):
+        weights = {i: get_quantized_weights(8 - i) for i in range(3)}
+        nbytes = weights[0].nbytes
+        # The budget fits two candidates weights.
+        cache = CandidateWeightsCache(max_bytes=2 * nbytes)
+        owner_id = cache.new_owner_id()
+
+        def _get(i):
+            return cache.get(owner_id, i, lambda: weights[i])
+
+        for i in [0, 1, 0, 2]:
+            self.assertTrue(np.array_equal(_get(i), weights[i]))
+        self.assertEqual(cache.num_quantizations, 3)
+        self.assertEqual(cache.nbytes, 2 * nbytes)
+        # Candidate 1 was the least recently used, so it was evicted.
+        _get(0)
+        _get(2)
+        self.assertEqual(cache.num_quantizations, 3)
+        _get(1)
+        self.assertEqual(cache.num_quantizations, 4)
+
+        # Candidates of different owners do not collide.
+        self.assertTrue(np.array_equal(cache.get(cache.new_owner_id(), 1, lambda: weights[2]), weights[2]))
+
+        # Weights that exceed the budget are not cached.
+        small_cache = CandidateWeightsCache(max_bytes=nbytes - 1)
+        small_cache.get(0, 0, lambda: weights[0])
+        self.assertEqual(len(small_cache), 0)
+
+    def test_compact_cache(self):
+        weights = get_quantized_weights(4, shape=(3, 3, 32, 8))
+        cache = CandidateWeightsCache(max_bytes=weights.nbytes, compact=True)
+        self.assertTrue(np.array_equal(cache.get(0, 0, lambda: weights, channels_axis=3), weights))
+        self.assertTrue(cache.nbytes < weights.nbytes / 2)
+        self.assertTrue(np.array_equal(cache.get(0, 0, lambda: None, channels_axis=3), weights))
+
+        # Float weights are not smaller in the compact form, and are kept as is.
+        float_weights = np.random.randn(16, 16).astype(np.float32)
+        cache.get(1, 0, lambda: float_weights)
+        self.assertIs(cache.get(1, 0, lambda: None), float_weights)
+
+
+if __name__ == '__main__':
+    unittest.main()
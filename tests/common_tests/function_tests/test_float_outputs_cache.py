@@ -0,0 +1,95 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCache
+
+
+def get_batches(num_batches, seed=0):
+    np.random.seed(seed)
+    return [[np.random.randn(2, 8).astype(np.float32)] for _ in range(num_batches)]
+
+
+def float_model(input_data):
+    return [2 * input_data[0], input_data[0].sum(axis=-1)]
+
+
+class CountingFloatModel:
+
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self, input_data):
+        self.num_calls += 1
+        return float_model(input_data)
+
+
+class TestFloatOutputsCache(unittest.TestCase):
+
+    def _run_epoch(self, cache, model, batches):
+        outputs = [cache.get_outputs(batch, lambda: model(batch)) for batch in batches]
+        cache.end_epoch()
+        for batch, batch_outputs in zip(batches, outputs):
+            for output, expected in zip(batch_outputs, float_model(batch)):
+                self.assertTrue(np.array_equal(output, expected))
+
+    def _get_cache(self, ram_budget=None):
+        return FloatOutputsCache(to_numpy=lambda x: x, to_tensor=lambda x: x, ram_budget=ram_budget)
+
+    def test_replay(self):
+        batches = get_batches(4)
+        model = CountingFloatModel()
+        cache = self._get_cache()
+        for _ in range(3):
+            self._run_epoch(cache, model, batches)
+        self.assertTrue(cache.enabled)
+        self.assertEqual(model.num_calls, len(batches))
+        self.assertEqual(cache.num_replays, 2 * len(batches))
+
+    def test_replay_spilled_outputs(self):
+        batches = get_batches(4)
+        model = CountingFloatModel()
+        # The budget fits the outputs of the first batch only.
+        cache = self._get_cache(ram_budget=sum([o.nbytes for o in float_model(batches[0])]))
+        for _ in range(2):
+            self._run_epoch(cache, model, batches)
+        self.assertTrue(cache.enabled)
+        self.assertEqual(model.num_calls, len(batches))
+
+    def test_fallback_on_different_batches(self):
+        model = CountingFloatModel()
+        cache = self._get_cache()
+        self._run_epoch(cache, model, get_batches(4, seed=0))
+        self._run_epoch(cache, model, get_batches(4, seed=1))
+        self._run_epoch(cache, model, get_batches(4, seed=0))
+        self.assertFalse(cache.enabled)
+        self.assertEqual(model.num_calls, 12)
+        self.assertEqual(cache.num_replays, 0)
+
+    def test_fallback_on_different_number_of_batches(self):
+        batches = get_batches(4)
+        model = CountingFloatModel()
+        cache = self._get_cache()
+        self._run_epoch(cache, model, batches)
+        self._run_epoch(cache, model, batches[:3])
+        self.assertFalse(cache.enabled)
+        self._run_epoch(cache, model, batches)
+        self.assertEqual(model.num_calls, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@
 import numpy as np
 import os
 import shutil
+import tempfile
 import unittest
 from PIL import Image
 from pathlib import Path
@@ -59,5 +60,91 @@ class TestFolderLoader(unittest.TestCase):
                               batch_size=sample_batch)
 
 
+class TestParallelFolderLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.images = {}
+        for i in range(4):
+            img = np.full((32, 48, 3), 10 * i, dtype=np.uint8)
+            path = os.path.join(self.folder, f'img{i}.png')
+            Image.fromarray(img).save(path)
+            self.images[path] = img
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _assert_batch(self, batch, preprocess=lambda x: x):
+        self.assertEqual(batch.shape, (sample_batch, 32, 48, 3))
+        expected_images = [preprocess(img) for img in self.images.values()]
+        for img in batch:
+            self.assertTrue(any([np.array_equal(img, e) for e in expected_images]))
+
+    def test_parallel_prefetching_loader(self):
+        imgs_loader = FolderImageLoader(folder=self.folder,
+                                        preprocessing=[lambda x: x.astype(np.float32) / 255],
+                                        batch_size=sample_batch,
+                                        num_workers=3,
+                                        prefetch_batches=2)
+        for _ in range(4):
+            self._assert_batch(imgs_loader.sample(), lambda x: x.astype(np.float32) / 255)
+        imgs_loader.close()
+
+    def test_seed(self):
+        def sample_batches(**kwargs):
+            imgs_loader = FolderImageLoader(folder=self.folder, preprocessing=[], batch_size=sample_batch, seed=3,
+                                            **kwargs)
+            batches = [imgs_loader.sample() for _ in range(4)]
+            imgs_loader.close()
+            return batches
+
+        batches = sample_batches()
+        # The images are sampled by the loader's random generator, so the global random state does not affect them.
+        np.random.seed(0)
+        prefetched_batches = sample_batches(num_workers=2, prefetch_batches=2)
+        for batch, prefetched_batch in zip(batches, prefetched_batches):
+            self.assertTrue(np.array_equal(batch, prefetched_batch))
+
+    def test_decoded_images_cache(self):
+        img_bytes = 32 * 48 * 3
+        imgs_loader = FolderImageLoader(folder=self.folder,
+                                        preprocessing=[],
+                                        batch_size=sample_batch,
+                                        cache_bytes=2 * img_bytes)
+        for _ in range(4):
+            self._assert_batch(imgs_loader.sample())
+            self.assertTrue(0 < imgs_loader.cached_bytes <= 2 * img_bytes)
+
+        # Cached images are not decoded again.
+        imgs_loader.image_list = imgs_loader.image_list[:1]
+        imgs_loader.n_files = 1
+        imgs_loader.sample()
+        os.remove(imgs_loader.image_list[0])
+        self._assert_batch(imgs_loader.sample())
+
+    def test_inplace_preprocessing_with_cache(self):
+        def inplace_preprocess(img):
+            img += 1
+            return img
+
+        imgs_loader = FolderImageLoader(folder=self.folder,
+                                        preprocessing=[inplace_preprocess],
+                                        batch_size=sample_batch,
+                                        cache_bytes=4 * 32 * 48 * 3)
+        # In-place preprocessing does not modify the cached images, so they are preprocessed once in every sample.
+        for _ in range(4):
+            self._assert_batch(imgs_loader.sample(), lambda x: x + 1)
+
+    def test_draft_size(self):
+        path = os.path.join(self.folder, 'large.jpg')
+        Image.fromarray(np.random.randint(0, 256, (256, 320, 3), dtype=np.uint8)).save(path)
+        imgs_loader = FolderImageLoader(folder=self.folder,
+                                        preprocessing=[],
+                                        batch_size=1,
+                                        file_types=['jpg'],
+                                        draft_size=(80, 64))
+        self.assertEqual(imgs_loader.sample().shape, (1, 64, 80, 3))
+
+
 if __name__ == '__main__':
     unittest.main()
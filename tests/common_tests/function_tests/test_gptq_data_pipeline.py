@@ -0,0 +1,119 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.gptq import GPTQDataConfig
+from model_compression_toolkit.gptq.common.gptq_data_pipeline import GPTQDataPipeline
+
+NUM_BATCHES = 5
+BATCH_SIZE = 4
+
+
+class CountingDataGen:
+    """
+    A representative dataset of two inputs, where the samples of the second input are the indices of the samples.
+    """
+
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self):
+        self.num_calls += 1
+        np.random.seed(0)
+        for i in range(NUM_BATCHES):
+            images = np.random.randint(0, 256, size=(BATCH_SIZE, 3, 4, 4), dtype=np.uint8)
+            indices = np.arange(i * BATCH_SIZE, (i + 1) * BATCH_SIZE)
+            yield [images, indices]
+
+
+def get_samples():
+    return [np.concatenate(x) for x in zip(*CountingDataGen()())]
+
+
+class TestGPTQDataPipeline(unittest.TestCase):
+
+    def _get_epoch_indices(self, pipeline):
+        return [batch[1].tolist() for batch in pipeline()]
+
+    def test_original_batches(self):
+        data_gen = CountingDataGen()
+        pipeline = GPTQDataPipeline(data_gen, GPTQDataConfig())
+        for _ in range(3):
+            batches = list(pipeline())
+            self.assertEqual(len(batches), NUM_BATCHES)
+            for batch, expected in zip(batches, CountingDataGen()()):
+                for x, e in zip(batch, expected):
+                    self.assertTrue(np.array_equal(x, e))
+        self.assertEqual(data_gen.num_calls, 1)
+
+    def test_rebatching(self):
+        pipeline = GPTQDataPipeline(CountingDataGen(), GPTQDataConfig(batch_size=3, prefetch_batches=0))
+        indices = self._get_epoch_indices(pipeline)
+        self.assertEqual([len(i) for i in indices], [3] * 6 + [2])
+        self.assertEqual(sum(indices, []), list(range(NUM_BATCHES * BATCH_SIZE)))
+
+        images = get_samples()[0]
+        for batch in pipeline():
+            self.assertTrue(np.array_equal(batch[0], images[batch[1]]))
+
+    def test_shuffle(self):
+        config = GPTQDataConfig(batch_size=6, shuffle=True, seed=3)
+        pipeline = GPTQDataPipeline(CountingDataGen(), config)
+        epochs = [self._get_epoch_indices(pipeline) for _ in range(2)]
+        for epoch in epochs:
+            self.assertEqual(sorted(sum(epoch, [])), list(range(NUM_BATCHES * BATCH_SIZE)))
+        self.assertNotEqual(epochs[0], epochs[1])
+
+        # The same seed gives the same orders.
+        other_pipeline = GPTQDataPipeline(CountingDataGen(), config)
+        self.assertEqual(epochs, [self._get_epoch_indices(other_pipeline) for _ in range(2)])
+
+        images = get_samples()[0]
+        for batch in pipeline():
+            self.assertTrue(np.array_equal(batch[0], images[batch[1]]))
+
+    def test_preprocessing_of_spilled_samples(self):
+        def preprocess(batch):
+            return [batch[0].astype(np.float32) / 255, batch[1]]
+
+        # The budget fits the first batch only.
+        pipeline = GPTQDataPipeline(CountingDataGen(), GPTQDataConfig(batch_size=8, ram_budget=BATCH_SIZE * 56,
+                                                                      preprocess_fn=preprocess))
+        images = get_samples()[0]
+        for batch in pipeline():
+            self.assertEqual(batch[0].dtype, np.float32)
+            self.assertTrue(np.allclose(batch[0], images[batch[1]] / 255))
+        self.assertTrue(pipeline._store.disk_bytes > 0)
+
+    def test_prefetch_error(self):
+        def preprocess(batch):
+            raise ValueError('preprocessing error')
+
+        pipeline = GPTQDataPipeline(CountingDataGen(), GPTQDataConfig(preprocess_fn=preprocess))
+        with self.assertRaises(ValueError):
+            list(pipeline())
+
+    def test_stop_consuming_prefetched_batches(self):
+        pipeline = GPTQDataPipeline(CountingDataGen(), GPTQDataConfig(batch_size=1, prefetch_batches=1))
+        batches = pipeline()
+        next(batches)
+        batches.close()
+        self.assertEqual(len(list(pipeline())), NUM_BATCHES * BATCH_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
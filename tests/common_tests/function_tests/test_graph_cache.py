@@ -0,0 +1,126 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import networkx as nx
+
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.graph.base_graph import Graph, OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+
+
+class ConfigurableTestNode(BaseNode):
+    """
+    Node with fixed weights/activation configurability (instead of quantization configuration candidates).
+    """
+
+    def __init__(self, name, weights_configurable=False, activation_configurable=False):
+        super().__init__(name=name, framework_attr={}, input_shape=(), output_shape=(), weights={},
+                         layer_class=None)
+        self.weights_configurable = weights_configurable
+        self.activation_configurable = activation_configurable
+
+    def is_weights_quantization_enabled(self) -> bool:
+        return self.weights_configurable
+
+    def is_all_weights_candidates_equal(self) -> bool:
+        return False
+
+    def is_activation_quantization_enabled(self) -> bool:
+        return self.activation_configurable
+
+    def is_all_activation_candidates_equal(self) -> bool:
+        return False
+
+
+def build_chain_graph(n_nodes):
+    nodes = [ConfigurableTestNode(f'node{i}', weights_configurable=i % 2 == 0, activation_configurable=i % 3 == 0)
+             for i in range(n_nodes)]
+    edges = [Edge(nodes[i], nodes[i + 1], 0, 0) for i in range(n_nodes - 1)]
+    # Add nodes in reversed order so the nodes iteration order is different from the topological order.
+    return Graph('chain', list(reversed(nodes)), [nodes[0]], [OutTensor(nodes[-1], 0)], edges), nodes
+
+
+class TestGraphCache(unittest.TestCase):
+
+    def test_topo_sort_cache(self):
+        graph, nodes = build_chain_graph(10)
+        self.assertEqual(graph.get_topo_sorted_nodes(), nodes)
+        self.assertEqual(graph.get_topo_sorted_nodes(), list(nx.topological_sort(graph)))
+        self.assertEqual([graph.get_node_topo_index(n) for n in nodes], list(range(10)))
+
+        # Modifying the returned list should not affect the graph's cache.
+        graph.get_topo_sorted_nodes().pop()
+        self.assertEqual(len(graph.get_topo_sorted_nodes()), 10)
+
+    def test_cache_invalidation(self):
+        graph, nodes = build_chain_graph(5)
+        version = graph.cache_version
+        graph.get_topo_sorted_nodes()
+
+        # Insert a new node between the first two nodes.
+        new_node = ConfigurableTestNode('new_node', weights_configurable=True)
+        graph.reconnect_out_edges(nodes[0], new_node)
+        graph.add_node_with_in_edges(new_node, [nodes[0]])
+        self.assertTrue(graph.cache_version > version)
+        self.assertEqual(graph.get_topo_sorted_nodes(), [nodes[0], new_node] + nodes[1:])
+        self.assertEqual(graph.get_node_topo_index(new_node), 1)
+        self.assertEqual(graph.get_configurable_sorted_nodes_names(),
+                         ['node0', 'new_node', 'node2', 'node3', 'node4'])
+
+        # Remove the new node.
+        version = graph.cache_version
+        graph.reconnect_out_edges(new_node, nodes[0])
+        graph.remove_edge(nodes[0], new_node)
+        graph.remove_node(new_node)
+        self.assertTrue(graph.cache_version > version)
+        self.assertEqual(graph.get_topo_sorted_nodes(), nodes)
+        self.assertEqual(graph.get_configurable_sorted_nodes_names(), ['node0', 'node2', 'node3', 'node4'])
+
+    def test_configurable_nodes(self):
+        graph, nodes = build_chain_graph(10)
+        expected_weights = [n for n in nodes if n.weights_configurable]
+        expected_activation = [n for n in nodes if n.activation_configurable]
+        expected_configurable = [n for n in nodes if n.weights_configurable or n.activation_configurable]
+
+        self.assertEqual(graph.get_sorted_weights_configurable_nodes(), expected_weights)
+        self.assertEqual(graph.get_sorted_activation_configurable_nodes(), expected_activation)
+        self.assertEqual(graph.get_configurable_sorted_nodes(), expected_configurable)
+        self.assertEqual(graph.get_configurable_nodes_index(),
+                         {n.name: i for i, n in enumerate(expected_configurable)})
+        self.assertNotIn('node1', graph.get_configurable_nodes_index())
+
+        # The configurable nodes depend on the nodes' candidates, so they are not cached, and changing the nodes
+        # configurations in-place does not require an invalidation.
+        version = graph.cache_version
+        nodes[1].activation_configurable = True
+        self.assertEqual(graph.get_configurable_nodes_index()['node1'], 1)
+        self.assertEqual(graph.get_sorted_activation_configurable_nodes(),
+                         [nodes[0], nodes[1]] + expected_activation[1:])
+        self.assertEqual(graph.cache_version, version)
+
+    def test_deepcopy_cache(self):
+        graph, nodes = build_chain_graph(5)
+        graph.get_configurable_sorted_nodes()
+        copied_graph = copy.deepcopy(graph)
+        copied_nodes = copied_graph.get_topo_sorted_nodes()
+        self.assertEqual([n.name for n in copied_nodes], [n.name for n in nodes])
+        self.assertTrue(all([copied_graph.get_node_topo_index(n) == i for i, n in enumerate(copied_nodes)]))
+        self.assertTrue(all([n in copied_nodes for n in copied_graph.get_configurable_sorted_nodes()]))
+
+
+if __name__ == '__main__':
+    unittest.main()
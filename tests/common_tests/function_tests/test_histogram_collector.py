@@ -16,7 +16,11 @@
 
 import unittest
 import numpy as np
-from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, interpolate_histogram
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, \
+    interpolate_histogram, rebin_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_histogram
+from model_compression_toolkit.constants import THRESHOLD
 
 
 class TestHistogramCollector(unittest.TestCase):
@@ -54,6 +58,80 @@ class TestHistogramCollector(unittest.TestCase):
         interpolate_histogram(bins, b, c)
         self.assertTrue(True)  # Just check it works
 
+    def test_rebin_histogram(self):
+        x = np.random.rand(1000)
+        c, b = np.histogram(x, bins=16)
+        merged_b, merged_c = rebin_histogram(b, c, -1.0, 2.0)
+        self.assertEqual(len(merged_c), 16)
+        self.assertEqual(merged_c.sum(), c.sum())
+        self.assertTrue(merged_b[0] <= -1.0 and merged_b[-1] >= 2.0)
+        # New bins edges are aligned with the original bins edges.
+        n_original_bins = (merged_b - b[0]) / (b[1] - b[0])
+        self.assertTrue(np.allclose(n_original_bins, np.round(n_original_bins)))
+
+    def test_streaming_same(self):
+        hc = HistogramCollector(streaming=True)
+        x = np.random.rand(1, 2, 3, 4)
+        for i in range(100):
+            hc.update(x)
+
+        bins, counts = hc.get_histogram()
+        self.assertEqual(len(counts), 2048)
+        self.assertEqual(counts.sum(), 100 * x.size)
+        self.assertTrue(np.isclose(np.max(x), hc.max(), atol=(x.max() - x.min()) / 2048))
+        self.assertTrue(np.isclose(np.min(x), hc.min()))
+
+    def test_streaming_update_hist(self):
+        hc = HistogramCollector(streaming=True)
+        x = 0.1 * np.random.rand(1, 2, 3, 4) + 0.1
+        hc.update(x)
+        for i in range(1000):
+            x = np.random.rand(1, 2, 3, 4)
+            hc.update(x)
+        bins, counts = hc.get_histogram()
+        self.assertEqual(len(counts), 2048)
+        self.assertEqual(counts.sum(), 1001 * x.size)
+        self.assertTrue(hc.max() > 0.9)
+        self.assertTrue(hc.min() < 0.1)
+
+    def test_streaming_same_value(self):
+        hc = HistogramCollector(streaming=True)
+        x = np.ones([100, 100])
+        hc.update(x)
+        self.assertTrue(hc.max() == 1.0)
+        self.assertTrue(hc.min() == 1.0)
+
+    def test_merge(self):
+        for streaming in [False, True]:
+            hc, hc1, hc2 = [HistogramCollector(streaming=streaming) for _ in range(3)]
+            for i in range(20):
+                x = np.random.randn(2, 8, 8, 3) * (i + 1)
+                hc.update(x)
+                (hc1 if i % 2 else hc2).update(x)
+            hc1.merge(hc2)
+            bins, counts = hc.get_histogram()
+            merged_bins, merged_counts = hc1.get_histogram()
+            self.assertTrue(np.isclose(merged_counts.sum(), counts.sum()))
+            bin_width = max(bins[1] - bins[0], merged_bins[1] - merged_bins[0])
+            self.assertTrue(np.isclose(hc.max(), hc1.max(), atol=2 * bin_width))
+            self.assertTrue(np.isclose(hc.min(), hc1.min(), atol=2 * bin_width))
+
+    def test_streaming_threshold_tolerance(self):
+        # Thresholds that are selected using the streaming histogram should be close to the thresholds that are
+        # selected using the per-iteration histograms (up to about two bins of the streaming histogram).
+        hc = HistogramCollector()
+        streaming_hc = HistogramCollector(streaming=True)
+        for i in range(50):
+            x = np.random.randn(4, 8, 8, 3) * (1 + i / 10)
+            hc.update(x)
+            streaming_hc.update(x)
+        bins, counts = hc.get_histogram()
+        streaming_bins, streaming_counts = streaming_hc.get_histogram()
+        threshold = symmetric_selection_histogram(bins, counts, 2, 8, None, None, min_threshold=1e-8)[THRESHOLD]
+        streaming_threshold = symmetric_selection_histogram(streaming_bins, streaming_counts, 2, 8, None, None,
+                                                            min_threshold=1e-8)[THRESHOLD]
+        self.assertTrue(np.isclose(threshold, streaming_threshold, atol=2 * (streaming_bins[1] - streaming_bins[0])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import \
+    power_of_two_selection, symmetric_selection, uniform_selection
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    _mse_error_histogram, _mae_error_histogram, _lp_error_histogram, _kl_error_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.histogram_error_engine import \
+    HistogramErrorEngine
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import uniform_quantize_tensor
+
+RANGES_MIN = np.array([-3., -1., -10., -0.3, 0., -0.01])
+RANGES_MAX = np.array([2., 1.5, 12., 0.5, 4., 0.01])
+
+
+def get_histogram(seed, n_bins=1024):
+    np.random.seed(seed)
+    # A heavy-tailed distribution, so the candidate ranges are clipping the histogram.
+    counts, bins = np.histogram(np.random.randn(20000) ** 3, bins=n_bins)
+    return bins, counts
+
+
+class TestHistogramErrorEngine(unittest.TestCase):
+
+    def test_errors_equal_histogram_error_functions(self):
+        bins, counts = get_histogram(0)
+        engine = HistogramErrorEngine(bins, counts)
+        for n_bits in [2, 4, 8]:
+            q_bins = [uniform_quantize_tensor(bins, range_min, range_max, n_bits)
+                      for range_min, range_max in zip(RANGES_MIN, RANGES_MAX)]
+            q_counts = [np.histogram(q, bins=bins, weights=np.concatenate([counts, [0]]))[0] for q in q_bins]
+
+            self.assertTrue(np.allclose(engine.mse(RANGES_MIN, RANGES_MAX, n_bits),
+                                        [_mse_error_histogram(q, None, bins, counts) for q in q_bins]))
+            self.assertTrue(np.allclose(engine.mae(RANGES_MIN, RANGES_MAX, n_bits),
+                                        [_mae_error_histogram(q, None, bins, counts) for q in q_bins]))
+            for p in [1, 2, 3]:
+                self.assertTrue(np.allclose(engine.lp(RANGES_MIN, RANGES_MAX, n_bits, p),
+                                            [_lp_error_histogram(q, None, bins, counts, p) for q in q_bins]))
+            self.assertTrue(np.allclose(engine.kl(RANGES_MIN, RANGES_MAX, n_bits, RANGES_MIN, RANGES_MAX),
+                                        [_kl_error_histogram(q, q_c, bins, counts, range_min, range_max)
+                                         for q, q_c, range_min, range_max in
+                                         zip(q_bins, q_counts, RANGES_MIN, RANGES_MAX)]))
+
+    def test_kl_out_of_histogram_range(self):
+        bins, counts = get_histogram(1)
+        engine = HistogramErrorEngine(bins, counts)
+        kl = engine.kl(np.array([-1.]), np.array([1.]), 8, np.array([bins[-1] + 1]), np.array([bins[-1] + 2]))
+        self.assertTrue(np.isinf(kl[0]))
+
+    def test_histogram_selection_equals_sequential_selection(self):
+        bins, counts = get_histogram(2, n_bins=256)
+        selection_fns = [power_of_two_selection.power_of_two_selection_histogram,
+                         symmetric_selection.symmetric_selection_histogram,
+                         uniform_selection.uniform_selection_histogram]
+        for error_method in [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.MAE,
+                             qc.QuantizationErrorMethod.LP, qc.QuantizationErrorMethod.KL]:
+            for selection_fn in selection_fns:
+                batched_res = selection_fn(bins, counts, 3, 4, None, None, quant_error_method=error_method)
+                # Without the histogram error engine the candidates are evaluated one by one.
+                sequential_res = selection_fn(bins, counts, 3, 4, None, None, quant_error_method=error_method,
+                                              histogram_error_engine=False)
+                # The KL-divergence is computed in float32 (as in _kl_error_histogram) with a different summation
+                # order, so nearly tied candidates may be selected differently.
+                rtol = 1e-3 if error_method == qc.QuantizationErrorMethod.KL else 1e-5
+                for k in sequential_res:
+                    self.assertTrue(np.isclose(batched_res[k], sequential_res[k], rtol=rtol),
+                                    f'Batched histogram search result differs for {error_method} in '
+                                    f'{selection_fn.__name__}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.integer_executor.integer_kernels import requantize, int_matmul, \
+    conv2d_nhwc, get_same_padding, max_pool2d_nhwc, sum_pool2d_nhwc
+from model_compression_toolkit.core.common.integer_executor.integer_ops import IntegerAdd, IntegerLUTActivation, \
+    IntegerConv2D, SAME, sigmoid
+from model_compression_toolkit.core.common.integer_executor.integer_tensor import IntegerTensor, \
+    IntegerQuantizationParams
+
+
+def reference_conv2d(x, kernel, strides, padding, dilations, groups):
+    # Direct (loop) convolution to validate the vectorized kernels.
+    x = np.pad(x, [(0, 0), padding[0], padding[1], (0, 0)])
+    kh, kw, group_in, c_out = kernel.shape
+    group_out = c_out // groups
+    h_out = (x.shape[1] - (kh - 1) * dilations[0] - 1) // strides[0] + 1
+    w_out = (x.shape[2] - (kw - 1) * dilations[1] - 1) // strides[1] + 1
+    out = np.zeros((x.shape[0], h_out, w_out, c_out), dtype=np.int64)
+    for o in range(c_out):
+        g = o // group_out
+        for i in range(kh):
+            for j in range(kw):
+                window = x[:, i * dilations[0]::strides[0], j * dilations[1]::strides[1],
+                           g * group_in:(g + 1) * group_in][:, :h_out, :w_out]
+                out[..., o] += (window * kernel[i, j, :, o]).sum(-1)
+    return out
+
+
+class TestIntegerKernels(unittest.TestCase):
+
+    def test_requantize(self):
+        np.random.seed(0)
+        x = np.random.randint(-2 ** 24, 2 ** 24, size=1000).astype(np.int64)
+        multipliers = np.random.uniform(1e-6, 2, size=1000)
+        expected = np.round(x * multipliers)
+        self.assertLessEqual(np.abs(requantize(x, multipliers) - expected).max(), 1)
+        # Ties of exact multipliers (powers of two) are rounded to even.
+        self.assertTrue(np.array_equal(requantize(np.array([-3, -1, 1, 3, 5]), 0.5), [-2, 0, 0, 2, 2]))
+
+    def test_int_matmul(self):
+        np.random.seed(0)
+        a = np.random.randint(-128, 128, size=(50, 300)).astype(np.int64)
+        b = np.random.randint(-128, 128, size=(300, 20)).astype(np.int64)
+        self.assertTrue(np.array_equal(int_matmul(a, b), np.matmul(a, b)))
+
+    def test_conv2d(self):
+        np.random.seed(0)
+        x = np.random.randint(-128, 128, size=(2, 11, 9, 8)).astype(np.int64)
+        for groups, c_out, strides, dilations in [(1, 6, (1, 1), (1, 1)),
+                                                  (2, 6, (2, 1), (1, 2)),
+                                                  (8, 8, (2, 2), (1, 1)),
+                                                  (8, 16, (1, 1), (2, 2))]:
+            kernel = np.random.randint(-128, 128, size=(3, 3, 8 // groups, c_out)).astype(np.int64)
+            padding = [get_same_padding(x.shape[1], 3, strides[0], dilations[0]),
+                       get_same_padding(x.shape[2], 3, strides[1], dilations[1])]
+            self.assertTrue(np.array_equal(conv2d_nhwc(x, kernel, strides, padding, dilations, groups),
+                                           reference_conv2d(x, kernel, strides, padding, dilations, groups)))
+
+    def test_pooling(self):
+        x = np.arange(2 * 5 * 5 * 3).reshape(2, 5, 5, 3).astype(np.int64) - 40
+        padding = [get_same_padding(5, 2, 2), get_same_padding(5, 2, 2)]
+        max_pooled = max_pool2d_nhwc(x, (2, 2), (2, 2), padding, np.iinfo(np.int64).min)
+        self.assertEqual(max_pooled.shape, (2, 3, 3, 3))
+        self.assertTrue(np.array_equal(max_pooled[:, :2, :2], x[:, 1:4:2, 1:4:2]))
+        sums, counts = sum_pool2d_nhwc(x, (2, 2), (2, 2), padding, count_include_pad=False)
+        self.assertTrue(np.array_equal(counts[0, :, :, 0], [[4, 4, 2], [4, 4, 2], [2, 2, 1]]))
+        self.assertTrue(np.array_equal(sums[:, 2, 2], x[:, 4, 4]))
+
+    def test_add_rescaling(self):
+        np.random.seed(0)
+        a_params = IntegerQuantizationParams(0.05, 3, 0, 255, 8)
+        b_params = IntegerQuantizationParams(0.013, 0, -128, 127, 8)
+        out_params = IntegerQuantizationParams(0.07, 0, -128, 127, 8)
+        a = IntegerTensor.from_float(np.random.uniform(-0.1, 12, 1000), a_params)
+        b = IntegerTensor.from_float(np.random.uniform(-1.6, 1.6, 1000), b_params)
+        out = IntegerAdd()([a, b], out_params)
+        expected = out_params.quantize(a.dequantize().astype(np.float64) + b.dequantize())
+        self.assertLessEqual(np.abs(out.values - expected).max(), 1)
+        self.assertGreater(np.mean(out.values == expected), 0.99)
+
+    def test_lut_activation(self):
+        in_params = IntegerQuantizationParams(8 / 128, 0, -128, 127, 8)
+        out_params = IntegerQuantizationParams(1 / 256, 0, 0, 255, 8)
+        x = IntegerTensor(np.arange(-128, 128), in_params.scale, 0, in_params)
+        out = IntegerLUTActivation(sigmoid)([x], out_params)
+        self.assertTrue(np.array_equal(out.values, out_params.quantize(sigmoid(x.dequantize()))))
+
+    def test_conv_accumulator(self):
+        np.random.seed(0)
+        in_params = IntegerQuantizationParams(0.1, 0, -128, 127, 8)
+        x = IntegerTensor.from_float(np.random.uniform(-5, 5, (1, 6, 6, 4)), in_params)
+        kernel = np.random.randint(-127, 128, size=(3, 3, 4, 5)).astype(np.int64)
+        kernel_scale = np.random.uniform(0.001, 0.01, 5)
+        bias = np.random.uniform(-1, 1, 5)
+        out = IntegerConv2D(kernel, kernel_scale, 8, bias=bias, padding=SAME, lower_bound=0)([x], None)
+        self.assertFalse(out.is_quantized)
+        # The accumulator is the exact integer convolution with a rounded bias.
+        acc = conv2d_nhwc(x.values, kernel, (1, 1), [(1, 1), (1, 1)])
+        acc += np.round(bias / (in_params.scale * kernel_scale)).astype(np.int64)
+        self.assertTrue(np.array_equal(out.values, np.maximum(acc, 0)))
+        self.assertTrue(np.allclose(out.dequantize(), np.maximum(acc, 0) * in_params.scale * kernel_scale))
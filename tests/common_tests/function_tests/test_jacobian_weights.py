@@ -0,0 +1,76 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.constants import MIN_JACOBIANS_ITER, JACOBIANS_COMP_TOLERANCE
+from model_compression_toolkit.core.common.jacobian_weights import JacobianTraceAccumulator, \
+    average_jacobian_weights
+
+
+def sequential_jacobian_trace(samples, n_iter):
+    """
+    Reference approximation that draws a single sample at a time.
+    """
+    trace_jv = []
+    for j in range(n_iter):
+        jac_trace_approx = samples[j]
+        if j > MIN_JACOBIANS_ITER:
+            new_mean = np.mean([jac_trace_approx, *trace_jv])
+            delta = new_mean - np.mean(trace_jv)
+            if np.abs(delta) / (np.abs(new_mean) + 1e-6) < JACOBIANS_COMP_TOLERANCE:
+                trace_jv.append(jac_trace_approx)
+                break
+        trace_jv.append(jac_trace_approx)
+    return np.mean(trace_jv)
+
+
+class TestJacobianWeights(unittest.TestCase):
+
+    def test_accumulator_matches_sequential_stop(self):
+        np.random.seed(0)
+        n_iter, num_images, num_ipts = 50, 3, 5
+        # Samples with different spreads, so the approximations stop after different numbers of samples.
+        samples = np.abs(1 + np.random.randn(n_iter, num_images, num_ipts) *
+                         np.logspace(-4, 0, num_ipts)[np.newaxis, np.newaxis, :])
+        samples[:, :, 0] = 0  # Non-differentiable interest point
+
+        for n_probes in [1, 4, 7]:
+            accumulator = JacobianTraceAccumulator(num_images, num_ipts, n_iter)
+            num_passes = 0
+            while not accumulator.done:
+                probes_samples = samples[num_passes * n_probes:(num_passes + 1) * n_probes]
+                accumulator.update(probes_samples)
+                num_passes += 1
+            self.assertLessEqual(num_passes, int(np.ceil(n_iter / n_probes)))
+
+            expected = np.array([[sequential_jacobian_trace(samples[:, b, i], n_iter) for i in range(num_ipts)]
+                                 for b in range(num_images)])
+            self.assertTrue(np.allclose(accumulator.get_means(), expected))
+            self.assertTrue(np.all(accumulator.get_means()[:, 0] == 0))
+
+    def test_average_jacobian_weights(self):
+        traces = np.array([[1., 3., 5.], [2., 2., 7.]])
+        # Each image is normalized before averaging, and the output gets a constant weight.
+        weights = average_jacobian_weights(traces, all_outputs_indices=[2], alpha=0.2, norm_weights=True)
+        self.assertTrue(np.allclose(weights, [(0.2 + 0.4) / 2, (0.6 + 0.4) / 2, 0.2], atol=1e-6))
+        self.assertTrue(np.isclose(np.sum(weights), 1))
+
+        self.assertTrue(np.allclose(average_jacobian_weights(traces, [2], 0.2, norm_weights=False), [1.5, 2.5, 6.]))
+
+
+if __name__ == '__main__':
+    unittest.main()
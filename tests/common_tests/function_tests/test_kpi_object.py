@@ -20,7 +20,7 @@ from model_compression_toolkit.core import KPI
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget
 
 default_kpi = KPI()
-custom_kpi = KPI(1, 2, 3, 4)
+custom_kpi = KPI(1, 2, 3, 4, 5)
 
 
 class TestKPIObject(unittest.TestCase):
@@ -30,22 +30,26 @@ class TestKPIObject(unittest.TestCase):
         self.assertTrue(default_kpi.activation_memory, np.inf)
         self.assertTrue(default_kpi.total_memory, np.inf)
         self.assertTrue(default_kpi.bops, np.inf)
+        self.assertTrue(default_kpi.activation_max_cut_memory, np.inf)
 
         self.assertTrue(custom_kpi.weights_memory, 1)
         self.assertTrue(custom_kpi.activation_memory, 2)
         self.assertTrue(custom_kpi.total_memory, 3)
         self.assertTrue(custom_kpi.bops, 4)
+        self.assertTrue(custom_kpi.activation_max_cut_memory, 5)
 
     def test_representation(self):
         self.assertEqual(repr(default_kpi), f"Weights_memory: {np.inf}, "
                                             f"Activation_memory: {np.inf}, "
                                             f"Total_memory: {np.inf}, "
-                                            f"BOPS: {np.inf}")
+                                            f"BOPS: {np.inf}, "
+                                            f"Activation_max_cut_memory: {np.inf}")
 
         self.assertEqual(repr(custom_kpi), f"Weights_memory: {1}, "
                                            f"Activation_memory: {2}, "
                                            f"Total_memory: {3}, "
-                                           f"BOPS: {4}")
+                                           f"BOPS: {4}, "
+                                           f"Activation_max_cut_memory: {5}")
 
     def test_kpi_hold_constraints(self):
         self.assertTrue(default_kpi.holds_constraints(custom_kpi))
@@ -53,4 +57,5 @@ class TestKPIObject(unittest.TestCase):
         self.assertFalse(custom_kpi.holds_constraints({KPITarget.WEIGHTS: 1,
                                                        KPITarget.ACTIVATION: 1,
                                                        KPITarget.TOTAL: 1,
-                                                       KPITarget.BOPS: 1}))
+                                                       KPITarget.BOPS: 1,
+                                                       KPITarget.ACTIVATION_MAX_CUT: 1}))
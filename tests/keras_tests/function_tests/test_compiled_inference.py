@@ -0,0 +1,114 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_keras_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+keras = tf.keras
+layers = keras.layers
+
+INPUT_SHAPE = (2, 16, 16, 3)
+
+
+def get_model():
+    inputs = layers.Input(shape=INPUT_SHAPE[1:])
+    x = layers.Conv2D(8, 3)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    y = layers.Conv2D(8, 3, padding='same')(x)
+    x = layers.Add()([x, y])
+    outputs = layers.Conv2D(4, 3)(x)
+    return keras.Model(inputs=inputs, outputs=outputs)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+class TestCompiledInference(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(get_model(), KerasImplementation(), DEFAULT_KERAS_INFO,
+                                                                representative_dataset, generate_keras_tpc,
+                                                                input_shape=INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _get_sensitivity_evaluator(self, keras_impl, candidate_weights_cache_size=None):
+        return keras_impl.get_sensitivity_evaluator(self.graph,
+                                                    MixedPrecisionQuantizationConfigV2(
+                                                        num_of_images=4,
+                                                        use_grad_based_weights=False,
+                                                        candidate_weights_cache_size=candidate_weights_cache_size),
+                                                    representative_dataset,
+                                                    DEFAULT_KERAS_INFO)
+
+    def _compute_metrics(self, se):
+        max_cfg = self.graph.get_max_candidates_config()
+        min_cfg = self.graph.get_min_candidates_config()
+        metrics = [se.compute_metric(max_cfg), se.compute_metric(min_cfg)]
+        for node_idx in range(len(max_cfg)):
+            cfg = list(max_cfg)
+            cfg[node_idx] = min_cfg[node_idx]
+            metrics.append(se.compute_metric(cfg, [node_idx], max_cfg))
+        return metrics
+
+    def test_compiled_sensitivity_evaluation(self):
+        eager_metrics = self._compute_metrics(self._get_sensitivity_evaluator(KerasImplementation()))
+
+        for jit_compile in [False, True]:
+            keras_impl = KerasImplementation(compiled_inference=True, jit_compile=jit_compile)
+            se = self._get_sensitivity_evaluator(keras_impl)
+            compiled_metrics = self._compute_metrics(se)
+            self.assertTrue(np.allclose(eager_metrics, compiled_metrics, rtol=1e-4, atol=1e-6),
+                            f'Compiled metrics differ from eager metrics (jit_compile={jit_compile})')
+
+            # Configuring the MP model to different configurations does not retrace its inference.
+            self.assertEqual(keras_impl.compiled_inference.get_trace_count(se.model_mp), 1)
+            self.assertEqual(keras_impl.compiled_inference.get_trace_count(se.baseline_model), 1)
+
+    def test_compiled_lazy_candidate_weights(self):
+        eager_metrics = self._compute_metrics(self._get_sensitivity_evaluator(KerasImplementation()))
+
+        keras_impl = KerasImplementation(compiled_inference=True)
+        # A budget of zero bytes quantizes the candidate weights whenever a layer's bit-width is changed.
+        se = self._get_sensitivity_evaluator(keras_impl, candidate_weights_cache_size=0)
+        compiled_metrics = self._compute_metrics(se)
+        self.assertTrue(np.allclose(eager_metrics, compiled_metrics, rtol=1e-4, atol=1e-6))
+        self.assertEqual(keras_impl.compiled_inference.get_trace_count(se.model_mp), 1)
+
+    def test_compiled_model_inference(self):
+        keras_impl = KerasImplementation(compiled_inference=True)
+        model, _ = keras_impl.model_builder(self.graph, mode=ModelBuilderMode.FLOAT, append2output=None,
+                                            fw_info=DEFAULT_KERAS_INFO)
+        # Batches of different sizes (and dtypes) do not retrace the inference.
+        for batch_size in [1, 3, 5]:
+            x = np.random.randn(batch_size, *INPUT_SHAPE[1:])
+            self.assertTrue(np.allclose(keras_impl.run_model_inference(model, [x]), model([x.astype(np.float32)]),
+                                        atol=1e-5))
+        self.assertEqual(keras_impl.compiled_inference.get_trace_count(model), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
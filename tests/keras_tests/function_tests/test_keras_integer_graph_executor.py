@@ -0,0 +1,87 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.integer_executor.integer_graph_executor import IntegerGraphExecutor
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.ptq.runner import ptq_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_keras_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+layers = tf.keras.layers
+
+
+def get_model():
+    inputs = layers.Input(shape=(16, 16, 3))
+    x = layers.Conv2D(16, 3, padding='same')(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    y = layers.ZeroPadding2D(((0, 1), (0, 1)))(x)
+    y = layers.DepthwiseConv2D(3, strides=2, depth_multiplier=2)(y)
+    y = layers.ReLU(max_value=6.0)(y)
+    y = layers.Add()([y, layers.Conv2D(32, 1)(y)])
+    y = layers.Activation('swish')(y)
+    y = layers.Concatenate()([layers.MaxPooling2D(2, padding='same')(y),
+                              layers.AveragePooling2D(3, 2, padding='same')(y)])
+    y = tf.nn.relu(y)
+    pooled = layers.GlobalAveragePooling2D()(y)
+    y = layers.Flatten()(y)
+    y = layers.Dense(10, activation='sigmoid')(y)
+    return tf.keras.Model(inputs=inputs, outputs=[y, pooled])
+
+
+class TestKerasIntegerGraphExecutor(unittest.TestCase):
+
+    def representative_data_gen(self):
+        np.random.seed(0)
+        for _ in range(2):
+            yield [np.random.randn(4, 16, 16, 3).astype(np.float32)]
+
+    def test_integer_executor(self):
+        fw_impl = KerasImplementation()
+        tpc = generate_keras_tpc(name='integer_executor_test', tp_model=generate_test_tp_model({}))
+        core_config = mct.core.CoreConfig()
+        tg, _ = core_runner(get_model(), self.representative_data_gen, core_config, DEFAULT_KERAS_INFO, fw_impl,
+                            tpc)
+        tg = ptq_runner(tg, self.representative_data_gen, core_config, DEFAULT_KERAS_INFO, fw_impl, None)
+
+        x = next(self.representative_data_gen())[0]
+        # TensorFlow's fake-quantization rounds ties up.
+        executor = IntegerGraphExecutor(tg, fw_impl, DEFAULT_KERAS_INFO, round_half_to_even=False)
+        outputs = executor([x])
+
+        quantized_tg = quantize_graph_weights(copy.deepcopy(tg), DEFAULT_KERAS_INFO, fw_impl)
+        fq_model, _ = fw_impl.model_builder(quantized_tg, ModelBuilderMode.QUANTIZED, fw_info=DEFAULT_KERAS_INFO)
+        fq_outputs = [o.numpy() for o in fq_model(x)]
+
+        self.assertEqual(len(outputs), 2)
+        for output, fq_output, node in zip(outputs, fq_outputs, executor.output_nodes):
+            output_scale = executor.output_params[node].scale
+            self.assertEqual(output.shape, fq_output.shape)
+            self.assertLessEqual(np.max(np.abs(output - fq_output)), 2 * output_scale + 1e-6)
+            self.assertGreater(np.mean(np.isclose(output, fq_output)), 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
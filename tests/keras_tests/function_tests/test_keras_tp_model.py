@@ -181,6 +181,42 @@ class TestKerasTPModel(unittest.TestCase):
         self.assertEqual(tanh_qco, sevenbit_qco)
         self.assertEqual(relu_qco, default_qco)
 
+    def test_qco_resolver(self):
+        default_qco = tp.QuantizationConfigOptions([TEST_QC])
+        hm = tp.TargetPlatformModel(default_qco, name='test')
+        with hm:
+            sixbit_qco = TEST_QCO.clone_and_edit(activation_n_bits=6)
+            sevenbit_qco = TEST_QCO.clone_and_edit(activation_n_bits=7)
+            fourbit_qco = TEST_QCO.clone_and_edit(activation_n_bits=4)
+            tp.OperatorsSet("relu6", sixbit_qco)
+            tp.OperatorsSet("bounded_relu", sevenbit_qco)
+            tp.OperatorsSet("relu", fourbit_qco)
+
+        hm_keras = tp.TargetPlatformCapabilities(hm, name='fw_test')
+        with hm_keras:
+            tp.OperationsSetToLayers("relu6", [LayerFilterParams(ReLU, max_value=6),
+                                               LayerFilterParams(Activation, activation="relu6")])
+            tp.OperationsSetToLayers("bounded_relu", [LayerFilterParams(ReLU, Smaller("max_value", 6)
+                                                                        | Eq("max_value", 7))])
+            tp.OperationsSetToLayers("relu", [ReLU, LayerFilterParams(Activation, activation="relu")])
+
+        def linear_scan_qco(node):
+            for fl, qco in hm_keras.filterlayer2qco.items():
+                if node.is_match_filter_params(fl):
+                    return qco
+            return hm_keras.layer2qco.get(node.type, hm_keras.tp_model.default_qco)
+
+        nodes = [get_node(ReLU(max_value=6)), get_node(ReLU(max_value=2)), get_node(ReLU(max_value=7)),
+                 get_node(ReLU(max_value=8)), get_node(ReLU(max_value=6)), get_node(Activation('relu6')),
+                 get_node(Activation('relu')), get_node(Activation('tanh')), get_node(Conv2D(1, 1))]
+        expected_qcos = [sixbit_qco, sevenbit_qco, sevenbit_qco, fourbit_qco, sixbit_qco, sixbit_qco, fourbit_qco,
+                         default_qco, default_qco]
+        for node, expected_qco in zip(nodes, expected_qcos):
+            self.assertIs(linear_scan_qco(node), expected_qco)
+            self.assertIs(node.get_qco(hm_keras), expected_qco)
+            # Resolved again from the memoized results.
+            self.assertIs(node.get_qco(hm_keras), expected_qco)
+
     def test_opset_not_in_tp(self):
         default_qco = tp.QuantizationConfigOptions([TEST_QC])
         hm = tp.TargetPlatformModel(default_qco)
@@ -0,0 +1,158 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from tensorflow.keras.layers import Conv2D, ReLU, Input, Add, Concatenate
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core import DEFAULTCONFIG
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods import MpKpiMetric
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.max_cut_memory import \
+    get_max_cut_activation_memory, MaxCutActivationMemory
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.runner import read_model_to_graph, get_finalized_graph
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import \
+    get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_tpc_with_activation_mp_keras
+
+MP_BITWIDTH_CANDIDATES = [(8, 8), (8, 4), (8, 2)]
+
+
+def branched_model():
+    inputs = Input(shape=(8, 8, 3))
+    x = Conv2D(8, 3, padding='same')(inputs)
+    x = ReLU()(x)
+    y = Conv2D(8, 3, padding='same')(x)
+    y = ReLU()(y)
+    z = Conv2D(4, 1)(x)
+    x = Add()([x, y])
+    x = Conv2D(4, 1)(x)
+    outputs = Concatenate()([x, z])
+    return keras.Model(inputs=inputs, outputs=outputs)
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+
+def get_tpc():
+    base_config, _ = get_op_quantization_configs()
+    return get_tpc_with_activation_mp_keras(base_config=base_config,
+                                            mp_bitwidth_candidates_list=MP_BITWIDTH_CANDIDATES,
+                                            name="max_cut_kpi_test")
+
+
+def get_mp_graph(model):
+    fw_impl = KerasImplementation()
+    tpc = get_tpc()
+    graph = read_model_to_graph(model, representative_dataset, tpc, DEFAULT_KERAS_INFO, fw_impl)
+    return get_finalized_graph(graph, tpc, DEFAULTCONFIG, DEFAULT_KERAS_INFO, fw_impl=fw_impl,
+                               mixed_precision_enable=True)
+
+
+class TestMaxCutKPI(unittest.TestCase):
+
+    def test_incremental_cuts_memory(self):
+        graph = get_mp_graph(branched_model())
+        max_cut_memory = get_max_cut_activation_memory(graph)
+        self.assertTrue(get_max_cut_activation_memory(graph) is max_cut_memory)  # Cached in the graph
+
+        min_cfg = graph.get_min_candidates_config()
+        max_cfg = graph.get_max_candidates_config()
+        # Single node changes of the minimal configuration are evaluated incrementally.
+        configs = [min_cfg] + [[c if i != j else max_cfg[j] for i, c in enumerate(min_cfg)]
+                               for j in range(len(min_cfg))] + [max_cfg]
+
+        for cfg in configs:
+            # Compare the (possibly incremental) cuts memory to a computation from scratch.
+            expected_cuts_memory = max_cut_memory.cuts_sizes @ max_cut_memory._get_cfg_bytes(cfg)
+            self.assertTrue(np.allclose(max_cut_memory.compute_cuts_memory(cfg), expected_cuts_memory))
+
+        # The peak activation memory is bounded by the largest single activation tensor and the total activations.
+        for cfg in [min_cfg, max_cfg]:
+            cuts_memory = MpKpiMetric.ACTIVATION_MAX_CUT(cfg, graph, DEFAULT_KERAS_INFO, KerasImplementation())
+            activation_memory = MpKpiMetric.ACTIVATION_OUTPUT_SIZE(cfg, graph, DEFAULT_KERAS_INFO,
+                                                                   KerasImplementation())
+            self.assertTrue(max(cuts_memory) >= max(activation_memory))
+            self.assertTrue(max(cuts_memory) <= sum([n.get_total_output_params() for n in graph.nodes]) * 4)
+
+        # The KPI of an empty configuration is empty since the cuts include non-configurable nodes as well.
+        self.assertEqual(len(MpKpiMetric.ACTIVATION_MAX_CUT([], graph, DEFAULT_KERAS_INFO, KerasImplementation())), 0)
+
+    def test_cache_invalidation(self):
+        graph = get_mp_graph(branched_model())
+        max_cut_memory = get_max_cut_activation_memory(graph)
+        graph.invalidate_cache()
+        self.assertFalse(get_max_cut_activation_memory(graph) is max_cut_memory)
+
+    def test_candidates_modified_in_place(self):
+        graph = get_mp_graph(branched_model())
+        max_cfg = graph.get_max_candidates_config()
+        max_cut_memory = get_max_cut_activation_memory(graph)
+        cuts_memory = max_cut_memory.compute_cuts_memory(max_cfg)
+
+        # Disabling the activation quantization of a node (without modifying the graph's structure) keeps the cuts,
+        # but the node's activation tensors are counted as float tensors.
+        node = graph.get_sorted_activation_configurable_nodes()[0]
+        for c in node.candidates_quantization_cfg:
+            c.activation_quantization_cfg.enable_activation_quantization = False
+        self.assertTrue(get_max_cut_activation_memory(graph) is max_cut_memory)
+        mp_cfg = graph.get_max_candidates_config()
+        expected_cuts_memory = max_cut_memory.cuts_sizes @ max_cut_memory._get_cfg_bytes(mp_cfg)
+        self.assertTrue(np.allclose(max_cut_memory.compute_cuts_memory(mp_cfg), expected_cuts_memory))
+        self.assertTrue(np.all(max_cut_memory.compute_cuts_memory(mp_cfg) >= cuts_memory))
+        self.assertFalse(np.allclose(max_cut_memory.compute_cuts_memory(mp_cfg), cuts_memory))
+
+    def test_max_cut_mixed_precision_search(self):
+        model = branched_model()
+        core_config = mct.core.CoreConfig(mixed_precision_config=mct.core.MixedPrecisionQuantizationConfigV2(num_of_images=1))
+        graph = get_mp_graph(model)
+        max_cut_memory = get_max_cut_activation_memory(graph)
+        min_peak = max(max_cut_memory.compute_cuts_memory(graph.get_min_candidates_config()))
+        max_peak = max(max_cut_memory.compute_cuts_memory(graph.get_max_candidates_config()))
+        target_kpi = KPI(activation_max_cut_memory=(min_peak + max_peak) / 2)
+
+        _, quantization_info = mct.ptq.keras_post_training_quantization_experimental(
+            model, representative_dataset, target_kpi=target_kpi, core_config=core_config,
+            target_platform_capabilities=get_tpc())
+
+        final_peak = quantization_info.final_kpi.activation_max_cut_memory
+        self.assertTrue(min_peak <= final_peak <= target_kpi.activation_max_cut_memory)
+
+    def test_kpi_data_max_cut(self):
+        model = branched_model()
+        core_config = mct.core.CoreConfig(mixed_precision_config=mct.core.MixedPrecisionQuantizationConfigV2())
+
+        # The max-cut search runs only when the activation max cut is requested.
+        with patch.object(MaxCutActivationMemory, 'compute_max_cut_size') as compute_max_cut_size:
+            kpi_data = mct.core.keras_kpi_data_experimental(model, representative_dataset, core_config,
+                                                            target_platform_capabilities=get_tpc())
+        compute_max_cut_size.assert_not_called()
+        self.assertEqual(kpi_data.activation_max_cut_memory, np.inf)
+
+        kpi_data = mct.core.keras_kpi_data_experimental(model, representative_dataset, core_config,
+                                                        target_platform_capabilities=get_tpc(),
+                                                        compute_activation_max_cut=True)
+        expected_max_cut_size = get_max_cut_activation_memory(get_mp_graph(model)).compute_max_cut_size()
+        self.assertEqual(kpi_data.activation_max_cut_memory, expected_max_cut_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
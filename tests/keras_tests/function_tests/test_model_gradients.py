@@ -152,6 +152,49 @@ class TestModelGradients(unittest.TestCase):
         self.assertTrue(np.isclose(y[2], np.float32(1.0)))
 
 
+    def test_batched_jacobian_trace_calculation(self):
+        input_shape = (8, 8, 3)
+        in_model = basic_derivative_model(input_shape)
+        keras_impl = KerasImplementation()
+        graph = prepare_graph_with_configs(in_model, keras_impl, DEFAULT_KERAS_INFO, representative_dataset, generate_keras_tpc)
+
+        interest_points = graph.get_topo_sorted_nodes()
+        output_nodes = [o.node for o in graph.output_nodes]
+        # Several images, and several random vectors in each backward pass
+        input_tensors = {inode: np.random.randn(4, *input_shape).astype(np.float32) for inode in graph.get_inputs()}
+        x = keras_impl.model_grad(graph_float=graph,
+                                  model_input_tensors=input_tensors,
+                                  interest_points=interest_points,
+                                  output_list=output_nodes,
+                                  all_outputs_indices=[len(interest_points) - 1],
+                                  alpha=0,
+                                  n_probes=8)
+
+        self.assertTrue(np.isclose(x[0], np.float32(0.8), 1e-1))
+        self.assertTrue(np.isclose(x[1], np.float32(0.2), 1e-1))
+        self.assertTrue(np.isclose(x[2], np.float32(0.0)))
+
+    def test_batched_inputs_as_list_model_grad(self):
+        # The model stacks its inputs on the batch axis, so the images are processed separately.
+        input_shape = (8, 8, 3)
+        in_model = inputs_as_list_model(input_shape)
+        keras_impl = KerasImplementation()
+        graph = prepare_graph_with_configs(in_model, keras_impl, DEFAULT_KERAS_INFO, representative_dataset, generate_keras_tpc)
+
+        interest_points = graph.get_topo_sorted_nodes()
+        output_nodes = [o.node for o in graph.output_nodes]
+        input_tensors = {inode: np.random.randn(3, *input_shape).astype(np.float32) for inode in graph.get_inputs()}
+        x = keras_impl.model_grad(graph_float=graph,
+                                  model_input_tensors=input_tensors,
+                                  interest_points=interest_points,
+                                  output_list=output_nodes,
+                                  all_outputs_indices=[len(interest_points) - 1],
+                                  alpha=0.3,
+                                  n_probes=4)
+
+        self.assertTrue(np.isclose(np.sum(x), 1))
+
+
     def test_basic_model_grad(self):
         input_shape = (8, 8, 3)
         in_model = basic_model(input_shape)
@@ -0,0 +1,143 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Micro-benchmark of the per-step overhead of PytorchModel's forward pass.
+
+Compares the compiled execution plan with a graph-traversing forward pass (resolving each node's inputs,
+operation and activation quantization function from the graph in every step), on small ResNet-style and
+ViT-style models, where the python overhead dominates the runtime.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.execution_plan_benchmark [--n_iters N]
+"""
+import argparse
+import timeit
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import _run_operation
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.reader.node_holders import DummyPlaceHolder
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+
+class ResidualBlock(torch.nn.Module):
+    def __init__(self, channels):
+        super(ResidualBlock, self).__init__()
+        self.conv1 = torch.nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+        self.bn1 = torch.nn.BatchNorm2d(channels)
+        self.conv2 = torch.nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+        self.bn2 = torch.nn.BatchNorm2d(channels)
+
+    def forward(self, x):
+        y = torch.relu(self.bn1(self.conv1(x)))
+        y = self.bn2(self.conv2(y))
+        return torch.relu(x + y)
+
+
+class ResNetStyleModel(torch.nn.Module):
+    def __init__(self, n_blocks=16, channels=8):
+        super(ResNetStyleModel, self).__init__()
+        self.stem = torch.nn.Conv2d(3, channels, kernel_size=3, padding=1)
+        self.blocks = torch.nn.Sequential(*[ResidualBlock(channels) for _ in range(n_blocks)])
+
+    def forward(self, x):
+        return torch.mean(self.blocks(self.stem(x)), dim=[2, 3])
+
+
+class TransformerBlock(torch.nn.Module):
+    def __init__(self, dim):
+        super(TransformerBlock, self).__init__()
+        self.norm1 = torch.nn.LayerNorm(dim)
+        self.q = torch.nn.Linear(dim, dim)
+        self.k = torch.nn.Linear(dim, dim)
+        self.v = torch.nn.Linear(dim, dim)
+        self.proj = torch.nn.Linear(dim, dim)
+        self.norm2 = torch.nn.LayerNorm(dim)
+        self.fc1 = torch.nn.Linear(dim, 2 * dim)
+        self.fc2 = torch.nn.Linear(2 * dim, dim)
+
+    def forward(self, x):
+        y = self.norm1(x)
+        attn = torch.softmax(torch.matmul(self.q(y), torch.transpose(self.k(y), 1, 2)), dim=-1)
+        x = x + self.proj(torch.matmul(attn, self.v(y)))
+        return x + self.fc2(torch.nn.functional.gelu(self.fc1(self.norm2(x))))
+
+
+class ViTStyleModel(torch.nn.Module):
+    def __init__(self, n_blocks=12, dim=16, patch_size=4):
+        super(ViTStyleModel, self).__init__()
+        self.patch_embed = torch.nn.Conv2d(3, dim, kernel_size=patch_size, stride=patch_size)
+        self.blocks = torch.nn.Sequential(*[TransformerBlock(dim) for _ in range(n_blocks)])
+
+    def forward(self, x):
+        x = torch.flatten(self.patch_embed(x), 2)
+        x = torch.transpose(x, 1, 2)
+        return torch.mean(self.blocks(x), dim=1)
+
+
+def graph_traversal_forward(model, *args):
+    """
+    Forward pass of a PytorchModel that resolves the inputs, operation and activation quantization function
+    of each node from the graph in every step (the forward pass without a compiled execution plan).
+    """
+    node_to_output_tensors_dict = dict()
+    configurable_nodes = model.graph.get_configurable_sorted_nodes_names()
+    for node in model.node_sort:
+        if node.type == DummyPlaceHolder:
+            input_tensors = [args[model.graph.get_inputs().index(node)]]
+        else:
+            input_tensors = [t for ie in model.graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX)
+                             for t in node_to_output_tensors_dict[ie.source_node]]
+        op_func = model._get_op_func(node, configurable_nodes)
+        use_activation_quantization, activation_quantization_fn = model._get_activation_quantization_fn(node)
+        out_tensors_of_n, _ = _run_operation(node, input_tensors, op_func, activation_quantization_fn,
+                                             use_activation_quantization)
+        node_to_output_tensors_dict[node] = out_tensors_of_n if isinstance(out_tensors_of_n, list) else [out_tensors_of_n]
+    return [t for ot in model.graph.get_outputs() for t in node_to_output_tensors_dict[ot.node]]
+
+
+def benchmark(name, model, input_shape, n_iters):
+    def representative_data_gen():
+        yield [np.random.randn(*input_shape).astype(np.float32)]
+
+    graph = prepare_graph_with_configs(model, PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                       representative_data_gen, generate_pytorch_tpc)
+    float_model, _ = FloatPyTorchModelBuilder(graph).build_model()
+    x = to_torch_tensor(np.random.randn(*input_shape).astype(np.float32))
+
+    with torch.no_grad():
+        assert torch.allclose(float_model(x), graph_traversal_forward(float_model, x)[0])
+        traversal_time = min(timeit.repeat(lambda: graph_traversal_forward(float_model, x), number=n_iters, repeat=3))
+        plan_time = min(timeit.repeat(lambda: float_model(x), number=n_iters, repeat=3))
+
+    n_steps = len(graph.nodes)
+    print(f'{name}: {n_steps} steps | graph traversal: {1e6 * traversal_time / n_iters / n_steps:.2f} us/step | '
+          f'execution plan: {1e6 * plan_time / n_iters / n_steps:.2f} us/step | '
+          f'speedup: {traversal_time / plan_time:.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='PytorchModel execution plan micro-benchmark')
+    parser.add_argument('--n_iters', type=int, default=100)
+    n_iters = parser.parse_args().n_iters
+    benchmark('ResNet-style', ResNetStyleModel(), (1, 3, 8, 8), n_iters)
+    benchmark('ViT-style', ViTStyleModel(), (1, 3, 16, 16), n_iters)
@@ -0,0 +1,126 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the peak memory (resident set size) of exporting a quantized PyTorch model to TorchScript:
+- With a deep copy of the model (as the exporter did before).
+- With a copy of the model's structure that shares its unquantized parameters (the default export).
+- In place, replacing the model's weights by their quantized weights layer by layer (inplace=True).
+
+The benchmark uses a model of fully-connected layers with the given number of parameters (25M by default). Each
+export runs in a new process that quantizes the model, and the peak memory of the export is measured (on Linux)
+above the memory of the process after the quantization.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.export_memory_benchmark [--num_params P] [--width W]
+"""
+import argparse
+import copy
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_torchscript_pytorch_exporter import \
+    FakelyQuantTorchScriptPyTorchExporter
+from model_compression_toolkit.exporter.model_wrapper.pytorch.validate_layer import is_pytorch_layer_exportable
+
+MODES = ['deepcopy', 'default', 'inplace']
+
+
+class FCModel(torch.nn.Module):
+    def __init__(self, width, n_layers):
+        super(FCModel, self).__init__()
+        self.layers = torch.nn.ModuleList([torch.nn.Linear(width, width) for _ in range(n_layers)])
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = self.relu(layer(x))
+        return x
+
+
+def read_memory_status(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) * 1024
+
+
+def quantize(num_params, width):
+    def representative_data_gen():
+        np.random.seed(0)
+        yield [np.random.random((1, width))]
+
+    n_layers = max(int(num_params / (width ** 2)), 1)
+    exportable_model, _ = mct.ptq.pytorch_post_training_quantization_experimental(
+        in_module=FCModel(width, n_layers),
+        representative_data_gen=representative_data_gen,
+        new_experimental_exporter=True)
+    return exportable_model.eval(), representative_data_gen
+
+
+def export(num_params, width, mode):
+    model, representative_data_gen = quantize(num_params, width)
+    gc.collect()
+
+    # Reset the peak resident set size of the process to its current size.
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+    quantized_rss = read_memory_status('VmRSS')
+    start = time.perf_counter()
+    if mode == 'deepcopy':
+        model = copy.deepcopy(model)
+    _, save_path = tempfile.mkstemp('.pth')
+    FakelyQuantTorchScriptPyTorchExporter(model,
+                                          is_pytorch_layer_exportable,
+                                          save_path,
+                                          representative_data_gen,
+                                          inplace=mode != 'default').export()
+    elapsed = time.perf_counter() - start
+    os.remove(save_path)
+    print(quantized_rss, read_memory_status('VmHWM') - quantized_rss, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num_params', type=float, default=25e6)
+    parser.add_argument('--width', type=int, default=1024)
+    parser.add_argument('--export_mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.export_mode is not None:
+        export(args.num_params, args.width, args.export_mode)
+        return
+
+    n_layers = max(int(args.num_params / (args.width ** 2)), 1)
+    print(f'{n_layers} layers, {n_layers * args.width ** 2 / 1e6:.1f}M weights')
+    for mode in MODES:
+        result = subprocess.run([sys.executable, '-m', 'tests.pytorch_tests.benchmarks.export_memory_benchmark',
+                                 '--num_params', str(args.num_params), '--width', str(args.width),
+                                 '--export_mode', mode],
+                                capture_output=True, text=True, check=True)
+        quantized_rss, peak_increase, elapsed = result.stdout.strip().splitlines()[-1].split()
+        print(f'{mode:10s} RSS after quantization {int(quantized_rss) / 2 ** 20:8.1f} MB, '
+              f'export peak RSS increase {int(peak_increase) / 2 ** 20:8.1f} MB, {float(elapsed):6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
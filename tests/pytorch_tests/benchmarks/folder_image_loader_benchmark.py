@@ -0,0 +1,82 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of sampling batches from a FolderImageLoader of JPEG images (resized to 224x224 by
+the preprocessing) while a model runs on the previous batch, with serial decoding (as was done before the decoding
+options were added), and with parallel decoding, prefetching and draft JPEG decoding.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.folder_image_loader_benchmark [--n_images N] [--n_batches B]
+        [--num_workers W]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+from model_compression_toolkit.core import FolderImageLoader
+from tests.pytorch_tests.benchmarks.incremental_sensitivity_benchmark import MobileNetStyleModel
+
+BATCH_SIZE = 8
+
+
+def resize(img):
+    return np.asarray(Image.fromarray(img).resize((224, 224)), dtype=np.float32) / 255
+
+
+def measure(folder, n_batches, model, **loader_kwargs):
+    loader = FolderImageLoader(folder, preprocessing=[resize], batch_size=BATCH_SIZE, **loader_kwargs)
+    start = time.perf_counter()
+    with torch.no_grad():
+        for _ in range(n_batches):
+            model(torch.from_numpy(loader.sample()).permute(0, 3, 1, 2))
+    elapsed = time.perf_counter() - start
+    loader.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_images', type=int, default=32)
+    parser.add_argument('--n_batches', type=int, default=10)
+    parser.add_argument('--num_workers', type=int, default=4)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    try:
+        for i in range(args.n_images):
+            img = np.random.randint(0, 256, (1080, 1440, 3), dtype=np.uint8)
+            Image.fromarray(img).save(os.path.join(folder, f'img{i}.jpg'), quality=90)
+
+        model = MobileNetStyleModel(4).eval()
+        serial_time = measure(folder, args.n_batches, model)
+        parallel_time = measure(folder, args.n_batches, model, num_workers=args.num_workers, prefetch_batches=2)
+        draft_time = measure(folder, args.n_batches, model, num_workers=args.num_workers, prefetch_batches=2,
+                             draft_size=(224, 224))
+    finally:
+        shutil.rmtree(folder)
+
+    print(f'Serial decoding:                       {serial_time:.2f}s')
+    print(f'Parallel decoding and prefetching:     {parallel_time:.2f}s ({serial_time / parallel_time:.2f}x)')
+    print(f'... and draft JPEG decoding:           {draft_time:.2f}s ({serial_time / draft_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of the GPTQ training epochs with a slow representative dataset generator (that
+simulates decoding and resizing images), when the generator is iterated in every epoch and when the GPTQ data
+pipeline reads it once and feeds its samples (as uint8 images, preprocessed on the fly) in every epoch.
+
+The benchmark uses a MobileNetV2-style model (a stack of inverted residual blocks).
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.gptq_data_pipeline_benchmark [--n_epochs E] [--decode_time T]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental, GPTQDataConfig
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from tests.pytorch_tests.benchmarks.incremental_sensitivity_benchmark import MobileNetStyleModel
+
+NUM_BATCHES = 8
+BATCH_SIZE = 8
+
+
+def get_raw_images_gen(decode_time):
+    def raw_images_gen():
+        np.random.seed(0)
+        for _ in range(NUM_BATCHES):
+            time.sleep(decode_time)  # Decoding and resizing the images
+            yield [np.random.randint(0, 256, size=(BATCH_SIZE, 3, 64, 64), dtype=np.uint8)]
+    return raw_images_gen
+
+
+def preprocess(batch):
+    return [batch[0].astype(np.float32) / 127.5 - 1]
+
+
+def measure_training_time(n_epochs, decode_time, data_config):
+    raw_images_gen = get_raw_images_gen(decode_time)
+
+    def representative_data_gen():
+        for batch in raw_images_gen():
+            yield preprocess(batch)
+
+    gptq_config = get_pytorch_gptq_config(n_epochs=n_epochs)
+    gptq_config.use_hessian_based_weights = False
+    gptq_config.data_config = data_config
+    training_time = []
+    train = PytorchGPTQTrainer.train
+
+    def timed_train(trainer, data_gen):
+        start = time.perf_counter()
+        # The data pipeline reads the raw images and preprocesses them on the fly.
+        train(trainer, data_gen if data_config is None else raw_images_gen)
+        training_time.append(time.perf_counter() - start)
+
+    PytorchGPTQTrainer.train = timed_train
+    try:
+        pytorch_gradient_post_training_quantization_experimental(MobileNetStyleModel(4), representative_data_gen,
+                                                                 gptq_config=gptq_config)
+    finally:
+        PytorchGPTQTrainer.train = train
+    return training_time[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_epochs', type=int, default=5)
+    parser.add_argument('--decode_time', type=float, default=0.2)
+    args = parser.parse_args()
+
+    generator_time = measure_training_time(args.n_epochs, args.decode_time, data_config=None)
+    pipeline_time = measure_training_time(args.n_epochs, args.decode_time,
+                                          data_config=GPTQDataConfig(preprocess_fn=preprocess))
+
+    print(f'GPTQ training with the generator in every epoch: {generator_time:.2f}s')
+    print(f'GPTQ training with the data pipeline:             {pipeline_time:.2f}s')
+    print(f'Speedup: {generator_time / pipeline_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the GPTQ training step time (measured with the GPTQ config's step_profiler), with the gradients,
+parameters and loss copied to the host in every step (as was done in every step regardless of logging, and is
+still done when logging every step) and without these copies (when log_function is None).
+
+The benchmark uses a MobileNetV2-style model (a stack of inverted residual blocks).
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.gptq_step_time_benchmark [--n_blocks N] [--n_epochs E] [--batch_size B]
+"""
+import argparse
+
+import numpy as np
+
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from tests.pytorch_tests.benchmarks.incremental_sensitivity_benchmark import MobileNetStyleModel
+
+
+def measure_step_times(n_blocks, n_epochs, batch_size, log_function):
+    def representative_data_gen():
+        np.random.seed(0)
+        for _ in range(8):
+            yield [np.random.randn(batch_size, 3, 64, 64).astype(np.float32)]
+
+    step_times = []
+    gptq_config = get_pytorch_gptq_config(n_epochs=n_epochs, log_function=log_function)
+    gptq_config.use_hessian_based_weights = False
+    gptq_config.step_profiler = lambda step, duration: step_times.append(duration)
+    pytorch_gradient_post_training_quantization_experimental(MobileNetStyleModel(n_blocks),
+                                                             representative_data_gen,
+                                                             gptq_config=gptq_config)
+    # The first steps include one-time warmup costs.
+    return np.median(step_times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_blocks', type=int, default=8)
+    parser.add_argument('--n_epochs', type=int, default=4)
+    parser.add_argument('--batch_size', type=int, default=8)
+    args = parser.parse_args()
+
+    copy_time = measure_step_times(args.n_blocks, args.n_epochs, args.batch_size,
+                                   log_function=lambda loss_value, grads, params: None)
+    no_copy_time = measure_step_times(args.n_blocks, args.n_epochs, args.batch_size, log_function=None)
+
+    print(f'Median step time with host copies:    {copy_time * 1e3:.1f}ms')
+    print(f'Median step time without host copies: {no_copy_time * 1e3:.1f}ms')
+    print(f'Speedup: {copy_time / no_copy_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
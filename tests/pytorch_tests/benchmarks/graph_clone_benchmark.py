@@ -0,0 +1,100 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time and the peak memory of copying a graph with a deep copy (copy.deepcopy, as was
+done before mixed-precision search, sensitivity evaluation and GPTQ) and with a clone that shares the weights and
+statistics collectors with the graph (Graph.clone).
+
+The benchmark uses a model of fully-connected layers with the given number of parameters (100M by default), whose
+graph holds statistics collectors after a statistics collection.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.graph_clone_benchmark [--num_params P] [--width W]
+"""
+import argparse
+import copy
+import time
+import tracemalloc
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import DEFAULTCONFIG
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+
+class FCModel(torch.nn.Module):
+    def __init__(self, width, n_layers):
+        super(FCModel, self).__init__()
+        self.layers = torch.nn.ModuleList([torch.nn.Linear(width, width) for _ in range(n_layers)])
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = self.relu(layer(x))
+        return x
+
+
+def measure(copy_fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph_copy = copy_fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph_copy
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num_params', type=float, default=100e6)
+    parser.add_argument('--width', type=int, default=4096)
+    args = parser.parse_args()
+
+    n_layers = max(1, int(round(args.num_params / (args.width * (args.width + 1)))))
+    input_shape = (1, args.width)
+
+    def representative_data_gen():
+        yield [np.random.randn(*input_shape).astype(np.float32)]
+
+    fw_impl = PytorchImplementation()
+    graph = prepare_graph_with_configs(FCModel(args.width, n_layers), fw_impl, DEFAULT_PYTORCH_INFO,
+                                       representative_data_gen, generate_pytorch_tpc)
+    analyzer_graph(node_analyze_func=fw_impl.attach_sc_to_node, graph=graph, fw_info=DEFAULT_PYTORCH_INFO,
+                   qc=DEFAULTCONFIG)
+    mi = ModelCollector(graph, fw_impl=fw_impl, fw_info=DEFAULT_PYTORCH_INFO)
+    for _ in range(4):
+        mi.infer([np.random.randn(*input_shape).astype(np.float32)])
+
+    num_params = sum([n.get_num_parameters(DEFAULT_PYTORCH_INFO)[0] + n.get_num_parameters(DEFAULT_PYTORCH_INFO)[1]
+                      for n in graph.nodes])
+    print(f'Graph of {n_layers} layers with {num_params / 1e6:.1f}M parameters')
+
+    deepcopy_time, deepcopy_peak = measure(lambda: copy.deepcopy(graph))
+    clone_time, clone_peak = measure(lambda: graph.clone())
+
+    print(f'copy.deepcopy: {deepcopy_time:.3f}s, peak memory {deepcopy_peak / 2 ** 20:.1f}MB')
+    print(f'Graph.clone:   {clone_time:.3f}s, peak memory {clone_peak / 2 ** 20:.1f}MB')
+    print(f'Speedup: {deepcopy_time / clone_time:.1f}x, memory reduction: {deepcopy_peak / clone_peak:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
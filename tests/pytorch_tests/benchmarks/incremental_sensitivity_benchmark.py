@@ -0,0 +1,120 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of building the mixed-precision sensitivity metrics of single-node modifications
+of the max configuration (as done by the linear programming search) with a full inference of the MP model for
+each modification and with an incremental inference that resumes from the modified node.
+
+The benchmark uses a MobileNetV2-style model (a stack of inverted residual blocks), and verifies that the metrics
+of the incremental inference match the metrics of the full inference.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.incremental_sensitivity_benchmark [--n_blocks N] [--num_of_images I]
+"""
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+
+class InvertedResidual(torch.nn.Module):
+    def __init__(self, channels, expansion=4):
+        super(InvertedResidual, self).__init__()
+        hidden = channels * expansion
+        self.expand = torch.nn.Conv2d(channels, hidden, kernel_size=1)
+        self.bn1 = torch.nn.BatchNorm2d(hidden)
+        self.dw = torch.nn.Conv2d(hidden, hidden, kernel_size=3, padding=1, groups=hidden)
+        self.bn2 = torch.nn.BatchNorm2d(hidden)
+        self.project = torch.nn.Conv2d(hidden, channels, kernel_size=1)
+        self.bn3 = torch.nn.BatchNorm2d(channels)
+        self.relu = torch.nn.ReLU6()
+
+    def forward(self, x):
+        y = self.relu(self.bn1(self.expand(x)))
+        y = self.relu(self.bn2(self.dw(y)))
+        return x + self.bn3(self.project(y))
+
+
+class MobileNetStyleModel(torch.nn.Module):
+    def __init__(self, n_blocks, channels=16):
+        super(MobileNetStyleModel, self).__init__()
+        self.stem = torch.nn.Conv2d(3, channels, kernel_size=3, stride=2, padding=1)
+        self.relu = torch.nn.ReLU6()
+        self.blocks = torch.nn.Sequential(*[InvertedResidual(channels) for _ in range(n_blocks)])
+        self.head = torch.nn.Conv2d(channels, 32, kernel_size=1)
+
+    def forward(self, x):
+        return self.head(self.blocks(self.relu(self.stem(x))))
+
+
+def compute_single_node_metrics(graph, representative_data_gen, num_of_images, incremental):
+    se = PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=num_of_images, use_grad_based_weights=False,
+                                           incremental_sensitivity_evaluation=incremental),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+    max_cfg = graph.get_max_candidates_config()
+    start = time.perf_counter()
+    metrics = [se.compute_metric(max_cfg)]
+    for node_idx, node in enumerate(graph.get_configurable_sorted_nodes()):
+        for bitwidth_idx in range(len(node.candidates_quantization_cfg)):
+            if bitwidth_idx == max_cfg[node_idx]:
+                continue
+            cfg = list(max_cfg)
+            cfg[node_idx] = bitwidth_idx
+            metrics.append(se.compute_metric(cfg, [node_idx], max_cfg))
+    return metrics, time.perf_counter() - start
+
+
+def benchmark(n_blocks, num_of_images):
+    input_shape = (1, 3, 64, 64)
+
+    images = np.random.randn(num_of_images, *input_shape[1:]).astype(np.float32)
+
+    def representative_data_gen():
+        # The same images are used by both evaluations.
+        yield [images]
+
+    graph = prepare_graph_with_quantization_parameters(MobileNetStyleModel(n_blocks), PytorchImplementation(),
+                                                       DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                       generate_pytorch_tpc, input_shape,
+                                                       mixed_precision_enabled=True)
+
+    full_metrics, full_time = compute_single_node_metrics(graph, representative_data_gen, num_of_images,
+                                                          incremental=False)
+    incremental_metrics, incremental_time = compute_single_node_metrics(graph, representative_data_gen,
+                                                                        num_of_images, incremental=True)
+    assert np.allclose(full_metrics, incremental_metrics, rtol=1e-4)
+
+    print(f'{len(graph.get_configurable_sorted_nodes())} configurable nodes, {len(full_metrics)} metrics | '
+          f'full inference: {full_time:.2f}s | incremental inference: {incremental_time:.2f}s | '
+          f'speedup: {full_time / incremental_time:.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Incremental sensitivity evaluation benchmark')
+    parser.add_argument('--n_blocks', type=int, default=8)
+    parser.add_argument('--num_of_images', type=int, default=8)
+    args = parser.parse_args()
+    benchmark(args.n_blocks, args.num_of_images)
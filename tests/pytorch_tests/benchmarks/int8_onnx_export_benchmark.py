@@ -0,0 +1,92 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the size and the ONNX Runtime (CPU) latency of a MobileNetV2 quantized by MCT and exported to ONNX
+in the fakely-quantized format (float weights) and in the INT8 format (integer weights and QDQ nodes), with 8-bit
+and 4-bit weights.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.int8_onnx_export_benchmark [--n_runs N]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import onnxruntime
+from torchvision.models.mobilenetv2 import mobilenet_v2
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+from tests.pytorch_tests.function_tests.test_export_pytorch_int8_onnx_model import get_int8_tpc
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.random((1, 3, 224, 224))]
+
+
+def export(weights_n_bits, int8):
+    int8_tpc = get_int8_tpc(weights_n_bits)
+    exportable_model, _ = mct.ptq.pytorch_post_training_quantization_experimental(
+        in_module=mobilenet_v2(),
+        representative_data_gen=representative_data_gen,
+        target_platform_capabilities=int8_tpc,
+        new_experimental_exporter=True)
+    tpc = int8_tpc if int8 else generate_pytorch_tpc(name='fq_benchmark',
+                                                     tp_model=generate_test_tp_model({'weights_n_bits': weights_n_bits}))
+    _, path = tempfile.mkstemp('.onnx')
+    mct.exporter.pytorch_export_model(model=exportable_model.eval(),
+                                      save_model_path=path,
+                                      repr_dataset=representative_data_gen,
+                                      target_platform_capabilities=tpc,
+                                      serialization_format=mct.exporter.PytorchExportSerializationFormat.ONNX)
+    return path
+
+
+def measure_latency(path, n_runs):
+    session = onnxruntime.InferenceSession(path)
+    x = {session.get_inputs()[0].name: next(representative_data_gen())[0].astype(np.float32)}
+    session.run(None, x)
+    start = time.perf_counter()
+    for _ in range(n_runs):
+        session.run(None, x)
+    return (time.perf_counter() - start) / n_runs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_runs', type=int, default=20)
+    args = parser.parse_args()
+
+    results = {}
+    for name, weights_n_bits, int8 in [('Fake-quant, 8-bit weights', 8, False),
+                                       ('INT8, 8-bit weights', 8, True),
+                                       ('INT8, 4-bit packed weights', 4, True)]:
+        path = export(weights_n_bits, int8)
+        results[name] = (os.path.getsize(path), measure_latency(path, args.n_runs))
+        os.remove(path)
+
+    fq_size, fq_latency = results['Fake-quant, 8-bit weights']
+    for name, (size, latency) in results.items():
+        print(f'{name:28s} {size / 2 ** 20:6.2f} MB ({fq_size / size:.2f}x smaller), '
+              f'{latency * 1000:6.1f} ms ({fq_latency / latency:.2f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of computing the Jacobian-based weights of the mixed-precision sensitivity
+evaluation with a single image and a single random vector in each backward pass, and with several images and
+several random vectors in each backward pass.
+
+The benchmark uses the MobileNetV2-style model of the incremental sensitivity benchmark.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.jacobian_weights_benchmark [--n_blocks N] [--num_of_images I]
+        [--n_probes P] [--images_per_pass B]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.benchmarks.incremental_sensitivity_benchmark import MobileNetStyleModel
+
+
+def compute_jacobian_weights(se, n_probes, images_per_pass):
+    se.quant_config.jacobians_n_probes = n_probes
+    se.quant_config.jacobians_images_per_pass = images_per_pass
+    start = time.perf_counter()
+    weights = se._compute_gradient_based_weights()
+    return weights, time.perf_counter() - start
+
+
+def benchmark(n_blocks, num_of_images, n_probes, images_per_pass):
+    input_shape = (1, 3, 64, 64)
+
+    images = np.random.randn(num_of_images, *input_shape[1:]).astype(np.float32)
+
+    def representative_data_gen():
+        yield [images]
+
+    graph = prepare_graph_with_quantization_parameters(MobileNetStyleModel(n_blocks), PytorchImplementation(),
+                                                       DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                       generate_pytorch_tpc, input_shape,
+                                                       mixed_precision_enabled=True)
+    se = PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=num_of_images),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+    single_weights, single_time = compute_jacobian_weights(se, n_probes=1, images_per_pass=1)
+    batched_weights, batched_time = compute_jacobian_weights(se, n_probes, images_per_pass)
+
+    print(f'{len(se.interest_points)} interest points, {num_of_images} images | '
+          f'single image and vector per pass: {single_time:.2f}s | '
+          f'{images_per_pass} images and {n_probes} vectors per pass: {batched_time:.2f}s | '
+          f'speedup: {single_time / batched_time:.2f}x | '
+          f'max weight difference: {np.max(np.abs(single_weights - batched_weights)):.4f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Jacobian-based weights computation benchmark')
+    parser.add_argument('--n_blocks', type=int, default=8)
+    parser.add_argument('--num_of_images', type=int, default=8)
+    parser.add_argument('--n_probes', type=int, default=8)
+    parser.add_argument('--images_per_pass', type=int, default=4)
+    args = parser.parse_args()
+    benchmark(args.n_blocks, args.num_of_images, args.n_probes, args.images_per_pass)
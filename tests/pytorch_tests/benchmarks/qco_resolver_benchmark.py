@@ -0,0 +1,91 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of resolving the QuantizationConfigOptions of the nodes of a large graph with a
+linear scan over all the LayerFilterParams of a TPC (as BaseNode.get_qco did before the TPC's resolver was added)
+and with the TPC's resolver (which buckets the filters by layer type and memoizes results).
+
+The benchmark uses a TPC with a LayerFilterParams for each of the given number of operator sets, and nodes of
+layers with and without filters (as in decomposed attention blocks).
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.qco_resolver_benchmark [--n_nodes N] [--n_filters F]
+"""
+import argparse
+import time
+
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.attribute_filter import \
+    Eq, GreaterEq
+from tests.common_tests.test_tp_model import TEST_QC, TEST_QCO
+
+tp = mct.target_platform
+
+LAYERS = [torch.nn.Linear, torch.nn.Hardtanh, torch.nn.Softmax, torch.nn.LayerNorm, torch.nn.GELU, torch.nn.Dropout]
+
+
+def get_tpc(n_filters):
+    tp_model = tp.TargetPlatformModel(tp.QuantizationConfigOptions([TEST_QC]), name='benchmark')
+    with tp_model:
+        for i in range(n_filters):
+            tp.OperatorsSet(f'opset{i}', TEST_QCO.clone_and_edit(activation_n_bits=2 + i % 7))
+    tpc = tp.TargetPlatformCapabilities(tp_model, name='benchmark')
+    with tpc:
+        for i in range(n_filters):
+            layer = [torch.nn.Hardtanh, torch.nn.Softmax, torch.nn.GELU][i % 3]
+            tp.OperationsSetToLayers(f'opset{i}', [tp.LayerFilterParams(layer, Eq('dim', i) | GreaterEq('min_val', i),
+                                                                        approximate=f'mode{i}')])
+    return tpc
+
+
+def linear_scan_qco(node, tpc):
+    for fl, qco in tpc.filterlayer2qco.items():
+        if node.is_match_filter_params(fl):
+            return qco
+    if node.type in tpc.layer2qco:
+        return tpc.layer2qco.get(node.type)
+    return tpc.tp_model.default_qco
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_nodes', type=int, default=20000)
+    parser.add_argument('--n_filters', type=int, default=48)
+    args = parser.parse_args()
+
+    tpc = get_tpc(args.n_filters)
+    nodes = [BaseNode(f'node{i}', {'dim': i % 4, 'min_val': (i % 8) - 4, 'approximate': 'none'}, (1, 8), (1, 8), {},
+                      LAYERS[i % len(LAYERS)]) for i in range(args.n_nodes)]
+
+    start = time.perf_counter()
+    scan_qcos = [linear_scan_qco(n, tpc) for n in nodes]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolver_qcos = [n.get_qco(tpc) for n in nodes]
+    resolver_time = time.perf_counter() - start
+
+    assert all([a is b for a, b in zip(scan_qcos, resolver_qcos)])
+    print(f'{args.n_nodes} nodes, {args.n_filters} layer filters')
+    print(f'Linear scan: {scan_time:.3f}s')
+    print(f'Resolver:    {resolver_time:.3f}s')
+    print(f'Speedup: {scan_time / resolver_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
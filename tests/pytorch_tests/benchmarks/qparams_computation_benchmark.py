@@ -0,0 +1,82 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the wall-clock time of the quantization parameters computation (calculate_quantization_params)
+with a serial computation and with a concurrent computation of the nodes' candidates.
+
+The weights and activation parameters are searched with the MSE error method on a ResNet-style model with
+wide convolutions, and the concurrently computed parameters are verified to be identical to the serially
+computed ones.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.qparams_computation_benchmark [--n_workers N] [--channels C]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.benchmarks.execution_plan_benchmark import ResNetStyleModel
+
+
+def get_candidates_params(graph):
+    return [(c.weights_quantization_cfg.weights_quantization_params,
+             c.activation_quantization_cfg.activation_quantization_params)
+            for n in graph.get_topo_sorted_nodes() for c in n.candidates_quantization_cfg]
+
+
+def benchmark(n_workers, channels):
+    input_shape = (1, 3, 16, 16)
+
+    def representative_data_gen():
+        yield [np.random.randn(*input_shape).astype(np.float32)]
+
+    qc = mct.core.QuantizationConfig(weights_error_method=mct.core.QuantizationErrorMethod.MSE,
+                                     activation_error_method=mct.core.QuantizationErrorMethod.MSE)
+    graph = prepare_graph_with_quantization_parameters(ResNetStyleModel(n_blocks=8, channels=channels),
+                                                       PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                                       representative_data_gen, generate_pytorch_tpc, input_shape,
+                                                       qc=qc)
+
+    times = {}
+    for workers in [1, n_workers]:
+        start = time.perf_counter()
+        calculate_quantization_params(graph, DEFAULT_PYTORCH_INFO, fw_impl=PytorchImplementation(),
+                                      n_workers=workers)
+        times[workers] = time.perf_counter() - start
+        if workers == 1:
+            serial_params = get_candidates_params(graph)
+
+    for serial, parallel in zip(serial_params, get_candidates_params(graph)):
+        for s, p in zip(serial, parallel):
+            assert all([np.array_equal(s[k], p[k]) for k in s])
+
+    print(f'{len(graph.nodes)} nodes, {channels} channels | serial: {times[1]:.2f}s | '
+          f'{n_workers} workers: {times[n_workers]:.2f}s | speedup: {times[1] / times[n_workers]:.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Quantization parameters computation benchmark')
+    parser.add_argument('--n_workers', type=int, default=8)
+    parser.add_argument('--channels', type=int, default=128)
+    args = parser.parse_args()
+    benchmark(args.n_workers, args.channels)
@@ -0,0 +1,139 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the graph substitutions that prepare a graph for quantization (graph preparation, pre-statistics
+collection, linear collapsing and residual collapsing substitutions), when each substitution searches its
+matches in the entire graph (as substitute did before) and when it searches the nodes of the types it can match
+only (using the index of the graph's nodes by their types).
+
+The benchmark uses a ResNet-style model with the given number of residual blocks, and checks that both searches
+give the same graph. It reports the time of searching the matches (the graph filtering) separately from the total
+time, which also includes applying the substitutions to their matches.
+
+Usage:
+    python -m tests.pytorch_tests.benchmarks.substitutions_benchmark [--n_blocks B] [--n_iters N]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from model_compression_toolkit.core import DEFAULTCONFIG
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute
+from model_compression_toolkit.core.common.substitutions.linear_collapsing_substitution import \
+    linear_collapsing_substitute
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.runner import read_model_to_graph
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+from tests.pytorch_tests.benchmarks.execution_plan_benchmark import ResNetStyleModel
+
+
+def substitute_by_searching_all_nodes(graph, substitutions_list):
+    for substitution in substitutions_list:
+        for match in graph.filter(substitution.matcher_instance):
+            graph = substitution.substitute(graph, match)
+    return graph
+
+
+def linear_collapsing_by_searching_all_nodes(graph, linear_collapsing_substitution):
+    matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
+    matched_nodes_list = []
+    match_indicator = True
+    while len(matched_nodes) > 0 and match_indicator:
+        match_indicator = False
+        for matched_node in matched_nodes:
+            if matched_node not in matched_nodes_list:
+                graph = linear_collapsing_substitution.substitute(graph, matched_node)
+                matched_nodes_list.append(matched_node)
+                match_indicator = True
+                break
+        matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
+    return graph
+
+
+class FilterTimer:
+    """
+    Accumulate the time spent in Graph.filter while the timer is active.
+    """
+
+    def __init__(self):
+        self.duration = 0.0
+        self.graph_filter = Graph.filter
+
+    def __enter__(self):
+        def timed_filter(graph, *args, **kwargs):
+            start = time.perf_counter()
+            matches = self.graph_filter(graph, *args, **kwargs)
+            self.duration += time.perf_counter() - start
+            return matches
+        Graph.filter = timed_filter
+        return self
+
+    def __exit__(self, *exc_info):
+        Graph.filter = self.graph_filter
+
+
+def prepare_graph(graph, fw_impl, substitute_fn, linear_collapsing_fn):
+    graph = substitute_fn(graph, fw_impl.get_substitutions_prepare_graph(DEFAULT_PYTORCH_INFO))
+    for node in graph.nodes:
+        node.prior_info = fw_impl.get_node_prior_info(node=node, fw_info=DEFAULT_PYTORCH_INFO, graph=graph)
+    graph = substitute_fn(graph, fw_impl.get_substitutions_pre_statistics_collection(DEFAULTCONFIG))
+    graph = linear_collapsing_fn(graph, fw_impl.get_linear_collapsing_substitution())
+    return substitute_fn(graph, fw_impl.get_residual_collapsing_substitution())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_blocks', type=int, default=128)
+    parser.add_argument('--n_iters', type=int, default=5)
+    args = parser.parse_args()
+
+    def representative_data_gen():
+        yield [np.random.randn(1, 3, 16, 16).astype(np.float32)]
+
+    fw_impl = PytorchImplementation()
+    graph = read_model_to_graph(ResNetStyleModel(n_blocks=args.n_blocks).eval(),
+                                representative_data_gen,
+                                get_target_platform_capabilities('pytorch', 'default'),
+                                DEFAULT_PYTORCH_INFO,
+                                fw_impl)
+    print(f'{len(graph.nodes)} nodes')
+
+    results = {}
+    for name, substitute_fn, linear_collapsing_fn in [
+        ('Search all nodes', substitute_by_searching_all_nodes, linear_collapsing_by_searching_all_nodes),
+        ('Search indexed candidates', substitute, linear_collapsing_substitute)]:
+        durations, filter_durations = [], []
+        for _ in range(args.n_iters):
+            graph_copy = graph.clone()
+            with FilterTimer() as filter_timer:
+                start = time.perf_counter()
+                prepared_graph = prepare_graph(graph_copy, fw_impl, substitute_fn, linear_collapsing_fn)
+                durations.append(time.perf_counter() - start)
+            filter_durations.append(filter_timer.duration)
+        results[name] = ([n.name for n in prepared_graph.nodes], np.median(filter_durations), np.median(durations))
+
+    baseline_nodes, baseline_filter_duration, _ = results['Search all nodes']
+    for name, (nodes, filter_duration, duration) in results.items():
+        assert nodes == baseline_nodes, 'The substitutions gave different graphs.'
+        print(f'{name:26s} search {filter_duration * 1000:8.1f} ms '
+              f'({baseline_filter_duration / filter_duration:5.2f}x), total {duration * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -205,6 +205,38 @@ class ModelGradientsCalculationTest(BasePytorchTest):
         self.unit_test.assertTrue(model_grads[2] == 0.0)
 
 
+class ModelGradientsBatchedCalculationTest(ModelGradientsCalculationTest):
+    """
+    This test checks the Jacobian-based weights computation of several images with several random vectors
+    in each backward pass.
+    """
+
+    def __init__(self, unit_test):
+        super().__init__(unit_test)
+        self.val_batch_size = 4
+
+    def run_test(self, seed=0):
+        model_float = basic_derivative_model()
+        pytorch_impl = PytorchImplementation()
+        graph = prepare_graph_with_configs(model_float, PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                           self.representative_data_gen, generate_pytorch_tpc)
+        input_tensors = {inode: next(self.representative_data_gen())[0] for inode in graph.get_inputs()}
+
+        ipts = [n for n in graph.get_topo_sorted_nodes()]
+        output_list = [ipts[-1]]
+        model_grads = pytorch_impl.model_grad(graph_float=graph,
+                                              model_input_tensors=input_tensors,
+                                              interest_points=ipts,
+                                              output_list=output_list,
+                                              all_outputs_indices=[len(ipts) - 1],
+                                              alpha=0,
+                                              n_probes=8)
+
+        self.unit_test.assertTrue(np.isclose(model_grads[0], 0.8, 1e-1))
+        self.unit_test.assertTrue(np.isclose(model_grads[1], 0.2, 1e-1))
+        self.unit_test.assertTrue(model_grads[2] == 0.0)
+
+
 class ModelGradientsBasicModelTest(BasePytorchTest):
     def __init__(self, unit_test):
         super().__init__(unit_test)
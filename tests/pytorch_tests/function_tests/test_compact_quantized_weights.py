@@ -0,0 +1,96 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import pickle
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import QuantizationConfig
+from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.quantization.compact_weights import CompactWeights
+from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = (1, 3, 16, 16)
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super(Model, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 128, kernel_size=1)
+        self.conv2 = torch.nn.Conv2d(128, 16, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        return self.conv2(self.relu(self.conv1(x)))
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def get_quantized_graph(compact_quantized_weights):
+    fw_impl = PytorchImplementation()
+    graph = prepare_graph_with_quantization_parameters(
+        Model(), fw_impl, DEFAULT_PYTORCH_INFO, representative_data_gen, generate_pytorch_tpc, INPUT_SHAPE,
+        qc=QuantizationConfig(compact_quantized_weights=compact_quantized_weights))
+    graph = set_bit_widths(mixed_precision_enable=False, graph=graph)
+    return quantize_graph_weights(graph, fw_info=DEFAULT_PYTORCH_INFO, fw_impl=fw_impl)
+
+
+class TestCompactQuantizedWeights(unittest.TestCase):
+
+    def test_compact_quantized_weights(self):
+        torch.manual_seed(0)
+        graph = get_quantized_graph(compact_quantized_weights=False)
+        torch.manual_seed(0)
+        compact_graph = get_quantized_graph(compact_quantized_weights=True)
+
+        # The kernel of conv1 has 3 values in each channel, so it is kept as is since its compact form (with
+        # the levels table) is not smaller.
+        self.assertIsInstance(compact_graph.find_node_by_name('conv1')[0].weights[KERNEL], np.ndarray)
+        self.assertIsInstance(compact_graph.find_node_by_name('conv2')[0].weights[KERNEL], CompactWeights)
+        for name in ['conv1', 'conv2']:
+            n = compact_graph.find_node_by_name(name)[0]
+            float_node = graph.find_node_by_name(name)[0]
+            self.assertTrue(np.array_equal(n.get_weights_by_keys(KERNEL), float_node.get_weights_by_keys(KERNEL)))
+            self.assertEqual(n.get_num_parameters(DEFAULT_PYTORCH_INFO),
+                             float_node.get_num_parameters(DEFAULT_PYTORCH_INFO))
+
+        # The 8-bit kernel of conv2 is coded in a byte per value instead of 8 bytes (plus the levels table).
+        self.assertTrue(len(pickle.dumps([n.weights for n in compact_graph.nodes])) <
+                        0.5 * len(pickle.dumps([n.weights for n in graph.nodes])))
+        self.assertIsInstance(copy.deepcopy(compact_graph).find_node_by_name('conv2')[0].weights[KERNEL],
+                              CompactWeights)
+
+        fw_impl = PytorchImplementation()
+        x = to_torch_tensor(next(representative_data_gen())[0])
+        model, _ = fw_impl.model_builder(graph, mode=ModelBuilderMode.QUANTIZED, fw_info=DEFAULT_PYTORCH_INFO)
+        compact_model, _ = fw_impl.model_builder(compact_graph, mode=ModelBuilderMode.QUANTIZED,
+                                                 fw_info=DEFAULT_PYTORCH_INFO)
+        self.assertTrue(torch.equal(model(x), compact_model(x)))
+
+
+if __name__ == '__main__':
+    unittest.main()
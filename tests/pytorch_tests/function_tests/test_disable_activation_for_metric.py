@@ -0,0 +1,108 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc, \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = (1, 3, 16, 16)
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super(Model, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        return self.conv2(self.relu(self.conv1(x)))
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def get_activation_mp_tpc(name, _):
+    base_config, _ = get_op_quantization_configs()
+    return generate_pytorch_tpc(name, generate_tp_model_with_activation_mp(base_config, [(8, 8), (8, 4), (4, 8),
+                                                                                         (4, 4)]))
+
+
+class RecordingPytorchImplementation(PytorchImplementation):
+    """
+    PyTorch implementation that records the graphs the MP models are built from.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.mp_graphs = []
+
+    def model_builder(self, graph, mode, *args, **kwargs):
+        if mode == ModelBuilderMode.MIXEDPRECISION:
+            self.mp_graphs.append(graph)
+        return super().model_builder(graph, mode, *args, **kwargs)
+
+
+class TestDisableActivationForMetric(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                get_activation_mp_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+        # Cache the configurable nodes lists before the graph is cloned for the sensitivity evaluation.
+        self.activation_configurable_nodes = self.graph.get_sorted_activation_configurable_nodes()
+        self.assertTrue(len(self.activation_configurable_nodes) > 0)
+
+    def build_mp_graph(self, disable_activation_for_metric):
+        fw_impl = RecordingPytorchImplementation()
+        fw_impl.get_sensitivity_evaluator(self.graph,
+                                          MixedPrecisionQuantizationConfigV2(num_of_images=1,
+                                                                             use_grad_based_weights=False),
+                                          representative_data_gen,
+                                          DEFAULT_PYTORCH_INFO,
+                                          disable_activation_for_metric=disable_activation_for_metric)
+        self.assertEqual(len(fw_impl.mp_graphs), 1)
+        return fw_impl.mp_graphs[0]
+
+    def test_disable_activation_for_metric(self):
+        mp_graph = self.build_mp_graph(disable_activation_for_metric=True)
+        self.assertEqual(mp_graph.get_sorted_activation_configurable_nodes(), [])
+        self.assertTrue(all([not n.is_activation_quantization_enabled()
+                             for n in mp_graph.get_configurable_sorted_nodes()]))
+
+        # The evaluated graph is not modified.
+        self.assertEqual(self.graph.get_sorted_activation_configurable_nodes(), self.activation_configurable_nodes)
+        self.assertTrue(all([n.is_activation_quantization_enabled() for n in self.activation_configurable_nodes]))
+
+    def test_enable_activation_for_metric(self):
+        mp_graph = self.build_mp_graph(disable_activation_for_metric=False)
+        self.assertEqual([n.name for n in mp_graph.get_sorted_activation_configurable_nodes()],
+                         [n.name for n in self.activation_configurable_nodes])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+from mct_quantizers import PytorchQuantizationWrapper
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_torchscript_pytorch_exporter import \
+    FakelyQuantTorchScriptPyTorchExporter
+from model_compression_toolkit.exporter.model_wrapper.pytorch.validate_layer import is_pytorch_layer_exportable
+
+
+class ExportModel(torch.nn.Module):
+    def __init__(self):
+        super(ExportModel, self).__init__()
+        self.conv = torch.nn.Conv2d(3, 8, 3)
+        self.relu = torch.nn.ReLU()
+        self.linear = torch.nn.Linear(8, 4)
+
+    def forward(self, x):
+        x = self.relu(self.conv(x))
+        return self.linear(torch.mean(x, dim=(2, 3)))
+
+
+class TestPyTorchInplaceExport(unittest.TestCase):
+
+    def representative_data_gen(self):
+        np.random.seed(0)
+        yield [np.random.random((1, 3, 16, 16))]
+
+    def setUp(self):
+        self.exportable_model, _ = mct.ptq.pytorch_post_training_quantization_experimental(
+            in_module=ExportModel(),
+            representative_data_gen=self.representative_data_gen,
+            new_experimental_exporter=True)
+        self.exportable_model.eval()
+        self.x = to_torch_tensor(next(self.representative_data_gen()))[0]
+        self.expected_output = self.exportable_model(self.x).detach()
+        _, self.save_model_path = tempfile.mkstemp('.pth')
+
+    def tearDown(self):
+        os.remove(self.save_model_path)
+
+    def check_exported_model(self):
+        exported_model = torch.load(self.save_model_path)
+        self.assertTrue(torch.equal(exported_model(self.x), self.expected_output))
+
+    def test_export_from_copy(self):
+        conv_wrapper = self.exportable_model.conv
+        float_weight = conv_wrapper.weight.detach().clone()
+        exporter = FakelyQuantTorchScriptPyTorchExporter(self.exportable_model,
+                                                         is_pytorch_layer_exportable,
+                                                         self.save_model_path,
+                                                         self.representative_data_gen)
+        # The copy shares the unquantized parameters with the model, and does not copy its float weights.
+        self.assertIsNot(exporter.model.conv, conv_wrapper)
+        self.assertIs(exporter.model.conv.layer.bias, conv_wrapper.layer.bias)
+        self.assertTrue(exporter.model.conv.weight.is_meta)
+
+        exporter.export()
+        self.check_exported_model()
+        self.assertFalse(any([p.is_meta for p in exporter.model.parameters()]))
+
+        # The exported model is unchanged.
+        self.assertIsInstance(self.exportable_model.conv, PytorchQuantizationWrapper)
+        self.assertTrue(torch.equal(conv_wrapper.weight, float_weight))
+        self.assertTrue(torch.equal(self.exportable_model(self.x), self.expected_output))
+
+    def test_inplace_export(self):
+        conv_layer = self.exportable_model.conv.layer
+        quantized_weight = self.exportable_model.conv.get_quantized_weights()['weight'].detach()
+        mct.exporter.pytorch_export_model(model=self.exportable_model,
+                                          save_model_path=self.save_model_path,
+                                          repr_dataset=self.representative_data_gen,
+                                          target_platform_capabilities=mct.get_target_platform_capabilities(
+                                              'pytorch', 'default'),
+                                          inplace=True)
+        self.check_exported_model()
+
+        # The model's wrapped layers are unwrapped and hold their quantized weights.
+        self.assertIs(self.exportable_model.conv, conv_layer)
+        self.assertFalse(any([isinstance(m, PytorchQuantizationWrapper) for m in self.exportable_model.modules()]))
+        self.assertTrue(torch.equal(conv_layer.weight, quantized_weight))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from mct_quantizers import PytorchQuantizationWrapper
+from model_compression_toolkit.constants import FOUND_ONNX, FOUND_ONNXRUNTIME
+from model_compression_toolkit.exporter import pytorch_export_model
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from model_compression_toolkit.target_platform_capabilities.tpc_models.tflite_tpc.v1 import tp_model as tflite_tp_model
+from model_compression_toolkit.target_platform_capabilities.tpc_models.tflite_tpc.v1 import \
+    tpc_pytorch as tflite_tpc_pytorch
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+
+class ConvLinearModel(torch.nn.Module):
+    def __init__(self):
+        super(ConvLinearModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, 3)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = torch.nn.Conv2d(16, 16, 3, groups=16)
+        # Applied on a 4D tensor, so it is exported as MatMul with transposed weights.
+        self.linear1 = torch.nn.Linear(12, 10)
+        self.linear2 = torch.nn.Linear(16 * 12 * 10, 200)
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        x = self.conv2(x)
+        x = self.linear1(x)
+        x = torch.flatten(x, 1)
+        return self.linear2(x)
+
+
+def get_int8_tpc(weights_n_bits):
+    # The TFLite target platform model sets QuantizationFormat.INT8.
+    base_config, _ = tflite_tp_model.get_op_quantization_configs()
+    base_config = base_config.clone_and_edit(weights_n_bits=weights_n_bits)
+    tp_model = tflite_tp_model.generate_tp_model(default_config=base_config,
+                                                 base_config=base_config,
+                                                 mixed_precision_cfg_list=[base_config],
+                                                 name='int8_onnx_test')
+    return tflite_tpc_pytorch.generate_pytorch_tpc(name='int8_onnx_test', tp_model=tp_model)
+
+
+if FOUND_ONNX:
+    import onnx
+    from onnx import numpy_helper
+
+
+    class TestPyTorchINT8ONNXExporter(unittest.TestCase):
+
+        def setUp(self):
+            _, self.int8_model_path = tempfile.mkstemp('.onnx')
+            _, self.fq_model_path = tempfile.mkstemp('.onnx')
+
+        def tearDown(self):
+            os.remove(self.int8_model_path)
+            os.remove(self.fq_model_path)
+
+        def repr_datagen(self):
+            np.random.seed(0)
+            for _ in range(2):
+                yield [np.random.random((2, 3, 16, 16))]
+
+        def export(self, weights_n_bits):
+            tpc = get_int8_tpc(weights_n_bits)
+            torch.manual_seed(0)
+            exportable_model, _ = mct.ptq.pytorch_post_training_quantization_experimental(
+                in_module=ConvLinearModel(),
+                representative_data_gen=self.repr_datagen,
+                target_platform_capabilities=tpc,
+                new_experimental_exporter=True)
+            exportable_model.eval()
+            pytorch_export_model(model=exportable_model,
+                                 save_model_path=self.int8_model_path,
+                                 repr_dataset=self.repr_datagen,
+                                 target_platform_capabilities=tpc,
+                                 serialization_format=mct.exporter.PytorchExportSerializationFormat.ONNX)
+            pytorch_export_model(model=exportable_model,
+                                 save_model_path=self.fq_model_path,
+                                 repr_dataset=self.repr_datagen,
+                                 target_platform_capabilities=generate_pytorch_tpc(
+                                     name="fq_onnx_test", tp_model=generate_test_tp_model(
+                                         {'weights_n_bits': weights_n_bits})),
+                                 serialization_format=mct.exporter.PytorchExportSerializationFormat.ONNX)
+            int8_model = onnx.load(self.int8_model_path)
+            onnx.checker.check_model(int8_model)
+            return exportable_model, int8_model
+
+        def check_integer_weights(self, exportable_model, int8_model, data_type):
+            dequantized_weights = {}
+            for node in int8_model.graph.node:
+                if node.op_type == 'DequantizeLinear' and node.output[0] not in dequantized_weights:
+                    inits = {i.name: i for i in int8_model.graph.initializer}
+                    if node.input[0] not in inits:
+                        continue
+                    self.assertEqual(inits[node.input[0]].data_type, data_type)
+                    values = numpy_helper.to_array(inits[node.input[0]]).astype(np.float32)
+                    scale = numpy_helper.to_array(inits[node.input[1]])
+                    zero_point = numpy_helper.to_array(inits[node.input[2]]).astype(np.float32)
+                    axis = [a.i for a in node.attribute if a.name == 'axis']
+                    if axis:
+                        shape = [1] * values.ndim
+                        shape[axis[0]] = -1
+                        scale, zero_point = scale.reshape(shape), zero_point.reshape(shape)
+                    dequantized_weights[node.output[0]] = ((values - zero_point) * scale).astype(np.float32)
+
+            for name, module in exportable_model.named_children():
+                if isinstance(module, PytorchQuantizationWrapper):
+                    quantized_weights = module.get_quantized_weights()['weight'].detach().cpu().numpy()
+                    if f'{name}.weight' in dequantized_weights:
+                        self.assertTrue(np.array_equal(dequantized_weights[f'{name}.weight'], quantized_weights))
+                    else:
+                        # Linear layers that are exported as MatMul have transposed weights.
+                        self.assertTrue(any([np.array_equal(w, quantized_weights.T)
+                                             for w in dequantized_weights.values() if w.ndim == 2]))
+            self.assertEqual(len(dequantized_weights), 4)
+
+        def test_int8_weights(self):
+            exportable_model, int8_model = self.export(weights_n_bits=8)
+            self.check_integer_weights(exportable_model, int8_model, onnx.TensorProto.INT8)
+            # Per-channel scales of the convolutions.
+            inits = {i.name: i for i in int8_model.graph.initializer}
+            self.assertEqual(numpy_helper.to_array(inits['conv1.weight_scale']).shape, (16,))
+            self.assertLess(os.path.getsize(self.int8_model_path), os.path.getsize(self.fq_model_path) / 3.5)
+
+        def test_packed_4bit_weights(self):
+            exportable_model, int8_model = self.export(weights_n_bits=4)
+            self.check_integer_weights(exportable_model, int8_model, onnx.TensorProto.INT4)
+            self.assertEqual(int8_model.opset_import[0].version, 21)
+            self.assertLess(os.path.getsize(self.int8_model_path), os.path.getsize(self.fq_model_path) / 7)
+
+        if FOUND_ONNXRUNTIME:
+            def run_onnx_models(self, graph_optimization_level):
+                import onnxruntime
+                x = next(self.repr_datagen())[0].astype(np.float32)
+                outputs = []
+                for path in [self.int8_model_path, self.fq_model_path]:
+                    sess_options = onnxruntime.SessionOptions()
+                    sess_options.graph_optimization_level = graph_optimization_level
+                    ort_session = onnxruntime.InferenceSession(path, sess_options)
+                    outputs.append(ort_session.run(None, {ort_session.get_inputs()[0].name: x})[0])
+                return outputs
+
+            def test_int8_onnx_inference(self):
+                import onnxruntime
+                self.export(weights_n_bits=8)
+                int8_output, fq_output = self.run_onnx_models(onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL)
+                self.assertTrue(np.array_equal(int8_output, fq_output))
+
+                # With the default optimizations ONNX Runtime runs the layers with integer kernels.
+                _, optimized_model_path = tempfile.mkstemp('.onnx')
+                sess_options = onnxruntime.SessionOptions()
+                sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+                sess_options.optimized_model_filepath = optimized_model_path
+                onnxruntime.InferenceSession(self.int8_model_path, sess_options)
+                op_types = [n.op_type for n in onnx.load(optimized_model_path).graph.node]
+                os.remove(optimized_model_path)
+                self.assertIn('QLinearConv', op_types)
+
+            def test_packed_4bit_onnx_inference(self):
+                import onnxruntime
+                self.export(weights_n_bits=4)
+                int8_output, fq_output = self.run_onnx_models(onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL)
+                self.assertTrue(np.array_equal(int8_output, fq_output))
@@ -27,7 +27,7 @@ from tests.pytorch_tests.function_tests.layer_fusing_test import LayerFusingTest
 from tests.pytorch_tests.function_tests.model_gradients_test import ModelGradientsBasicModelTest, \
     ModelGradientsCalculationTest, ModelGradientsAdvancedModelTest, ModelGradientsOutputReplacementTest, \
     ModelGradientsMultipleOutputsModelTest, ModelGradientsNonDifferentiableNodeModelTest, \
-    ModelGradientsMultipleOutputsTest
+    ModelGradientsMultipleOutputsTest, ModelGradientsBatchedCalculationTest
 from tests.pytorch_tests.function_tests.set_layer_to_bitwidth_test import TestSetLayerToBitwidthWeights, \
     TestSetLayerToBitwidthActivation
 from tests.pytorch_tests.function_tests.test_sensitivity_eval_output_replacement import \
@@ -105,6 +105,7 @@ class FunctionTestRunner(unittest.TestCase):
         """
         ModelGradientsBasicModelTest(self).run_test()
         ModelGradientsCalculationTest(self).run_test()
+        ModelGradientsBatchedCalculationTest(self).run_test()
         ModelGradientsAdvancedModelTest(self).run_test()
         ModelGradientsMultipleOutputsTest(self).run_test()
         ModelGradientsOutputReplacementTest(self).run_test()
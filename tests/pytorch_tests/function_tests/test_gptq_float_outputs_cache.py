@@ -0,0 +1,100 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCache
+from model_compression_toolkit.logger import LOGGER_NAME
+from tests.pytorch_tests.function_tests.get_gptq_config_test import TestModel
+
+NUM_BATCHES = 4
+
+
+def get_batches(seed=0):
+    np.random.seed(seed)
+    return [[np.random.random((1, 3, 8, 8)).astype(np.float32)] for _ in range(NUM_BATCHES)]
+
+
+class TestGPTQFloatOutputsCache(unittest.TestCase):
+
+    def _run_gptq(self, representative_data_gen, cache_float_outputs):
+        torch.manual_seed(0)
+        gptq_config = get_pytorch_gptq_config(n_epochs=3)
+        gptq_config.use_hessian_based_weights = False
+        gptq_config.cache_float_outputs = cache_float_outputs
+        core_config = CoreConfig(quantization_config=QuantizationConfig(QuantizationErrorMethod.MSE,
+                                                                        QuantizationErrorMethod.MSE,
+                                                                        weights_bias_correction=False))
+        torch.manual_seed(0)
+        model = TestModel()
+
+        caches = []
+        get_outputs = FloatOutputsCache.get_outputs
+
+        def _get_outputs(cache, *args, **kwargs):
+            if cache not in caches:
+                caches.append(cache)
+            return get_outputs(cache, *args, **kwargs)
+
+        with patch.object(FloatOutputsCache, 'get_outputs', _get_outputs):
+            quant_model, _ = pytorch_gradient_post_training_quantization_experimental(
+                model=model,
+                representative_data_gen=representative_data_gen,
+                core_config=core_config,
+                gptq_config=gptq_config)
+        return quant_model, caches
+
+    def test_cached_float_outputs(self):
+        batches = get_batches()
+
+        def representative_data_gen():
+            for batch in batches:
+                yield batch
+
+        quant_model, caches = self._run_gptq(representative_data_gen, cache_float_outputs=False)
+        self.assertEqual(len(caches), 0)
+        cached_quant_model, caches = self._run_gptq(representative_data_gen, cache_float_outputs=True)
+        self.assertEqual(len(caches), 1)
+        self.assertTrue(caches[0].enabled)
+        self.assertEqual(caches[0].num_replays, 2 * NUM_BATCHES)
+
+        # Replaying the float outputs does not change the training.
+        for (name, param), (_, cached_param) in zip(quant_model.state_dict().items(),
+                                                    cached_quant_model.state_dict().items()):
+            self.assertTrue(torch.equal(param, cached_param), msg=f'Mismatch in {name}')
+
+    def test_non_deterministic_dataset(self):
+        epoch = [0]
+
+        def representative_data_gen():
+            epoch[0] += 1
+            for batch in get_batches(seed=epoch[0]):
+                yield batch
+
+        with self.assertLogs(LOGGER_NAME, level='WARNING') as logs:
+            _, caches = self._run_gptq(representative_data_gen, cache_float_outputs=True)
+        self.assertFalse(caches[0].enabled)
+        self.assertEqual(caches[0].num_replays, 0)
+        self.assertTrue(any(['not deterministic' in line for line in logs.output]))
+
+
+if __name__ == '__main__':
+    unittest.main()
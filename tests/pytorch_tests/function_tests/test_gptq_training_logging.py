@@ -0,0 +1,113 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.gptq import get_pytorch_gptq_config, \
+    pytorch_gradient_post_training_quantization_experimental, GPTQDataConfig
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from tests.pytorch_tests.function_tests.get_gptq_config_test import TestModel
+
+NUM_BATCHES = 5
+NUM_EPOCHS = 2
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    for _ in range(NUM_BATCHES):
+        yield [np.random.random((1, 3, 8, 8)).astype(np.float32)]
+
+
+class TestGPTQTrainingLogging(unittest.TestCase):
+
+    def _run_gptq(self, log_function=None, log_interval=1, step_profiler=None, data_config=None):
+        gptq_config = get_pytorch_gptq_config(n_epochs=NUM_EPOCHS, log_function=log_function)
+        gptq_config.use_hessian_based_weights = False
+        gptq_config.log_interval = log_interval
+        gptq_config.step_profiler = step_profiler
+        gptq_config.data_config = data_config
+        core_config = CoreConfig(quantization_config=QuantizationConfig(QuantizationErrorMethod.MSE,
+                                                                        QuantizationErrorMethod.MSE,
+                                                                        weights_bias_correction=False))
+        trainers = []
+        micro_training_loop = PytorchGPTQTrainer.micro_training_loop
+
+        def _micro_training_loop(trainer, *args, **kwargs):
+            trainers.append(trainer)
+            return micro_training_loop(trainer, *args, **kwargs)
+
+        with patch.object(PytorchGPTQTrainer, 'micro_training_loop', _micro_training_loop):
+            pytorch_gradient_post_training_quantization_experimental(model=TestModel(),
+                                                                     representative_data_gen=representative_data_gen,
+                                                                     core_config=core_config,
+                                                                     gptq_config=gptq_config)
+        return trainers[0]
+
+    def test_no_gradients_copy_without_log_function(self):
+        return_grads = []
+        compute_gradients = PytorchGPTQTrainer.compute_gradients
+
+        def _compute_gradients(trainer, *args, **kwargs):
+            loss_value, grads = compute_gradients(trainer, *args, **kwargs)
+            return_grads.append(grads is not None)
+            return loss_value, grads
+
+        with patch.object(PytorchGPTQTrainer, 'compute_gradients', _compute_gradients):
+            trainer = self._run_gptq()
+        self.assertEqual(return_grads, [False] * NUM_BATCHES * NUM_EPOCHS)
+        self.assertEqual(len(trainer.loss_list), NUM_BATCHES * NUM_EPOCHS)
+        self.assertTrue(all([isinstance(loss, float) for loss in trainer.loss_list]))
+
+    def test_log_interval(self):
+        logged = []
+
+        def log_function(loss_value, grads, params):
+            logged.append((loss_value, grads, params))
+
+        trainer = self._run_gptq(log_function=log_function, log_interval=3)
+        # Steps 0, 3, 6 and 9 are logged.
+        self.assertEqual(len(logged), 4)
+        for i, (loss_value, grads, params) in enumerate(logged):
+            self.assertAlmostEqual(loss_value, trainer.loss_list[3 * i], places=5)
+            self.assertTrue(len(grads) > 0)
+            self.assertTrue(all([isinstance(g, np.ndarray) for g in grads]))
+            self.assertTrue(all([isinstance(p, np.ndarray) for p in params]))
+
+    def test_step_profiler(self):
+        profiled = []
+        self._run_gptq(step_profiler=lambda step, duration: profiled.append((step, duration)))
+        self.assertEqual([step for step, _ in profiled], list(range(NUM_BATCHES * NUM_EPOCHS)))
+        self.assertTrue(all([duration > 0 for _, duration in profiled]))
+
+    def test_data_pipeline(self):
+        batch_sizes = []
+        compute_gradients = PytorchGPTQTrainer.compute_gradients
+
+        def _compute_gradients(trainer, y_float, input_tensors, *args, **kwargs):
+            batch_sizes.append(input_tensors[0].shape[0])
+            return compute_gradients(trainer, y_float, input_tensors, *args, **kwargs)
+
+        with patch.object(PytorchGPTQTrainer, 'compute_gradients', _compute_gradients):
+            trainer = self._run_gptq(data_config=GPTQDataConfig(batch_size=2, shuffle=True))
+        self.assertEqual(batch_sizes, [2, 2, 1] * NUM_EPOCHS)
+        self.assertEqual(len(trainer.loss_list), 3 * NUM_EPOCHS)
+
+
+if __name__ == '__main__':
+    unittest.main()
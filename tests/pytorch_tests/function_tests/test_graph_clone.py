@@ -0,0 +1,87 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_metric_cache import Model, representative_data_gen, \
+    INPUT_SHAPE
+
+
+class TestGraphClone(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                generate_pytorch_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _get_node_pairs(self, clone):
+        nodes_pairs = list(zip(self.graph.get_topo_sorted_nodes(), clone.get_topo_sorted_nodes()))
+        for n, cloned_n in nodes_pairs:
+            self.assertEqual(n.name, cloned_n.name)
+            self.assertIsNot(n, cloned_n)
+            self.assertIsNot(n.weights, cloned_n.weights)
+            self.assertIsNot(n.candidates_quantization_cfg, cloned_n.candidates_quantization_cfg)
+        return nodes_pairs
+
+    def test_shared_weights_clone(self):
+        clone = self.graph.clone()
+        nodes_pairs = self._get_node_pairs(clone)
+        self.assertEqual(len(clone.edges), len(self.graph.edges))
+
+        for n, cloned_n in nodes_pairs:
+            for k, w in n.weights.items():
+                self.assertIs(cloned_n.weights[k], w)
+            self.assertIs(clone.get_out_stats_collector(cloned_n), self.graph.get_out_stats_collector(n))
+
+        # Setting a weight of the clone does not modify the graph.
+        conv, cloned_conv = [(n, c) for n, c in nodes_pairs if n.name == 'conv1'][0]
+        kernel = conv.get_weights_by_keys(KERNEL)
+        cloned_conv.set_weights_by_keys(KERNEL, np.zeros_like(kernel))
+        self.assertIs(conv.get_weights_by_keys(KERNEL), kernel)
+        self.assertFalse(np.all(kernel == 0))
+
+        # Scaling the statistics of the clone does not modify the graph's statistics.
+        relu, cloned_relu = [(n, c) for n, c in nodes_pairs if n.name == 'relu'][0]
+        collector = self.graph.get_out_stats_collector(relu)
+        mean = collector.get_mean()
+        clone.scale_stats_collector(cloned_relu, np.array([2.0]))
+        self.assertIs(self.graph.get_out_stats_collector(relu), collector)
+        self.assertTrue(np.array_equal(collector.get_mean(), mean))
+        self.assertTrue(np.allclose(clone.get_out_stats_collector(cloned_relu).get_mean(), 2.0 * mean))
+
+        # Modifying the candidates of the clone does not modify the graph.
+        self.assertTrue(relu.candidates_quantization_cfg[0].activation_quantization_cfg.enable_activation_quantization)
+        cloned_relu.candidates_quantization_cfg[0].activation_quantization_cfg.enable_activation_quantization = False
+        self.assertTrue(relu.candidates_quantization_cfg[0].activation_quantization_cfg.enable_activation_quantization)
+
+    def test_deep_clone(self):
+        clone = self.graph.clone(share_weights=False)
+        for n, cloned_n in self._get_node_pairs(clone):
+            for k, w in n.weights.items():
+                if w is not None:
+                    self.assertIsNot(cloned_n.weights[k], w)
+                    self.assertTrue(np.array_equal(cloned_n.weights[k], w))
+            self.assertIsNot(clone.get_out_stats_collector(cloned_n), self.graph.get_out_stats_collector(n))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = (1, 3, 16, 16)
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super(ResidualModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(8, 8, kernel_size=1)
+        self.conv4 = torch.nn.Conv2d(8, 4, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        # The output of conv1 is used after conv2 and conv3, so it is kept in the cache to resume from them.
+        y = self.conv3(self.relu(self.conv2(x)))
+        return self.conv4(x + y)
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def get_sensitivity_evaluator(graph, incremental_sensitivity_evaluation):
+    return PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=2, use_grad_based_weights=False, metric_cache_size=0,
+                                           incremental_sensitivity_evaluation=incremental_sensitivity_evaluation),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+
+class TestIncrementalSensitivityEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(ResidualModel(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                generate_pytorch_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _compute_metrics(self, se, baseline_cfg):
+        """
+        Computes the metric of each single-node modification of a baseline configuration.
+        """
+        metrics = [se.compute_metric(baseline_cfg)]
+        for node_idx, node in enumerate(self.graph.get_configurable_sorted_nodes()):
+            for bitwidth_idx in range(len(node.candidates_quantization_cfg)):
+                cfg = list(baseline_cfg)
+                cfg[node_idx] = bitwidth_idx
+                metrics.append(se.compute_metric(cfg, [node_idx], baseline_cfg))
+        return metrics
+
+    def test_incremental_metrics_equal_full_inference_metrics(self):
+        full_se = get_sensitivity_evaluator(self.graph, incremental_sensitivity_evaluation=False)
+        incremental_se = get_sensitivity_evaluator(self.graph, incremental_sensitivity_evaluation=True)
+        for baseline_cfg in [self.graph.get_max_candidates_config(), self.graph.get_min_candidates_config()]:
+            full_metrics = self._compute_metrics(full_se, baseline_cfg)
+            incremental_metrics = self._compute_metrics(incremental_se, baseline_cfg)
+            self.assertTrue(np.allclose(full_metrics, incremental_metrics, rtol=1e-5, atol=1e-8))
+            self.assertEqual(incremental_se._inference_caches_configuration, list(baseline_cfg))
+
+    def test_multiple_modified_nodes(self):
+        full_se = get_sensitivity_evaluator(self.graph, incremental_sensitivity_evaluation=False)
+        incremental_se = get_sensitivity_evaluator(self.graph, incremental_sensitivity_evaluation=True)
+        max_cfg = self.graph.get_max_candidates_config()
+        min_cfg = self.graph.get_min_candidates_config()
+        nodes_idx = [1, len(max_cfg) - 1]
+        cfg = list(max_cfg)
+        for i in nodes_idx:
+            cfg[i] = min_cfg[i]
+        for se in [full_se, incremental_se]:
+            se.compute_metric(max_cfg)
+        self.assertTrue(np.isclose(full_se.compute_metric(cfg, nodes_idx, max_cfg),
+                                   incremental_se.compute_metric(cfg, nodes_idx, max_cfg)))
+        self.assertIsNotNone(incremental_se._inference_caches)
+        self.assertIsNone(full_se._inference_caches)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.integer_executor.integer_graph_executor import IntegerGraphExecutor
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.ptq.runner import ptq_runner
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+
+
+class IntegerExecutorModel(torch.nn.Module):
+    def __init__(self):
+        super(IntegerExecutorModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, 3, padding=1)
+        self.bn = torch.nn.BatchNorm2d(16)
+        self.relu = torch.nn.ReLU()
+        self.dw = torch.nn.Conv2d(16, 16, 3, stride=2, padding=1, groups=16)
+        self.relu6 = torch.nn.ReLU6()
+        self.conv2 = torch.nn.Conv2d(16, 16, 1)
+        self.max_pool = torch.nn.MaxPool2d(2)
+        self.avg_pool = torch.nn.AvgPool2d(2)
+        self.linear = torch.nn.Linear(16 * 4 * 4 * 2, 10)
+
+    def forward(self, x):
+        x = self.relu(self.bn(self.conv1(x)))
+        y = self.relu6(self.dw(x))
+        y = y + self.conv2(y)
+        y = torch.nn.functional.silu(y)
+        y = torch.cat([self.max_pool(y), self.avg_pool(y)], 1)
+        y = torch.flatten(y, 1)
+        return torch.sigmoid(self.linear(y))
+
+
+class UnsupportedModel(torch.nn.Module):
+    def __init__(self):
+        super(UnsupportedModel, self).__init__()
+        self.conv = torch.nn.Conv2d(3, 4, 3)
+
+    def forward(self, x):
+        return torch.softmax(self.conv(x), 1)
+
+
+class TestIntegerGraphExecutor(unittest.TestCase):
+
+    def representative_data_gen(self):
+        np.random.seed(0)
+        for _ in range(2):
+            yield [np.random.randn(4, 3, 16, 16).astype(np.float32)]
+
+    def quantize(self, model, tp_model_params):
+        fw_impl = PytorchImplementation()
+        tpc = generate_pytorch_tpc(name='integer_executor_test', tp_model=generate_test_tp_model(tp_model_params))
+        core_config = mct.core.CoreConfig()
+        tg, _ = core_runner(model.eval(), self.representative_data_gen, core_config, DEFAULT_PYTORCH_INFO,
+                            fw_impl, tpc)
+        return ptq_runner(tg, self.representative_data_gen, core_config, DEFAULT_PYTORCH_INFO, fw_impl, None)
+
+    def run_fake_quant_model(self, tg, x):
+        fw_impl = PytorchImplementation()
+        quantized_tg = quantize_graph_weights(copy.deepcopy(tg), DEFAULT_PYTORCH_INFO, fw_impl)
+        model, _ = fw_impl.model_builder(quantized_tg, ModelBuilderMode.QUANTIZED, fw_info=DEFAULT_PYTORCH_INFO)
+        return torch_tensor_to_numpy(model(to_torch_tensor(x)))
+
+    def check_integer_executor(self, tp_model_params):
+        tg = self.quantize(IntegerExecutorModel(), tp_model_params)
+        x = next(self.representative_data_gen())[0]
+        executor = IntegerGraphExecutor(tg, PytorchImplementation(), DEFAULT_PYTORCH_INFO)
+        output = executor([x])[0]
+        fq_output = self.run_fake_quant_model(tg, x)
+
+        # Fixed-point requantization rounds differently than float fake-quantization in rare ties, so the outputs
+        # may differ by a few steps of the output quantization.
+        output_scale = executor.output_params[executor.output_nodes[0]].scale
+        self.assertEqual(output.shape, fq_output.shape)
+        self.assertLessEqual(np.max(np.abs(output - fq_output)), 2 * output_scale + 1e-6)
+        self.assertGreater(np.mean(np.isclose(output, fq_output)), 0.9)
+
+        integer_output = executor([x], return_integers=True)[0]
+        self.assertEqual(integer_output.values.dtype, np.int64)
+        self.assertTrue(np.array_equal(integer_output.dequantize(), output))
+        self.assertGreater(executor.weights_bytes, 0)
+        self.assertGreater(executor.peak_activation_bytes, x.size)
+        self.assertGreater(executor.activation_traffic_bytes, executor.peak_activation_bytes)
+
+    def test_power_of_two_quantization(self):
+        self.check_integer_executor({})
+
+    def test_uniform_quantization(self):
+        self.check_integer_executor({'activation_quantization_method': QuantizationMethod.UNIFORM,
+                                     'weights_quantization_method': QuantizationMethod.UNIFORM})
+
+    def test_unsupported_node(self):
+        tg = self.quantize(UnsupportedModel(), {})
+        with self.assertRaises(Exception) as e:
+            IntegerGraphExecutor(tg, PytorchImplementation(), DEFAULT_PYTORCH_INFO)
+        self.assertIn('does not support node softmax', str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.jacobian_weights_cache import JacobianWeightsCache, \
+    _update_hash_with_value
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_metric_cache import Model, representative_data_gen, \
+    INPUT_SHAPE
+
+
+def get_sensitivity_evaluator(graph, cache_dir, jacobians_n_iter=50):
+    return PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=1, jacobians_cache_dir=cache_dir,
+                                           jacobians_n_iter=jacobians_n_iter),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+
+def get_value_hash(value):
+    h = hashlib.sha256()
+    _update_hash_with_value(h, value)
+    return h.hexdigest()
+
+
+class Constant:
+    """
+    A tensor-like constant with a truncated representation (as tf.Tensor).
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def numpy(self):
+        return self.value
+
+    def __repr__(self):
+        return f'Constant(shape={self.value.shape})'
+
+
+class TestJacobianWeightsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                generate_pytorch_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_sensitivity_evaluation_reuses_cached_weights(self):
+        se = get_sensitivity_evaluator(self.graph, self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        with patch.object(PytorchImplementation, 'model_grad') as model_grad:
+            cached_se = get_sensitivity_evaluator(self.graph, self.cache_dir)
+        model_grad.assert_not_called()
+        self.assertTrue(np.array_equal(cached_se.interest_points_gradients, se.interest_points_gradients))
+
+        # A different number of approximation iterations is a different computation.
+        get_sensitivity_evaluator(self.graph, self.cache_dir, jacobians_n_iter=10)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_key(self):
+        interest_points = self.graph.get_topo_sorted_nodes()
+        samples = list(representative_data_gen())
+        settings = {'n_iter': 50}
+        key = JacobianWeightsCache.get_key(self.graph, interest_points, samples, settings)
+        self.assertEqual(JacobianWeightsCache.get_key(self.graph, interest_points, samples, settings), key)
+
+        self.assertNotEqual(JacobianWeightsCache.get_key(self.graph, interest_points[1:], samples, settings), key)
+        self.assertNotEqual(JacobianWeightsCache.get_key(self.graph, interest_points, [[2 * samples[0][0]]],
+                                                         settings), key)
+        self.assertNotEqual(JacobianWeightsCache.get_key(self.graph, interest_points, samples, {'n_iter': 10}), key)
+
+        # The nodes' attributes are part of the graph's fingerprint.
+        conv = [n for n in self.graph.nodes if n.name == 'conv1'][0]
+        padding = conv.framework_attr['padding']
+        conv.framework_attr['padding'] = (1, 1)
+        self.assertNotEqual(JacobianWeightsCache.get_key(self.graph, interest_points, samples, settings), key)
+        conv.framework_attr['padding'] = padding
+        self.assertEqual(JacobianWeightsCache.get_key(self.graph, interest_points, samples, settings), key)
+
+        conv.set_weights_by_keys(KERNEL, conv.get_weights_by_keys(KERNEL) + 1)
+        self.assertNotEqual(JacobianWeightsCache.get_key(self.graph, interest_points, samples, settings), key)
+
+    def test_attribute_values_hash(self):
+        # Large constants that differ only in the middle of their (truncated) representations.
+        a = np.zeros(10000)
+        b = a.copy()
+        b[5000] = 1
+        self.assertNotEqual(get_value_hash(Constant(a)), get_value_hash(Constant(b)))
+        self.assertNotEqual(get_value_hash({'w': torch.Tensor(a)}), get_value_hash({'w': torch.Tensor(b)}))
+        self.assertNotEqual(get_value_hash([a]), get_value_hash([b]))
+        self.assertNotEqual(get_value_hash(Constant(a)), get_value_hash(Constant(a.astype(np.float32))))
+        self.assertEqual(get_value_hash(Constant(a)), get_value_hash(Constant(a.copy())))
+        self.assertEqual(get_value_hash({'k': (1, 'same', None)}), get_value_hash({'k': (1, 'same', None)}))
+
+    def test_eviction(self):
+        weights = np.arange(16, dtype=np.float64)
+        cache = JacobianWeightsCache(self.cache_dir, max_bytes=2 ** 20)
+        cache.save('a', weights)
+        # Budget of two entries
+        cache.max_bytes = 2 * os.path.getsize(os.path.join(self.cache_dir, 'jacobian_weights_a.npy'))
+        cache.save('b', weights)
+        # Using 'a' makes 'b' the least recently used entry.
+        os.utime(os.path.join(self.cache_dir, 'jacobian_weights_b.npy'), (0, 0))
+        self.assertTrue(np.array_equal(cache.load('a'), weights))
+
+        cache.save('c', weights)
+        self.assertIsNone(cache.load('b'))
+        self.assertTrue(np.array_equal(cache.load('a'), weights))
+        self.assertTrue(np.array_equal(cache.load('c'), weights))
+
+        # Weights that exceed the budget by themselves are not cached.
+        cache.save('d', np.zeros(1000))
+        self.assertIsNone(cache.load('d'))
+
+        # An unreadable entry is removed and recomputed.
+        with open(os.path.join(self.cache_dir, 'jacobian_weights_e.npy'), 'wb') as f:
+            f.write(b'corrupted')
+        self.assertTrue(np.array_equal(cache.get_or_compute('e', lambda: weights), weights))
+        self.assertTrue(np.array_equal(cache.load('e'), weights))
+
+
+if __name__ == '__main__':
+    unittest.main()
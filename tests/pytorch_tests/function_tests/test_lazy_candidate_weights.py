@@ -0,0 +1,110 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+from mct_quantizers import PytorchQuantizationWrapper
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_metric_cache import Model, representative_data_gen, \
+    INPUT_SHAPE
+
+
+def get_sensitivity_evaluator(graph, candidate_weights_cache_size=None, compact_candidate_weights=False):
+    return PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=1, use_grad_based_weights=False, metric_cache_size=0,
+                                           candidate_weights_cache_size=candidate_weights_cache_size,
+                                           compact_candidate_weights=compact_candidate_weights),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+
+def get_configurable_quantizers(model):
+    return [q for m in model.modules() if isinstance(m, PytorchQuantizationWrapper)
+            for q in m.weights_quantizers.values() if isinstance(q, ConfigurableWeightsQuantizer)]
+
+
+class TestLazyCandidateWeights(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                generate_pytorch_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+
+    def _get_configurations(self):
+        max_cfg = self.graph.get_max_candidates_config()
+        num_candidates = [len(n.candidates_quantization_cfg) for n in self.graph.get_configurable_sorted_nodes()]
+        configurations = [max_cfg]
+        for node_idx, n in enumerate(num_candidates):
+            for candidate_idx in range(n):
+                cfg = list(max_cfg)
+                cfg[node_idx] = candidate_idx
+                configurations.append(cfg)
+        return configurations + [max_cfg]
+
+    def test_lazy_candidate_weights_metrics(self):
+        configurations = self._get_configurations()
+        full_se = get_sensitivity_evaluator(self.graph)
+        full_metrics = [full_se.compute_metric(cfg) for cfg in configurations]
+
+        float_kernel_bytes = max([q.float_weights.nbytes for q in get_configurable_quantizers(full_se.model_mp)])
+        for compact in [False, True]:
+            lazy_se = get_sensitivity_evaluator(self.graph, candidate_weights_cache_size=2 * float_kernel_bytes,
+                                                compact_candidate_weights=compact)
+            quantizers = get_configurable_quantizers(lazy_se.model_mp)
+            self.assertTrue(len(quantizers) > 0)
+            weights_cache = quantizers[0].weights_cache
+            for q in quantizers:
+                self.assertIsNone(q.quantized_weights)
+                self.assertIs(q.weights_cache, weights_cache)
+
+            lazy_metrics = [lazy_se.compute_metric(cfg) for cfg in configurations]
+            self.assertTrue(np.allclose(full_metrics, lazy_metrics), f'Lazy candidate weights metrics differ '
+                                                                     f'(compact={compact})')
+            self.assertTrue(weights_cache.nbytes <= weights_cache.max_bytes)
+            # Evicted candidates were quantized again when they were used.
+            self.assertTrue(weights_cache.num_quantizations > len(weights_cache))
+
+    def test_active_candidate_not_looked_up(self):
+        lazy_se = get_sensitivity_evaluator(self.graph, candidate_weights_cache_size=2 ** 20,
+                                            compact_candidate_weights=True)
+        quantizers = get_configurable_quantizers(lazy_se.model_mp)
+        weights_cache = quantizers[0].weights_cache
+        lookups = []
+        get = weights_cache.get
+        weights_cache.get = lambda owner_id, index, *args, **kwargs: (lookups.append((owner_id, index)),
+                                                                      get(owner_id, index, *args, **kwargs))[1]
+
+        # Setting the active candidate again does not look up its weights.
+        for q in quantizers:
+            q.set_weights_bit_width_index(q.active_quantization_config_index)
+        self.assertEqual(lookups, [])
+
+        # Only the quantizer that changes its candidate looks up the new candidate's weights.
+        new_index = (quantizers[0].active_quantization_config_index + 1) % len(quantizers[0].node_q_cfg)
+        quantizers[0].set_weights_bit_width_index(new_index)
+        self.assertEqual(lookups, [(quantizers[0].weights_cache_owner_id, new_index)])
+
+
+if __name__ == '__main__':
+    unittest.main()
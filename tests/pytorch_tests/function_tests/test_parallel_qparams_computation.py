@@ -0,0 +1,98 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import SCALE_PER_CHANNEL
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.v4_lut.tpc_pytorch import \
+    get_pytorch_tpc as get_lut_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = (1, 3, 16, 16)
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super(Model, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(16, 16, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(16, 8, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        x = x + self.relu(self.conv2(x))
+        return self.conv3(x)
+
+
+def get_graph(get_tpc_func, mixed_precision_enabled=False):
+    def representative_data_gen():
+        yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+    return prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                                      representative_data_gen, get_tpc_func, INPUT_SHAPE,
+                                                      mixed_precision_enabled=mixed_precision_enabled)
+
+
+def get_candidates_params(graph):
+    return [(c.weights_quantization_cfg.weights_quantization_params, c.weights_quantization_cfg.weights_channels_axis,
+             c.activation_quantization_cfg.activation_quantization_params)
+            for n in graph.get_topo_sorted_nodes() for c in n.candidates_quantization_cfg]
+
+
+class TestParallelQparamsComputation(unittest.TestCase):
+
+    def test_parallel_computation_equals_serial_computation(self):
+        graph = get_graph(generate_pytorch_tpc)
+        serial_params = get_candidates_params(graph)
+
+        calculate_quantization_params(graph, DEFAULT_PYTORCH_INFO, fw_impl=PytorchImplementation(), n_workers=4)
+        parallel_params = get_candidates_params(graph)
+
+        self.assertEqual(len(serial_params), len(parallel_params))
+        for (s_weights, s_axis, s_activation), (p_weights, p_axis, p_activation) in zip(serial_params,
+                                                                                       parallel_params):
+            self.assertEqual(s_axis, p_axis)
+            for s_params, p_params in [(s_weights, p_weights), (s_activation, p_activation)]:
+                self.assertEqual(s_params.keys(), p_params.keys())
+                for k in s_params:
+                    self.assertTrue(np.array_equal(s_params[k], p_params[k]))
+
+    def test_parallel_lut_computation(self):
+        # The LUT candidates are the mixed-precision candidates of the TPC.
+        graph = get_graph(lambda name, tp_model: get_lut_pytorch_tpc(), mixed_precision_enabled=True)
+        serial_params = get_candidates_params(graph)
+
+        # The LUT weights params are computed in a process pool.
+        calculate_quantization_params(graph, DEFAULT_PYTORCH_INFO, fw_impl=PytorchImplementation(), n_workers=2)
+        parallel_params = get_candidates_params(graph)
+
+        lut_params = [(s, p) for (s, _, _), (p, _, _) in zip(serial_params, parallel_params) if SCALE_PER_CHANNEL in s]
+        self.assertTrue(len(lut_params) > 0)
+        for s_weights, p_weights in lut_params:
+            # The clusters are computed by KMeans with a random initialization, so only the scales are compared.
+            self.assertEqual(s_weights.keys(), p_weights.keys())
+            self.assertTrue(np.array_equal(s_weights[SCALE_PER_CHANNEL], p_weights[SCALE_PER_CHANNEL]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super(ResidualModel, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(8, 8, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        y = self.relu(self.conv2(x))
+        y = self.conv3(y)
+        x = x + y
+        a, b = torch.split(x, 4, dim=1)
+        return torch.cat([b, a], dim=1), torch.mean(a, dim=1)
+
+
+class AttentionModel(torch.nn.Module):
+    def __init__(self):
+        super(AttentionModel, self).__init__()
+        self.q = torch.nn.Linear(16, 16)
+        self.k = torch.nn.Linear(16, 16)
+        self.v = torch.nn.Linear(16, 16)
+        self.proj = torch.nn.Linear(16, 16)
+
+    def forward(self, x):
+        attn = torch.matmul(self.q(x), torch.transpose(self.k(x), 1, 2))
+        attn = torch.softmax(attn, dim=-1)
+        return self.proj(torch.matmul(attn, self.v(x))) + x
+
+
+def get_float_model(model, input_shape, append2output=None):
+    def representative_data_gen():
+        yield [np.random.randn(*input_shape).astype(np.float32)]
+
+    graph = prepare_graph_with_configs(model, PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                       representative_data_gen, generate_pytorch_tpc)
+    float_model, _ = FloatPyTorchModelBuilder(graph, append2output=append2output).build_model()
+    return float_model, graph
+
+
+class TestPytorchExecutionPlan(unittest.TestCase):
+
+    def _assert_outputs_equal(self, outputs, expected_outputs):
+        if isinstance(expected_outputs, torch.Tensor):
+            expected_outputs, outputs = [expected_outputs], [outputs]
+        self.assertEqual(len(outputs), len(expected_outputs))
+        for o, e in zip(outputs, expected_outputs):
+            self.assertTrue(np.allclose(torch_tensor_to_numpy(o), torch_tensor_to_numpy(e), atol=1e-5))
+
+    def test_execution_plan_outputs(self):
+        for model, input_shape in [(ResidualModel(), (2, 3, 8, 8)), (AttentionModel(), (2, 5, 16))]:
+            model.eval()
+            float_model, graph = get_float_model(model, input_shape)
+            x = to_torch_tensor(np.random.randn(*input_shape).astype(np.float32))
+            expected_outputs = model.to(x.device)(x)
+            # Run twice: the first run compiles the execution plan, and the second run reuses it.
+            for _ in range(2):
+                self._assert_outputs_equal(float_model(x), expected_outputs)
+            self.assertEqual(len(float_model._execution_plan.steps), len(graph.nodes))
+
+    def test_execution_plan_release_intermediates(self):
+        float_model, graph = get_float_model(ResidualModel(), (2, 3, 8, 8))
+        float_model(to_torch_tensor(np.random.randn(2, 3, 8, 8).astype(np.float32)))
+        plan = float_model._execution_plan
+
+        # Each slot is released exactly once, except for the outputs slots which are never released.
+        released_slots = [s for step in plan.steps for s in step.slots_to_release]
+        self.assertEqual(len(released_slots), len(set(released_slots)))
+        self.assertEqual(set(released_slots).union(plan.output_slots), set(range(len(plan.steps))))
+        # A slot is released only after its last consumer.
+        for i, step in enumerate(plan.steps):
+            for s in step.input_slots:
+                self.assertTrue(all([s not in later_step.slots_to_release for later_step in plan.steps[:i]]))
+
+    def test_execution_plan_append2output(self):
+        model = AttentionModel()
+        _, graph = get_float_model(model, (2, 5, 16))
+        append2output = [n for n in graph.get_topo_sorted_nodes() if n.type == torch.nn.Linear][:2]
+        float_model, _ = FloatPyTorchModelBuilder(graph, append2output=append2output).build_model()
+        x = to_torch_tensor(np.random.randn(2, 5, 16).astype(np.float32))
+        outputs = float_model(x)
+        self.assertTrue(isinstance(outputs, list))
+        self._assert_outputs_equal(outputs, [model.q.to(x.device)(x), model.k.to(x.device)(x)])
+
+    def test_execution_plan_invalidation(self):
+        float_model, graph = get_float_model(AttentionModel(), (2, 5, 16))
+        x = to_torch_tensor(np.random.randn(2, 5, 16).astype(np.float32))
+        float_model(x)
+        plan = float_model._execution_plan
+
+        # Replacing a module of the model invalidates the plan.
+        proj_node = [n for n in graph.get_topo_sorted_nodes() if n.type == torch.nn.Linear][-1]
+        new_proj = copy.deepcopy(getattr(float_model, proj_node.name))
+        torch.nn.init.zeros_(new_proj.weight)
+        torch.nn.init.zeros_(new_proj.bias)
+        setattr(float_model, proj_node.name, new_proj)
+        self.assertIsNone(float_model._execution_plan)
+        self._assert_outputs_equal(float_model(x), x)
+
+        # Setting other attributes does not invalidate the plan.
+        plan = float_model._execution_plan
+        float_model.eval()
+        self.assertTrue(float_model._execution_plan is plan)
+
+        # A copy of the model compiles its own plan.
+        copied_model = copy.deepcopy(float_model)
+        self.assertIsNone(copied_model._execution_plan)
+        self._assert_outputs_equal(copied_model(x), x)
+        self.assertTrue(copied_model._execution_plan.steps[-2].op_func is getattr(copied_model, proj_node.name))
+
+        # Modifying the graph recompiles the plan.
+        graph.invalidate_cache()
+        float_model(x)
+        self.assertFalse(float_model._execution_plan is plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
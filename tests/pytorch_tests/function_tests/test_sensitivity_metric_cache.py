@@ -0,0 +1,152 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2, KPI
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width, \
+    get_sensitivity_evaluator
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+INPUT_SHAPE = (1, 3, 16, 16)
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super(Model, self).__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        return self.conv2(self.relu(self.conv1(x)))
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def get_sensitivity_evaluator_with_cache(graph, metric_cache_size):
+    return PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=1, use_grad_based_weights=False,
+                                           metric_cache_size=metric_cache_size),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+
+class TestSensitivityMetricCache(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(),
+                                                                DEFAULT_PYTORCH_INFO, representative_data_gen,
+                                                                generate_pytorch_tpc, INPUT_SHAPE,
+                                                                mixed_precision_enabled=True)
+        self.max_cfg = self.graph.get_max_candidates_config()
+        self.min_cfg = self.graph.get_min_candidates_config()
+
+    def test_searches_with_different_kpis_share_cached_metrics(self):
+        fw_impl = PytorchImplementation()
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=1, use_grad_based_weights=False)
+        kpis = [KPI(weights_memory=np.inf), KPI(weights_memory=500)]
+        se = get_sensitivity_evaluator(self.graph, DEFAULT_PYTORCH_INFO, fw_impl, kpis[0], mp_config,
+                                       representative_data_gen)
+
+        configurations = []
+        for i, kpi in enumerate(kpis):
+            metric_cache_misses = se.metric_cache_misses
+            configurations.append(search_bit_width(self.graph, DEFAULT_PYTORCH_INFO, fw_impl, kpi, mp_config,
+                                                   representative_data_gen, sensitivity_evaluator=se))
+            if i == 0:
+                self.assertEqual(se.metric_cache_hits, 0)
+                self.assertTrue(se.metric_cache_misses > 0)
+            else:
+                # The search with the second target KPI evaluates the same configurations, which are all cached.
+                self.assertEqual(se.metric_cache_hits, metric_cache_misses)
+                self.assertEqual(se.metric_cache_misses, metric_cache_misses)
+
+        # The searches with the shared evaluator give the same configurations as searches with their own evaluators.
+        for kpi, configuration in zip(kpis, configurations):
+            self.assertTrue(np.array_equal(configuration, search_bit_width(self.graph, DEFAULT_PYTORCH_INFO, fw_impl,
+                                                                           kpi, mp_config, representative_data_gen)))
+        self.assertFalse(np.array_equal(configurations[0], configurations[1]))
+
+        # An evaluator of another graph can not be used for the search.
+        with self.assertRaises(Exception):
+            search_bit_width(self.graph.clone(), DEFAULT_PYTORCH_INFO, fw_impl, kpis[1], mp_config,
+                             representative_data_gen, sensitivity_evaluator=se)
+
+    def test_cached_metrics_equal_computed_metrics(self):
+        se = get_sensitivity_evaluator_with_cache(self.graph, metric_cache_size=16)
+        max_metric = se.compute_metric(self.max_cfg)
+        cfg = list(self.max_cfg)
+        cfg[0] = self.min_cfg[0]
+        node_metric = se.compute_metric(cfg, [0], self.max_cfg)
+        self.assertEqual(se.compute_metric(self.max_cfg), max_metric)
+        self.assertEqual(se.compute_metric(cfg), node_metric)
+        self.assertEqual((se.metric_cache_hits, se.metric_cache_misses), (2, 2))
+
+        uncached_se = get_sensitivity_evaluator_with_cache(self.graph, metric_cache_size=0)
+        self.assertTrue(np.isclose(uncached_se.compute_metric(self.max_cfg), max_metric))
+        self.assertTrue(np.isclose(uncached_se.compute_metric(cfg), node_metric))
+        self.assertEqual((uncached_se.metric_cache_hits, uncached_se.metric_cache_misses), (0, 0))
+
+    def test_cache_hit_does_not_configure_model(self):
+        se = get_sensitivity_evaluator_with_cache(self.graph, metric_cache_size=16)
+        uncached_se = get_sensitivity_evaluator_with_cache(self.graph, metric_cache_size=0)
+        configured_layers = []
+        set_layer_to_bitwidth = se.set_layer_to_bitwidth
+        se.set_layer_to_bitwidth = lambda layer, bitwidth_idx: (configured_layers.append(layer),
+                                                                set_layer_to_bitwidth(layer, bitwidth_idx))
+
+        se.compute_metric(self.max_cfg)
+        cfg = list(self.max_cfg)
+        cfg[0] = self.min_cfg[0]
+        se.compute_metric(cfg, [0], self.max_cfg)
+        configured_layers.clear()
+
+        # Cache hits relative to the configuration the model is configured to do not configure any layer.
+        se.compute_metric(self.max_cfg)
+        se.compute_metric(cfg, [0], self.max_cfg)
+        self.assertEqual(len(configured_layers), 0)
+        self.assertEqual((se.metric_cache_hits, se.metric_cache_misses), (2, 2))
+
+        # A cache hit of a full configuration leaves the model in that configuration, so later (uncached)
+        # metrics are computed for the right configuration.
+        se.compute_metric(cfg)
+        self.assertEqual(len(configured_layers), len(se.conf_node2layers[se.sorted_configurable_nodes_names[0]]))
+        node_cfg = list(cfg)
+        node_cfg[1] = self.min_cfg[1]
+        self.assertTrue(np.isclose(se.compute_metric(node_cfg, [1], cfg), uncached_se.compute_metric(node_cfg)))
+        self.assertTrue(np.isclose(se.compute_metric(cfg), uncached_se.compute_metric(cfg)))
+
+    def test_lru_eviction(self):
+        se = get_sensitivity_evaluator_with_cache(self.graph, metric_cache_size=1)
+        se.compute_metric(self.max_cfg)
+        se.compute_metric(self.min_cfg)
+        se.compute_metric(self.min_cfg)
+        # The max configuration was evicted from the cache.
+        se.compute_metric(self.max_cfg)
+        self.assertEqual((se.metric_cache_hits, se.metric_cache_misses), (1, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
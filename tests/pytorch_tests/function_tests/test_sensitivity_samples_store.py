@@ -0,0 +1,65 @@
+# Copyright 2023 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.default_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.function_tests.test_sensitivity_metric_cache import Model
+
+INPUT_SHAPE = (2, 3, 16, 16)
+
+
+def representative_data_gen():
+    np.random.seed(0)
+    for _ in range(3):
+        yield [np.random.randn(*INPUT_SHAPE).astype(np.float32)]
+
+
+def get_sensitivity_evaluator(graph, samples_ram_budget):
+    return PytorchImplementation().get_sensitivity_evaluator(
+        graph,
+        MixedPrecisionQuantizationConfigV2(num_of_images=6, use_grad_based_weights=False, metric_cache_size=0,
+                                           samples_ram_budget=samples_ram_budget),
+        representative_data_gen,
+        DEFAULT_PYTORCH_INFO)
+
+
+class TestSensitivitySamplesStore(unittest.TestCase):
+
+    def test_spilled_samples_metrics(self):
+        graph = prepare_graph_with_quantization_parameters(Model(), PytorchImplementation(), DEFAULT_PYTORCH_INFO,
+                                                           representative_data_gen, generate_pytorch_tpc,
+                                                           INPUT_SHAPE, mixed_precision_enabled=True)
+        ram_se = get_sensitivity_evaluator(graph, samples_ram_budget=None)
+        # The budget fits a single images batch.
+        batch_bytes = np.prod(INPUT_SHAPE) * 4
+        spilled_se = get_sensitivity_evaluator(graph, samples_ram_budget=batch_bytes)
+
+        self.assertEqual(ram_se.images_batches.disk_bytes, 0)
+        self.assertEqual(spilled_se.images_batches.ram_bytes, batch_bytes)
+        self.assertEqual(spilled_se.images_batches.disk_bytes, 2 * batch_bytes)
+        self.assertEqual(spilled_se.baseline_tensors_list.ram_bytes, 0)
+
+        for cfg in [graph.get_max_candidates_config(), graph.get_min_candidates_config()]:
+            self.assertEqual(ram_se.compute_metric(cfg), spilled_se.compute_metric(cfg))
+
+
+if __name__ == '__main__':
+    unittest.main()
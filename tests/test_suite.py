@@ -25,13 +25,24 @@ from tests.common_tests.function_tests.test_folder_image_loader import TestFolde
 #  ----------------  Individual test suites
 from model_compression_toolkit.constants import FOUND_ONNX
 from tests.common_tests.function_tests.test_histogram_collector import TestHistogramCollector
+from tests.common_tests.function_tests.test_graph_cache import TestGraphCache
 from tests.common_tests.function_tests.test_kpi_object import TestKPIObject
 from tests.common_tests.function_tests.test_threshold_selection import TestThresholdSelection
+from tests.common_tests.function_tests.test_batched_qparams_search import TestBatchedQparamsSearch
+from tests.common_tests.function_tests.test_histogram_error_engine import TestHistogramErrorEngine
+from tests.common_tests.function_tests.test_activation_store import TestActivationStore
+from tests.common_tests.function_tests.test_candidate_weights_cache import TestCandidateWeightsCache
+from tests.common_tests.function_tests.test_jacobian_weights import TestJacobianWeights
+from tests.common_tests.function_tests.test_float_outputs_cache import TestFloatOutputsCache
+from tests.common_tests.function_tests.test_gptq_data_pipeline import TestGPTQDataPipeline
+from tests.common_tests.function_tests.test_integer_kernels import TestIntegerKernels
+from tests.common_tests.function_tests.test_apply_substitutions import TestApplySubstitutions
 from tests.common_tests.test_doc_examples import TestCommonDocsExamples
 from tests.common_tests.test_tp_model import TargetPlatformModelingTest, OpsetTest, QCOptionsTest, FusingTest
 
 if FOUND_ONNX:
     from tests.pytorch_tests.function_tests.test_export_pytorch_fully_quantized_model import TestPyTorchFakeQuantExporter
+    from tests.pytorch_tests.function_tests.test_export_pytorch_int8_onnx_model import TestPyTorchINT8ONNXExporter
 
 found_tf = importlib.util.find_spec("tensorflow") is not None
 found_pytorch = importlib.util.find_spec("torch") is not None and importlib.util.find_spec(
@@ -56,12 +67,15 @@ if found_tf:
     from tests.keras_tests.function_tests.test_uniform_quantize_tensor import TestUniformQuantizeTensor
     from tests.keras_tests.function_tests.test_uniform_range_selection_weights import TestUniformRangeSelectionWeights
     from tests.keras_tests.function_tests.test_keras_tp_model import TestKerasTPModel
+    from tests.keras_tests.function_tests.test_keras_integer_graph_executor import TestKerasIntegerGraphExecutor
     from tests.keras_tests.function_tests.test_sensitivity_metric_interest_points import \
         TestSensitivityMetricInterestPoints
     from tests.keras_tests.function_tests.test_weights_activation_split_substitution import TestWeightsActivationSplit
     from tests.keras_tests.function_tests.test_activation_weights_composition_substitution import \
         TestActivationWeightsComposition
     from tests.keras_tests.function_tests.test_graph_max_cut import TestGraphMaxCut
+    from tests.keras_tests.function_tests.test_max_cut_kpi import TestMaxCutKPI
+    from tests.keras_tests.function_tests.test_compiled_inference import TestCompiledInference
     from tests.keras_tests.function_tests.test_model_gradients import TestModelGradients
     from tests.keras_tests.function_tests.test_sensitivity_eval_output_replacement import \
         TestSensitivityEvalWithOutputReplacementNodes
@@ -82,6 +96,21 @@ if found_pytorch:
     # from tests.pytorch_tests.model_tests.test_models_runner import ModelTest
     from tests.pytorch_tests.function_tests.test_function_runner import FunctionTestRunner
     from tests.pytorch_tests.function_tests.test_pytorch_tp_model import TestPytorchTPModel
+    from tests.pytorch_tests.function_tests.test_pytorch_execution_plan import TestPytorchExecutionPlan
+    from tests.pytorch_tests.function_tests.test_parallel_qparams_computation import TestParallelQparamsComputation
+    from tests.pytorch_tests.function_tests.test_sensitivity_metric_cache import TestSensitivityMetricCache
+    from tests.pytorch_tests.function_tests.test_disable_activation_for_metric import TestDisableActivationForMetric
+    from tests.pytorch_tests.function_tests.test_incremental_sensitivity_evaluation import \
+        TestIncrementalSensitivityEvaluation
+    from tests.pytorch_tests.function_tests.test_sensitivity_samples_store import TestSensitivitySamplesStore
+    from tests.pytorch_tests.function_tests.test_lazy_candidate_weights import TestLazyCandidateWeights
+    from tests.pytorch_tests.function_tests.test_compact_quantized_weights import TestCompactQuantizedWeights
+    from tests.pytorch_tests.function_tests.test_graph_clone import TestGraphClone
+    from tests.pytorch_tests.function_tests.test_integer_graph_executor import TestIntegerGraphExecutor
+    from tests.pytorch_tests.function_tests.test_export_pytorch_inplace import TestPyTorchInplaceExport
+    from tests.pytorch_tests.function_tests.test_jacobian_weights_cache import TestJacobianWeightsCache
+    from tests.pytorch_tests.function_tests.test_gptq_float_outputs_cache import TestGPTQFloatOutputsCache
+    from tests.pytorch_tests.function_tests.test_gptq_training_logging import TestGPTQTrainingLogging
     from tests.trainable_infrastructure_tests.pytorch.test_pytorch_trainable_infra_runner import \
         PytorchTrainableInfrastructureTestRunner
     from tests.pytorch_tests.function_tests.test_gptq_soft_quantizer import TestGPTQSoftQuantizer as pytorch_gptq_soft_quantier_test
@@ -94,9 +123,19 @@ if __name__ == '__main__':
     # -----------------  Load all the test cases
     suiteList = []
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestHistogramCollector))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphCache))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCollectorsManipulations))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestFolderLoader))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestThresholdSelection))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestBatchedQparamsSearch))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestHistogramErrorEngine))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestActivationStore))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCandidateWeightsCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestJacobianWeights))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestFloatOutputsCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQDataPipeline))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestIntegerKernels))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestApplySubstitutions))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TargetPlatformModelingTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(OpsetTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(QCOptionsTest))
@@ -123,10 +162,13 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestUniformQuantizeTensor))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestUniformRangeSelectionWeights))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasTPModel))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasIntegerGraphExecutor))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestWeightsActivationSplit))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestActivationWeightsComposition))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestModelGradients))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphMaxCut))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMaxCutKPI))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCompiledInference))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasSetLayerToBitwidth))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivityEvalWithOutputReplacementNodes))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasFakeQuantExporter))
@@ -146,9 +188,24 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TorchLayerTest))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(FeatureModelsTestRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(FunctionTestRunner))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPytorchExecutionPlan))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestParallelQparamsComputation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivityMetricCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestDisableActivationForMetric))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestIncrementalSensitivityEvaluation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSensitivitySamplesStore))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestLazyCandidateWeights))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCompactQuantizedWeights))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphClone))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestIntegerGraphExecutor))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPyTorchInplaceExport))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestJacobianWeightsCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQFloatOutputsCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQTrainingLogging))
         # Exporter test of pytorch must have ONNX installed
         if FOUND_ONNX:
             suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPyTorchFakeQuantExporter))
+            suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPyTorchINT8ONNXExporter))
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_mobilenet_v2', ModelTest))
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_mobilenet_v3', ModelTest))
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_efficientnet_b0', ModelTest))